@@ -3,10 +3,14 @@ Main entrypoint for the CS2 Analytics FastAPI application.
 Includes middleware setup and route registration.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from cs2_analytics.config import API_CORS_ORIGINS, API_DEBUG
+from cs2_analytics.storage.async_database import close_async_db, get_async_db
 
 from .routes import players
 
@@ -16,11 +20,25 @@ def health_payload() -> dict[str, str]:
     return {"status": "ok", "service": "cs2-analytics-api"}
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Opens the async database pool for the app's lifetime.
+
+    The pool connects in the background, so the API (and /health) starts
+    even while the database is unreachable.
+    """
+    await get_async_db().open()
+    try:
+        yield
+    finally:
+        await close_async_db()
+
+
 def create_app() -> FastAPI:
     """
     Creates and configures the FastAPI application.
     """
-    app = FastAPI(title="CS2 Analytics API", debug=API_DEBUG)
+    app = FastAPI(title="CS2 Analytics API", debug=API_DEBUG, lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
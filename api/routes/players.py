@@ -11,11 +11,11 @@ router: APIRouter = APIRouter()
 
 
 @router.get("/top_players", response_model=list[PlayerStats])
-def get_top_players(
+async def get_top_players(
     min_maps: int = Query(5, ge=1), limit: int = Query(10, le=100)
 ) -> list[PlayerStats]:
     """
     Returns the top CS2 players by average rating, filtered by minimum maps played.
     """
     service = PlayerService()
-    return service.fetch_top_players(min_maps=min_maps, limit=limit)
+    return await service.fetch_top_players(min_maps=min_maps, limit=limit)
@@ -3,7 +3,7 @@ Service layer for retrieving player-related data from the database.
 Implements business logic separate from route handlers.
 """
 
-from cs2_analytics.storage.database import Database
+from cs2_analytics.storage.async_database import AsyncDatabase, get_async_db
 
 from ..schemas.player import PlayerStats
 
@@ -11,12 +11,13 @@ from ..schemas.player import PlayerStats
 class PlayerService:
     """
     Service class for handling player-related database operations.
+    Queries are awaited on the shared async pool, off the API threadpool.
     """
 
-    def __init__(self) -> None:
-        self.db: Database = Database()
+    def __init__(self, db: AsyncDatabase | None = None) -> None:
+        self.db: AsyncDatabase = db if db is not None else get_async_db()
 
-    def fetch_top_players(self, min_maps: int, limit: int) -> list[PlayerStats]:
+    async def fetch_top_players(self, min_maps: int, limit: int) -> list[PlayerStats]:
         """
         Fetches top players based on average rating, filtered by minimum maps played.
 
@@ -39,10 +40,9 @@ class PlayerService:
             LIMIT %s;
         """
         try:
-            with self.db.get_cursor() as cur:
-                cur.execute(sql, (min_maps, limit))
-                rows = cur.fetchall()
-                cols = [desc[0] for desc in cur.description]
-                return [PlayerStats(**dict(zip(cols, row))) for row in rows]
+            async with self.db.get_cursor() as cur:
+                await cur.execute(sql, (min_maps, limit))
+                rows = await cur.fetchall()
+                return [PlayerStats(**row) for row in rows]
         except Exception as e:
             raise RuntimeError(f"Failed to fetch top players: {e}") from e
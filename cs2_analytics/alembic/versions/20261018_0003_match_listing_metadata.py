@@ -0,0 +1,41 @@
+"""Store results-listing header data on match ingestion state.
+
+Discovery now records the teams, score, event, format and forfeit marker
+the results listing shows next to each match link, so matches can be
+classified and prioritized before their match page is fetched.
+
+Revision ID: 20261018_0003
+Revises: 20260716_0002
+Create Date: 2026-10-18
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_0003"
+down_revision: str | None = "20260716_0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+LISTING_COLUMNS = (
+    sa.Column("listing_team1", sa.Text()),
+    sa.Column("listing_team2", sa.Text()),
+    sa.Column("listing_score1", sa.Integer()),
+    sa.Column("listing_score2", sa.Integer()),
+    sa.Column("listing_event", sa.Text()),
+    sa.Column("listing_format", sa.Text()),
+    sa.Column("listing_forfeit", sa.Boolean()),
+    sa.Column("listing_date", sa.Date()),
+)
+
+
+def upgrade() -> None:
+    for column in LISTING_COLUMNS:
+        op.add_column("match_ingestion_state", column)
+
+
+def downgrade() -> None:
+    for column in reversed(LISTING_COLUMNS):
+        op.drop_column("match_ingestion_state", column.name)
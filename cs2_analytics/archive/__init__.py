@@ -0,0 +1,17 @@
+"""Raw page archive used to replay parsing without re-scraping."""
+
+from .page_archive import (
+    ArchivedPage,
+    PageArchive,
+    archive_page,
+    get_page_archive,
+    load_page_body,
+)
+
+__all__ = [
+    "ArchivedPage",
+    "PageArchive",
+    "archive_page",
+    "get_page_archive",
+    "load_page_body",
+]
@@ -0,0 +1,244 @@
+"""Content-addressed on-disk archive of raw fetched HTML pages.
+
+Page bodies are stored once per SHA-256 digest, compressed with zstd when
+the optional `zstandard` package is installed and gzip otherwise, and
+sharded into two levels of hash-prefix directories. A small SQLite index
+records every fetch as (url, fetched_at, kind, content_hash), so repeated
+fetches of an unchanged page cost one index row and no extra page body.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import hashlib
+import importlib
+import os
+import sqlite3
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Literal
+
+from cs2_analytics.config.config import PAGE_ARCHIVE_DIR
+from cs2_analytics.exceptions import PageArchiveError
+from cs2_analytics.utils.log_manager import get_logger
+
+# Loaded by name so the Optional annotation type-checks with or without it.
+zstandard: ModuleType | None
+try:
+    zstandard = importlib.import_module("zstandard")
+except ImportError:  # pragma: no cover - exercised only without the extra
+    zstandard = None
+
+logger = get_logger(__name__)
+
+PageKind = Literal["results", "match", "map"]
+
+INDEX_FILENAME = "index.sqlite3"
+ZSTD_SUFFIX = ".html.zst"
+GZIP_SUFFIX = ".html.gz"
+ZSTD_LEVEL = 10
+
+CREATE_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archived_pages (
+    url TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    byte_length INTEGER NOT NULL,
+    PRIMARY KEY (url, fetched_at)
+);
+CREATE INDEX IF NOT EXISTS idx_archived_pages_kind_url
+    ON archived_pages (kind, url, fetched_at);
+"""
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """One index row pointing at an archived page body."""
+
+    url: str
+    fetched_at: str
+    kind: str
+    content_hash: str
+
+
+class PageArchive:
+    """Stores raw page HTML by content hash with a URL/fetch-time index."""
+
+    def __init__(self, root: str | os.PathLike[str], *, use_zstd: bool = True):
+        self.root = Path(root)
+        self.use_zstd = use_zstd and zstandard is not None
+        self._lock = threading.Lock()
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.root / INDEX_FILENAME,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL;")
+            self._conn.executescript(CREATE_INDEX_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            raise PageArchiveError(
+                f"Failed to open page archive at {self.root}."
+            ) from e
+
+    def store(
+        self,
+        url: str,
+        html: str,
+        *,
+        kind: PageKind,
+        fetched_at: dt.datetime | None = None,
+    ) -> str:
+        """Archives one fetched page and returns its content hash."""
+        body = html.encode("utf-8")
+        content_hash = hashlib.sha256(body).hexdigest()
+        fetched = (fetched_at or dt.datetime.now(dt.UTC)).isoformat()
+        try:
+            if self._find_body_path(content_hash) is None:
+                self._write_body(content_hash, body)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO archived_pages "
+                    "(url, fetched_at, kind, content_hash, byte_length) "
+                    "VALUES (?, ?, ?, ?, ?);",
+                    (url, fetched, kind, content_hash, len(body)),
+                )
+        except Exception as e:
+            raise PageArchiveError(f"Failed to archive page: {url}") from e
+        return content_hash
+
+    def load(self, content_hash: str) -> str:
+        """Returns the archived HTML for a content hash."""
+        return load_page_body(self.root, content_hash)
+
+    def latest(self, url: str) -> ArchivedPage | None:
+        """Returns the most recent index row for a URL, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, fetched_at, kind, content_hash FROM archived_pages "
+                "WHERE url = ? ORDER BY fetched_at DESC LIMIT 1;",
+                (url,),
+            ).fetchone()
+        return ArchivedPage(*row) if row else None
+
+    def iter_latest(self, kind: PageKind) -> Iterator[ArchivedPage]:
+        """Yields the most recent archived fetch of every URL of one kind."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, MAX(fetched_at), kind, content_hash FROM archived_pages "
+                "WHERE kind = ? GROUP BY url ORDER BY url;",
+                (kind,),
+            ).fetchall()
+        for row in rows:
+            yield ArchivedPage(*row)
+
+    def close(self) -> None:
+        """Closes the SQLite index connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _shard_dir(self, content_hash: str) -> Path:
+        return _shard_dir(self.root, content_hash)
+
+    def _find_body_path(self, content_hash: str) -> Path | None:
+        return _find_body_path(self.root, content_hash)
+
+    def _write_body(self, content_hash: str, body: bytes) -> None:
+        """Writes a compressed page body atomically into its shard."""
+        if self.use_zstd and zstandard is not None:
+            suffix = ZSTD_SUFFIX
+            payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+        else:
+            suffix = GZIP_SUFFIX
+            payload = gzip.compress(body)
+
+        shard = self._shard_dir(content_hash)
+        shard.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=shard, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_path, shard / f"{content_hash}{suffix}")
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+
+def _shard_dir(root: Path, content_hash: str) -> Path:
+    return root / content_hash[:2] / content_hash[2:4]
+
+
+def _find_body_path(root: Path, content_hash: str) -> Path | None:
+    shard = _shard_dir(root, content_hash)
+    for suffix in (ZSTD_SUFFIX, GZIP_SUFFIX):
+        path = shard / f"{content_hash}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def load_page_body(root: str | os.PathLike[str], content_hash: str) -> str:
+    """Reads and decompresses one archived page body without opening the index.
+
+    Replay parse workers call this directly so each process only touches
+    the body files, never the shared SQLite index.
+    """
+    path = _find_body_path(Path(root), content_hash)
+    if path is None:
+        raise PageArchiveError(f"Archived page body not found: {content_hash}")
+    try:
+        raw = path.read_bytes()
+        if path.name.endswith(ZSTD_SUFFIX):
+            if zstandard is None:
+                raise PageArchiveError(
+                    "Reading zstd archive entries requires the zstandard package."
+                )
+            return str(zstandard.ZstdDecompressor().decompress(raw), "utf-8")
+        return gzip.decompress(raw).decode("utf-8")
+    except PageArchiveError:
+        raise
+    except Exception as e:
+        raise PageArchiveError(
+            f"Failed to read archived page body: {content_hash}"
+        ) from e
+
+
+_default_archive: PageArchive | None = None
+_default_archive_lock = threading.Lock()
+
+
+def get_page_archive() -> PageArchive | None:
+    """Returns the shared archive configured by PAGE_ARCHIVE_DIR, if enabled."""
+    global _default_archive
+
+    if not PAGE_ARCHIVE_DIR:
+        return None
+    with _default_archive_lock:
+        if _default_archive is None:
+            _default_archive = PageArchive(PAGE_ARCHIVE_DIR)
+    return _default_archive
+
+
+def archive_page(
+    archive: PageArchive | None, url: str, html: str, *, kind: PageKind
+) -> None:
+    """Archives a fetched page, downgrading archive failures to a warning.
+
+    Archiving is a side channel for later replay; it must never fail the
+    fetch that produced the page.
+    """
+    if archive is None:
+        return
+    try:
+        archive.store(url, html, kind=kind)
+    except PageArchiveError as e:
+        logger.warning("Failed to archive %s page %s: %s", kind, url, e)
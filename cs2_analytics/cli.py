@@ -7,13 +7,20 @@ do not pay the scraper-stack import cost.
 """
 
 from enum import StrEnum
+from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from cs2_analytics.exceptions import DatabaseConnectionError, IngestionStateError
+from cs2_analytics.exceptions import (
+    ConfigurationError,
+    DatabaseConnectionError,
+    IngestionStateError,
+    ParseError,
+)
 
 if TYPE_CHECKING:
+    from cs2_analytics.controllers.replay_controller import ReplayStage
     from cs2_analytics.ingestion_state.base_ingestion_state import BaseIngestionState
 
 app = typer.Typer(
@@ -30,6 +37,11 @@ db_app = typer.Typer(
     no_args_is_help=True,
 )
 app.add_typer(db_app, name="db")
+bench_app = typer.Typer(
+    help="Offline performance benchmarks over checked-in pages.",
+    no_args_is_help=True,
+)
+app.add_typer(bench_app, name="bench")
 
 
 class DiscoverMode(StrEnum):
@@ -49,7 +61,12 @@ DISCOVER_MODE_MAX_MATCHES = {
 def discover(
     mode: Annotated[
         DiscoverMode,
-        typer.Option(help="incremental caps at 50 matches; backfill at 1000."),
+        typer.Option(
+            help=(
+                "incremental caps at 50 matches and stops at the first fully "
+                "known results page; backfill walks up to 1000."
+            )
+        ),
     ] = DiscoverMode.INCREMENTAL,
     max_matches: Annotated[
         int | None,
@@ -60,7 +77,9 @@ def discover(
     from cs2_analytics.controllers.results_controller import ResultsController
 
     cap = max_matches if max_matches is not None else DISCOVER_MODE_MAX_MATCHES[mode]
-    ResultsController().run(max_matches=cap)
+    ResultsController().run(
+        max_matches=cap, stop_at_known=mode is DiscoverMode.INCREMENTAL
+    )
 
 
 @app.command()
@@ -69,13 +88,177 @@ def process(
         int,
         typer.Option(min=1, help="Items to process per stage batch."),
     ] = 50,
+    workers: Annotated[
+        int,
+        typer.Option(
+            min=1,
+            help="Concurrent browser sessions draining each stage batch.",
+        ),
+    ] = 1,
+    parse_workers: Annotated[
+        int,
+        typer.Option(
+            min=0,
+            help=(
+                "Parser processes for map pages, so browsers keep fetching "
+                "while pages parse; 0 parses inline."
+            ),
+        ),
+    ] = 0,
 ) -> None:
     """Process pending matches, then pending maps."""
     from cs2_analytics.controllers.map_controller import MapController
     from cs2_analytics.controllers.match_controller import MatchController
 
-    MatchController().run(batch_size=batch)
-    MapController().run(batch_size=batch)
+    MatchController().run(batch_size=batch, workers=workers)
+    MapController().run(batch_size=batch, workers=workers, parse_workers=parse_workers)
+
+
+class ReplayScope(StrEnum):
+    """Stages an offline replay re-runs from archived pages."""
+
+    MATCH = "match"
+    MAP = "map"
+    ALL = "all"
+
+
+class ParseBackendOption(StrEnum):
+    """HTML tree builder used to parse archived pages."""
+
+    FAST = "fast"
+    LXML = "lxml"
+    HTML_PARSER = "html.parser"
+
+
+REPLAY_SCOPE_STAGES: dict[ReplayScope, tuple["ReplayStage", ...]] = {
+    ReplayScope.MATCH: ("match",),
+    ReplayScope.MAP: ("map",),
+    ReplayScope.ALL: ("match", "map"),
+}
+
+
+@app.command()
+def replay(
+    stage: Annotated[
+        ReplayScope,
+        typer.Option(help="Stage to replay; all replays matches before maps."),
+    ] = ReplayScope.ALL,
+    limit: Annotated[
+        int | None,
+        typer.Option(min=1, help="Replay at most this many archived pages per stage."),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(min=1, help="Parser processes; defaults to the CPU count."),
+    ] = None,
+    batch: Annotated[
+        int,
+        typer.Option(min=1, help="Parsed items persisted per write transaction."),
+    ] = 200,
+    archive_dir: Annotated[
+        str | None,
+        typer.Option(help="Page archive directory; defaults to PAGE_ARCHIVE_DIR."),
+    ] = None,
+    parse_backend: Annotated[
+        ParseBackendOption,
+        typer.Option(help="HTML tree builder; fast uses lxml when installed."),
+    ] = ParseBackendOption.FAST,
+) -> None:
+    """Re-run match and map parsing from archived pages, without a browser."""
+    from cs2_analytics.archive import PageArchive
+    from cs2_analytics.config.config import PAGE_ARCHIVE_DIR
+    from cs2_analytics.controllers.replay_controller import ReplayController
+
+    root = archive_dir or PAGE_ARCHIVE_DIR
+    if not root:
+        typer.echo(
+            "No page archive configured; set PAGE_ARCHIVE_DIR or pass --archive-dir.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    _echo_target_database()
+    ReplayController(
+        PageArchive(root),
+        workers=workers,
+        write_batch_size=batch,
+        parse_backend=parse_backend.value,
+    ).run(stages=REPLAY_SCOPE_STAGES[stage], limit=limit)
+
+
+@bench_app.command("parse")
+def bench_parse(
+    corpus: Annotated[
+        Path,
+        typer.Option(
+            help="Corpus manifest, e.g. tests/parsers/fixtures/corpus.json.",
+        ),
+    ],
+    backend: Annotated[
+        list[ParseBackendOption] | None,
+        typer.Option(
+            help="Backend to benchmark; repeatable. Defaults to every installed one."
+        ),
+    ] = None,
+    rounds: Annotated[
+        int,
+        typer.Option(min=2, help="Timed passes over the corpus per backend."),
+    ] = 20,
+    max_regression: Annotated[
+        float,
+        typer.Option(
+            min=0,
+            help="Percent relative-speed drop or peak RSS rise that fails the run.",
+        ),
+    ] = 15.0,
+    baseline: Annotated[
+        Path | None,
+        typer.Option(
+            help="Baseline file to gate against; without it nothing is gated."
+        ),
+    ] = None,
+    update_baseline: Annotated[
+        bool,
+        typer.Option("--update-baseline", help="Store this run as the new baseline."),
+    ] = False,
+) -> None:
+    """Benchmark map, match and results parsing over a frozen page corpus."""
+    from cs2_analytics.parsers import parse_benchmark
+    from cs2_analytics.parsers.parse_backend import resolve_parse_backend
+
+    if update_baseline and baseline is None:
+        typer.echo("--update-baseline needs --baseline to write to.", err=True)
+        raise typer.Exit(code=1)
+
+    try:
+        pages = parse_benchmark.load_corpus(corpus)
+        backends = (
+            tuple(
+                dict.fromkeys(resolve_parse_backend(choice.value) for choice in backend)
+            )
+            if backend
+            else parse_benchmark.default_backends()
+        )
+        results = parse_benchmark.benchmark_backends(pages, backends, rounds)
+        for line in parse_benchmark.format_results(results):
+            typer.echo(line)
+
+        if baseline is None:
+            return
+        if update_baseline:
+            parse_benchmark.write_baseline(results, baseline)
+            typer.echo(f"Baseline written to {baseline}.")
+            return
+        stored = parse_benchmark.load_baseline(baseline)
+    except (ConfigurationError, ParseError) as e:
+        typer.echo(f"Parse benchmark failed: {e}", err=True)
+        raise typer.Exit(code=1) from e
+
+    regressions = parse_benchmark.find_regressions(results, stored, max_regression)
+    for regression in regressions:
+        typer.echo(f"Regression: {regression}", err=True)
+    if regressions:
+        raise typer.Exit(code=1)
 
 
 class RetryStage(StrEnum):
@@ -187,8 +370,6 @@ def _alembic_config():
     initialize_db.run_migrations does) to keep `cs2a db` working from any
     working directory.
     """
-    from pathlib import Path
-
     from alembic.config import Config
 
     package_root = Path(__file__).resolve().parent
@@ -106,6 +106,24 @@ DB_USER = os.getenv("DB_USER", default="postgres")
 DB_PASS = os.getenv("DB_PASS", default="password")
 DB_HOST = os.getenv("DB_HOST", default="localhost")
 DB_PORT = _read_int("DB_PORT", default=5432)
+# Shared connection pool. Checkout waits up to DB_POOL_TIMEOUT_SECONDS for a
+# free connection; connections idle longer than DB_POOL_VALIDATE_IDLE_SECONDS
+# are pinged before reuse, and are replaced once older than
+# DB_POOL_MAX_LIFETIME_SECONDS or idle longer than DB_POOL_MAX_IDLE_SECONDS.
+DB_POOL_MIN_CONNECTIONS = _read_int("DB_POOL_MIN_CONNECTIONS", default=1)
+DB_POOL_MAX_CONNECTIONS = _read_int("DB_POOL_MAX_CONNECTIONS", default=10)
+DB_POOL_TIMEOUT_SECONDS = _read_int("DB_POOL_TIMEOUT_SECONDS", default=30)
+DB_POOL_MAX_LIFETIME_SECONDS = _read_int("DB_POOL_MAX_LIFETIME_SECONDS", default=1800)
+DB_POOL_MAX_IDLE_SECONDS = _read_int("DB_POOL_MAX_IDLE_SECONDS", default=300)
+DB_POOL_VALIDATE_IDLE_SECONDS = _read_int("DB_POOL_VALIDATE_IDLE_SECONDS", default=10)
+# Storage writes of at least this many rows are bulk loaded: one COPY into a
+# temp staging table and one INSERT ... SELECT ... ON CONFLICT merge, instead
+# of an INSERT round-trip per row. 0 keeps every write on executemany.
+BULK_COPY_MIN_ROWS = _read_int("BULK_COPY_MIN_ROWS", default=200)
+# The map stage commits parsed maps in groups of this many per transaction
+# instead of one each; a failed group is retried map by map. 0 or 1 commits
+# every map on its own.
+MAP_GROUP_COMMIT_SIZE = _read_int("MAP_GROUP_COMMIT_SIZE", default=0)
 BATCH_SIZE = 1000
 
 # API Configuration
@@ -132,6 +150,64 @@ START_DATE = "2025-10-01"
 END_DATE = str(dt.datetime.today().date())
 MAX_MATCHES = 10
 
+# Request pacing, shared by every scraper session per host. A rate of 0
+# disables pacing; jitter is added only to waits the limiter enforces.
+SCRAPE_REQUESTS_PER_MINUTE = _read_int("SCRAPE_REQUESTS_PER_MINUTE", default=30)
+SCRAPE_BURST = _read_int("SCRAPE_BURST", default=2)
+SCRAPE_JITTER_SECONDS = 0.5
+# When adaptive, the rate above is only the starting point: it climbs while
+# pages load cleanly and is cut on challenge pages or session-error spikes,
+# staying within these bounds.
+SCRAPE_ADAPTIVE_RATE = _read_bool("SCRAPE_ADAPTIVE_RATE", default=True)
+SCRAPE_MIN_REQUESTS_PER_MINUTE = 6
+SCRAPE_MAX_REQUESTS_PER_MINUTE = _read_int("SCRAPE_MAX_REQUESTS_PER_MINUTE", default=90)
+
+# Browser sessions kept warming in the background during match/map batches
+# so scraper rotation and recovery swap sessions instead of waiting for a
+# new one. Each is an extra browser for the whole batch, so this is opt-in;
+# 0 disables standby sessions.
+SCRAPER_STANDBY_SESSIONS = _read_int("SCRAPER_STANDBY_SESSIONS", default=0)
+
+# Scraper browsers block images, fonts, media and ad/analytics requests that
+# no parser reads; disable to load pages fully when debugging.
+SCRAPE_BLOCK_RESOURCES = _read_bool("SCRAPE_BLOCK_RESOURCES", default=True)
+
+# Scrapers try a plain HTTP client (seeded with the browser session's cookies)
+# before loading a page in the browser, escalating to the browser on challenge
+# pages or missing content. Requires the optional `http` extra.
+SCRAPE_HTTP_FETCH = _read_bool("SCRAPE_HTTP_FETCH", default=False)
+
+# Map scrapers read the stats tables out of the rendered page with a small
+# script instead of serializing the whole DOM for BeautifulSoup, falling back
+# to the HTML when the script's result is incomplete. Ignored while the page
+# archive is enabled, so archived HTML and parsed results always match.
+SCRAPE_MAP_EXTRACTION = _read_bool("SCRAPE_MAP_EXTRACTION", default=False)
+
+# The match stage stores forfeits straight from the header data recorded off
+# the results listing, without loading their match pages: a forfeit has no
+# maps or demos to follow. Disable to fetch every match page.
+SCRAPE_FORFEITS_FROM_LISTING = _read_bool("SCRAPE_FORFEITS_FROM_LISTING", default=True)
+
+# Schema drift breaker: the map stage fingerprints each fetched page and halts
+# fetching once this percentage of the last SCHEMA_DRIFT_WINDOW pages lack
+# the selectors or stat columns MapParser needs, writing one diagnostic with
+# sample pages under SCHEMA_DRIFT_DIAGNOSTICS_DIR. A window of 0 disables it.
+SCHEMA_DRIFT_WINDOW = _read_int("SCHEMA_DRIFT_WINDOW", default=20)
+SCHEMA_DRIFT_THRESHOLD_PCT = _read_int("SCHEMA_DRIFT_THRESHOLD_PCT", default=50)
+SCHEMA_DRIFT_DIAGNOSTICS_DIR = os.getenv(
+    "SCHEMA_DRIFT_DIAGNOSTICS_DIR",
+    default=os.path.join(os.getcwd(), "logs", "schema_drift"),
+).strip()
+
+# Tree builder behind parsed pages: html.parser, lxml, or fast (lxml when
+# installed). Replay defaults to fast regardless of this setting.
+PARSE_BACKEND = os.getenv("PARSE_BACKEND", default="html.parser").strip()
+
+# Raw Page Archive
+# Every fetched results/match/map page is archived under this directory when
+# set; an empty value disables archiving.
+PAGE_ARCHIVE_DIR = os.getenv("PAGE_ARCHIVE_DIR", default="").strip()
+
 # Logging Config
 LOG_LEVEL = logging.INFO
 if DEBUG_MODE:
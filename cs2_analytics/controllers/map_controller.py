@@ -1,18 +1,36 @@
 """Controller for scraping and storing map-level player data."""
 
-import time
-from contextlib import suppress
+from dataclasses import replace
 
+from cs2_analytics.config.config import (
+    MAP_GROUP_COMMIT_SIZE,
+    SCHEMA_DRIFT_DIAGNOSTICS_DIR,
+    SCHEMA_DRIFT_THRESHOLD_PCT,
+    SCHEMA_DRIFT_WINDOW,
+    SCRAPER_STANDBY_SESSIONS,
+)
+from cs2_analytics.controllers.parse_pipeline import (
+    FingerprintedMap,
+    MapParseTask,
+    ParsePipeline,
+    parse_fingerprinted_map_task,
+)
 from cs2_analytics.controllers.retry_utils import (
     BatchRunState,
     is_retryable_scraper_error,
+    log_rate_metrics,
     mark_item_failed,
     reset_scraper,
 )
+from cs2_analytics.controllers.standby_pool import StandbyScraperPool
+from cs2_analytics.controllers.worker_pool import run_with_workers, total_run_states
+from cs2_analytics.exceptions import MapParseError, SchemaDriftError
 from cs2_analytics.ingestion_state import MapIngestionState
 from cs2_analytics.parsers.map_parser import MapParser
+from cs2_analytics.parsers.schema_drift import SchemaDriftBreaker
 from cs2_analytics.scrapers.map_scraper import MapScraper
-from cs2_analytics.stage_services import MapStageService
+from cs2_analytics.scrapers.rate_limiter import get_rate_limiter
+from cs2_analytics.stage_services import MapStageService, StageItemResult
 from cs2_analytics.storage.db_instance import get_db
 from cs2_analytics.storage.map_storage import store_maps
 from cs2_analytics.storage.player_storage import store_players
@@ -21,9 +39,9 @@ from cs2_analytics.utils.log_manager import get_logger
 logger = get_logger("map_controller")
 
 ROTATE_EVERY = 8
-INTER_MAP_DELAY_SECONDS = 0.75
 RETRY_BACKOFF_SECONDS = 3.0
 MAX_ATTEMPTS = 3
+SESSION_STARTUP_DELAY_SECONDS = 1.0
 
 
 class MapController:
@@ -31,43 +49,121 @@ class MapController:
 
     def __init__(self) -> None:
         self.scraper = MapScraper()
+        self.standby: StandbyScraperPool[MapScraper] | None = None
+        self.pipeline: ParsePipeline[MapParseTask, FingerprintedMap] | None = None
+        self.rate_limiter = get_rate_limiter()
         self.parser = MapParser()
         self.state = MapIngestionState()
+        self.drift_breaker = SchemaDriftBreaker(
+            stage="map",
+            window=SCHEMA_DRIFT_WINDOW,
+            threshold_pct=SCHEMA_DRIFT_THRESHOLD_PCT,
+            diagnostics_dir=SCHEMA_DRIFT_DIAGNOSTICS_DIR,
+        )
         self.stage_service = MapStageService(
             parser=self.parser,
             store_maps=store_maps,
             store_players=store_players,
             map_state=self.state,
             db=get_db(),
+            drift_breaker=self.drift_breaker,
+            group_commit_size=MAP_GROUP_COMMIT_SIZE,
         )
 
-    def run(self, batch_size: int = 25) -> None:
-        logger.info("Running MapController with batch size: %d", batch_size)
+    def run(
+        self, batch_size: int = 25, workers: int = 1, parse_workers: int = 0
+    ) -> None:
+        """Runs the map stage for a batch of pending maps across scraper workers.
+
+        With parse_workers > 0, scraper workers only fetch; pages are parsed
+        in that many processes and persisted by the pipeline's writer. Under
+        group commit, maps whose deferred write failed are moved from
+        succeeded to failed in the summary.
+
+        Raises SchemaDriftError after the batch summary when the schema drift
+        breaker tripped; maps it kept from being fetched stay discovered.
+        """
+        logger.info(
+            "Running MapController with batch size: %d workers: %d parse workers: %d",
+            batch_size,
+            workers,
+            parse_workers,
+        )
 
         selected = self.state.fetch_with_match_context(batch_size)
         logger.info("%d pending maps selected from ingestion state", len(selected))
 
-        run_state: BatchRunState[MapScraper] = BatchRunState(scraper=self.scraper)
+        self.standby = self._start_standby_pool() if selected else None
+        if selected and parse_workers > 0:
+            self.pipeline = self._start_parse_pipeline(parse_workers)
         try:
-            for map_id, map_url, match_id, map_order in selected:
-                self._rotate_scraper_if_due(run_state)
-                self.state.mark_as_processing(map_id)
-                self._process_map_with_retries(
-                    map_id, map_url, match_id, map_order, run_state
-                )
+            run_states = run_with_workers(
+                selected,
+                workers=workers,
+                initial_scraper=self.scraper,
+                scraper_factory=MapScraper,
+                process_item=self._process_selected_map,
+            )
         finally:
-            with suppress(Exception):
-                run_state.scraper.close()
+            if self.standby is not None:
+                self.standby.close()
+                self.standby = None
+            pipeline, self.pipeline = self.pipeline, None
+            if pipeline is not None:
+                pipeline.close()
+            write_failures = self.stage_service.finish_writes()
+        if len(run_states) > 1:
+            for worker_index, worker_state in enumerate(run_states, start=1):
+                logger.info(
+                    "MapController worker %d: succeeded=%d failed=%d retries=%d",
+                    worker_index,
+                    worker_state.succeeded,
+                    worker_state.failed,
+                    worker_state.retries,
+                )
 
+        totals = total_run_states(run_states)
+        if pipeline is not None:
+            totals = replace(
+                totals,
+                succeeded=totals.succeeded + pipeline.totals.succeeded,
+                failed=totals.failed + pipeline.totals.failed,
+            )
+        if write_failures:
+            totals = replace(
+                totals,
+                succeeded=totals.succeeded - write_failures,
+                failed=totals.failed + write_failures,
+            )
         logger.info(
             "MapController summary: selected=%d succeeded=%d failed=%d retries=%d",
             len(selected),
-            run_state.succeeded,
-            run_state.failed,
-            run_state.retries,
+            totals.succeeded,
+            totals.failed,
+            totals.retries,
         )
+        log_rate_metrics(logger, "MapController", self.rate_limiter)
+        if self.drift_breaker.tripped:
+            raise SchemaDriftError(
+                "Map stage halted on schema drift; "
+                f"{self.drift_breaker.refused} selected maps were not fetched. "
+                f"Diagnostic: {self.drift_breaker.diagnostic_path or 'not written'}"
+            )
         logger.info("MapController complete.")
 
+    def _process_selected_map(
+        self,
+        item: tuple[int, str, int | None, int | None],
+        run_state: BatchRunState[MapScraper],
+    ) -> None:
+        """Claims one selected map and runs it on the worker's scraper session."""
+        map_id, map_url, match_id, map_order = item
+        if not self.drift_breaker.allow_fetch():
+            return
+        self._rotate_scraper_if_due(run_state)
+        self.state.mark_as_processing(map_id)
+        self._process_map_with_retries(map_id, map_url, match_id, map_order, run_state)
+
     def _rotate_scraper_if_due(self, run_state: BatchRunState[MapScraper]) -> None:
         """Swaps in a fresh scraper session after enough processed maps."""
         if run_state.processed_since_reset < ROTATE_EVERY:
@@ -96,7 +192,9 @@ class MapController:
                 return
             except Exception as e:
                 if attempt < MAX_ATTEMPTS and self._is_recoverable_scraper_error(e):
-                    self._recover_from_retryable_error(map_id, attempt, e, run_state)
+                    self._recover_from_retryable_error(
+                        map_id, map_url, attempt, e, run_state
+                    )
                 else:
                     self._mark_terminal_failure(map_id, attempt, e, run_state)
                     return
@@ -109,7 +207,12 @@ class MapController:
         map_order: int | None,
         run_state: BatchRunState[MapScraper],
     ) -> None:
-        """Processes one map and applies success/pacing bookkeeping."""
+        """Processes one map and applies success bookkeeping."""
+        if self.pipeline is not None:
+            self._hand_off_to_pipeline(
+                self.pipeline, map_id, map_url, match_id, map_order, run_state
+            )
+            return
         result = self.stage_service.process_item(
             map_id,
             map_url,
@@ -129,16 +232,82 @@ class MapController:
             )
 
         run_state.processed_since_reset += 1
-        time.sleep(INTER_MAP_DELAY_SECONDS)
+
+    def _hand_off_to_pipeline(
+        self,
+        pipeline: ParsePipeline[MapParseTask, FingerprintedMap],
+        map_id: int,
+        map_url: str,
+        match_id: int | None,
+        map_order: int | None,
+        run_state: BatchRunState[MapScraper],
+    ) -> None:
+        """Fetches one map and queues its HTML; the pipeline counts the outcome."""
+        page_source = run_state.scraper.fetch_page(map_url)
+        pipeline.submit(
+            MapParseTask(
+                map_id=map_id, map_url=map_url, match_id=match_id, map_order=map_order
+            ),
+            page_source,
+        )
+        run_state.processed_since_reset += 1
+
+    def _start_parse_pipeline(
+        self, parse_workers: int
+    ) -> ParsePipeline[MapParseTask, FingerprintedMap]:
+        """Starts the parser processes and writer for a pipelined batch."""
+        pipeline = ParsePipeline(
+            parse_fingerprinted_map_task,
+            record=self._record_parsed_map,
+            fail=self._mark_pipeline_failure,
+            workers=parse_workers,
+        )
+        pipeline.start()
+        return pipeline
+
+    def _record_parsed_map(
+        self, task: MapParseTask, page: FingerprintedMap
+    ) -> StageItemResult:
+        """Persists one pipeline-parsed map; runs on the pipeline writer thread.
+
+        A parse error is raised after observing the fingerprint, so the
+        pipeline's fail path marks the map failed.
+        """
+        self.drift_breaker.observe(
+            task.map_id, task.map_url, page.fingerprint, page.page_source
+        )
+        if page.error is not None:
+            raise page.error
+        if page.parsed_map is None:
+            raise MapParseError(f"Parse worker returned no map for {task.map_url}")
+        result = self.stage_service.record_parsed(task.map_id, page.parsed_map)
+        if result.succeeded:
+            logger.info("Stored map: %s", task.map_id)
+        else:
+            logger.warning("Map %s was not processed: %s", task.map_id, result.message)
+        return result
+
+    def _mark_pipeline_failure(self, task: MapParseTask, error: Exception) -> None:
+        """Marks a map failed whose page could not be parsed or persisted."""
+        mark_item_failed(
+            self.state,
+            task.map_id,
+            error,
+            logger=logger,
+            log_message="Error parsing or storing map %s on attempt %d/%d: %s",
+            attempt=1,
+            max_attempts=1,
+        )
 
     def _recover_from_retryable_error(
         self,
         map_id: int,
+        map_url: str,
         attempt: int,
         error: Exception,
         run_state: BatchRunState[MapScraper],
     ) -> None:
-        """Backs off and resets the scraper before the next attempt."""
+        """Defers the host on the shared rate limiter and resets the scraper."""
         run_state.retries += 1
         logger.warning(
             "Retryable scraper error for map %s (attempt %d/%d): %s",
@@ -147,7 +316,7 @@ class MapController:
             MAX_ATTEMPTS,
             error,
         )
-        time.sleep(RETRY_BACKOFF_SECONDS * attempt)
+        self.rate_limiter.defer(map_url, RETRY_BACKOFF_SECONDS * attempt)
         run_state.scraper = self._reset_scraper(run_state.scraper)
 
     def _mark_terminal_failure(
@@ -178,12 +347,24 @@ class MapController:
     def _is_recoverable_scraper_error(self, error: Exception) -> bool:
         return is_retryable_scraper_error(error)
 
+    def _start_standby_pool(self) -> StandbyScraperPool[MapScraper] | None:
+        """Starts warming standby sessions for this batch, if enabled."""
+        if SCRAPER_STANDBY_SESSIONS <= 0:
+            return None
+        return StandbyScraperPool(
+            MapScraper,
+            logger=logger,
+            size=SCRAPER_STANDBY_SESSIONS,
+            startup_delay_seconds=SESSION_STARTUP_DELAY_SECONDS,
+        )
+
     def _reset_scraper(self, scraper: MapScraper) -> MapScraper:
-        self.scraper = reset_scraper(
+        """Replaces a worker's session; the caller keeps it in its run state."""
+        return reset_scraper(
             scraper,
             MapScraper,
             logger=logger,
             close_warning_message="Failed to close map scraper during recovery: %s",
-            startup_delay_seconds=1.0,
+            startup_delay_seconds=SESSION_STARTUP_DELAY_SECONDS,
+            standby=self.standby,
         )
-        return self.scraper
@@ -1,14 +1,18 @@
 """Controller for scraping and storing match-level data."""
 
-import time
-from contextlib import suppress
-
+from cs2_analytics.config.config import (
+    SCRAPE_FORFEITS_FROM_LISTING,
+    SCRAPER_STANDBY_SESSIONS,
+)
 from cs2_analytics.controllers.retry_utils import (
     BatchRunState,
     is_retryable_scraper_error,
+    log_rate_metrics,
     mark_item_failed,
     reset_scraper,
 )
+from cs2_analytics.controllers.standby_pool import StandbyScraperPool
+from cs2_analytics.controllers.worker_pool import run_with_workers, total_run_states
 from cs2_analytics.ingestion_state import (
     DemoIngestionState,
     MapIngestionState,
@@ -16,6 +20,7 @@ from cs2_analytics.ingestion_state import (
 )
 from cs2_analytics.parsers.match_parser import MatchParser
 from cs2_analytics.scrapers.match_scraper import MatchScraper
+from cs2_analytics.scrapers.rate_limiter import get_rate_limiter
 from cs2_analytics.stage_services import MatchStageService
 from cs2_analytics.storage.db_instance import get_db
 from cs2_analytics.storage.match_storage import store_matches
@@ -24,9 +29,9 @@ from cs2_analytics.utils.log_manager import get_logger
 logger = get_logger("match_controller")
 
 ROTATE_EVERY = 8
-INTER_MATCH_DELAY_SECONDS = 1.1
 RETRY_BACKOFF_SECONDS = 3.0
 MAX_ATTEMPTS = 3
+SESSION_STARTUP_DELAY_SECONDS = 1.5
 COOLDOWN_AFTER_CONSECUTIVE_ERRORS = 2
 COOLDOWN_SECONDS = 8.0
 
@@ -36,6 +41,8 @@ class MatchController:
 
     def __init__(self) -> None:
         self.scraper = MatchScraper()
+        self.standby: StandbyScraperPool[MatchScraper] | None = None
+        self.rate_limiter = get_rate_limiter()
         self.parser = MatchParser()
         self.match_state = MatchIngestionState()
         self.map_state = MapIngestionState()
@@ -49,32 +56,79 @@ class MatchController:
             db=get_db(),
         )
 
-    def run(self, batch_size: int = 25) -> None:
+    def run(self, batch_size: int = 25, workers: int = 1) -> None:
         """Runs the match stage for a batch of pending match URLs."""
-        logger.info("Running MatchController with batch size: %d", batch_size)
+        logger.info(
+            "Running MatchController with batch size: %d workers: %d",
+            batch_size,
+            workers,
+        )
+
+        if SCRAPE_FORFEITS_FROM_LISTING:
+            self._store_listed_forfeits(batch_size)
 
         selected = self.match_state.fetch(limit=batch_size)
         logger.info("%d pending matches selected from ingestion state", len(selected))
 
-        run_state: BatchRunState[MatchScraper] = BatchRunState(scraper=self.scraper)
+        self.standby = self._start_standby_pool() if selected else None
         try:
-            for match_id, match_url in selected:
-                self._rotate_scraper_if_due(run_state)
-                self.match_state.mark_as_processing(match_id)
-                self._process_match_with_retries(match_id, match_url, run_state)
+            run_states = run_with_workers(
+                selected,
+                workers=workers,
+                initial_scraper=self.scraper,
+                scraper_factory=MatchScraper,
+                process_item=self._process_selected_match,
+            )
         finally:
-            with suppress(Exception):
-                run_state.scraper.close()
+            if self.standby is not None:
+                self.standby.close()
+                self.standby = None
+        if len(run_states) > 1:
+            for worker_index, worker_state in enumerate(run_states, start=1):
+                logger.info(
+                    "MatchController worker %d: succeeded=%d failed=%d retries=%d",
+                    worker_index,
+                    worker_state.succeeded,
+                    worker_state.failed,
+                    worker_state.retries,
+                )
 
+        totals = total_run_states(run_states)
         logger.info(
             "MatchController summary: selected=%d succeeded=%d failed=%d retries=%d",
             len(selected),
-            run_state.succeeded,
-            run_state.failed,
-            run_state.retries,
+            totals.succeeded,
+            totals.failed,
+            totals.retries,
         )
+        log_rate_metrics(logger, "MatchController", self.rate_limiter)
         logger.info("MatchController complete.")
 
+    def _store_listed_forfeits(self, limit: int) -> None:
+        """Stores discovered forfeits from their listing header data.
+
+        Runs before the page-fetching batch so forfeits never take a browser
+        slot; anything left unresolved stays discovered for that batch.
+        """
+        listings = self.match_state.fetch_listed_forfeits(limit=limit)
+        if not listings:
+            return
+        stored = self.stage_service.record_listed_forfeits(listings)
+        logger.info(
+            "Stored %d of %d listed forfeits without a match page load",
+            stored,
+            len(listings),
+        )
+
+    def _process_selected_match(
+        self, item: tuple[int, str], run_state: BatchRunState[MatchScraper]
+    ) -> None:
+        """Claims one selected match and runs it on the worker's scraper session."""
+        match_id, match_url = item
+        self._rotate_scraper_if_due(run_state)
+        self.match_state.mark_as_processing(match_id)
+        self._process_match_with_retries(match_id, match_url, run_state)
+
     def _rotate_scraper_if_due(self, run_state: BatchRunState[MatchScraper]) -> None:
         """Swaps in a fresh scraper session after enough processed matches."""
         if run_state.processed_since_reset < ROTATE_EVERY:
@@ -96,7 +150,9 @@ class MatchController:
                 return
             except Exception as e:
                 if attempt < MAX_ATTEMPTS and self._is_recoverable_scraper_error(e):
-                    self._recover_from_retryable_error(match_id, attempt, e, run_state)
+                    self._recover_from_retryable_error(
+                        match_id, match_url, attempt, e, run_state
+                    )
                 else:
                     self._mark_terminal_failure(match_id, attempt, e, run_state)
                     return
@@ -104,7 +160,7 @@ class MatchController:
     def _record_stage_outcome(
         self, match_id: int, match_url: str, run_state: BatchRunState[MatchScraper]
     ) -> None:
-        """Processes one match and applies success/pacing bookkeeping."""
+        """Processes one match and applies success bookkeeping."""
         result = self.stage_service.process_item(
             match_id, match_url, scraper=run_state.scraper
         )
@@ -121,16 +177,21 @@ class MatchController:
 
         run_state.consecutive_recoverable_errors = 0
         run_state.processed_since_reset += 1
-        time.sleep(INTER_MATCH_DELAY_SECONDS)
 
     def _recover_from_retryable_error(
         self,
         match_id: int,
+        match_url: str,
         attempt: int,
         error: Exception,
         run_state: BatchRunState[MatchScraper],
     ) -> None:
-        """Backs off, cools down if errors cluster, and resets the scraper."""
+        """Defers the host, cooling down longer if errors cluster, then resets.
+
+        The backoff is charged to the shared rate limiter rather than slept
+        here, so it overlaps with the scraper reset and holds back every
+        worker hitting the same host.
+        """
         run_state.retries += 1
         run_state.consecutive_recoverable_errors += 1
         logger.warning(
@@ -141,6 +202,7 @@ class MatchController:
             error,
         )
 
+        backoff_seconds = RETRY_BACKOFF_SECONDS * attempt
         if (
             run_state.consecutive_recoverable_errors
             >= COOLDOWN_AFTER_CONSECUTIVE_ERRORS
@@ -149,9 +211,9 @@ class MatchController:
                 "Applying cooldown after %d consecutive recoverable errors",
                 run_state.consecutive_recoverable_errors,
             )
-            time.sleep(COOLDOWN_SECONDS)
+            backoff_seconds += COOLDOWN_SECONDS
 
-        time.sleep(RETRY_BACKOFF_SECONDS * attempt)
+        self.rate_limiter.defer(match_url, backoff_seconds)
         run_state.scraper = self._reset_scraper(run_state.scraper)
 
     def _mark_terminal_failure(
@@ -184,14 +246,26 @@ class MatchController:
         """Returns True for transient scraper failures worth retrying."""
         return bool(is_retryable_scraper_error(error))
 
+    def _start_standby_pool(self) -> StandbyScraperPool[MatchScraper] | None:
+        """Starts warming standby sessions for this batch, if enabled."""
+        if SCRAPER_STANDBY_SESSIONS <= 0:
+            return None
+        return StandbyScraperPool(
+            MatchScraper,
+            logger=logger,
+            size=SCRAPER_STANDBY_SESSIONS,
+            startup_delay_seconds=SESSION_STARTUP_DELAY_SECONDS,
+            health_check=self._is_scraper_session_ready,
+        )
+
     def _reset_scraper(self, scraper: MatchScraper) -> MatchScraper:
         """Closes and recreates the scraper so the next attempt gets a fresh session."""
-        self.scraper = reset_scraper(
+        return reset_scraper(
             scraper,
             MatchScraper,
             logger=logger,
             close_warning_message="Failed to close scraper during recovery: %s",
-            startup_delay_seconds=1.5,
+            startup_delay_seconds=SESSION_STARTUP_DELAY_SECONDS,
             health_check=self._is_scraper_session_ready,
             max_reset_attempts=3,
             between_attempt_delay_seconds=1.0,
@@ -202,9 +276,9 @@ class MatchController:
             fallback_warning_message=(
                 "Returning scraper after reset retries; first request may still require retry"
             ),
-            fallback_delay_seconds=1.5,
+            fallback_delay_seconds=SESSION_STARTUP_DELAY_SECONDS,
+            standby=self.standby,
         )
-        return self.scraper
 
     def _is_scraper_session_ready(self, scraper: MatchScraper) -> bool:
         """Performs a lightweight health check for a fresh Selenium session."""
@@ -0,0 +1,189 @@
+"""Fetch -> parse -> persist pipeline that keeps browsers off the parser's clock.
+
+Inline, a scraper session sits idle while its page is parsed, and threads
+cannot overlap parsing under the GIL. In the pipeline, scraper workers hand
+raw page HTML (never soups, which do not pickle cheaply) to a process pool
+of parsers and go straight back to fetching; parsed results are persisted
+in submission order by a single writer thread.
+
+Both hand-offs are bounded so a slow stage applies backpressure instead of
+buffering pages in memory: at most `parse_depth` pages are queued in or
+running on the parser pool, and at most `write_depth` handed-off pages
+(parsing or parsed) wait for the writer. A slow database therefore stalls
+parsing, and slow parsing stalls fetching.
+"""
+
+import multiprocessing
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from cs2_analytics.exceptions import MapParseError
+from cs2_analytics.parsers.map_parser import MapParser, ParsedMap
+from cs2_analytics.parsers.parse_backend import make_soup
+from cs2_analytics.parsers.schema_drift import PageFingerprint, fingerprint_map_page
+from cs2_analytics.stage_services.stage_result import StageItemResult
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+PARSE_DEPTH_PER_WORKER = 2
+WRITE_QUEUE_DEPTH = 32
+
+
+@dataclass(frozen=True)
+class MapParseTask:
+    """One fetched map page's identity and the parent context its parser needs."""
+
+    map_id: int
+    map_url: str
+    match_id: int | None
+    map_order: int | None
+
+
+@dataclass(frozen=True)
+class FingerprintedMap:
+    """A worker's parse of one map page, with the page's structural fingerprint.
+
+    Parse errors are returned rather than raised so the fingerprint still
+    reaches the schema drift breaker; page_source is sent back only for a
+    drifted page, as a diagnostic sample.
+    """
+
+    fingerprint: PageFingerprint
+    parsed_map: ParsedMap | None = None
+    error: MapParseError | None = None
+    page_source: str | None = None
+
+
+def parse_fingerprinted_map_task(
+    task: MapParseTask, page_source: str
+) -> FingerprintedMap:
+    """Fingerprints and parses one fetched map page inside a worker process."""
+    soup = make_soup(page_source, regions=MapParser.page_regions)
+    fingerprint = fingerprint_map_page(soup)
+    sample = page_source if fingerprint.drifted else None
+    try:
+        parsed_map = _parse_map_soup(task, soup)
+    except MapParseError as e:
+        return FingerprintedMap(fingerprint, error=e, page_source=sample)
+    return FingerprintedMap(fingerprint, parsed_map=parsed_map, page_source=sample)
+
+
+def _parse_map_soup(task: MapParseTask, soup) -> ParsedMap:
+    return MapParser().parse_map_details(
+        soup,
+        task.map_url,
+        task.map_id,
+        match_id=task.match_id,
+        map_order=task.map_order,
+    )
+
+
+@dataclass
+class PipelineTotals:
+    """Writer-side outcome counters for pages handed to the pipeline."""
+
+    succeeded: int = 0
+    failed: int = 0
+
+
+class ParsePipeline[TaskT, ParsedT]:
+    """Parses fetched pages in worker processes and persists them on one thread.
+
+    `parse_page(task, page_source)` must be a module-level function so it
+    can be sent to spawned workers. `record(task, parsed)` and
+    `fail(task, error)` run on the writer thread; `fail` receives parse
+    errors and anything `record` raises, so every handed-off page ends in
+    exactly one of them.
+    """
+
+    def __init__(
+        self,
+        parse_page: Callable[[TaskT, str], ParsedT],
+        *,
+        record: Callable[[TaskT, ParsedT], StageItemResult],
+        fail: Callable[[TaskT, Exception], None],
+        workers: int,
+        parse_depth: int | None = None,
+        write_depth: int = WRITE_QUEUE_DEPTH,
+    ) -> None:
+        self.parse_page = parse_page
+        self.record = record
+        self.fail = fail
+        self.workers = workers
+        self.totals = PipelineTotals()
+        self._parse_slots = threading.BoundedSemaphore(
+            parse_depth or workers * PARSE_DEPTH_PER_WORKER
+        )
+        self._pending_writes: queue.Queue[tuple[TaskT, Future[ParsedT]] | None] = (
+            queue.Queue(maxsize=write_depth)
+        )
+        self._executor: ProcessPoolExecutor | None = None
+        self._writer: threading.Thread | None = None
+
+    def __enter__(self) -> "ParsePipeline[TaskT, ParsedT]":  # noqa: UP037
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Starts the parser processes and the writer thread."""
+        # spawn, not fork: the controller process already holds browser,
+        # DB pool and logging threads, which fork would copy mid-state.
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._writer = threading.Thread(
+            target=self._write_results, name="parse-pipeline-writer", daemon=True
+        )
+        self._writer.start()
+
+    def submit(self, task: TaskT, page_source: str) -> None:
+        """Hands one fetched page to the parser pool, blocking while it is full."""
+        if self._executor is None:
+            raise RuntimeError("ParsePipeline must be started before submitting.")
+        self._parse_slots.acquire()
+        try:
+            future = self._executor.submit(self.parse_page, task, page_source)
+        except BaseException:
+            self._parse_slots.release()
+            raise
+        future.add_done_callback(lambda _future: self._parse_slots.release())
+        self._pending_writes.put((task, future))
+
+    def close(self) -> None:
+        """Waits for every handed-off page to be written, then stops the workers."""
+        if self._writer is not None:
+            self._pending_writes.put(None)
+            self._writer.join()
+            self._writer = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _write_results(self) -> None:
+        """Persists parse results in submission order until close() is called."""
+        while (pending := self._pending_writes.get()) is not None:
+            task, future = pending
+            try:
+                result = self.record(task, future.result())
+            except Exception as e:
+                self.totals.failed += 1
+                self._fail_quietly(task, e)
+                continue
+            if result.succeeded:
+                self.totals.succeeded += 1
+            else:
+                self.totals.failed += 1
+
+    def _fail_quietly(self, task: TaskT, error: Exception) -> None:
+        """Reports a failed page; a failing report never stops the writer."""
+        try:
+            self.fail(task, error)
+        except Exception:
+            logger.exception("Could not record parse pipeline failure for %s", task)
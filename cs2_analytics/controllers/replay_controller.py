@@ -0,0 +1,329 @@
+"""Controller for re-running match and map stages from archived HTML.
+
+Replay never opens a browser. Archived pages are parsed in a process pool
+and the parsed results are persisted through the existing stage-service
+transactions in batches, so a parser fix can be backfilled across the whole
+archive without re-scraping.
+"""
+
+import multiprocessing
+import re
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Literal
+
+from cs2_analytics.archive import PageArchive, load_page_body
+from cs2_analytics.exceptions import PageArchiveError, ParseError, StorageError
+from cs2_analytics.ingestion_state import (
+    DemoIngestionState,
+    MapIngestionState,
+    MatchIngestionState,
+)
+from cs2_analytics.parsers.map_parser import MapParser
+from cs2_analytics.parsers.match_parser import MatchParser
+from cs2_analytics.parsers.parse_backend import (
+    FAST_BACKEND,
+    make_soup,
+    resolve_parse_backend,
+)
+from cs2_analytics.stage_services import MapStageService, MatchStageService
+from cs2_analytics.storage.db_instance import get_db
+from cs2_analytics.storage.map_storage import store_maps
+from cs2_analytics.storage.match_storage import store_matches
+from cs2_analytics.storage.player_storage import store_players
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger("replay_controller")
+
+ReplayStage = Literal["match", "map"]
+
+DEFAULT_WRITE_BATCH_SIZE = 200
+PARSE_CHUNK_SIZE = 16
+
+MATCH_ID_PATTERN = re.compile(r"/matches/(\d+)")
+MAP_ID_PATTERN = re.compile(r"/mapstatsid/(\d+)")
+
+
+@dataclass(frozen=True)
+class ReplayTask:
+    """One archived page to parse, with the context its parser needs."""
+
+    url: str
+    content_hash: str
+    item_id: int
+    match_id: int | None = None
+    map_order: int | None = None
+
+
+@dataclass(frozen=True)
+class ReplayOutcome:
+    """Parse result for one task: a parsed payload or an error message."""
+
+    task: ReplayTask
+    parsed: object = None
+    error: str | None = None
+
+
+@dataclass
+class ReplayRunState:
+    """Outcome counters for one replayed stage."""
+
+    selected: int = 0
+    stored: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+def parse_match_page(
+    archive_root: str, task: ReplayTask, backend: str = FAST_BACKEND
+) -> ReplayOutcome:
+    """Parses one archived match page; runs inside a replay worker process."""
+    try:
+        soup = make_soup(
+            load_page_body(archive_root, task.content_hash),
+            backend,
+            MatchParser.page_regions,
+        )
+        match, map_links, demo_links = MatchParser().parse_match(soup, task.url)
+    except (PageArchiveError, ParseError) as e:
+        return ReplayOutcome(task=task, error=str(e))
+    if not match:
+        return ReplayOutcome(task=task, error="Parsing returned None")
+    return ReplayOutcome(task=task, parsed=(task.item_id, match, map_links, demo_links))
+
+
+def parse_map_page(
+    archive_root: str, task: ReplayTask, backend: str = FAST_BACKEND
+) -> ReplayOutcome:
+    """Parses one archived map stats page; runs inside a replay worker process."""
+    try:
+        soup = make_soup(
+            load_page_body(archive_root, task.content_hash),
+            backend,
+            MapParser.page_regions,
+        )
+        parsed_map = MapParser().parse_map_details(
+            soup,
+            task.url,
+            task.item_id,
+            match_id=task.match_id,
+            map_order=task.map_order,
+        )
+    except (PageArchiveError, ParseError) as e:
+        return ReplayOutcome(task=task, error=str(e))
+    if not parsed_map.players:
+        return ReplayOutcome(task=task, error="Parsing returned no player records")
+    return ReplayOutcome(task=task, parsed=(task.item_id, parsed_map))
+
+
+class ReplayController:
+    """Coordinates offline replay of archived pages through the stage services."""
+
+    def __init__(
+        self,
+        archive: PageArchive,
+        *,
+        workers: int | None = None,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        parse_backend: str = FAST_BACKEND,
+    ) -> None:
+        self.archive = archive
+        self.workers = workers
+        self.write_batch_size = write_batch_size
+        self.parse_backend = resolve_parse_backend(parse_backend)
+        self.match_state = MatchIngestionState()
+        self.map_state = MapIngestionState()
+        db = get_db()
+        self.match_stage_service = MatchStageService(
+            parser=MatchParser(),
+            store_matches=store_matches,
+            match_state=self.match_state,
+            map_state=self.map_state,
+            demo_state=DemoIngestionState(),
+            db=db,
+        )
+        self.map_stage_service = MapStageService(
+            parser=MapParser(),
+            store_maps=store_maps,
+            store_players=store_players,
+            map_state=self.map_state,
+            db=db,
+        )
+
+    def run(
+        self,
+        stages: Iterable[ReplayStage] = ("match", "map"),
+        limit: int | None = None,
+    ) -> dict[ReplayStage, ReplayRunState]:
+        """Replays each requested stage in order; matches first so maps have parents."""
+        results: dict[ReplayStage, ReplayRunState] = {}
+        for stage in stages:
+            logger.info(
+                "Running ReplayController for %s pages with workers=%s limit=%s "
+                "parse_backend=%s",
+                stage,
+                self.workers or "auto",
+                limit,
+                self.parse_backend,
+            )
+            if stage == "match":
+                results[stage] = self._replay(
+                    stage,
+                    self._match_tasks(limit),
+                    parse_match_page,
+                    self.match_stage_service.record_parsed_batch,
+                )
+            else:
+                results[stage] = self._replay(
+                    stage,
+                    self._map_tasks(limit),
+                    parse_map_page,
+                    self.map_stage_service.record_parsed_batch,
+                )
+        logger.info("ReplayController complete.")
+        return results
+
+    def _match_tasks(self, limit: int | None) -> tuple[list[ReplayTask], int]:
+        """Builds match replay tasks from the newest archived page per URL."""
+        tasks: list[ReplayTask] = []
+        skipped = 0
+        for page in islice(self.archive.iter_latest("match"), limit):
+            found = MATCH_ID_PATTERN.search(page.url)
+            if not found:
+                skipped += 1
+                continue
+            tasks.append(
+                ReplayTask(
+                    url=page.url,
+                    content_hash=page.content_hash,
+                    item_id=int(found.group(1)),
+                )
+            )
+        return tasks, skipped
+
+    def _map_tasks(self, limit: int | None) -> tuple[list[ReplayTask], int]:
+        """Builds map replay tasks, attaching parent match context from state."""
+        pages = []
+        skipped = 0
+        for page in islice(self.archive.iter_latest("map"), limit):
+            found = MAP_ID_PATTERN.search(page.url)
+            if not found:
+                skipped += 1
+                continue
+            pages.append((int(found.group(1)), page))
+
+        context = self.map_state.fetch_match_context([map_id for map_id, _ in pages])
+        tasks: list[ReplayTask] = []
+        for map_id, page in pages:
+            match_id, map_order = context.get(map_id, (None, None))
+            if match_id is None:
+                logger.debug("Skipping map %s without parent match context", map_id)
+                skipped += 1
+                continue
+            tasks.append(
+                ReplayTask(
+                    url=page.url,
+                    content_hash=page.content_hash,
+                    item_id=map_id,
+                    match_id=match_id,
+                    map_order=map_order,
+                )
+            )
+        return tasks, skipped
+
+    def _replay(
+        self,
+        stage: ReplayStage,
+        task_build: tuple[list[ReplayTask], int],
+        parse_page: Callable[..., ReplayOutcome],
+        record_batch: Callable[[list], None],
+    ) -> ReplayRunState:
+        """Parses tasks in the pool and flushes parsed results in write batches."""
+        tasks, skipped = task_build
+        run_state = ReplayRunState(selected=len(tasks) + skipped, skipped=skipped)
+        pending: list[object] = []
+
+        for outcome in self._parse_all(tasks, parse_page):
+            if outcome.error is not None:
+                run_state.failed += 1
+                logger.warning(
+                    "Replay %s %s failed to parse: %s",
+                    stage,
+                    outcome.task.item_id,
+                    outcome.error,
+                )
+                continue
+            pending.append(outcome.parsed)
+            if len(pending) >= self.write_batch_size:
+                self._flush(stage, pending, record_batch, run_state)
+                pending = []
+        self._flush(stage, pending, record_batch, run_state)
+
+        logger.info(
+            "ReplayController %s summary: selected=%d stored=%d failed=%d skipped=%d",
+            stage,
+            run_state.selected,
+            run_state.stored,
+            run_state.failed,
+            run_state.skipped,
+        )
+        return run_state
+
+    def _parse_all(
+        self,
+        tasks: list[ReplayTask],
+        parse_page: Callable[..., ReplayOutcome],
+    ) -> Iterator[ReplayOutcome]:
+        """Yields parse outcomes in task order, inline or from a process pool."""
+        parse_one = partial(
+            parse_page, str(Path(self.archive.root)), backend=self.parse_backend
+        )
+        if self.workers == 1 or len(tasks) <= 1:
+            yield from map(parse_one, tasks)
+            return
+        # spawn, not fork: the controller process may already hold DB pool
+        # and logging threads, which fork would copy in an undefined state.
+        with ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            yield from pool.map(parse_one, tasks, chunksize=PARSE_CHUNK_SIZE)
+
+    def _flush(
+        self,
+        stage: ReplayStage,
+        pending: list,
+        record_batch: Callable[[list], None],
+        run_state: ReplayRunState,
+    ) -> None:
+        """Persists one write batch; failed items are counted and replay continues.
+
+        As with group commit, a failed batch is rewritten one item per
+        transaction, so one bad row fails only its own item.
+        """
+        if not pending:
+            return
+        try:
+            record_batch(pending)
+        except StorageError as e:
+            if len(pending) == 1:
+                run_state.failed += 1
+                logger.exception(
+                    "Replay %s item %s failed to write: %s", stage, pending[0][0], e
+                )
+                return
+            logger.warning(
+                "Replay %s write batch of %d items failed; retrying each on its own: %s",
+                stage,
+                len(pending),
+                e,
+            )
+        else:
+            run_state.stored += len(pending)
+            return
+
+        for item in pending:
+            self._flush(stage, [item], record_batch, run_state)
@@ -1,6 +1,17 @@
-"""Controller for scraping and recording match result links."""
-
+"""Controller for scraping and recording match result links.
+
+A full discovery walk (backfill) records each page's matches on a writer
+thread while the next results page is fetched, so database round-trips stay
+off the fetch path. The hand-off queue is bounded: a slow database holds
+fetching back instead of buffering pages. Incremental discovery
+(stop_at_known) stays sequential, because whether to fetch the next page
+depends on what recording the current one found.
+"""
+
+import queue
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from cs2_analytics.controllers.retry_utils import (
@@ -9,6 +20,7 @@ from cs2_analytics.controllers.retry_utils import (
 )
 from cs2_analytics.exceptions import PipelineError
 from cs2_analytics.ingestion_state import MatchIngestionState
+from cs2_analytics.models.result_listing import ResultListing
 from cs2_analytics.scrapers.results_scraper import ResultsScraper
 from cs2_analytics.stage_services import ResultsStageService
 from cs2_analytics.utils.log_manager import get_logger
@@ -17,6 +29,9 @@ logger = get_logger("results_controller")
 
 RETRY_BACKOFF_SECONDS = 3.0
 MAX_ATTEMPTS = 3
+# Fetched pages that may wait for the writer; one is enough to overlap
+# recording page N with fetching page N+1.
+WRITE_QUEUE_DEPTH = 2
 
 
 @dataclass
@@ -29,6 +44,72 @@ class _ResultsRunState:
     terminal_failures: int = 0
 
 
+class _BatchWriter:
+    """Records discovered batches on a background thread, in page order.
+
+    A failed write stops recording: later batches are drained unwritten and
+    the error is raised to the fetching thread on its next submit or on
+    finish, so the attempt fails as it would have inline.
+    """
+
+    def __init__(
+        self,
+        record_batch: Callable[[list[ResultListing]], int],
+        *,
+        depth: int = WRITE_QUEUE_DEPTH,
+    ) -> None:
+        self.record_batch = record_batch
+        self.recorded = 0
+        self.error: Exception | None = None
+        self._pending: queue.Queue[list[ResultListing] | None] = queue.Queue(
+            maxsize=depth
+        )
+        self._thread = threading.Thread(
+            target=self._write_batches, name="results-discovery-writer", daemon=True
+        )
+
+    def __enter__(self) -> "_BatchWriter":  # noqa: UP037
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._thread.is_alive():
+            self._stop()
+            if self.error is not None:
+                logger.warning(
+                    "Discarding results write error after fetch failure: %s",
+                    self.error,
+                )
+
+    def submit(self, batch: list[ResultListing]) -> None:
+        """Queues one page's batch, blocking while the writer is behind."""
+        self._raise_if_failed()
+        self._pending.put(batch)
+
+    def finish(self) -> int:
+        """Waits for every queued batch to be written; returns the count recorded."""
+        self._stop()
+        self._raise_if_failed()
+        return self.recorded
+
+    def _stop(self) -> None:
+        self._pending.put(None)
+        self._thread.join()
+
+    def _raise_if_failed(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def _write_batches(self) -> None:
+        while (batch := self._pending.get()) is not None:
+            if self.error is not None:
+                continue
+            try:
+                self.recorded += self.record_batch(batch)
+            except Exception as e:
+                self.error = e
+
+
 class ResultsController:
     """Orchestrates the results scraping stage."""
 
@@ -37,13 +118,22 @@ class ResultsController:
         self.match_state = MatchIngestionState()
         self.stage_service = ResultsStageService(match_state=self.match_state)
 
-    def run(self, max_matches: int = 50) -> None:
-        """Scrapes result pages and records match URLs for downstream stages."""
-        logger.info("Running ResultsController with max_matches=%d", max_matches)
+    def run(self, max_matches: int = 50, stop_at_known: bool = False) -> None:
+        """Scrapes result pages and records match URLs for downstream stages.
+
+        With stop_at_known (incremental discovery), only new matches are
+        recorded and discovery stops at the first results page whose
+        matches are all already in match ingestion state.
+        """
+        logger.info(
+            "Running ResultsController with max_matches=%d stop_at_known=%s",
+            max_matches,
+            stop_at_known,
+        )
 
         run_state = _ResultsRunState(scraper=self.scraper)
         try:
-            self._run_attempts(max_matches, run_state)
+            self._run_attempts(max_matches, stop_at_known, run_state)
         finally:
             self._close_scraper(run_state)
             logger.info(
@@ -54,11 +144,15 @@ class ResultsController:
                 max_matches,
             )
 
-    def _run_attempts(self, max_matches: int, run_state: _ResultsRunState) -> None:
+    def _run_attempts(
+        self, max_matches: int, stop_at_known: bool, run_state: _ResultsRunState
+    ) -> None:
         """Attempts the results stage until it succeeds or retries are exhausted."""
         for attempt in range(1, MAX_ATTEMPTS + 1):
             try:
-                recorded = self._record_discovered_batches(max_matches, run_state)
+                recorded = self._record_discovered_batches(
+                    max_matches, stop_at_known, run_state
+                )
                 run_state.status = "succeeded"
                 logger.info("ResultsController complete. recorded=%d", recorded)
                 return
@@ -66,12 +160,32 @@ class ResultsController:
                 self._handle_attempt_failure(e, attempt, run_state)
 
     def _record_discovered_batches(
-        self, max_matches: int, run_state: _ResultsRunState
+        self, max_matches: int, stop_at_known: bool, run_state: _ResultsRunState
     ) -> int:
         """Streams result pages and records each discovered match batch."""
+        if stop_at_known:
+            return self._record_new_batches_until_known(max_matches, run_state)
+
+        batches = run_state.scraper.iter_match_batches(max_matches=max_matches)
+        with _BatchWriter(self.stage_service.record_batch) as writer:
+            for batch in batches:
+                writer.submit(batch)
+            return writer.finish()
+
+    def _record_new_batches_until_known(
+        self, max_matches: int, run_state: _ResultsRunState
+    ) -> int:
+        """Records only new matches, page by page, until a page is fully known."""
         recorded = 0
         for batch in run_state.scraper.iter_match_batches(max_matches=max_matches):
-            recorded += self.stage_service.record_batch(batch)
+            batch_recorded = self.stage_service.record_batch(batch, skip_known=True)
+            recorded += batch_recorded
+            if batch_recorded == 0:
+                logger.info(
+                    "Stopping discovery: all %d matches on the page are already known",
+                    len(batch),
+                )
+                break
         return recorded
 
     def _handle_attempt_failure(
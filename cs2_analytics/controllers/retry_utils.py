@@ -5,7 +5,9 @@ from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
 
+from cs2_analytics.controllers.standby_pool import StandbyScraperPool
 from cs2_analytics.exceptions import RetryableScrapeError
+from cs2_analytics.scrapers.rate_limiter import HostRateLimiter
 
 
 @dataclass
@@ -71,10 +73,20 @@ def reset_scraper[ScraperT](
     not_ready_warning_message: str | None = None,
     fallback_warning_message: str | None = None,
     fallback_delay_seconds: float | None = None,
+    standby: StandbyScraperPool[ScraperT] | None = None,
 ) -> ScraperT:
-    """Closes and recreates a scraper, optionally retrying until a health check passes."""
+    """Closes and recreates a scraper, optionally retrying until a health check passes.
+
+    With a standby pool, a pre-warmed session is swapped in without any
+    startup wait; the inline rebuild below only runs if none is available.
+    """
     _close_before_reset(scraper, logger, close_warning_message)
 
+    if standby is not None:
+        standby_scraper = standby.take()
+        if standby_scraper is not None:
+            return standby_scraper
+
     attempt_total = max(1, max_reset_attempts)
 
     for reset_attempt in range(1, attempt_total + 1):
@@ -121,3 +133,20 @@ def mark_item_failed(
     """Marks an ingestion-state item failed, then logs the terminal controller exception."""
     state.mark_as_failed(item_id, str(error)[:reason_limit])
     logger.exception(log_message, item_id, attempt, max_attempts, error)
+
+
+def log_rate_metrics(logger, label: str, rate_limiter: HostRateLimiter) -> None:
+    """Logs the shared limiter's adaptive rate metrics, if rate control is on."""
+    metrics = rate_limiter.metrics()
+    if metrics is None:
+        return
+    logger.info(
+        "%s pacing: requests_per_minute=%.1f challenge_ratio=%.2f "
+        "error_ratio=%.2f backing_off=%s decreases=%d",
+        label,
+        metrics.requests_per_minute,
+        metrics.challenge_ratio,
+        metrics.error_ratio,
+        metrics.backing_off,
+        metrics.decreases,
+    )
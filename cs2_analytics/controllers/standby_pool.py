@@ -0,0 +1,117 @@
+"""Pre-warmed standby scraper sessions for instant rotation and recovery.
+
+Starting a browser session costs several seconds: driver launch, the
+startup delay, and a health check. A StandbyScraperPool pays that cost on a
+background thread while the active session is still working, so
+reset_scraper can swap in a ready session instead of building one inline.
+Every session handed out is immediately replaced by a new one warming in
+the background.
+
+A ready session can sit idle for a long time before it is taken, and the
+browser behind it may have crashed meanwhile, so take() checks the driver
+still answers before handing a session out.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+
+
+class StandbyScraperPool[ScraperT]:
+    """Keeps `size` scraper sessions launching or ready in the background."""
+
+    def __init__(
+        self,
+        scraper_factory: Callable[[], ScraperT],
+        *,
+        logger,
+        size: int = 1,
+        startup_delay_seconds: float = 1.0,
+        health_check: Callable[[ScraperT], bool] | None = None,
+        alive_check: Callable[[ScraperT], bool] | None = None,
+    ) -> None:
+        self.scraper_factory = scraper_factory
+        self.logger = logger
+        self.startup_delay_seconds = startup_delay_seconds
+        self.health_check = health_check
+        self.alive_check = alive_check or driver_is_alive
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, size), thread_name_prefix="scraper-standby"
+        )
+        self._pending: deque[Future[ScraperT | None]] = deque(
+            self._executor.submit(self._warm) for _ in range(max(1, size))
+        )
+
+    def take(self) -> ScraperT | None:
+        """Returns the oldest standby session, waiting if it is still warming.
+
+        Returns None when the pool is closed or the standby session failed
+        to start, failed its health check, or died while waiting; callers
+        then build a session inline. A replacement starts warming either way.
+        """
+        with self._lock:
+            if self._closed or not self._pending:
+                return None
+            future = self._pending.popleft()
+            self._pending.append(self._executor.submit(self._warm))
+
+        try:
+            scraper = future.result()
+        except Exception as e:
+            self.logger.warning("Standby scraper session failed to start: %s", e)
+            return None
+        if scraper is None:
+            return None
+        if not self.alive_check(scraper):
+            self.logger.warning("Standby scraper session died before it was taken")
+            _close_quietly(scraper)
+            return None
+        self.logger.info("Swapped in pre-warmed standby scraper session")
+        return scraper
+
+    def close(self) -> None:
+        """Stops warming new sessions and closes any that were never taken."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pending = list(self._pending)
+            self._pending.clear()
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for future in pending:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            scraper = future.result()
+            if scraper is not None:
+                _close_quietly(scraper)
+
+    def _warm(self) -> ScraperT | None:
+        """Builds one session, waits out startup, and health-checks it."""
+        scraper = self.scraper_factory()
+        time.sleep(self.startup_delay_seconds)
+        if self.health_check is None or self.health_check(scraper):
+            return scraper
+        self.logger.warning("Standby scraper session failed its health check")
+        _close_quietly(scraper)
+        return None
+
+
+def driver_is_alive(scraper) -> bool:
+    """Returns True if the scraper's browser still answers a driver call."""
+    try:
+        _ = scraper.driver.current_url
+    except Exception:
+        return False
+    return True
+
+
+def _close_quietly(scraper) -> None:
+    """Closes an unused standby session; close failures are not actionable."""
+    with suppress(Exception):
+        scraper.close()
@@ -0,0 +1,101 @@
+"""Bounded pool of scraper sessions that drains one controller batch.
+
+Each worker owns an independent scraper session and its own BatchRunState,
+so rotation counters, reset_scraper recovery, and outcome counters never
+cross workers. Controllers pass a per-item callback that already owns retry
+policy; the pool only distributes items and rolls counters up at the end.
+"""
+
+import queue
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+
+from cs2_analytics.controllers.retry_utils import BatchRunState
+
+
+@dataclass(frozen=True)
+class BatchTotals:
+    """Outcome counters summed across every worker in one batch run."""
+
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+
+
+def total_run_states(run_states: Sequence[BatchRunState]) -> BatchTotals:
+    """Rolls per-worker counters up into one batch-level total."""
+    return BatchTotals(
+        succeeded=sum(state.succeeded for state in run_states),
+        failed=sum(state.failed for state in run_states),
+        retries=sum(state.retries for state in run_states),
+    )
+
+
+def run_with_workers[ItemT, ScraperT](
+    items: Sequence[ItemT],
+    *,
+    workers: int,
+    initial_scraper: ScraperT,
+    scraper_factory: Callable[[], ScraperT],
+    process_item: Callable[[ItemT, BatchRunState[ScraperT]], None],
+) -> list[BatchRunState[ScraperT]]:
+    """Drains items across up to `workers` scraper sessions.
+
+    The first worker reuses initial_scraper; any additional workers build
+    their own session from scraper_factory. A single worker runs inline on
+    the calling thread. If process_item raises, the remaining workers stop
+    pulling new items and the first error is re-raised after every worker's
+    scraper has been closed.
+
+    Returns one BatchRunState per worker, in worker order.
+    """
+    worker_count = max(1, min(workers, len(items)))
+    if worker_count == 1:
+        run_state = BatchRunState(scraper=initial_scraper)
+        try:
+            for item in items:
+                process_item(item, run_state)
+        finally:
+            _close_quietly(run_state.scraper)
+        return [run_state]
+
+    pending: queue.SimpleQueue[ItemT] = queue.SimpleQueue()
+    for item in items:
+        pending.put(item)
+    stop = threading.Event()
+
+    def drain(worker_index: int) -> BatchRunState[ScraperT]:
+        try:
+            scraper = initial_scraper if worker_index == 0 else scraper_factory()
+        except Exception:
+            stop.set()
+            raise
+        run_state = BatchRunState(scraper=scraper)
+        try:
+            while not stop.is_set():
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    break
+                process_item(item, run_state)
+        except Exception:
+            stop.set()
+            raise
+        finally:
+            _close_quietly(run_state.scraper)
+        return run_state
+
+    with ThreadPoolExecutor(
+        max_workers=worker_count, thread_name_prefix="scraper-worker"
+    ) as executor:
+        futures = [executor.submit(drain, index) for index in range(worker_count)]
+    return [future.result() for future in futures]
+
+
+def _close_quietly(scraper) -> None:
+    """Closes a worker's scraper; close failures never mask batch outcomes."""
+    with suppress(Exception):
+        scraper.close()
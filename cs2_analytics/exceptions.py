@@ -21,6 +21,10 @@ class MapParseError(ParseError):
     """Raised when a map stats page cannot be parsed."""
 
 
+class SchemaDriftError(ParseError):
+    """Raised when a stage halts because fetched pages no longer match the parser."""
+
+
 class ScrapeError(CS2AnalyticsError):
     """Base exception for scraping failures."""
 
@@ -33,6 +37,10 @@ class SessionScrapeError(RetryableScrapeError):
     """Raised for transient browser/session failures."""
 
 
+class ChallengePageError(SessionScrapeError):
+    """Raised when a fetched page shows bot-challenge markers instead of content."""
+
+
 class ResultsScrapeError(ScrapeError):
     """Raised when the results stage cannot scrape match discovery data."""
 
@@ -73,6 +81,10 @@ class PlayerStorageError(StorageError):
     """Raised when player records cannot be stored."""
 
 
+class PageArchiveError(StorageError):
+    """Raised when a raw page cannot be written to or read from the archive."""
+
+
 class IngestionStateError(CS2AnalyticsError):
     """Base exception for ingestion-state operation failures."""
 
@@ -17,6 +17,10 @@ class BaseIngestionState[IdT: (int, str)]:
     - table_name: the DB table to use
     - id_field: the primary key field
     - url_field: the URL field name (e.g. match_url, map_url, demo_url)
+
+    The per-item statements (fetch, queue and the processing, processed
+    and failed transitions) run as server-side prepared statements, named
+    per table through statement_name().
     """
 
     def __init__(
@@ -36,6 +40,10 @@ class BaseIngestionState[IdT: (int, str)]:
         """Return the shared database instance when an operation needs it."""
         return get_db()
 
+    def statement_name(self, action: str) -> str:
+        """Prepared-statement name for action on this table."""
+        return f"{self.table_name}_{action}"
+
     def fetch(self, limit: int = 25) -> list[tuple[IdT, str]]:
         """Fetches discovered items from the ingestion state table."""
         query = f"""
@@ -47,7 +55,9 @@ class BaseIngestionState[IdT: (int, str)]:
         """
         try:
             with self.db.get_cursor() as cur:
-                cur.execute(query, (limit,))
+                self.db.execute_prepared(
+                    cur, self.statement_name("fetch"), query, (limit,)
+                )
                 rows: list[tuple[IdT, str]] = cur.fetchall()
                 return rows
         except Exception as e:
@@ -55,6 +65,28 @@ class BaseIngestionState[IdT: (int, str)]:
                 f"Failed to fetch discovered items from {self.table_name}."
             ) from e
 
+    def fetch_known_ids(self, ids: list[IdT]) -> set[IdT]:
+        """Returns the subset of ids that already have an ingestion state row.
+
+        One set-membership query regardless of status, so discovery can
+        tell already-seen items from new ones without upserting them.
+        """
+        if not ids:
+            return set()
+        query = f"""
+        SELECT {self.id_field}
+        FROM {self.table_name}
+        WHERE {self.id_field} = ANY(%s);
+        """
+        try:
+            with self.db.get_cursor() as cur:
+                cur.execute(query, (list(ids),))
+                return {row[0] for row in cur.fetchall()}
+        except Exception as e:
+            raise self.error_cls(
+                f"Failed to look up known items in {self.table_name}."
+            ) from e
+
     def queue(
         self,
         id_value: IdT,
@@ -87,12 +119,13 @@ class BaseIngestionState[IdT: (int, str)]:
             last_updated_at = EXCLUDED.last_updated_at;
         """
         params = (id_value, url, source, priority, now, now, now)
+        name = self.statement_name("queue")
         try:
             if cur is not None:
-                cur.execute(query, params)
+                self.db.execute_prepared(cur, name, query, params)
             else:
                 with self.db.get_cursor() as own_cur:
-                    own_cur.execute(query, params)
+                    self.db.execute_prepared(own_cur, name, query, params)
         except Exception as e:
             raise self.error_cls(
                 f"Failed to record ingestion state item in {self.table_name}."
@@ -151,7 +184,12 @@ class BaseIngestionState[IdT: (int, str)]:
         """
         try:
             with self.db.get_cursor() as cur:
-                cur.execute(query, (now, now, id_value))
+                self.db.execute_prepared(
+                    cur,
+                    self.statement_name("mark_processing"),
+                    query,
+                    (now, now, id_value),
+                )
         except Exception as e:
             raise self.error_cls(
                 f"Failed to mark item as processing in {self.table_name}."
@@ -175,12 +213,13 @@ class BaseIngestionState[IdT: (int, str)]:
         WHERE {self.id_field} = %s;
         """
         params = (now, now, id_value)
+        name = self.statement_name("mark_processed")
         try:
             if cur is not None:
-                cur.execute(query, params)
+                self.db.execute_prepared(cur, name, query, params)
             else:
                 with self.db.get_cursor() as own_cur:
-                    own_cur.execute(query, params)
+                    self.db.execute_prepared(own_cur, name, query, params)
         except Exception as e:
             raise self.error_cls(
                 f"Failed to mark item as processed in {self.table_name}."
@@ -200,7 +239,12 @@ class BaseIngestionState[IdT: (int, str)]:
         """
         try:
             with self.db.get_cursor() as cur:
-                cur.execute(query, (now, now, reason, id_value))
+                self.db.execute_prepared(
+                    cur,
+                    self.statement_name("mark_failed"),
+                    query,
+                    (now, now, reason, id_value),
+                )
         except Exception as e:
             raise self.error_cls(
                 f"Failed to mark item as failed in {self.table_name}."
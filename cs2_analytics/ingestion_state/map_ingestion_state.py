@@ -38,6 +38,31 @@ class MapIngestionState(BaseIngestionState[int]):
                 "Failed to fetch discovered map items with match context."
             ) from e
 
+    def fetch_match_context(
+        self, map_ids: list[int]
+    ) -> dict[int, tuple[int | None, int | None]]:
+        """Map each known map id to its (match_id, map_order) context.
+
+        Used by offline replay, which starts from archived pages rather than
+        discovered rows and so needs the parent context in one lookup.
+        """
+        if not map_ids:
+            return {}
+        query = """
+        SELECT map_id, match_id, map_order
+        FROM map_ingestion_state
+        WHERE map_id = ANY(%s);
+        """
+        try:
+            with self.db.get_cursor() as cur:
+                cur.execute(query, (list(map_ids),))
+                rows: list[tuple[int, int | None, int | None]] = cur.fetchall()
+        except Exception as e:
+            raise self.error_cls(
+                "Failed to fetch match context for map ingestion items."
+            ) from e
+        return {map_id: (match_id, map_order) for map_id, match_id, map_order in rows}
+
     def queue(
         self,
         id_value: int,
@@ -85,12 +110,13 @@ class MapIngestionState(BaseIngestionState[int]):
             now,
             now,
         )
+        name = self.statement_name("queue")
         try:
             if cur is not None:
-                cur.execute(query, params)
+                self.db.execute_prepared(cur, name, query, params)
             else:
                 with self.db.get_cursor() as own_cur:
-                    own_cur.execute(query, params)
+                    self.db.execute_prepared(own_cur, name, query, params)
         except Exception as e:
             raise self.error_cls(
                 "Failed to record ingestion state item in map_ingestion_state."
@@ -4,6 +4,10 @@ import datetime as dt
 
 from cs2_analytics.exceptions import MatchIngestionStateError
 from cs2_analytics.ingestion_state.base_ingestion_state import BaseIngestionState
+from cs2_analytics.models.result_listing import ResultListing
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
 
 
 class MatchIngestionState(BaseIngestionState[int]):
@@ -37,3 +41,148 @@ class MatchIngestionState(BaseIngestionState[int]):
             raise self.error_cls(
                 "Failed to mark item as partial in match_ingestion_state."
             ) from e
+
+    def record_listings(
+        self,
+        listings: list[ResultListing],
+        source: str = "unknown",
+        *,
+        forfeit_priority: int = 0,
+    ) -> None:
+        """Adds or refreshes discovered matches with their listing header data.
+
+        Like record_many, plus the listing columns; a refresh keeps stored
+        header values the new listing lacks. Forfeits are queued at
+        forfeit_priority and every other match at priority 0.
+        """
+        if not listings:
+            return
+
+        query = """
+        INSERT INTO match_ingestion_state (
+            match_id, match_url, status, source, priority,
+            first_seen_at, last_seen_at, last_updated_at,
+            listing_team1, listing_team2, listing_score1, listing_score2,
+            listing_event, listing_format, listing_forfeit, listing_date
+        )
+        VALUES (
+            %s, %s, 'discovered', %s, %s, %s, %s, %s,
+            %s, %s, %s, %s, %s, %s, %s, %s
+        )
+        ON CONFLICT (match_id) DO UPDATE
+        SET match_url = EXCLUDED.match_url,
+            source = EXCLUDED.source,
+            priority = GREATEST(
+                COALESCE(match_ingestion_state.priority, 0),
+                EXCLUDED.priority
+            ),
+            last_seen_at = EXCLUDED.last_seen_at,
+            last_updated_at = EXCLUDED.last_updated_at,
+            listing_team1 = COALESCE(
+                EXCLUDED.listing_team1, match_ingestion_state.listing_team1
+            ),
+            listing_team2 = COALESCE(
+                EXCLUDED.listing_team2, match_ingestion_state.listing_team2
+            ),
+            listing_score1 = COALESCE(
+                EXCLUDED.listing_score1, match_ingestion_state.listing_score1
+            ),
+            listing_score2 = COALESCE(
+                EXCLUDED.listing_score2, match_ingestion_state.listing_score2
+            ),
+            listing_event = COALESCE(
+                EXCLUDED.listing_event, match_ingestion_state.listing_event
+            ),
+            listing_format = COALESCE(
+                EXCLUDED.listing_format, match_ingestion_state.listing_format
+            ),
+            listing_forfeit = EXCLUDED.listing_forfeit,
+            listing_date = COALESCE(
+                EXCLUDED.listing_date, match_ingestion_state.listing_date
+            );
+        """
+
+        now = dt.datetime.now()
+        values = [
+            (
+                listing.match_id,
+                listing.match_url,
+                source,
+                forfeit_priority if listing.forfeit else 0,
+                now,
+                now,
+                now,
+                listing.team1,
+                listing.team2,
+                listing.score1,
+                listing.score2,
+                listing.event,
+                listing.match_format,
+                listing.forfeit,
+                listing.listed_date,
+            )
+            for listing in listings
+        ]
+
+        try:
+            with self.db.get_cursor() as cur:
+                cur.executemany(query, values)
+                logger.info(
+                    "Recorded or refreshed %d listed matches in match_ingestion_state",
+                    len(listings),
+                )
+        except Exception as e:
+            raise self.error_cls(
+                "Failed to record listed matches in match_ingestion_state."
+            ) from e
+
+    def fetch_listed_forfeits(self, limit: int = 25) -> list[ResultListing]:
+        """Fetches discovered forfeits whose listing header data is complete."""
+        query = """
+        SELECT match_id, match_url, listing_team1, listing_team2,
+               listing_score1, listing_score2, listing_event, listing_format,
+               listing_date
+        FROM match_ingestion_state
+        WHERE status = 'discovered'
+          AND listing_forfeit
+          AND listing_team1 IS NOT NULL
+          AND listing_team2 IS NOT NULL
+          AND listing_score1 IS NOT NULL
+          AND listing_score2 IS NOT NULL
+          AND listing_date IS NOT NULL
+        ORDER BY priority DESC, first_seen_at ASC
+        LIMIT %s;
+        """
+        try:
+            with self.db.get_cursor() as cur:
+                cur.execute(query, (limit,))
+                rows = cur.fetchall()
+        except Exception as e:
+            raise self.error_cls(
+                "Failed to fetch listed forfeits from match_ingestion_state."
+            ) from e
+        return [
+            ResultListing(
+                match_id=match_id,
+                match_url=match_url,
+                team1=team1,
+                team2=team2,
+                score1=score1,
+                score2=score2,
+                event=event,
+                match_format=match_format,
+                forfeit=True,
+                listed_date=listed_date,
+            )
+            for (
+                match_id,
+                match_url,
+                team1,
+                team2,
+                score1,
+                score2,
+                event,
+                match_format,
+                listed_date,
+            ) in rows
+        ]
@@ -3,5 +3,7 @@
 from .map import Map
 from .match import Match
 from .player import Player
+from .player_batch import PlayerBatch
+from .result_listing import ResultListing
 
-__all__ = ["Match", "Player", "Map"]
+__all__ = ["Match", "Player", "PlayerBatch", "Map", "ResultListing"]
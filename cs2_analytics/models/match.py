@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 type MatchDictValue = (
-    int | str | bool | datetime | list[tuple[int, str]] | list[tuple[str, str]]
+    int | str | bool | datetime | list[tuple[int, str]] | list[tuple[str, str]] | None
 )
 
 
@@ -22,7 +22,7 @@ class Match:
     score2: int
     winner: str
     event: str
-    match_type: str
+    match_type: str | None
     forfeit: bool
     date: str
     last_inserted_at: datetime
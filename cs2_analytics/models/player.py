@@ -1,12 +1,16 @@
-""" "Module to represent a player in a match."""
+"""Module to represent a player in a match."""
 
 from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
-    """ "Class to represent a player in a match."""
+    """Class to represent a player in a match.
+
+    Slotted: replay and backfill hold hundreds of thousands of these, and a
+    per-instance __dict__ would roughly double each row's footprint.
+    """
 
     map_id: int
     player_id: int
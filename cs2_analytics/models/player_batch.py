@@ -0,0 +1,80 @@
+"""This module defines PlayerBatch, a columnar batch of player stat rows."""
+
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import fields
+from datetime import datetime
+
+from cs2_analytics.models.player import Player
+
+# Column order follows the Player fields, which is also the players table's
+# insert order in storage/player_storage.py.
+PLAYER_COLUMNS: tuple[str, ...] = tuple(field.name for field in fields(Player))
+# Numeric stat columns are packed into typed arrays; text, timestamp and
+# flag columns stay in lists.
+_ARRAY_TYPECODES: dict[object, str] = {int: "q", float: "d"}
+
+type PlayerColumn = array | list[str] | list[datetime] | list[bool]
+
+
+def _empty_column(field_type: object) -> PlayerColumn:
+    typecode = _ARRAY_TYPECODES.get(field_type)
+    return array(typecode) if typecode else []
+
+
+class PlayerBatch:
+    """Player rows stored column by column for bulk writes.
+
+    MapParser appends each parsed row to a batch and storage writes
+    positional rows straight out of it, so a parsed page holds one array or
+    list per column rather than an object per row, and no dict is built per
+    row. Integer stats are held as 64-bit ints and float stats as doubles,
+    one array per column.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self) -> None:
+        self._columns: dict[str, PlayerColumn] = {
+            field.name: _empty_column(field.type) for field in fields(Player)
+        }
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player]) -> "PlayerBatch":
+        """Builds a batch from Player rows."""
+        batch = cls()
+        for player in players:
+            batch.append(player)
+        return batch
+
+    @classmethod
+    def concat(cls, batches: Iterable["PlayerBatch"]) -> "PlayerBatch":
+        """Joins batches in order, copying whole columns at a time."""
+        joined = cls()
+        for batch in batches:
+            for name, column in joined._columns.items():
+                column.extend(batch._columns[name])  # type: ignore[arg-type]
+        return joined
+
+    def append(self, player: Player) -> None:
+        """Adds one player row to the end of every column."""
+        for name, column in self._columns.items():
+            column.append(getattr(player, name))
+
+    def column(self, name: str) -> PlayerColumn:
+        """Returns one column's values, in row order."""
+        return self._columns[name]
+
+    def rows(self) -> Iterator[tuple]:
+        """Yields each row as a tuple in PLAYER_COLUMNS order."""
+        return zip(*self._columns.values(), strict=True)
+
+    def __len__(self) -> int:
+        return len(self._columns["map_id"])
+
+    def __getitem__(self, index: int) -> Player:
+        row: tuple = tuple(column[index] for column in self._columns.values())
+        return Player(*row)
+
+    def __iter__(self) -> Iterator[Player]:
+        return (Player(*row) for row in self.rows())
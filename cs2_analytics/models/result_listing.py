@@ -0,0 +1,35 @@
+"""This module defines ResultListing, one match row on an HLTV results page."""
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True)
+class ResultListing:
+    """A discovered match link with the header data the results listing shows.
+
+    Header fields are None when the listing row lacks them. match_format is
+    the normalized best-of value (bo1, bo3, bo5); forfeits list no format.
+    """
+
+    match_id: int
+    match_url: str
+    team1: str | None = None
+    team2: str | None = None
+    score1: int | None = None
+    score2: int | None = None
+    event: str | None = None
+    match_format: str | None = None
+    forfeit: bool = False
+    listed_date: date | None = None
+
+    @property
+    def has_header(self) -> bool:
+        """True when teams, scores and date are all known from the listing."""
+        return None not in (
+            self.team1,
+            self.team2,
+            self.score1,
+            self.score2,
+            self.listed_date,
+        )
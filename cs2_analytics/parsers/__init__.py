@@ -1,6 +1,7 @@
-"""Parsing modules for match and map stats pages."""
+"""Parsing modules for match, map stats and results listing pages."""
 
 from .map_parser import MapParser
 from .match_parser import MatchParser
+from .results_parser import ResultsParser
 
-__all__ = ["MatchParser", "MapParser"]
+__all__ = ["MatchParser", "MapParser", "ResultsParser"]
@@ -0,0 +1,145 @@
+"""Adapter from in-browser map page extraction to what MapParser reads.
+
+With in-browser extraction on, the map scraper runs a small script in the
+rendered page and gets back only the stats tables, the match info box text,
+the date and the mapstatsid links as JSON, instead of serializing the whole
+DOM for BeautifulSoup. ExtractedMapPage validates that payload, and its
+cells answer the few Tag calls MapParser's row logic makes (`get("class")`,
+`get_text`, `find("a")`), so both paths share the same row, score and map
+logic. A payload missing anything the parser needs is rejected, and the
+scraper falls back to the HTML path.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from cs2_analytics.exceptions import MapParseError
+
+
+@dataclass(frozen=True)
+class ExtractedLink:
+    """An anchor from a stats cell: its raw href and text nodes."""
+
+    href: str | None
+    strings: tuple[str, ...] = ()
+
+    @property
+    def attrs(self) -> dict[str, str]:
+        return {"href": self.href} if self.href is not None else {}
+
+    def __getitem__(self, name: str) -> str:
+        return self.attrs[name]
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return _join_strings(self.strings, separator, strip)
+
+
+@dataclass(frozen=True)
+class ExtractedCell:
+    """One stats table cell: classes, stripped text nodes and first link."""
+
+    classes: tuple[str, ...] = ()
+    strings: tuple[str, ...] = ()
+    link: ExtractedLink | None = None
+
+    def get(self, name: str, default: object = None) -> object:
+        if name == "class" and self.classes:
+            return list(self.classes)
+        return default
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return _join_strings(self.strings, separator, strip)
+
+    def find(self, name: str) -> ExtractedLink | None:
+        return self.link if name == "a" else None
+
+
+@dataclass(frozen=True)
+class ExtractedTable:
+    """One `table.stats-table`: classes, team heading, header texts and rows."""
+
+    classes: tuple[str, ...]
+    team_name: str | None
+    headers: tuple[str, ...]
+    rows: list[list[ExtractedCell]] | None
+
+
+@dataclass(frozen=True)
+class ExtractedMapPage:
+    """The parts of a map stats page MapParser reads, captured in the browser."""
+
+    map_name: str
+    info_box_tokens: list[str]
+    date_unix: str
+    tables: list[ExtractedTable]
+    map_stats_hrefs: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_payload(cls, payload: object) -> "ExtractedMapPage":  # noqa: UP037
+        """Builds a page from the extraction script's JSON result.
+
+        Raises MapParseError when the payload is malformed or lacks the map
+        name, date or stats tables, so the caller can fall back to HTML.
+        """
+        if not isinstance(payload, Mapping):
+            raise MapParseError("In-browser map extraction returned no payload.")
+        try:
+            map_name = payload["mapName"]
+            date_unix = payload["dateUnix"]
+            tables = [_table_from_payload(table) for table in payload["tables"]]
+            info_box_tokens = [str(token) for token in payload["infoBoxTokens"]]
+            map_stats_hrefs = [str(href) for href in payload["mapStatsHrefs"]]
+        except (KeyError, TypeError) as e:
+            raise MapParseError(
+                f"In-browser map extraction returned a malformed payload: {e}"
+            ) from e
+        if not map_name or not date_unix or not tables:
+            raise MapParseError(
+                "In-browser map extraction found no map name, date or stats tables."
+            )
+        return cls(
+            map_name=str(map_name),
+            info_box_tokens=info_box_tokens,
+            date_unix=str(date_unix),
+            tables=tables,
+            map_stats_hrefs=map_stats_hrefs,
+        )
+
+    def visible_stat_tables(self) -> list[ExtractedTable]:
+        """Returns the totals tables (or all stats tables) that are not hidden."""
+        tables = [table for table in self.tables if "totalstats" in table.classes]
+        if not tables:
+            tables = self.tables
+        if not tables:
+            raise MapParseError("No player stats tables found on map page.")
+        return [table for table in tables if "hidden" not in table.classes]
+
+
+def _table_from_payload(table: Mapping) -> ExtractedTable:
+    rows = table["rows"]
+    return ExtractedTable(
+        classes=tuple(table["classes"]),
+        team_name=table["teamName"],
+        headers=tuple(table["headers"]),
+        rows=None
+        if rows is None
+        else [[_cell_from_payload(cell) for cell in row] for row in rows],
+    )
+
+
+def _cell_from_payload(cell: Mapping) -> ExtractedCell:
+    link = cell["link"]
+    return ExtractedCell(
+        classes=tuple(cell["classes"]),
+        strings=tuple(cell["strings"]),
+        link=None
+        if link is None
+        else ExtractedLink(href=link["href"], strings=tuple(link["strings"])),
+    )
+
+
+def _join_strings(strings: tuple[str, ...], separator: str, strip: bool) -> str:
+    """Mirrors Tag.get_text over text nodes the script already stripped."""
+    if strip:
+        return separator.join(string for string in strings if string)
+    return separator.join(strings)
@@ -2,28 +2,101 @@
 
 import datetime as dt
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
 from cs2_analytics.exceptions import MapParseError
 from cs2_analytics.models.map import Map
 from cs2_analytics.models.player import Player
+from cs2_analytics.models.player_batch import PlayerBatch
+from cs2_analytics.parsers.extracted_map import ExtractedMapPage
+from cs2_analytics.parsers.parse_backend import PageRegion, PageRegions
 from cs2_analytics.utils.log_manager import get_logger
 
 logger = get_logger(__name__)
 
+PAIR_PATTERN = re.compile(r"(\d+)\s*\((\d+)\)")
+FIRST_INT_PATTERN = re.compile(r"(\d+)")
+SIGNED_INT_PATTERN = re.compile(r"-?\d+")
+COLON_PAIR_PATTERN = re.compile(r"(\d+)\s*:\s*(\d+)")
+PERCENT_PATTERN = re.compile(r"([+-]?\d+(?:\.\d+)?)\s*%")
+PLAYER_ID_PATTERN = re.compile(r"/(\d+)/")
+MAP_ID_PATTERN = re.compile(r"/mapstatsid/(\d+)")
+HEADER_NOISE_PATTERN = re.compile(r"[^a-z0-9.]")
+SCORE_TOKEN_PATTERN = re.compile(r"\d+")
+PAGE_DATE_PATTERN = re.compile(r"\b(\d{4}-\d{2}-\d{2})(?:\s+(\d{1,2}:\d{2}))?\b")
+
+# Header aliases per stat column, with the index used when no header matches.
+COLUMN_HEADER_ALIASES: dict[str, tuple[tuple[str, ...], int]] = {
+    "opkd": (("op.k-d", "opkd", "op.kd"), 1),
+    "mks": (("mks",), 2),
+    "kast": (("kast",), 4),
+    "clutches": (("1vsx", "clutches"), 6),
+    "kills": (("k(hs)", "khs", "kills"), 7),
+    "assists": (("a(f)", "af", "assists"), 9),
+    "deaths": (("d(t)", "dt", "d(q)", "dq", "deaths", "d"), 10),
+    "adr": (("adr",), 12),
+    "round_swing": (("swing", "roundswing"), 16),
+    "rating": (
+        ("rating3.0", "rating30", "rating2.1", "rating2.0", "rating", "rt"),
+        17,
+    ),
+}
+# Stats pages share a handful of header layouts, so resolved column indexes
+# are memoized by header signature; the bound only guards against churn.
+COLUMN_LAYOUT_CACHE_SIZE = 64
+
+
+def normalize_header(value: str) -> str:
+    """Lowercases a header and drops everything but letters, digits and dots."""
+    return HEADER_NOISE_PATTERN.sub("", value.lower())
+
+
+@lru_cache(maxsize=COLUMN_LAYOUT_CACHE_SIZE)
+def resolve_column_indexes(header_signature: tuple[str, ...]) -> Mapping[str, int]:
+    """Resolves stat column indexes for a table's header texts, in order."""
+    column_map: dict[str, int] = {}
+    for idx, text in enumerate(header_signature):
+        if not text:
+            continue
+        header = normalize_header(text)
+        if header not in column_map:
+            column_map[header] = idx
+
+    column_indexes = {}
+    for column, (aliases, default) in COLUMN_HEADER_ALIASES.items():
+        column_indexes[column] = default
+        for alias in aliases:
+            normalized = normalize_header(alias)
+            if normalized in column_map:
+                column_indexes[column] = column_map[normalized]
+                break
+    return MappingProxyType(column_indexes)
+
 
 @dataclass(frozen=True)
 class ParsedMap:
     """Map-level metadata and player rows parsed from one map stats page."""
 
     map: Map
-    players: list[Player]
+    players: PlayerBatch
 
 
 class MapParser:
     """Extracts player stats from a map stats page."""
 
-    def parse_map(self, soup, map_url: str, map_id: int) -> list[Player]:
+    # The info box holds map name, teams, scores and date; the mapstatsid
+    # links give map order when discovery did not.
+    page_regions = PageRegions(
+        PageRegion("div", css_class="match-info-box"),
+        PageRegion("div", css_class="date"),
+        PageRegion("table", css_class="stats-table"),
+        PageRegion("a", href_contains="/stats/matches/mapstatsid/"),
+    )
+
+    def parse_map(self, soup, map_url: str, map_id: int) -> PlayerBatch:
         """Extracts player object from a map stats page."""
         logger.info("Parsing %s for player stats", map_url)
         try:
@@ -53,7 +126,14 @@ class MapParser:
         match_id: int | None,
         map_order: int | None,
     ) -> ParsedMap:
-        """Extracts map metadata and player objects from a map stats page."""
+        """Extracts map metadata and player objects from a map stats page.
+
+        `soup` may also be an ExtractedMapPage captured in the browser.
+        """
+        if isinstance(soup, ExtractedMapPage):
+            return self.parse_extracted_map_details(
+                soup, map_url, map_id, match_id=match_id, map_order=map_order
+            )
         logger.info("Parsing %s for player stats", map_url)
         try:
             map_id_value = self._resolve_map_id(map_id)
@@ -83,6 +163,66 @@ class MapParser:
         logger.info("Extracted %s player stats from %s", len(players), map_url)
         return ParsedMap(map=parsed_map, players=players)
 
+    def parse_extracted_map_details(
+        self,
+        page: ExtractedMapPage,
+        map_url: str,
+        map_id: int,
+        *,
+        match_id: int | None,
+        map_order: int | None,
+    ) -> ParsedMap:
+        """Extracts map metadata and player objects from an in-browser extraction."""
+        logger.info("Parsing %s for player stats from in-browser extraction", map_url)
+        try:
+            map_id_value = self._resolve_map_id(map_id)
+            tables = page.visible_stat_tables()
+            team_names: list[str] = []
+            players = PlayerBatch()
+            for table in tables:
+                team_name = (
+                    table.team_name.strip()
+                    if table.team_name is not None
+                    else "Unknown"
+                )
+                if team_name != "Unknown" and team_name not in team_names:
+                    team_names.append(team_name)
+                if table.rows is None:
+                    logger.warning("Skipping table without tbody in %s", map_url)
+                    continue
+                self._extract_table_players(
+                    players,
+                    rows=table.rows,
+                    map_id_value=map_id_value,
+                    map_name=page.map_name,
+                    team_name=team_name,
+                    column_indexes=resolve_column_indexes(table.headers),
+                )
+            if len(team_names) < 2:
+                raise MapParseError("Failed to extract map teams from map stats page.")
+
+            resolved_match_id = self._require_match_id(match_id)
+            parsed_map = self._assemble_map(
+                map_id_value=map_id_value,
+                map_url=map_url,
+                match_id=resolved_match_id,
+                map_order=map_order
+                or self._map_order_from_hrefs(
+                    page.map_stats_hrefs, map_url=map_url, map_id_value=map_id_value
+                ),
+                map_name=page.map_name,
+                team_scores=self._scores_from_tokens(page.info_box_tokens, team_names),
+                date=self._format_unix_date(page.date_unix),
+            )
+
+        except MapParseError:
+            raise
+        except Exception as e:
+            raise MapParseError(f"Failed to parse map stats page: {map_url}") from e
+
+        logger.info("Extracted %s player stats from %s", len(players), map_url)
+        return ParsedMap(map=parsed_map, players=players)
+
     def _resolve_map_id(self, map_id: int) -> int:
         """Resolves the numeric map identifier from the explicit id or URL."""
         return map_id
@@ -108,9 +248,9 @@ class MapParser:
 
     def _extract_players_from_tables(
         self, *, soup, map_url: str, map_id_value: int, map_name: str
-    ) -> list[Player]:
+    ) -> PlayerBatch:
         """Extracts parsed player rows from each visible stats table."""
-        players: list[Player] = []
+        players = PlayerBatch()
 
         for table in self._iter_visible_stat_tables(soup):
             team_name = self._extract_team_name(table)
@@ -120,58 +260,63 @@ class MapParser:
                 logger.warning("Skipping table without tbody in %s", map_url)
                 continue
 
-            for row in tbody.find_all("tr"):
-                player = self._parse_player_row(
-                    row=row,
-                    map_id_value=map_id_value,
-                    map_name=map_name,
-                    team_name=team_name,
-                    column_indexes=column_indexes,
-                )
-                if player is None:
-                    continue
-                logger.debug("Extracted stats for player: %s", player.player_name)
-                players.append(player)
+            self._extract_table_players(
+                players,
+                rows=(row.find_all("td") for row in tbody.find_all("tr")),
+                map_id_value=map_id_value,
+                map_name=map_name,
+                team_name=team_name,
+                column_indexes=column_indexes,
+            )
 
         return players
 
-    def _build_column_indexes(self, table) -> dict[str, int]:
+    def _extract_table_players(
+        self,
+        players: PlayerBatch,
+        *,
+        rows,
+        map_id_value: int,
+        map_name: str,
+        team_name: str,
+        column_indexes: Mapping[str, int],
+    ) -> None:
+        """Appends the player rows of one stats table, given each row's cells."""
+        for cols in rows:
+            player = self._parse_player_row(
+                cols=cols,
+                map_id_value=map_id_value,
+                map_name=map_name,
+                team_name=team_name,
+                column_indexes=column_indexes,
+            )
+            if player is None:
+                continue
+            logger.debug("Extracted stats for player: %s", player.player_name)
+            players.append(player)
+
+    def _build_column_indexes(self, table) -> Mapping[str, int]:
         """Builds the column indexes used to parse a stats table row."""
-        column_map = self._build_column_map(table)
-        return {
-            "opkd": self._pick_column_index(column_map, ["op.k-d", "opkd", "op.kd"], 1),
-            "mks": self._pick_column_index(column_map, ["mks"], 2),
-            "kast": self._pick_column_index(column_map, ["kast"], 4),
-            "clutches": self._pick_column_index(column_map, ["1vsx", "clutches"], 6),
-            "kills": self._pick_column_index(column_map, ["k(hs)", "khs", "kills"], 7),
-            "assists": self._pick_column_index(
-                column_map, ["a(f)", "af", "assists"], 9
-            ),
-            "deaths": self._pick_column_index(
-                column_map, ["d(t)", "dt", "d(q)", "dq", "deaths", "d"], 10
-            ),
-            "adr": self._pick_column_index(column_map, ["adr"], 12),
-            "round_swing": self._pick_column_index(
-                column_map, ["swing", "roundswing"], 16
-            ),
-            "rating": self._pick_column_index(
-                column_map,
-                ["rating3.0", "rating30", "rating2.1", "rating2.0", "rating", "rt"],
-                17,
-            ),
-        }
+        return resolve_column_indexes(self._header_signature(table))
+
+    def _header_signature(self, table) -> tuple[str, ...]:
+        """Returns the table's header texts in column order."""
+        return tuple(
+            th.get_text(" ", strip=True)
+            for thead in table.find_all("thead")
+            for th in thead.find_all("th")
+        )
 
     def _parse_player_row(
         self,
         *,
-        row,
+        cols,
         map_id_value: int,
         map_name: str,
         team_name: str,
-        column_indexes: dict[str, int],
+        column_indexes: Mapping[str, int],
     ) -> Player | None:
-        """Parses a single player row into a Player model."""
-        cols = row.find_all("td")
+        """Parses a single player row's cells into a Player model."""
         if not cols:
             return None
 
@@ -199,14 +344,40 @@ class MapParser:
         team_scores: tuple[tuple[str, int], tuple[str, int]],
     ) -> Map:
         """Builds one relational map row from parsed map-level metadata."""
-        if match_id is None:
-            raise MapParseError("Missing parent match id for map persistence.")
-
+        resolved_match_id = self._require_match_id(match_id)
         resolved_map_order = map_order or self._extract_map_order(
             soup=soup,
             map_url=map_url,
             map_id_value=map_id_value,
         )
+        return self._assemble_map(
+            map_id_value=map_id_value,
+            map_url=map_url,
+            match_id=resolved_match_id,
+            map_order=resolved_map_order,
+            map_name=map_name,
+            team_scores=team_scores,
+            date=self._extract_map_date(soup),
+        )
+
+    def _require_match_id(self, match_id: int | None) -> int:
+        """Returns the parent match id a persisted map row requires."""
+        if match_id is None:
+            raise MapParseError("Missing parent match id for map persistence.")
+        return match_id
+
+    def _assemble_map(
+        self,
+        *,
+        map_id_value: int,
+        map_url: str,
+        match_id: int,
+        map_order: int,
+        map_name: str,
+        team_scores: tuple[tuple[str, int], tuple[str, int]],
+        date: str,
+    ) -> Map:
+        """Builds the Map model once every map-level field is resolved."""
         (team1_name, team1_score), (team2_name, team2_score) = team_scores
         map_winner = team1_name if team1_score > team2_score else team2_name
         now = dt.datetime.now(dt.UTC)
@@ -216,11 +387,11 @@ class MapParser:
             match_id=match_id,
             map_url=map_url,
             map_name=map_name,
-            map_order=resolved_map_order,
+            map_order=map_order,
             team1_score=team1_score,
             team2_score=team2_score,
             map_winner=map_winner,
-            date=self._extract_map_date(soup),
+            date=date,
             inserted_at=now,
             last_scraped_at=now,
             last_updated_at=now,
@@ -246,7 +417,7 @@ class MapParser:
         return None
 
     def _extract_player_stats(
-        self, cols, column_indexes: dict[str, int]
+        self, cols, column_indexes: Mapping[str, int]
     ) -> dict[str, int | float]:
         """Extracts parsed combat and utility stats from a player row."""
         kills, headshots = self._extract_kills(cols, column_indexes["kills"])
@@ -407,9 +578,6 @@ class MapParser:
             data_complete=True,
         )
 
-    def _normalize_header(self, value: str) -> str:
-        return re.sub(r"[^a-z0-9.]", "", value.lower())
-
     def _extract_map_name(self, soup) -> str:
         """Extracts the map name from the match info box."""
         match_box = soup.find("div", class_="match-info-box")
@@ -432,21 +600,10 @@ class MapParser:
         """Extracts the map date as a timestamp-compatible string."""
         date_tag = soup.find("div", class_="date")
         if date_tag and date_tag.has_attr("data-unix"):
-            try:
-                return dt.datetime.fromtimestamp(
-                    int(date_tag["data-unix"]) / 1000,
-                    tz=dt.UTC,
-                ).strftime("%Y-%m-%d %H:%M:%S")
-            except (TypeError, ValueError, OSError, OverflowError) as e:
-                raise MapParseError(
-                    "Failed to extract map date from map stats page."
-                ) from e
+            return self._format_unix_date(date_tag["data-unix"])
 
         page_text = soup.get_text(" ", strip=True)
-        date_match = re.search(
-            r"\b(\d{4}-\d{2}-\d{2})(?:\s+(\d{1,2}:\d{2}))?\b",
-            page_text,
-        )
+        date_match = PAGE_DATE_PATTERN.search(page_text)
         if date_match:
             if date_match.group(2):
                 return f"{date_match.group(1)} {date_match.group(2)}:00"
@@ -454,6 +611,18 @@ class MapParser:
 
         raise MapParseError("Failed to extract map date from map stats page.")
 
+    def _format_unix_date(self, unix_millis: str) -> str:
+        """Formats a `data-unix` millisecond timestamp as a UTC timestamp string."""
+        try:
+            return dt.datetime.fromtimestamp(
+                int(unix_millis) / 1000,
+                tz=dt.UTC,
+            ).strftime("%Y-%m-%d %H:%M:%S")
+        except (TypeError, ValueError, OSError, OverflowError) as e:
+            raise MapParseError(
+                "Failed to extract map date from map stats page."
+            ) from e
+
     def _extract_map_team_scores(self, soup) -> tuple[tuple[str, int], tuple[str, int]]:
         """Extracts the two map teams and scores in page order."""
         match_box = soup.find("div", class_="match-info-box")
@@ -464,7 +633,13 @@ class MapParser:
         if len(team_names) < 2:
             raise MapParseError("Failed to extract map teams from map stats page.")
 
-        tokens = [text.strip() for text in match_box.stripped_strings if text.strip()]
+        return self._scores_from_tokens(match_box.stripped_strings, team_names)
+
+    def _scores_from_tokens(
+        self, strings, team_names: list[str]
+    ) -> tuple[tuple[str, int], tuple[str, int]]:
+        """Pairs the first two teams with the score following each in the info box."""
+        tokens = [text.strip() for text in strings if text.strip()]
         scores: list[tuple[str, int]] = []
         for team_name in team_names[:2]:
             score = self._find_score_after_team(tokens, team_name)
@@ -491,7 +666,7 @@ class MapParser:
             ) from e
 
         for token in tokens[start_index + 1 :]:
-            if re.fullmatch(r"\d+", token):
+            if SCORE_TOKEN_PATTERN.fullmatch(token):
                 return int(token)
             if token in ("Breakdown", "Team rating 2.1", "First kills", "Clutches won"):
                 break
@@ -500,9 +675,21 @@ class MapParser:
 
     def _extract_map_order(self, *, soup, map_url: str, map_id_value: int) -> int:
         """Infers map order from mapstats links when discovery did not provide it."""
+        return self._map_order_from_hrefs(
+            [
+                link.get("href", "")
+                for link in soup.select('a[href*="/stats/matches/mapstatsid/"]')
+            ],
+            map_url=map_url,
+            map_id_value=map_id_value,
+        )
+
+    def _map_order_from_hrefs(
+        self, hrefs: list[str], *, map_url: str, map_id_value: int
+    ) -> int:
+        """Infers map order from the page's mapstats links in page order."""
         map_ids: list[int] = []
-        for link in soup.select('a[href*="/stats/matches/mapstatsid/"]'):
-            href = link.get("href", "")
+        for href in hrefs:
             map_id = self._extract_map_id_from_url(href)
             if map_id is not None and map_id not in map_ids:
                 map_ids.append(map_id)
@@ -517,24 +704,11 @@ class MapParser:
         raise MapParseError("Failed to extract map order from map stats page.")
 
     def _extract_map_id_from_url(self, url: str) -> int | None:
-        match = re.search(r"/mapstatsid/(\d+)", url)
+        match = MAP_ID_PATTERN.search(url)
         if match:
             return int(match.group(1))
         return None
 
-    def _build_column_map(self, table) -> dict[str, int]:
-        """Builds a normalized header->index map from table headers."""
-        mapping = {}
-        header_cells = table.select("thead th")
-        for idx, th in enumerate(header_cells):
-            text = th.get_text(" ", strip=True)
-            if not text:
-                continue
-            normalized = self._normalize_header(text)
-            if normalized not in mapping:
-                mapping[normalized] = idx
-        return mapping
-
     def _extract_player_name(self, cols, name_tag) -> str:
         """Extracts a non-empty player name from the first stats cell."""
         player_name: str
@@ -550,16 +724,6 @@ class MapParser:
 
         raise MapParseError("Failed to extract player name from map stats page.")
 
-    def _pick_column_index(
-        self, mapping: dict[str, int], keys: list[str], default: int
-    ) -> int:
-        """Returns the first matching column index from candidate normalized keys."""
-        for key in keys:
-            normalized = self._normalize_header(key)
-            if normalized in mapping:
-                return mapping[normalized]
-        return default
-
     def _column_text_or_empty(self, cols, idx: int) -> str:
         if idx < len(cols):
             return str(cols[idx].get_text(strip=True))
@@ -610,11 +774,11 @@ class MapParser:
 
     def _parse_pair(self, text: str, *, metric: str) -> tuple[int, int]:
         """Parses values like '19(10)' into tuple (19, 10)."""
-        match = re.search(r"(\d+)\s*\((\d+)\)", text)
+        match = PAIR_PATTERN.search(text)
         if match:
             return int(match.group(1)), int(match.group(2))
 
-        single = re.search(r"(\d+)", text)
+        single = FIRST_INT_PATTERN.search(text)
         if single:
             return int(single.group(1)), 0
         raise MapParseError(f"Failed to parse {metric} value: {text!r}")
@@ -626,7 +790,7 @@ class MapParser:
         raise MapParseError(message)
 
     def _extract_numeric_id(self, url: str) -> int:
-        match = re.search(r"/(\d+)/", url)
+        match = PLAYER_ID_PATTERN.search(url)
         if match:
             return int(match.group(1))
         raise MapParseError(f"Failed to extract player id from player URL: {url!r}")
@@ -637,14 +801,14 @@ class MapParser:
         Falls back to zeros with a warning because these secondary stats can
         legitimately render as empty cells.
         """
-        match = re.search(r"(\d+)\s*:\s*(\d+)", text)
+        match = COLON_PAIR_PATTERN.search(text)
         if match:
             return int(match.group(1)), int(match.group(2))
         logger.warning("Could not parse %s from %r; defaulting to 0", metric, text)
         return 0, 0
 
     def _parse_int_value(self, text: str, *, metric: str) -> int:
-        match = re.search(r"-?\d+", text)
+        match = SIGNED_INT_PATTERN.search(text)
         if match:
             return int(match.group(0))
         logger.warning("Could not parse %s from %r; defaulting to 0", metric, text)
@@ -652,7 +816,7 @@ class MapParser:
 
     def _parse_percent_value(self, text: str, *, metric: str) -> float:
         """Parses values like '+14.68%' into 0.1468."""
-        match = re.search(r"([+-]?\d+(?:\.\d+)?)\s*%", text)
+        match = PERCENT_PATTERN.search(text)
         if match:
             return round(float(match.group(1)) / 100, 4)
         logger.warning("Could not parse %s from %r; defaulting to 0", metric, text)
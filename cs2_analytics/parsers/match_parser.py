@@ -6,6 +6,8 @@ from typing import TypedDict
 
 from cs2_analytics.exceptions import MatchParseError
 from cs2_analytics.models.match import Match
+from cs2_analytics.models.result_listing import ResultListing
+from cs2_analytics.parsers.parse_backend import PageRegion, PageRegions
 from cs2_analytics.utils.log_manager import get_logger
 
 logger = get_logger(__name__)
@@ -20,7 +22,7 @@ class _MatchMetadata(TypedDict):
     score2: int
     winner: str
     event: str
-    match_type: str
+    match_type: str | None
     forfeit: bool
     match_date: str
 
@@ -28,6 +30,18 @@ class _MatchMetadata(TypedDict):
 class MatchParser:
     """Parses match metadata from HLTV match pages."""
 
+    page_regions = PageRegions(
+        PageRegion("div", css_class="team1-gradient"),
+        PageRegion("div", css_class="team2-gradient"),
+        PageRegion("div", css_class="teamName"),
+        PageRegion("div", css_class="event"),
+        PageRegion("div", css_class="preformatted-text"),
+        PageRegion("div", css_class="mapname"),
+        PageRegion("div", css_class="date"),
+        PageRegion("a", css_class="results-stats"),
+        PageRegion("a", css_class="stream-box"),
+    )
+
     def parse_match(
         self, soup, match_url: str
     ) -> tuple[Match, list[tuple[int, str]], list[tuple[str, str]]]:
@@ -51,6 +65,50 @@ class MatchParser:
         except (AttributeError, ValueError, TypeError, KeyError) as e:
             raise MatchParseError(f"Failed to parse match page: {match_url}") from e
 
+    def match_from_listing(self, listing: ResultListing) -> Match:
+        """Builds a forfeit's Match from its results listing, without a page load.
+
+        A forfeit has no maps or demos to follow, so the listing header holds
+        everything the match page would add except the best-of format, which
+        the listing replaces with "def". The match is stored with match_type
+        None and data_complete False to record that gap.
+        """
+        if not listing.forfeit:
+            raise MatchParseError(
+                f"Listing for match {listing.match_id} is not a forfeit."
+            )
+        team1, team2 = listing.team1, listing.team2
+        score1, score2 = listing.score1, listing.score2
+        if (
+            team1 is None
+            or team2 is None
+            or score1 is None
+            or score2 is None
+            or not listing.event
+            or listing.listed_date is None
+        ):
+            raise MatchParseError(
+                f"Listing for match {listing.match_id} lacks header data."
+            )
+
+        match = self._build_match(
+            match_id=listing.match_id,
+            match_url=listing.match_url,
+            map_links=[],
+            demo_links=[],
+            team1=team1,
+            team2=team2,
+            score1=score1,
+            score2=score2,
+            winner=self._determine_winner(team1, team2, score1, score2),
+            event=listing.event,
+            match_type=listing.match_format,
+            forfeit=True,
+            match_date=listing.listed_date.isoformat(),
+        )
+        match.data_complete = False
+        return match
+
     def _extract_match_id(self, match_url: str) -> int:
         """Extracts the match identifier from the match URL."""
         match = re.search(r"/matches/(\d+)", match_url)
@@ -110,7 +168,7 @@ class MatchParser:
         score2: int,
         winner: str,
         event: str,
-        match_type: str,
+        match_type: str | None,
         forfeit: bool,
         match_date: str,
     ) -> Match:
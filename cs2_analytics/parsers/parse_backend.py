@@ -0,0 +1,113 @@
+"""Selectable BeautifulSoup tree builders for page parsing.
+
+MapParser and MatchParser work on the BeautifulSoup API, so the backend is
+the tree builder behind it: the pure-Python `html.parser`, or the C-based
+`lxml` builder, which builds the same tree faster. The regression tests in
+tests/parsers/test_parse_backends.py hold both builders to identical parser
+output. lxml is an optional dependency (the `fast-parse` extra); the `fast`
+alias resolves to it when installed and to `html.parser` otherwise.
+
+Parsers also declare the page regions they read as PageRegions; passed to
+make_soup, only those subtrees are built, so ads, comments and sidebars
+never become tree nodes.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from importlib.util import find_spec
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from cs2_analytics.config.config import PARSE_BACKEND
+from cs2_analytics.exceptions import ConfigurationError
+
+HTML_PARSER_BACKEND = "html.parser"
+LXML_BACKEND = "lxml"
+FAST_BACKEND = "fast"
+PARSE_BACKENDS = (HTML_PARSER_BACKEND, LXML_BACKEND)
+
+LXML_AVAILABLE = find_spec("lxml") is not None
+
+
+def resolve_parse_backend(backend: str | None = None) -> str:
+    """Returns the tree builder name for a backend choice.
+
+    None selects the configured PARSE_BACKEND; `fast` selects lxml when it
+    is installed. Asking for lxml explicitly without it installed, or for an
+    unknown backend, raises ConfigurationError.
+    """
+    choice = (backend or PARSE_BACKEND).strip().lower()
+    if choice == FAST_BACKEND:
+        return LXML_BACKEND if LXML_AVAILABLE else HTML_PARSER_BACKEND
+    if choice not in PARSE_BACKENDS:
+        raise ConfigurationError(
+            f"Unknown parse backend {choice!r}; expected one of "
+            f"{', '.join((*PARSE_BACKENDS, FAST_BACKEND))}."
+        )
+    if choice == LXML_BACKEND and not LXML_AVAILABLE:
+        raise ConfigurationError(
+            "The lxml parse backend requires the lxml package; "
+            "install the `fast-parse` extra."
+        )
+    return choice
+
+
+@dataclass(frozen=True)
+class PageRegion:
+    """A subtree root a parser reads: a tag, by class or by href substring."""
+
+    tag: str
+    css_class: str | None = None
+    href_contains: str | None = None
+
+    def matches(self, name: str, attrs: Mapping[str, object]) -> bool:
+        if name != self.tag:
+            return False
+        if self.css_class is not None:
+            classes = attrs.get("class")
+            if isinstance(classes, str):
+                classes = classes.split()
+            if not isinstance(classes, (list, tuple)):
+                return False
+            if self.css_class not in classes:
+                return False
+        if self.href_contains is not None:
+            href = attrs.get("href")
+            if not isinstance(href, str) or self.href_contains not in href:
+                return False
+        return True
+
+
+class PageRegions(SoupStrainer):
+    """SoupStrainer that builds only the subtrees rooted at the given regions.
+
+    Tags are tested until one matches; everything inside a matching tag is
+    kept, and text outside every region is dropped. The overridden hooks are
+    beautifulsoup4 4.13's strainer API, hence the >=4.13 pin in pyproject.
+    """
+
+    def __init__(self, *regions: PageRegion) -> None:
+        super().__init__()
+        self.regions = regions
+
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:  # noqa: ARG002
+        attrs = attrs or {}
+        return any(region.matches(name, attrs) for region in self.regions)
+
+    def allow_string_creation(self, string: str) -> bool:  # noqa: ARG002
+        return False
+
+
+def make_soup(
+    page_source: str,
+    backend: str | None = None,
+    regions: PageRegions | None = None,
+) -> BeautifulSoup:
+    """Parses page HTML with the selected backend, optionally only `regions`."""
+    return BeautifulSoup(
+        page_source, resolve_parse_backend(backend), parse_only=regions
+    )
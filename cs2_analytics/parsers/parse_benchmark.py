@@ -0,0 +1,445 @@
+"""Parser throughput benchmark over a frozen corpus of HLTV pages.
+
+The corpus manifest (tests/parsers/fixtures/corpus.json in a source
+checkout) lists pages with the parser that reads them, the page URL and how many
+items a correct parse yields: players for map pages, map stats links for
+match pages and match links for results pages. Each page is timed end to
+end from HTML, as the scrapers and replay parse it: make_soup restricted to
+the parser's page regions, then the parse. A page yielding the wrong item
+count fails the run, so a fast but broken parser cannot pass.
+
+Each backend runs in a fresh spawned process so its peak RSS is its own,
+not the high-water mark of a previous backend. The same process also times
+a reference pass: the standard library's HTMLParser tokenizing the corpus.
+Its speed tracks the machine, not this code. Throughput is therefore gated
+as relative speed, pages/sec divided by the reference pages/sec, so a
+baseline recorded on one machine still holds on another.
+
+Map pages are also timed with MapParser's header-layout memo cleared
+before each page (cold) next to the usual warm runs, and header resolution
+alone is timed with and without the memo. This shows what the memo saves.
+Neither figure is stored in the baseline or gated.
+
+Results are compared with a baseline file when one is given. Relative
+speed falling, or peak RSS rising, by more than the allowed percentage is a
+regression. p50/p99 latency are reported but not gated, since tail latency
+over a small corpus is too noisy to fail on.
+"""
+
+import datetime as dt
+import json
+import logging
+import multiprocessing
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+
+from cs2_analytics.exceptions import ConfigurationError, ParseError
+from cs2_analytics.parsers.map_parser import (
+    MAP_ID_PATTERN,
+    MapParser,
+    resolve_column_indexes,
+)
+from cs2_analytics.parsers.match_parser import MatchParser
+from cs2_analytics.parsers.parse_backend import (
+    HTML_PARSER_BACKEND,
+    LXML_AVAILABLE,
+    LXML_BACKEND,
+    make_soup,
+)
+from cs2_analytics.parsers.results_parser import ResultsParser
+
+if sys.platform != "win32":
+    import resource
+
+DEFAULT_ROUNDS = 20
+DEFAULT_MAX_REGRESSION_PCT = 15.0
+# Map pages need a parent match id to build their Map row.
+BENCH_MATCH_ID = 2380000
+# Header resolution alone is too fast to time per call; each timed sample
+# resolves every corpus header signature this many times.
+HEADER_RESOLVE_REPEATS = 200
+
+
+@dataclass(frozen=True)
+class CorpusPage:
+    """One checked-in page, the parser that reads it and its expected yield."""
+
+    name: str
+    parser: str
+    path: Path
+    url: str
+    expected_items: int
+    start_date: dt.date | None = None
+    end_date: dt.date | None = None
+
+
+@dataclass(frozen=True)
+class ParserTiming:
+    """Throughput and latency of one parser over its corpus pages."""
+
+    pages: int
+    pages_per_sec: float
+    p50_ms: float
+    p99_ms: float
+
+
+@dataclass(frozen=True)
+class HeaderMemoTiming:
+    """Map parsing with the header-layout memo cleared (cold) and reused (warm)."""
+
+    cold_pages_per_sec: float
+    warm_pages_per_sec: float
+    cold_resolve_us: float
+    warm_resolve_us: float
+
+
+@dataclass(frozen=True)
+class BackendResult:
+    """One backend's per-parser timings, its reference speed and peak RSS."""
+
+    backend: str
+    peak_rss_mib: float | None
+    parsers: dict[str, ParserTiming]
+    reference_pages_per_sec: float
+    header_memo: HeaderMemoTiming | None = None
+
+    def relative_speed(self, parser: str) -> float:
+        """Returns a parser's pages/sec as a multiple of the reference pass."""
+        return round(
+            self.parsers[parser].pages_per_sec / self.reference_pages_per_sec, 4
+        )
+
+
+def default_backends() -> tuple[str, ...]:
+    """Returns the tree builders installed here, html.parser first."""
+    if LXML_AVAILABLE:
+        return (HTML_PARSER_BACKEND, LXML_BACKEND)
+    return (HTML_PARSER_BACKEND,)
+
+
+def load_corpus(manifest_path: Path) -> list[CorpusPage]:
+    """Reads the corpus manifest; page files resolve relative to it."""
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        pages = [
+            CorpusPage(
+                name=entry["name"],
+                parser=entry["parser"],
+                path=manifest_path.parent / entry["file"],
+                url=entry["url"],
+                expected_items=int(entry["expected_items"]),
+                start_date=_optional_date(entry.get("start_date")),
+                end_date=_optional_date(entry.get("end_date")),
+            )
+            for entry in manifest["pages"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        raise ConfigurationError(
+            f"Could not load parse benchmark corpus {manifest_path}: {e}"
+        ) from e
+
+    unknown = sorted({page.parser for page in pages} - PAGE_PARSERS.keys())
+    if unknown:
+        raise ConfigurationError(
+            f"Parse benchmark corpus names unknown parsers: {', '.join(unknown)}."
+        )
+    return pages
+
+
+def _optional_date(value: str | None) -> dt.date | None:
+    return dt.date.fromisoformat(value) if value else None
+
+
+def _parse_map_page(page: CorpusPage, page_source: str, backend: str) -> int:
+    map_id = MAP_ID_PATTERN.search(page.url)
+    if map_id is None:
+        raise ConfigurationError(f"Corpus page {page.name} has no mapstatsid URL.")
+    parsed = MapParser().parse_map_details(
+        make_soup(page_source, backend, MapParser.page_regions),
+        page.url,
+        int(map_id.group(1)),
+        match_id=BENCH_MATCH_ID,
+        map_order=None,
+    )
+    return len(parsed.players)
+
+
+def _parse_match_page(page: CorpusPage, page_source: str, backend: str) -> int:
+    _match, map_links, _demo_links = MatchParser().parse_match(
+        make_soup(page_source, backend, MatchParser.page_regions), page.url
+    )
+    return len(map_links)
+
+
+def _parse_results_page(page: CorpusPage, page_source: str, backend: str) -> int:
+    listings, _stop = ResultsParser().parse_results_page(
+        make_soup(page_source, backend, ResultsParser.page_regions),
+        start_date=page.start_date or dt.date.min,
+        end_date=page.end_date or dt.date.max,
+    )
+    return len(listings)
+
+
+PAGE_PARSERS: dict[str, Callable[[CorpusPage, str, str], int]] = {
+    "map": _parse_map_page,
+    "match": _parse_match_page,
+    "results": _parse_results_page,
+}
+
+
+def parse_corpus_page(page: CorpusPage, page_source: str, backend: str) -> None:
+    """Parses one page and checks its item count against the manifest."""
+    items = PAGE_PARSERS[page.parser](page, page_source, backend)
+    if items != page.expected_items:
+        raise ParseError(
+            f"{page.name} parsed {items} items with {backend}; "
+            f"the corpus expects {page.expected_items}."
+        )
+
+
+def tokenize_reference(page_source: str) -> None:
+    """The reference pass: stdlib HTMLParser tokenizing a page, no tree built."""
+    tokenizer = HTMLParser()
+    tokenizer.feed(page_source)
+    tokenizer.close()
+
+
+def run_backend(pages: list[CorpusPage], backend: str, rounds: int) -> BackendResult:
+    """Times every corpus page `rounds` times with one backend, after a warm-up.
+
+    Each round also times the reference pass over the same pages, so both
+    see the same machine load. Every map page is parsed cold, with the
+    header memo cleared, right before its warm timing.
+    """
+    sources = [page.path.read_text(encoding="utf-8") for page in pages]
+    for page, page_source in zip(pages, sources, strict=True):
+        parse_corpus_page(page, page_source, backend)
+        tokenize_reference(page_source)
+
+    latencies: dict[str, list[float]] = {page.parser: [] for page in pages}
+    cold_map_seconds: list[float] = []
+    reference_seconds = 0.0
+    for _ in range(rounds):
+        for page, page_source in zip(pages, sources, strict=True):
+            if page.parser == "map":
+                resolve_column_indexes.cache_clear()
+                started = time.perf_counter()
+                parse_corpus_page(page, page_source, backend)
+                cold_map_seconds.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            parse_corpus_page(page, page_source, backend)
+            latencies[page.parser].append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            tokenize_reference(page_source)
+            reference_seconds += time.perf_counter() - started
+
+    parsers = {name: _timing_of(samples) for name, samples in latencies.items()}
+    header_memo = None
+    if cold_map_seconds:
+        signatures = _map_header_signatures(pages, sources, backend)
+        header_memo = HeaderMemoTiming(
+            cold_pages_per_sec=round(len(cold_map_seconds) / sum(cold_map_seconds), 1),
+            warm_pages_per_sec=parsers["map"].pages_per_sec,
+            cold_resolve_us=_resolve_us(
+                resolve_column_indexes.__wrapped__, signatures, rounds
+            ),
+            warm_resolve_us=_resolve_us(resolve_column_indexes, signatures, rounds),
+        )
+
+    return BackendResult(
+        backend=backend,
+        peak_rss_mib=peak_rss_mib(),
+        parsers=parsers,
+        reference_pages_per_sec=round(rounds * len(pages) / reference_seconds, 1),
+        header_memo=header_memo,
+    )
+
+
+def _map_header_signatures(
+    pages: list[CorpusPage], sources: list[str], backend: str
+) -> list[tuple[str, ...]]:
+    """Returns the header signature of every visible stats table on map pages."""
+    parser = MapParser()
+    return [
+        parser._header_signature(table)
+        for page, page_source in zip(pages, sources, strict=True)
+        if page.parser == "map"
+        for table in parser._iter_visible_stat_tables(
+            make_soup(page_source, backend, MapParser.page_regions)
+        )
+    ]
+
+
+def _resolve_us(
+    resolve: Callable[[tuple[str, ...]], object],
+    signatures: list[tuple[str, ...]],
+    rounds: int,
+) -> float:
+    """Returns the mean microseconds resolve takes per header signature."""
+    started = time.perf_counter()
+    for _ in range(rounds * HEADER_RESOLVE_REPEATS):
+        for signature in signatures:
+            resolve(signature)
+    calls = rounds * HEADER_RESOLVE_REPEATS * len(signatures)
+    return round((time.perf_counter() - started) / calls * 1_000_000, 3)
+
+
+def _timing_of(samples: list[float]) -> ParserTiming:
+    cut_points = statistics.quantiles(samples, n=100, method="inclusive")
+    return ParserTiming(
+        pages=len(samples),
+        pages_per_sec=round(len(samples) / sum(samples), 1),
+        p50_ms=round(cut_points[49] * 1000, 3),
+        p99_ms=round(cut_points[98] * 1000, 3),
+    )
+
+
+def peak_rss_mib() -> float | None:
+    """Returns this process's peak RSS in MiB, or None where unsupported."""
+    if sys.platform == "win32":  # No getrusage; reported as n/a.
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in KiB elsewhere.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(max_rss / divisor, 1)
+
+
+def _run_backend_in_worker(
+    pages: list[CorpusPage], backend: str, rounds: int
+) -> BackendResult:
+    # Per-page debug logging would otherwise dominate the timings.
+    logging.disable(logging.CRITICAL)
+    return run_backend(pages, backend, rounds)
+
+
+def benchmark_backends(
+    pages: list[CorpusPage], backends: Iterable[str], rounds: int = DEFAULT_ROUNDS
+) -> list[BackendResult]:
+    """Runs the corpus once per backend, each in its own spawned process."""
+    results = []
+    for backend in backends:
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results.append(
+                executor.submit(_run_backend_in_worker, pages, backend, rounds).result()
+            )
+    return results
+
+
+def load_baseline(path: Path) -> dict[str, dict]:
+    """Reads stored baselines keyed by backend; a missing file means none."""
+    if not path.exists():
+        return {}
+    try:
+        return dict(json.loads(path.read_text(encoding="utf-8"))["backends"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ConfigurationError(
+            f"Could not load parse benchmark baseline {path}: {e}"
+        ) from e
+
+
+def write_baseline(results: Iterable[BackendResult], path: Path) -> None:
+    """Stores results as the new baseline, keeping other backends' entries."""
+    backends = load_baseline(path)
+    for result in results:
+        entry = asdict(result)
+        entry.pop("header_memo")
+        for name, timing in entry["parsers"].items():
+            timing["relative_speed"] = result.relative_speed(name)
+        backends[entry.pop("backend")] = entry
+    # Only relative speed and RSS are gated; record where the baseline was
+    # taken so the absolute figures can be read in context.
+    recorded_on = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+    }
+    path.write_text(
+        json.dumps(
+            {"recorded_on": recorded_on, "backends": backends},
+            indent=2,
+            sort_keys=True,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+
+def find_regressions(
+    results: Iterable[BackendResult],
+    baseline: Mapping[str, Mapping],
+    max_regression_pct: float = DEFAULT_MAX_REGRESSION_PCT,
+) -> list[str]:
+    """Describes every gated metric worse than baseline by over the threshold.
+
+    Throughput is compared as relative speed, not absolute pages/sec.
+    Backends or parsers without a baseline entry are not gated.
+    """
+    allowed = max_regression_pct / 100
+    regressions = []
+    for result in results:
+        stored = baseline.get(result.backend)
+        if not stored:
+            continue
+        for name, timing in result.parsers.items():
+            stored_speed = stored.get("parsers", {}).get(name, {}).get("relative_speed")
+            if not stored_speed:
+                continue
+            speed = result.relative_speed(name)
+            if speed < stored_speed * (1 - allowed):
+                regressions.append(
+                    f"{result.backend} {name}: relative speed {speed:.3f} "
+                    f"({timing.pages_per_sec:.1f} pages/sec) is below the "
+                    f"baseline {stored_speed:.3f} by more than {max_regression_pct:g}%"
+                )
+        stored_rss = stored.get("peak_rss_mib")
+        if (
+            result.peak_rss_mib is not None
+            and stored_rss
+            and result.peak_rss_mib > stored_rss * (1 + allowed)
+        ):
+            regressions.append(
+                f"{result.backend}: peak RSS {result.peak_rss_mib:.1f} MiB "
+                f"is above the baseline {stored_rss:.1f} MiB "
+                f"by more than {max_regression_pct:g}%"
+            )
+    return regressions
+
+
+def format_results(results: Iterable[BackendResult]) -> list[str]:
+    """Renders one table line per backend and parser, then the memo comparisons."""
+    results = list(results)
+    lines = [
+        f"{'backend':<12} {'parser':<8} {'pages':>6} {'pages/s':>9} {'rel':>7} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'peak RSS':>10}"
+    ]
+    for result in results:
+        rss = "n/a" if result.peak_rss_mib is None else f"{result.peak_rss_mib} MiB"
+        for name, timing in result.parsers.items():
+            lines.append(
+                f"{result.backend:<12} {name:<8} {timing.pages:>6} "
+                f"{timing.pages_per_sec:>9.1f} {result.relative_speed(name):>7.3f} "
+                f"{timing.p50_ms:>8.2f} {timing.p99_ms:>8.2f} {rss:>10}"
+            )
+    for result in results:
+        memo = result.header_memo
+        if memo is None:
+            continue
+        lines.append(
+            f"{result.backend} header memo: map pages {memo.cold_pages_per_sec:.1f} "
+            f"pages/s cold, {memo.warm_pages_per_sec:.1f} warm "
+            f"({memo.warm_pages_per_sec / memo.cold_pages_per_sec:.2f}x); "
+            f"header resolution {memo.cold_resolve_us:.2f} us cold, "
+            f"{memo.warm_resolve_us:.2f} us warm "
+            f"({memo.cold_resolve_us / memo.warm_resolve_us:.1f}x)"
+        )
+    return lines
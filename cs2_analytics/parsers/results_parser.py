@@ -0,0 +1,142 @@
+"""Parses discovered matches and their header data from HLTV results pages."""
+
+import datetime as dt
+import re
+
+from cs2_analytics.models.result_listing import ResultListing
+from cs2_analytics.parsers.parse_backend import PageRegion, PageRegions
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+# Ordinal suffixes only after a day number, so "August" keeps its "st".
+ORDINAL_SUFFIX_PATTERN = re.compile(r"(\d+)(st|nd|rd|th)\b")
+MATCH_ID_PATTERN = re.compile(r"/matches/(\d+)")
+BEST_OF_PATTERN = re.compile(r"^bo([135])$")
+# The listing's format cell shows "bo3"/"bo5" for series, the map played
+# (e.g. "mrg") for a best-of-one, and "def" for a forfeit.
+FORFEIT_MARKER = "def"
+
+
+class ResultsParser:
+    """Parses match rows from the dated sublists of an HLTV results page."""
+
+    # The listing parser reads only the results sublists, so the rest of the
+    # page is never built into the soup.
+    page_regions = PageRegions(PageRegion("div", css_class="results-sublist"))
+
+    def parse_results_page(
+        self, soup, *, start_date: dt.date, end_date: dt.date
+    ) -> tuple[list[ResultListing], bool]:
+        """
+        Extracts match listings dated within [start_date, end_date].
+
+        Sublists newer than end_date are skipped. The first sublist older
+        than start_date ends the walk, since the listing is newest first.
+        Rows whose link carries no match id are dropped.
+
+        Returns:
+            Tuple of (match listings, whether to stop scraping)
+        """
+        listings: list[ResultListing] = []
+
+        for section in soup.find_all("div", class_="results-sublist"):
+            match_date = self._extract_section_date(section)
+            if match_date is None:
+                continue
+
+            if match_date > end_date:
+                continue
+            if match_date < start_date:
+                logger.info(
+                    "Stopping at match date %s because it is out of range.", match_date
+                )
+                return listings, True
+
+            for row in section.find_all("div", class_="result-con"):
+                listing = self._parse_result_row(row, match_date)
+                if listing is not None:
+                    listings.append(listing)
+
+        return listings, False
+
+    def _extract_section_date(self, section) -> dt.date | None:
+        """Parses a sublist's "Results for May 5th 2025" headline date."""
+        date_header = section.find("div", class_="standard-headline")
+        if not date_header:
+            return None
+
+        raw_date = ORDINAL_SUFFIX_PATTERN.sub(
+            r"\1", date_header.text.replace("Results for ", "")
+        )
+        try:
+            return dt.datetime.strptime(raw_date.strip(), "%B %d %Y").date()
+        except ValueError:
+            logger.warning("Could not parse date: %s", raw_date)
+            return None
+
+    def _parse_result_row(self, row, listed_date: dt.date) -> ResultListing | None:
+        """Builds one listing; header fields the row lacks are left as None."""
+        a_tag = row.find("a", href=True)
+        if not a_tag:
+            return None
+        match = MATCH_ID_PATTERN.search(a_tag["href"])
+        if not match:
+            logger.debug("Skipping results row without a match id: %s", a_tag["href"])
+            return None
+
+        team1, team2 = self._extract_teams(row)
+        score1, score2 = self._extract_scores(row)
+        format_text = (self._text_of(row, "map-text") or "").lower()
+        return ResultListing(
+            match_id=int(match.group(1)),
+            match_url=f"https://www.hltv.org{a_tag['href']}",
+            team1=team1,
+            team2=team2,
+            score1=score1,
+            score2=score2,
+            event=self._text_of(row, "event-name"),
+            match_format=self._normalize_format(format_text),
+            forfeit=format_text == FORFEIT_MARKER,
+            listed_date=listed_date,
+        )
+
+    def _extract_teams(self, row) -> tuple[str | None, str | None]:
+        """Reads the two team names from the row's team cells."""
+        names = [
+            cell.find("div", class_="team")
+            for cell in row.find_all("td", class_="team-cell")
+        ]
+        if len(names) != 2:
+            return None, None
+        team1, team2 = (
+            self._text_or_none(name.get_text(strip=True)) if name else None
+            for name in names
+        )
+        return team1, team2
+
+    def _extract_scores(self, row) -> tuple[int | None, int | None]:
+        """Reads the series (or best-of-one round) score from the score cell."""
+        score_cell = row.find("td", class_="result-score")
+        scores = score_cell.find_all("span") if score_cell else []
+        if len(scores) != 2:
+            return None, None
+        score1, score2 = (
+            int(text) if (text := score.get_text(strip=True)).isdigit() else None
+            for score in scores
+        )
+        return score1, score2
+
+    def _text_of(self, row, css_class: str) -> str | None:
+        tag = row.find(class_=css_class)
+        return self._text_or_none(tag.get_text(strip=True)) if tag else None
+
+    def _text_or_none(self, text: str) -> str | None:
+        return text or None
+
+    def _normalize_format(self, format_text: str) -> str | None:
+        """Maps the format cell to bo1/bo3/bo5; forfeits and blanks give None."""
+        if not format_text or format_text == FORFEIT_MARKER:
+            return None
+        best_of = BEST_OF_PATTERN.match(format_text)
+        return f"bo{best_of.group(1)}" if best_of else "bo1"
@@ -0,0 +1,262 @@
+"""Detects HLTV markup drift on map pages and halts the stage that hits it.
+
+When HLTV changes its markup, every map page fails to parse, but each one
+still costs a full fetch. Every fetched page is fingerprinted here by
+structure: which of the selectors MapParser needs are present, and which
+required stat columns its visible stats tables resolve by header. A page is
+drifted when anything required is missing.
+
+SchemaDriftBreaker tracks fingerprints over a sliding window of recent
+pages. Once the drifted share of a full enough window reaches the
+threshold, the breaker trips. It writes one diagnostic directory, holding a
+JSON summary and the most recent drifted pages as samples, and from then on
+refuses further fetches for the run.
+"""
+
+import datetime as dt
+import json
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from cs2_analytics.parsers.extracted_map import ExtractedMapPage
+from cs2_analytics.parsers.map_parser import COLUMN_HEADER_ALIASES, normalize_header
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+# Selectors every parseable map stats page carries, checked in this order.
+REQUIRED_MAP_SELECTORS = (
+    "div.match-info-box",
+    "div.date",
+    "table.stats-table",
+    "th.st-teamname",
+    "td.st-player",
+)
+# MapParser logs and defaults these when a layout omits them.
+OPTIONAL_STAT_COLUMNS = frozenset({"clutches", "round_swing"})
+REQUIRED_STAT_COLUMNS = tuple(
+    column for column in COLUMN_HEADER_ALIASES if column not in OPTIONAL_STAT_COLUMNS
+)
+# A window needs this many pages before it may trip, so one bad page at the
+# start of a batch cannot halt the stage.
+DRIFT_MIN_SAMPLES = 5
+DRIFT_SAMPLE_PAGES = 3
+
+
+@dataclass(frozen=True)
+class PageFingerprint:
+    """Structural shape of one map stats page, as MapParser would read it."""
+
+    missing_selectors: tuple[str, ...]
+    header_signatures: tuple[tuple[str, ...], ...]
+    unresolved_columns: tuple[str, ...]
+
+    @property
+    def drifted(self) -> bool:
+        """True when the page lacks a selector or stat column the parser needs."""
+        return bool(self.missing_selectors or self.unresolved_columns)
+
+
+def fingerprint_map_page(page) -> PageFingerprint:
+    """Fingerprints a map page soup or an in-browser ExtractedMapPage."""
+    if isinstance(page, ExtractedMapPage):
+        present = {
+            "div.match-info-box": bool(page.info_box_tokens),
+            "div.date": bool(page.date_unix),
+            "table.stats-table": bool(page.tables),
+            "th.st-teamname": any(table.team_name for table in page.tables),
+            "td.st-player": any(
+                "st-player" in cell.classes
+                for table in page.tables
+                for row in table.rows or ()
+                for cell in row
+            ),
+        }
+        signatures = [table.headers for table in page.visible_stat_tables()]
+    else:
+        present = {
+            selector: page.select_one(selector) is not None
+            for selector in REQUIRED_MAP_SELECTORS
+        }
+        signatures = [
+            tuple(th.get_text(" ", strip=True) for th in table.select("thead th"))
+            for table in page.select("table.stats-table")
+            if "hidden" not in table.get("class", [])
+        ]
+
+    header_signatures = tuple(
+        tuple(normalize_header(text) for text in signature if text)
+        for signature in signatures
+    )
+    return PageFingerprint(
+        missing_selectors=tuple(
+            selector for selector in REQUIRED_MAP_SELECTORS if not present[selector]
+        ),
+        header_signatures=header_signatures,
+        unresolved_columns=_unresolved_columns(header_signatures),
+    )
+
+
+def _unresolved_columns(
+    header_signatures: tuple[tuple[str, ...], ...],
+) -> tuple[str, ...]:
+    """Required stat columns that some visible table has no header for."""
+    unresolved: list[str] = []
+    for column in REQUIRED_STAT_COLUMNS:
+        aliases = {
+            normalize_header(alias) for alias in COLUMN_HEADER_ALIASES[column][0]
+        }
+        if any(not aliases.intersection(headers) for headers in header_signatures):
+            unresolved.append(column)
+    return tuple(unresolved)
+
+
+@dataclass(frozen=True)
+class DriftSample:
+    """One drifted page kept for the diagnostic."""
+
+    item_id: int
+    url: str
+    fingerprint: PageFingerprint
+    page_source: str | None
+
+
+class SchemaDriftBreaker:
+    """Trips once the drifted share of recent pages reaches a threshold.
+
+    Safe to share across scraper worker threads and the parse pipeline's
+    writer. A window of 0 disables the breaker.
+    """
+
+    def __init__(
+        self,
+        *,
+        stage: str,
+        window: int,
+        threshold_pct: int,
+        diagnostics_dir: str | Path,
+        min_samples: int = DRIFT_MIN_SAMPLES,
+    ) -> None:
+        self.stage = stage
+        self.window = window
+        self.threshold_pct = threshold_pct
+        self.diagnostics_dir = Path(diagnostics_dir)
+        self.min_samples = min(min_samples, window)
+        self.diagnostic_path: Path | None = None
+        self.refused = 0
+        self._recent: deque[bool] = deque(maxlen=max(window, 1))
+        self._samples: deque[DriftSample] = deque(maxlen=DRIFT_SAMPLE_PAGES)
+        self._tripped = False
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0
+
+    @property
+    def tripped(self) -> bool:
+        return self._tripped
+
+    def observe(
+        self,
+        item_id: int,
+        url: str,
+        fingerprint: PageFingerprint,
+        page_source: str | None = None,
+    ) -> None:
+        """Adds one fetched page's fingerprint to the window."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._recent.append(fingerprint.drifted)
+            if fingerprint.drifted:
+                self._samples.append(
+                    DriftSample(item_id, url, fingerprint, page_source)
+                )
+            if self._tripped or len(self._recent) < self.min_samples:
+                return
+            drifted = sum(self._recent)
+            if drifted * 100 < self.threshold_pct * len(self._recent):
+                return
+            self._tripped = True
+            samples = list(self._samples)
+            window_size = len(self._recent)
+
+        self.diagnostic_path = self._write_diagnostic(drifted, window_size, samples)
+        logger.error(
+            "Schema drift on %s pages: %d of the last %d failed their fingerprint "
+            "(threshold %d%%); halting fetches. Diagnostic: %s",
+            self.stage,
+            drifted,
+            window_size,
+            self.threshold_pct,
+            self.diagnostic_path or "not written",
+        )
+
+    def observe_page(self, item_id: int, url: str, page) -> None:
+        """Fingerprints one fetched page and observes it.
+
+        A drifted soup is kept as a sample of the regions the parser read;
+        in-browser extractions have no HTML to sample.
+        """
+        if not self.enabled:
+            return
+        fingerprint = fingerprint_map_page(page)
+        page_source = (
+            str(page)
+            if fingerprint.drifted and not isinstance(page, ExtractedMapPage)
+            else None
+        )
+        self.observe(item_id, url, fingerprint, page_source)
+
+    def allow_fetch(self) -> bool:
+        """Returns False, and counts the refusal, once the breaker has tripped."""
+        if not self._tripped:
+            return True
+        with self._lock:
+            self.refused += 1
+        return False
+
+    def _write_diagnostic(
+        self, drifted: int, window_size: int, samples: list[DriftSample]
+    ) -> Path | None:
+        """Writes the one diagnostic for this trip; failures only log."""
+        tripped_at = dt.datetime.now(dt.UTC)
+        path = self.diagnostics_dir / (
+            f"{self.stage}-{tripped_at.strftime('%Y%m%dT%H%M%SZ')}"
+        )
+        sample_entries = []
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            for index, sample in enumerate(samples, start=1):
+                page_file = None
+                if sample.page_source is not None:
+                    page_file = f"sample-{index}-{sample.item_id}.html"
+                    (path / page_file).write_text(sample.page_source, encoding="utf-8")
+                sample_entries.append(
+                    {
+                        "item_id": sample.item_id,
+                        "url": sample.url,
+                        "page_file": page_file,
+                        "fingerprint": asdict(sample.fingerprint),
+                    }
+                )
+            summary = {
+                "stage": self.stage,
+                "tripped_at": tripped_at.isoformat(),
+                "drifted_pages": drifted,
+                "window_pages": window_size,
+                "threshold_pct": self.threshold_pct,
+                "required_selectors": list(REQUIRED_MAP_SELECTORS),
+                "required_stat_columns": list(REQUIRED_STAT_COLUMNS),
+                "samples": sample_entries,
+            }
+            (path / "diagnostic.json").write_text(
+                json.dumps(summary, indent=2) + "\n", encoding="utf-8"
+            )
+        except OSError as e:
+            logger.warning("Could not write schema drift diagnostic to %s: %s", path, e)
+            return None
+        return path
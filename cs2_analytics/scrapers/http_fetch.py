@@ -0,0 +1,244 @@
+"""Lightweight HTTP fetch path tried before the scraper's browser session.
+
+Most HLTV pages are server-rendered, so once a browser session has cleared
+the site's challenge its cookies and user agent are enough for a plain HTTP
+client to fetch the same HTML. An HttpPageFetcher keeps one pooled,
+keep-alive (HTTP/2 when `h2` is installed) client per scraper, seeded from
+the browser session after each browser page load. A page is only returned
+when it already contains the scraper's required selectors, checked on the
+soup of the parser's page regions, which is returned with the HTML so the
+page is parsed once; challenge pages,
+missing content and transport errors return None so the scraper escalates
+to its browser session. After repeated escalations the HTTP path stands
+down for a number of pages, so a host that always challenges plain clients
+does not pay a wasted request per page.
+
+A page costs one rate limiter token whichever path loads it: fetch()
+acquires it, and an escalated page loads in the browser without acquiring
+again. HTTP outcomes are not reported to adaptive rate control. A
+challenged plain client usually means its fingerprint was rejected, not
+that the scraper is going too fast, so it must not cut the rate every
+browser session shares.
+
+Requires the optional `httpx` package (the `http` extra); without it, or
+with SCRAPE_HTTP_FETCH disabled, scrapers use the browser for every page.
+"""
+
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Protocol
+
+from bs4 import BeautifulSoup
+
+from cs2_analytics.config.config import SCRAPE_HTTP_FETCH
+from cs2_analytics.exceptions import ChallengePageError
+from cs2_analytics.parsers.parse_backend import PageRegions, make_soup
+from cs2_analytics.scrapers.page_readiness import challenge_marker_flags
+from cs2_analytics.scrapers.rate_limiter import HostRateLimiter
+from cs2_analytics.scrapers.resource_blocking import BlockingProfile
+from cs2_analytics.utils.log_manager import get_logger
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+logger = get_logger(__name__)
+
+HTTP_FETCH_TIMEOUT_SECONDS = 15.0
+MAX_CONSECUTIVE_ESCALATIONS = 3
+STAND_DOWN_PAGES = 20
+MAX_KEEPALIVE_CONNECTIONS = 4
+KEEPALIVE_EXPIRY_SECONDS = 30.0
+# Statuses Cloudflare and similar front ends use for challenge interstitials
+# and throttling; treated as challenge outcomes even without page markers.
+CHALLENGE_STATUS_CODES = frozenset({403, 429, 503})
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+@dataclass(frozen=True)
+class FetchedPage:
+    """Page HTML fetched over HTTP, with the soup its content check parsed."""
+
+    html: str
+    soup: BeautifulSoup
+
+
+class PageFetcher(Protocol):
+    """A fetch path a scraper tries before falling back to its browser."""
+
+    def fetch(self, url: str) -> FetchedPage | None:
+        """Returns the fetched page, or None when the browser should load it.
+
+        Acquires the page's rate limiter token either way.
+        """
+        ...
+
+    def harvest_browser_session(self, driver) -> None:
+        """Adopts cookies and identity from a browser session that loaded a page."""
+        ...
+
+    def close(self) -> None:
+        """Releases any pooled connections."""
+        ...
+
+
+class HttpPageFetcher:
+    """Fetches pages with a pooled HTTP client seeded from the browser session."""
+
+    def __init__(
+        self,
+        *,
+        required_selectors: tuple[str, ...],
+        rate_limiter: HostRateLimiter,
+        regions: PageRegions | None = None,
+        client=None,
+        timeout_seconds: float = HTTP_FETCH_TIMEOUT_SECONDS,
+        max_consecutive_escalations: int = MAX_CONSECUTIVE_ESCALATIONS,
+        stand_down_pages: int = STAND_DOWN_PAGES,
+    ) -> None:
+        self.required_selectors = required_selectors
+        self.regions = regions
+        self.rate_limiter = rate_limiter
+        self.client = client if client is not None else _build_client(timeout_seconds)
+        self.max_consecutive_escalations = max_consecutive_escalations
+        self.stand_down_pages = stand_down_pages
+        self.consecutive_escalations = 0
+        self.pages_to_skip = 0
+
+    def fetch(self, url: str) -> FetchedPage | None:
+        """Returns the page over HTTP, or None to escalate to the browser.
+
+        Always acquires the page's rate limiter token, also while standing
+        down, so the browser load of an escalated page must not acquire
+        again. The returned soup holds only `regions`, ready for the
+        scraper's parser.
+        """
+        self.rate_limiter.acquire(url)
+        if self.pages_to_skip > 0:
+            self.pages_to_skip -= 1
+            return None
+
+        try:
+            response = self.client.get(url)
+            page_source = str(response.text)
+            soup = make_soup(page_source, regions=self.regions)
+            if self._has_required_content(soup):
+                self.consecutive_escalations = 0
+                return FetchedPage(page_source, soup)
+            self._raise_for_challenge(response.status_code, page_source, url)
+        except ChallengePageError as e:
+            self._escalate(url, str(e))
+            return None
+        except Exception as e:
+            self._escalate(url, f"HTTP fetch failed: {e}")
+            return None
+
+        self._escalate(
+            url,
+            f"HTTP response {response.status_code} missing required selector="
+            f"{', '.join(self.required_selectors)}",
+        )
+        return None
+
+    def harvest_browser_session(self, driver) -> None:
+        """Copies the browser's cookies and user agent into the HTTP client."""
+        try:
+            cookies = driver.get_cookies()
+            user_agent = driver.execute_script("return navigator.userAgent")
+        except Exception as e:
+            logger.debug("Could not harvest browser session for HTTP fetch: %s", e)
+            return
+
+        for cookie in cookies:
+            self.client.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+        if user_agent:
+            self.client.headers["User-Agent"] = user_agent
+
+    def close(self) -> None:
+        """Closes the pooled HTTP client."""
+        self.client.close()
+
+    def _has_required_content(self, soup: BeautifulSoup) -> bool:
+        return all(
+            soup.select_one(selector) is not None
+            for selector in self.required_selectors
+        )
+
+    def _raise_for_challenge(
+        self, status_code: int, page_source: str, url: str
+    ) -> None:
+        markers = [
+            marker
+            for marker, is_present in challenge_marker_flags(page_source).items()
+            if is_present
+        ]
+        if markers or status_code in CHALLENGE_STATUS_CODES:
+            raise ChallengePageError(
+                f"HTTP response {status_code} appears blocked or challenged "
+                f"(markers: {', '.join(markers) or 'none'}): {url}"
+            )
+
+    def _escalate(self, url: str, reason: str) -> None:
+        """Records an escalation and stands down after too many in a row."""
+        self.consecutive_escalations += 1
+        logger.debug("Escalating %s to the browser session: %s", url, reason)
+        if self.consecutive_escalations >= self.max_consecutive_escalations:
+            logger.info(
+                "HTTP fetch escalated %d pages in a row; using the browser for "
+                "the next %d pages",
+                self.consecutive_escalations,
+                self.stand_down_pages,
+            )
+            self.consecutive_escalations = 0
+            self.pages_to_skip = self.stand_down_pages
+
+
+def _build_client(timeout_seconds: float):
+    """Builds a keep-alive client, negotiating HTTP/2 when `h2` is installed."""
+    return httpx.Client(
+        http2=find_spec("h2") is not None,
+        timeout=timeout_seconds,
+        follow_redirects=True,
+        headers=DEFAULT_HEADERS,
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+
+
+def build_http_fetcher(
+    profile: BlockingProfile,
+    rate_limiter: HostRateLimiter,
+    regions: PageRegions | None = None,
+) -> HttpPageFetcher | None:
+    """Returns an HTTP fetcher for a scraper, or None when the path is off.
+
+    regions should be the page regions of the scraper's parser, and must
+    contain the profile's required selectors.
+
+    The path is off when SCRAPE_HTTP_FETCH is disabled or httpx is missing;
+    the latter is logged rather than failing scraper startup.
+    """
+    if not SCRAPE_HTTP_FETCH:
+        return None
+    if httpx is None:
+        logger.warning(
+            "SCRAPE_HTTP_FETCH is enabled but httpx is not installed; "
+            "install the `http` extra. Using the browser for every page."
+        )
+        return None
+    return HttpPageFetcher(
+        required_selectors=profile.required_selectors,
+        rate_limiter=rate_limiter,
+        regions=regions,
+    )
@@ -0,0 +1,101 @@
+"""In-browser extraction of the map stats page parts MapParser reads.
+
+`driver.page_source` serializes the whole rendered DOM, which is then
+parsed again in Python. With SCRAPE_MAP_EXTRACTION enabled, the map scraper
+instead runs MAP_EXTRACTION_SCRIPT in the already-rendered page; it returns
+only the stats tables, match info box text, date and mapstatsid links as
+JSON, which parsers/extracted_map.py adapts for MapParser.
+
+The script mirrors the BeautifulSoup lookups in MapParser: the same
+selectors, text nodes stripped and empty ones dropped (as `get_text(...,
+strip=True)` and `stripped_strings` do), and raw `href` attributes rather
+than resolved URLs. Any script error or incomplete payload returns None so
+the scraper falls back to the page HTML.
+"""
+
+from cs2_analytics.exceptions import MapParseError
+from cs2_analytics.parsers.extracted_map import ExtractedMapPage
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+MAP_EXTRACTION_SCRIPT = """
+const textsOf = (root) => {
+  const strings = [];
+  const walker = document.createTreeWalker(root, NodeFilter.SHOW_TEXT, {
+    acceptNode: (node) =>
+      node.parentElement && node.parentElement.closest("script, style, template")
+        ? NodeFilter.FILTER_REJECT
+        : NodeFilter.FILTER_ACCEPT,
+  });
+  for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+    const text = node.data.trim();
+    if (text) {
+      strings.push(text);
+    }
+  }
+  return strings;
+};
+
+const cellOf = (td) => {
+  const link = td.querySelector("a");
+  return {
+    classes: Array.from(td.classList),
+    strings: textsOf(td),
+    link: link ? { href: link.getAttribute("href"), strings: textsOf(link) } : null,
+  };
+};
+
+const tableOf = (table) => {
+  const teamHeader = table.querySelector("th.st-teamname");
+  const body = table.querySelector("tbody");
+  return {
+    classes: Array.from(table.classList),
+    teamName: teamHeader ? teamHeader.textContent.trim() : null,
+    headers: Array.from(table.querySelectorAll("thead th"), (th) =>
+      textsOf(th).join(" ")
+    ),
+    rows: body
+      ? Array.from(body.querySelectorAll("tr"), (tr) =>
+          Array.from(tr.querySelectorAll("td"), cellOf)
+        )
+      : null,
+  };
+};
+
+const infoBox = document.querySelector("div.match-info-box");
+const mapLabel = infoBox ? infoBox.querySelector("div.small-text") : null;
+let mapName = null;
+for (let node = mapLabel ? mapLabel.nextSibling : null; node; node = node.nextSibling) {
+  if (node.nodeType === Node.TEXT_NODE && node.data.trim()) {
+    mapName = node.data.trim();
+    break;
+  }
+}
+const dateTag = document.querySelector("div.date");
+
+return {
+  mapName: mapName,
+  infoBoxTokens: infoBox ? textsOf(infoBox) : [],
+  dateUnix: dateTag ? dateTag.getAttribute("data-unix") : null,
+  tables: Array.from(document.querySelectorAll("table.stats-table"), tableOf),
+  mapStatsHrefs: Array.from(
+    document.querySelectorAll('a[href*="/stats/matches/mapstatsid/"]'),
+    (link) => link.getAttribute("href")
+  ),
+};
+"""
+
+
+def extract_map_page(driver) -> ExtractedMapPage | None:
+    """Runs the extraction script in the loaded page; None falls back to HTML."""
+    try:
+        payload = driver.execute_script(MAP_EXTRACTION_SCRIPT)
+    except Exception as e:
+        logger.debug("In-browser map extraction failed: %s", e)
+        return None
+    try:
+        return ExtractedMapPage.from_payload(payload)
+    except MapParseError as e:
+        logger.debug("In-browser map extraction incomplete: %s", e)
+        return None
@@ -1,27 +1,34 @@
 """Fetches raw map HTML for downstream parsing."""
 
+from collections.abc import Callable
+
 from bs4 import BeautifulSoup
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from seleniumbase import Driver
 
+from cs2_analytics.archive import PageArchive, archive_page, get_page_archive
+from cs2_analytics.config.config import SCRAPE_MAP_EXTRACTION
 from cs2_analytics.exceptions import MapScrapeError, SessionScrapeError
+from cs2_analytics.parsers.extracted_map import ExtractedMapPage
+from cs2_analytics.parsers.map_parser import MapParser
+from cs2_analytics.parsers.parse_backend import make_soup
+from cs2_analytics.scrapers.http_fetch import PageFetcher, build_http_fetcher
+from cs2_analytics.scrapers.map_extraction import extract_map_page
+from cs2_analytics.scrapers.page_readiness import (
+    DEFAULT_CONTENT_WAIT_SECONDS,
+    ensure_page_ready,
+)
+from cs2_analytics.scrapers.rate_limiter import HostRateLimiter, get_rate_limiter
+from cs2_analytics.scrapers.resource_blocking import (
+    BlockingProfile,
+    apply_blocking_profile,
+)
 from cs2_analytics.utils.log_manager import get_logger
 
 logger = get_logger(__name__)
 
 REQUIRED_MAP_SELECTOR = "div.match-info-box"
-DEFAULT_CONTENT_WAIT_SECONDS = 10.0
-PAGE_SNIPPET_LIMIT = 300
-CHALLENGE_MARKERS = (
-    "access denied",
-    "captcha",
-    "checking your browser",
-    "cloudflare",
-    "enable javascript",
-    "just a moment",
-    "verify you are human",
+MAP_BLOCKING_PROFILE = BlockingProfile(
+    name="map", required_selectors=(REQUIRED_MAP_SELECTOR,)
 )
 
 
@@ -33,12 +40,36 @@ class MapScraper:
     persistence.
     """
 
+    blocking_profile = MAP_BLOCKING_PROFILE
+
     def __init__(
         self,
         content_wait_seconds: float = DEFAULT_CONTENT_WAIT_SECONDS,
+        archive: PageArchive | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        blocking_profile: BlockingProfile | None = None,
+        http_fetcher: PageFetcher | None = None,
+        extract_in_browser: bool | None = None,
     ) -> None:
         self.driver = Driver(uc=True, headless=True)
+        if blocking_profile is not None:
+            self.blocking_profile = blocking_profile
+        apply_blocking_profile(self.driver, self.blocking_profile)
         self.content_wait_seconds = content_wait_seconds
+        self.archive = archive if archive is not None else get_page_archive()
+        self.rate_limiter = (
+            rate_limiter if rate_limiter is not None else get_rate_limiter()
+        )
+        self.http_fetcher = (
+            http_fetcher
+            if http_fetcher is not None
+            else build_http_fetcher(
+                self.blocking_profile, self.rate_limiter, MapParser.page_regions
+            )
+        )
+        self.extract_in_browser = (
+            SCRAPE_MAP_EXTRACTION if extract_in_browser is None else extract_in_browser
+        )
 
     def __enter__(self) -> "MapScraper":  # noqa: UP037
         return self
@@ -46,68 +77,80 @@ class MapScraper:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
-    def fetch_soup(self, url: str) -> BeautifulSoup:
-        """Loads a map page and returns its parsed HTML."""
+    def fetch_soup(self, url: str) -> BeautifulSoup | ExtractedMapPage:
+        """Loads a map page, over HTTP when possible, ready for MapParser.
+
+        With in-browser extraction on and no page archive, a page loaded in
+        the browser comes back as an ExtractedMapPage when the script's
+        result is complete; otherwise the page HTML is parsed as usual.
+        """
+        fetched = self.http_fetcher.fetch(url) if self.http_fetcher else None
+        if fetched is not None:
+            archive_page(self.archive, url, fetched.html, kind="map")
+            return fetched.soup
+
+        page = self._open_in_browser(url, self._read_loaded_page)
+        if isinstance(page, ExtractedMapPage):
+            return page
+        archive_page(self.archive, url, page, kind="map")
+        return make_soup(page, regions=MapParser.page_regions)
+
+    def fetch_page(self, url: str) -> str:
+        """Loads and archives a map page, returning its raw HTML unparsed."""
+        fetched = self.http_fetcher.fetch(url) if self.http_fetcher else None
+        if fetched is not None:
+            page_source = fetched.html
+        else:
+            page_source = self._open_in_browser(
+                url, lambda: str(self.driver.page_source)
+            )
+
+        archive_page(self.archive, url, page_source, kind="map")
+        return page_source
+
+    def _open_in_browser[T](self, url: str, read_page: Callable[[], T]) -> T:
+        """Loads a map page in the browser session and reads it with read_page."""
         try:
-            self.driver.get(url)
-            self._wait_for_map_content(url)
-            return BeautifulSoup(self.driver.page_source, "html.parser")
+            with self.rate_limiter.paced(url, acquire=self.http_fetcher is None):
+                self.driver.get(url)
+                self._wait_for_map_content(url)
+                page = read_page()
         except SessionScrapeError:
             raise
         except Exception as e:
             raise SessionScrapeError(f"Failed to fetch map stats page: {url}") from e
 
+        if self.http_fetcher is not None:
+            self.http_fetcher.harvest_browser_session(self.driver)
+        return page
+
+    def _read_loaded_page(self) -> ExtractedMapPage | str:
+        """Returns the in-browser extraction when usable, else the page source.
+
+        Extraction is skipped while archiving, so the archived HTML and the
+        parsed result always come from the same page source.
+        """
+        if self.extract_in_browser and self.archive is None:
+            extracted = extract_map_page(self.driver)
+            if extracted is not None:
+                return extracted
+        return str(self.driver.page_source)
+
     def _wait_for_map_content(self, url: str) -> None:
         """Waits until the fetched page contains expected map stats content."""
-        try:
-            WebDriverWait(self.driver, self.content_wait_seconds).until(
-                lambda driver: driver.find_element(
-                    By.CSS_SELECTOR,
-                    REQUIRED_MAP_SELECTOR,
-                )
-            )
-        except TimeoutException as e:
-            marker_flags = self._log_missing_map_content(url)
-            challenge_markers = [
-                marker for marker, is_present in marker_flags.items() if is_present
-            ]
-            if challenge_markers:
-                marker_list = ", ".join(challenge_markers)
-                raise SessionScrapeError(
-                    "Map stats page appears blocked or challenged "
-                    f"after {self.content_wait_seconds:g}s "
-                    f"(markers: {marker_list}): {url}"
-                ) from e
-            raise SessionScrapeError(
-                "Map stats page missing required content "
-                f"after {self.content_wait_seconds:g}s: {url}"
-            ) from e
-
-    def _log_missing_map_content(self, requested_url: str) -> dict[str, bool]:
-        page_source = self.driver.page_source or ""
-        page_source_lower = page_source.lower()
-        marker_flags = {
-            marker.replace(" ", "_"): marker in page_source_lower
-            for marker in CHALLENGE_MARKERS
-        }
-        snippet = " ".join(page_source.split())[:PAGE_SNIPPET_LIMIT]
-
-        logger.warning(
-            "Map stats page missing required selector=%s requested_url=%s "
-            "current_url=%s title=%s page_source_length=%d marker_flags=%s "
-            "page_snippet=%r",
-            REQUIRED_MAP_SELECTOR,
-            requested_url,
-            getattr(self.driver, "current_url", None),
-            getattr(self.driver, "title", None),
-            len(page_source),
-            marker_flags,
-            snippet,
+        ensure_page_ready(
+            self.driver,
+            logger=logger,
+            page_label="Map stats page",
+            selectors=self.blocking_profile.required_selectors,
+            timeout=self.content_wait_seconds,
+            url=url,
         )
-        return marker_flags
 
     def close(self) -> None:
         """Closes the Selenium driver."""
+        if self.http_fetcher is not None:
+            self.http_fetcher.close()
         try:
             self.driver.quit()
             logger.info("Selenium driver closed.")
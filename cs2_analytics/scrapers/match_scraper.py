@@ -1,15 +1,34 @@
 """Fetches raw match HTML for downstream parsing."""
 
-import time
-
 from bs4 import BeautifulSoup
 from seleniumbase import Driver
 
+from cs2_analytics.archive import PageArchive, archive_page, get_page_archive
 from cs2_analytics.exceptions import MatchScrapeError, SessionScrapeError
+from cs2_analytics.parsers.match_parser import MatchParser
+from cs2_analytics.parsers.parse_backend import make_soup
+from cs2_analytics.scrapers.http_fetch import PageFetcher, build_http_fetcher
+from cs2_analytics.scrapers.page_readiness import (
+    DEFAULT_CONTENT_WAIT_SECONDS,
+    ensure_page_ready,
+)
+from cs2_analytics.scrapers.rate_limiter import HostRateLimiter, get_rate_limiter
+from cs2_analytics.scrapers.resource_blocking import (
+    BlockingProfile,
+    apply_blocking_profile,
+)
 from cs2_analytics.utils.log_manager import get_logger
 
 logger = get_logger(__name__)
 
+# Team names and the per-map rows are server-rendered together with the map
+# stats links. div.mapname is required rather than a.results-stats because
+# forfeited matches render a "Default" map row but no stats link.
+REQUIRED_MATCH_SELECTORS = ("div.teamName", "div.mapname")
+MATCH_BLOCKING_PROFILE = BlockingProfile(
+    name="match", required_selectors=REQUIRED_MATCH_SELECTORS
+)
+
 
 class MatchScraper:
     """
@@ -19,8 +38,32 @@ class MatchScraper:
     database insertion.
     """
 
-    def __init__(self):
+    blocking_profile = MATCH_BLOCKING_PROFILE
+
+    def __init__(
+        self,
+        archive: PageArchive | None = None,
+        content_wait_seconds: float = DEFAULT_CONTENT_WAIT_SECONDS,
+        rate_limiter: HostRateLimiter | None = None,
+        blocking_profile: BlockingProfile | None = None,
+        http_fetcher: PageFetcher | None = None,
+    ):
         self.driver = Driver(uc=True, headless=True)
+        if blocking_profile is not None:
+            self.blocking_profile = blocking_profile
+        apply_blocking_profile(self.driver, self.blocking_profile)
+        self.content_wait_seconds = content_wait_seconds
+        self.archive = archive if archive is not None else get_page_archive()
+        self.rate_limiter = (
+            rate_limiter if rate_limiter is not None else get_rate_limiter()
+        )
+        self.http_fetcher = (
+            http_fetcher
+            if http_fetcher is not None
+            else build_http_fetcher(
+                self.blocking_profile, self.rate_limiter, MatchParser.page_regions
+            )
+        )
 
     def __enter__(self) -> "MatchScraper":
         return self
@@ -29,16 +72,43 @@ class MatchScraper:
         self.close()
 
     def fetch_soup(self, url: str) -> BeautifulSoup:
-        """Loads a match page and returns its parsed HTML."""
+        """Loads a match page, over HTTP when possible, and returns its parsed HTML."""
+        fetched = self.http_fetcher.fetch(url) if self.http_fetcher else None
+        if fetched is not None:
+            archive_page(self.archive, url, fetched.html, kind="match")
+            return fetched.soup
+
+        page_source = self._load_in_browser(url)
+        archive_page(self.archive, url, page_source, kind="match")
+        return make_soup(page_source, regions=MatchParser.page_regions)
+
+    def _load_in_browser(self, url: str) -> str:
+        """Loads a match page in the browser session and returns its source."""
         try:
-            self.driver.get(url)
-            time.sleep(3)
-            return BeautifulSoup(self.driver.page_source, "html.parser")
+            with self.rate_limiter.paced(url, acquire=self.http_fetcher is None):
+                self.driver.get(url)
+                ensure_page_ready(
+                    self.driver,
+                    logger=logger,
+                    page_label="Match page",
+                    selectors=self.blocking_profile.required_selectors,
+                    timeout=self.content_wait_seconds,
+                    url=url,
+                )
+                page_source = str(self.driver.page_source)
+        except SessionScrapeError:
+            raise
         except Exception as e:
             raise SessionScrapeError(f"Failed to fetch match page: {url}") from e
 
+        if self.http_fetcher is not None:
+            self.http_fetcher.harvest_browser_session(self.driver)
+        return page_source
+
     def close(self) -> None:
         """Closes the Selenium driver."""
+        if self.http_fetcher is not None:
+            self.http_fetcher.close()
         try:
             self.driver.quit()
             logger.info("Selenium driver closed.")
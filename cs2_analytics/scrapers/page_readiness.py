@@ -0,0 +1,117 @@
+"""Selector-driven readiness waits shared by the browser scrapers.
+
+Scrapers wait for the selectors their parser depends on instead of sleeping
+a fixed interval, so a page that renders quickly is parsed immediately. When
+the selectors never appear, the page source is checked for bot-challenge
+markers so blocked sessions surface as retryable session errors.
+"""
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from cs2_analytics.exceptions import ChallengePageError, SessionScrapeError
+
+DEFAULT_CONTENT_WAIT_SECONDS = 10.0
+PAGE_SNIPPET_LIMIT = 300
+CHALLENGE_MARKERS = (
+    "access denied",
+    "captcha",
+    "checking your browser",
+    "cloudflare",
+    "enable javascript",
+    "just a moment",
+    "verify you are human",
+)
+
+
+def wait_for_selectors(driver, selectors: tuple[str, ...], timeout: float) -> bool:
+    """Waits until every selector matches; returns False if the wait times out."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda current: all(
+                current.find_element(By.CSS_SELECTOR, selector)
+                for selector in selectors
+            )
+        )
+    except TimeoutException:
+        return False
+    return True
+
+
+def challenge_marker_flags(page_source: str) -> dict[str, bool]:
+    """Flags which known challenge markers appear in the page source."""
+    page_source_lower = page_source.lower()
+    return {
+        marker.replace(" ", "_"): marker in page_source_lower
+        for marker in CHALLENGE_MARKERS
+    }
+
+
+def log_missing_content(
+    driver,
+    *,
+    logger,
+    page_label: str,
+    selectors: tuple[str, ...],
+    requested_url: str,
+) -> dict[str, bool]:
+    """Logs diagnostics for a page missing its selectors; returns marker flags."""
+    page_source = driver.page_source or ""
+    marker_flags = challenge_marker_flags(page_source)
+    snippet = " ".join(page_source.split())[:PAGE_SNIPPET_LIMIT]
+
+    logger.warning(
+        "%s missing required selector=%s requested_url=%s "
+        "current_url=%s title=%s page_source_length=%d marker_flags=%s "
+        "page_snippet=%r",
+        page_label,
+        ", ".join(selectors),
+        requested_url,
+        getattr(driver, "current_url", None),
+        getattr(driver, "title", None),
+        len(page_source),
+        marker_flags,
+        snippet,
+    )
+    return marker_flags
+
+
+def raise_for_challenge(
+    marker_flags: dict[str, bool], *, page_label: str, timeout: float, url: str
+) -> None:
+    """Raises ChallengePageError when challenge markers were found."""
+    challenge_markers = [
+        marker for marker, is_present in marker_flags.items() if is_present
+    ]
+    if challenge_markers:
+        raise ChallengePageError(
+            f"{page_label} appears blocked or challenged "
+            f"after {timeout:g}s "
+            f"(markers: {', '.join(challenge_markers)}): {url}"
+        )
+
+
+def ensure_page_ready(
+    driver,
+    *,
+    logger,
+    page_label: str,
+    selectors: tuple[str, ...],
+    timeout: float,
+    url: str,
+) -> None:
+    """Waits for the page's required selectors or raises SessionScrapeError."""
+    if wait_for_selectors(driver, selectors, timeout):
+        return
+    marker_flags = log_missing_content(
+        driver,
+        logger=logger,
+        page_label=page_label,
+        selectors=selectors,
+        requested_url=url,
+    )
+    raise_for_challenge(marker_flags, page_label=page_label, timeout=timeout, url=url)
+    raise SessionScrapeError(
+        f"{page_label} missing required content after {timeout:g}s: {url}"
+    )
@@ -0,0 +1,153 @@
+"""AIMD request-rate control driven by page-fetch outcomes.
+
+Scrapers report every fetch to the shared rate limiter, which forwards the
+outcome here. Clean, fast pages raise the allowed rate by a fixed step;
+a challenge page cuts it multiplicatively at once, and other session
+failures (readiness timeouts, dropped sessions) cut it when they spike
+within the recent window. After every cut the rate holds for a backoff
+period before it may climb again, so the controller settles just below the
+highest rate the source tolerates.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from cs2_analytics.exceptions import ChallengePageError, ConfigurationError
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+FetchOutcome = Literal["clean", "slow", "challenge", "error"]
+
+DEFAULT_WINDOW_SIZE = 20
+DEFAULT_ERROR_SPIKE_RATIO = 0.25
+MIN_SPIKE_ERRORS = 2
+DEFAULT_SLOW_PAGE_SECONDS = 6.0
+DEFAULT_BACKOFF_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class RateControlMetrics:
+    """Point-in-time view of the adaptive rate controller."""
+
+    requests_per_minute: float
+    challenge_ratio: float
+    error_ratio: float
+    backing_off: bool
+    backoff_remaining_seconds: float
+    decreases: int
+
+
+class AimdRateControl:
+    """Additive-increase / multiplicative-decrease control of the request rate."""
+
+    def __init__(
+        self,
+        initial_requests_per_minute: float,
+        *,
+        min_requests_per_minute: float,
+        max_requests_per_minute: float,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        slow_page_seconds: float = DEFAULT_SLOW_PAGE_SECONDS,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        error_spike_ratio: float = DEFAULT_ERROR_SPIKE_RATIO,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < min_requests_per_minute <= max_requests_per_minute:
+            raise ConfigurationError(
+                "Adaptive rate bounds must satisfy 0 < min <= max requests/minute."
+            )
+        if not 0 < decrease_factor < 1:
+            raise ConfigurationError("Adaptive rate decrease factor must be in (0, 1).")
+        self.min_requests_per_minute = min_requests_per_minute
+        self.max_requests_per_minute = max_requests_per_minute
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.slow_page_seconds = slow_page_seconds
+        self.error_spike_ratio = error_spike_ratio
+        self.backoff_seconds = backoff_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests_per_minute = min(
+            max(initial_requests_per_minute, min_requests_per_minute),
+            max_requests_per_minute,
+        )
+        self._outcomes: deque[FetchOutcome] = deque(maxlen=window_size)
+        self._backoff_until = 0.0
+        self._decreases = 0
+
+    @property
+    def requests_per_second(self) -> float:
+        """Currently allowed request rate."""
+        with self._lock:
+            return self._requests_per_minute / 60.0
+
+    def record_success(self, latency_seconds: float) -> None:
+        """Records a page that became ready; fast pages raise the rate."""
+        slow = latency_seconds > self.slow_page_seconds
+        with self._lock:
+            self._outcomes.append("slow" if slow else "clean")
+            if slow or self._clock() < self._backoff_until:
+                return
+            self._requests_per_minute = min(
+                self._requests_per_minute + self.increase_step,
+                self.max_requests_per_minute,
+            )
+
+    def record_failure(self, error: Exception) -> None:
+        """Records a failed fetch; challenges and error spikes cut the rate."""
+        challenged = isinstance(error, ChallengePageError)
+        with self._lock:
+            self._outcomes.append("challenge" if challenged else "error")
+            if challenged or self._is_error_spike():
+                self._decrease()
+                logger.warning(
+                    "Cut scrape rate to %.1f requests/minute after %s: %s",
+                    self._requests_per_minute,
+                    "challenge page" if challenged else "session error spike",
+                    error,
+                )
+
+    def metrics(self) -> RateControlMetrics:
+        """Returns the current rate, recent challenge ratio, and backoff state."""
+        with self._lock:
+            remaining = max(0.0, self._backoff_until - self._clock())
+            return RateControlMetrics(
+                requests_per_minute=self._requests_per_minute,
+                challenge_ratio=self._ratio("challenge"),
+                error_ratio=self._ratio("challenge", "error"),
+                backing_off=remaining > 0,
+                backoff_remaining_seconds=remaining,
+                decreases=self._decreases,
+            )
+
+    def _decrease(self) -> None:
+        """Cuts the rate and starts (or extends) the no-increase backoff window."""
+        self._requests_per_minute = max(
+            self._requests_per_minute * self.decrease_factor,
+            self.min_requests_per_minute,
+        )
+        self._backoff_until = self._clock() + self.backoff_seconds
+        self._decreases += 1
+
+    def _is_error_spike(self) -> bool:
+        """True when failures make up too much of the recent window."""
+        failures = sum(
+            1 for outcome in self._outcomes if outcome in ("challenge", "error")
+        )
+        return (
+            failures >= MIN_SPIKE_ERRORS
+            and failures / len(self._outcomes) >= self.error_spike_ratio
+        )
+
+    def _ratio(self, *outcomes: FetchOutcome) -> float:
+        if not self._outcomes:
+            return 0.0
+        matching = sum(1 for outcome in self._outcomes if outcome in outcomes)
+        return matching / len(self._outcomes)
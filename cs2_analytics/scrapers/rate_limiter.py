@@ -0,0 +1,177 @@
+"""Per-host token-bucket pacing shared by every scraper session.
+
+All scrapers acquire from one limiter before `driver.get`, so the request
+budget for a host holds no matter how many worker sessions are running.
+Each bucket is tracked in virtual-scheduling form: a theoretical arrival
+time per host, advanced by one interval per request, with up to `burst`
+requests allowed ahead of it. A caller only sleeps when it is actually
+ahead of the allowed rate, so time already spent parsing or writing to the
+database counts toward the gap between requests.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from cs2_analytics.config.config import (
+    SCRAPE_ADAPTIVE_RATE,
+    SCRAPE_BURST,
+    SCRAPE_JITTER_SECONDS,
+    SCRAPE_MAX_REQUESTS_PER_MINUTE,
+    SCRAPE_MIN_REQUESTS_PER_MINUTE,
+    SCRAPE_REQUESTS_PER_MINUTE,
+)
+from cs2_analytics.exceptions import ConfigurationError
+from cs2_analytics.scrapers.rate_control import AimdRateControl, RateControlMetrics
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+class HostRateLimiter:
+    """Token bucket per host with randomized jitter on enforced waits.
+
+    A non-positive rate disables pacing entirely; `defer` still applies so
+    controller cooldowns keep working. When `rate_control` is given, the
+    steady-state rate comes from it instead, and scrapers feed it fetch
+    outcomes through `report_success` / `report_failure`.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        *,
+        burst: int = 1,
+        jitter_seconds: float = 0.0,
+        rate_control: AimdRateControl | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if burst < 1:
+            raise ConfigurationError("Rate limiter burst must be at least 1.")
+        if jitter_seconds < 0:
+            raise ConfigurationError("Rate limiter jitter cannot be negative.")
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.jitter_seconds = jitter_seconds
+        self.rate_control = rate_control
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._arrival_times: dict[str, float] = {}
+        self._blocked_until: dict[str, float] = {}
+
+    @property
+    def interval(self) -> float:
+        """Seconds between requests at the steady-state rate (0 when unlimited)."""
+        requests_per_second = (
+            self.rate_control.requests_per_second
+            if self.rate_control is not None
+            else self.requests_per_second
+        )
+        if requests_per_second <= 0:
+            return 0.0
+        return 1.0 / requests_per_second
+
+    def acquire(self, url: str) -> float:
+        """Blocks until a request to the URL's host is allowed; returns seconds slept."""
+        host = _host_of(url)
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._blocked_until.get(host, now))
+            interval = self.interval
+            if interval:
+                tolerance = (self.burst - 1) * interval
+                arrival = max(self._arrival_times.get(host, start), start)
+                start = max(start, arrival - tolerance)
+                self._arrival_times[host] = arrival + interval
+            wait = start - now
+
+        if wait <= 0:
+            return 0.0
+        wait += random.uniform(0.0, self.jitter_seconds)
+        logger.debug("Pacing request to %s: sleeping %.2fs", host, wait)
+        self._sleep(wait)
+        return wait
+
+    @contextmanager
+    def paced(self, url: str, *, acquire: bool = True) -> Iterator[None]:
+        """Acquires for one page load and reports how it went to rate control.
+
+        The block should cover the navigation and readiness wait; its
+        duration is the page-ready latency, and any exception raised inside
+        it is reported as a failed fetch before propagating. Pass
+        acquire=False when the page's token was already acquired, e.g. by
+        an HTTP fetch attempt that escalated to the browser.
+        """
+        if acquire:
+            self.acquire(url)
+        started = self._clock()
+        try:
+            yield
+        except Exception as e:
+            self.report_failure(e)
+            raise
+        self.report_success(self._clock() - started)
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Holds back every request to the URL's host for at least `seconds`.
+
+        Used for cooldowns after retryable errors: the wait is paid by the
+        next acquire on any worker, overlapping with session resets instead
+        of blocking the worker that hit the error.
+        """
+        host = _host_of(url)
+        with self._lock:
+            until = self._clock() + seconds
+            self._blocked_until[host] = max(self._blocked_until.get(host, until), until)
+
+    def report_success(self, latency_seconds: float) -> None:
+        """Feeds a successful fetch and its page-ready latency to rate control."""
+        if self.rate_control is not None:
+            self.rate_control.record_success(latency_seconds)
+
+    def report_failure(self, error: Exception) -> None:
+        """Feeds a failed fetch to rate control."""
+        if self.rate_control is not None:
+            self.rate_control.record_failure(error)
+
+    def metrics(self) -> RateControlMetrics | None:
+        """Returns adaptive rate metrics, or None when the rate is fixed."""
+        if self.rate_control is None:
+            return None
+        return self.rate_control.metrics()
+
+
+def _host_of(url: str) -> str:
+    """Returns the bucket key for a URL: its lowercase host."""
+    return urlsplit(url).netloc.lower()
+
+
+_default_limiter: HostRateLimiter | None = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Returns the process-wide limiter configured by SCRAPE_* settings."""
+    global _default_limiter
+
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            rate_control = None
+            if SCRAPE_ADAPTIVE_RATE and SCRAPE_REQUESTS_PER_MINUTE > 0:
+                rate_control = AimdRateControl(
+                    SCRAPE_REQUESTS_PER_MINUTE,
+                    min_requests_per_minute=SCRAPE_MIN_REQUESTS_PER_MINUTE,
+                    max_requests_per_minute=SCRAPE_MAX_REQUESTS_PER_MINUTE,
+                )
+            _default_limiter = HostRateLimiter(
+                SCRAPE_REQUESTS_PER_MINUTE / 60.0,
+                burst=SCRAPE_BURST,
+                jitter_seconds=SCRAPE_JITTER_SECONDS,
+                rate_control=rate_control,
+            )
+    return _default_limiter
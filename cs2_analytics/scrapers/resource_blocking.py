@@ -0,0 +1,127 @@
+"""Subresource blocking profiles for scraper browser sessions.
+
+Parsers read only server-rendered HTML, so images, fonts, media, ads and
+third-party analytics scripts are pure overhead on every page load. Each
+scraper class carries a BlockingProfile that is pushed to Chromium through
+CDP `Network.setBlockedURLs` when its session starts. First-party HTML,
+scripts and stylesheets, and Cloudflare challenge resources, are never
+blocked; the profile also records the selectors its page must still expose,
+so the readiness wait and the profile are defined side by side.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import cached_property
+
+from cs2_analytics.config.config import SCRAPE_BLOCK_RESOURCES
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+IMAGE_URL_PATTERNS = (
+    "*.png*",
+    "*.jpg*",
+    "*.jpeg*",
+    "*.gif*",
+    "*.webp*",
+    "*.avif*",
+    "*.svg*",
+    "*.ico*",
+    "*img-cdn.hltv.org/*",
+)
+FONT_URL_PATTERNS = (
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.eot*",
+    "*fonts.googleapis.com/*",
+    "*fonts.gstatic.com/*",
+)
+MEDIA_URL_PATTERNS = (
+    "*.mp4*",
+    "*.webm*",
+    "*.m3u8*",
+)
+AD_AND_ANALYTICS_URL_PATTERNS = (
+    "*doubleclick.net/*",
+    "*googlesyndication.com/*",
+    "*googleadservices.com/*",
+    "*googletagmanager.com/*",
+    "*google-analytics.com/*",
+    "*adnxs.com/*",
+    "*amazon-adsystem.com/*",
+    "*criteo.com/*",
+    "*criteo.net/*",
+    "*scorecardresearch.com/*",
+    "*quantserve.com/*",
+    "*hotjar.com/*",
+    "*connect.facebook.net/*",
+    "*platform.twitter.com/*",
+    "*embed.twitch.tv/*",
+    "*player.twitch.tv/*",
+    "*youtube.com/embed/*",
+)
+DEFAULT_BLOCKED_URL_PATTERNS = (
+    IMAGE_URL_PATTERNS
+    + FONT_URL_PATTERNS
+    + MEDIA_URL_PATTERNS
+    + AD_AND_ANALYTICS_URL_PATTERNS
+)
+
+
+@dataclass(frozen=True)
+class BlockingProfile:
+    """URL patterns one scraper class blocks, and the selectors it relies on."""
+
+    name: str
+    required_selectors: tuple[str, ...]
+    blocked_url_patterns: tuple[str, ...] = DEFAULT_BLOCKED_URL_PATTERNS
+
+    @cached_property
+    def _compiled(self) -> re.Pattern[str] | None:
+        if not self.blocked_url_patterns:
+            return None
+        return re.compile(
+            "|".join(
+                _wildcard_to_regex(pattern) for pattern in self.blocked_url_patterns
+            )
+        )
+
+    def blocks(self, url: str) -> bool:
+        """Returns True if Chromium would block this URL under the profile.
+
+        Mirrors CDP pattern semantics, where `*` is the only wildcard.
+        """
+        compiled = self._compiled
+        return compiled is not None and compiled.fullmatch(url) is not None
+
+
+def _wildcard_to_regex(pattern: str) -> str:
+    return ".*".join(re.escape(part) for part in pattern.split("*"))
+
+
+def apply_blocking_profile(driver, profile: BlockingProfile) -> bool:
+    """Installs the profile's URL blocklist on a fresh browser session.
+
+    Blocking is an optimization, so a driver that rejects the CDP commands
+    is logged and left unblocked rather than failing scraper startup.
+    Returns True when the blocklist was installed.
+    """
+    if not SCRAPE_BLOCK_RESOURCES or not profile.blocked_url_patterns:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": list(profile.blocked_url_patterns)}
+        )
+    except Exception as e:
+        logger.warning(
+            "Could not apply %s resource blocking profile: %s", profile.name, e
+        )
+        return False
+    logger.debug(
+        "Applied %s resource blocking profile (%d patterns)",
+        profile.name,
+        len(profile.blocked_url_patterns),
+    )
+    return True
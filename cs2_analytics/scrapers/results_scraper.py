@@ -1,4 +1,4 @@
-"""Scrapes HLTV results pages and yields discovered match links.
+"""Scrapes HLTV results pages and yields discovered match listings.
 
 Fetch-only by contract: this module performs no database or ingestion-state
 writes. Discovered matches are yielded to the caller, and
@@ -6,20 +6,38 @@ ResultsStageService owns recording them.
 """
 
 import datetime as dt
-import random
-import re
-import time
 from collections.abc import Iterator
 
-from bs4 import BeautifulSoup
 from seleniumbase import Driver
 
+from cs2_analytics.archive import PageArchive, archive_page, get_page_archive
 from cs2_analytics.config.config import END_DATE, MAX_MATCHES, SOURCE_URL, START_DATE
 from cs2_analytics.exceptions import ResultsScrapeError, SessionScrapeError
+from cs2_analytics.models.result_listing import ResultListing
+from cs2_analytics.parsers.parse_backend import make_soup
+from cs2_analytics.parsers.results_parser import ResultsParser
+from cs2_analytics.scrapers.http_fetch import PageFetcher, build_http_fetcher
+from cs2_analytics.scrapers.page_readiness import (
+    DEFAULT_CONTENT_WAIT_SECONDS,
+    log_missing_content,
+    raise_for_challenge,
+    wait_for_selectors,
+)
+from cs2_analytics.scrapers.rate_limiter import HostRateLimiter, get_rate_limiter
+from cs2_analytics.scrapers.resource_blocking import (
+    BlockingProfile,
+    apply_blocking_profile,
+)
 from cs2_analytics.utils.log_manager import get_logger
 
 logger = get_logger(__name__)
 
+REQUIRED_RESULTS_SELECTOR = "div.results-sublist"
+RESULTS_BLOCKING_PROFILE = BlockingProfile(
+    name="results", required_selectors=(REQUIRED_RESULTS_SELECTOR,)
+)
+RESULTS_PAGE_REGIONS = ResultsParser.page_regions
+
 
 class ResultsScraper:
     """
@@ -28,9 +46,34 @@ class ResultsScraper:
     Designed to be used as a context manager to ensure the browser is closed.
     """
 
-    def __init__(self) -> None:
+    blocking_profile = RESULTS_BLOCKING_PROFILE
+
+    def __init__(
+        self,
+        archive: PageArchive | None = None,
+        content_wait_seconds: float = DEFAULT_CONTENT_WAIT_SECONDS,
+        rate_limiter: HostRateLimiter | None = None,
+        blocking_profile: BlockingProfile | None = None,
+        http_fetcher: PageFetcher | None = None,
+    ) -> None:
         """Initializes the scraper with a SeleniumBase driver and config params."""
         self.driver = Driver(uc=True, headless=True)
+        if blocking_profile is not None:
+            self.blocking_profile = blocking_profile
+        apply_blocking_profile(self.driver, self.blocking_profile)
+        self.content_wait_seconds = content_wait_seconds
+        self.archive = archive if archive is not None else get_page_archive()
+        self.rate_limiter = (
+            rate_limiter if rate_limiter is not None else get_rate_limiter()
+        )
+        self.http_fetcher = (
+            http_fetcher
+            if http_fetcher is not None
+            else build_http_fetcher(
+                self.blocking_profile, self.rate_limiter, RESULTS_PAGE_REGIONS
+            )
+        )
+        self.parser = ResultsParser()
         self.base_url = SOURCE_URL
         self.start_date = dt.datetime.strptime(START_DATE, "%Y-%m-%d").date()
         self.end_date = dt.datetime.strptime(END_DATE, "%Y-%m-%d").date()
@@ -45,7 +88,7 @@ class ResultsScraper:
 
     def iter_match_batches(
         self, max_matches: int = MAX_MATCHES
-    ) -> Iterator[list[tuple[int, str]]]:
+    ) -> Iterator[list[ResultListing]]:
         """
         Scrapes HLTV results pages and yields discovered matches per page.
 
@@ -53,7 +96,7 @@ class ResultsScraper:
             max_matches (int): Maximum number of matches to discover.
 
         Yields:
-            One list of (match_id, match_url) tuples per results page.
+            One list of match listings (link plus header data) per results page.
         """
         offset = 0
         total_discovered = 0
@@ -62,93 +105,88 @@ class ResultsScraper:
             page_url = f"{self.base_url}?offset={offset}&gameType=CS2"
             logger.info("Scraping page: %s", page_url)
 
-            match_urls, stop = self._extract_matches_from_page(page_url)
-            batch = []
-            for full_url in match_urls:  # already starts with https://www.hltv.org
-                if total_discovered >= max_matches:
-                    break
-                match_id = self._extract_match_id(full_url)
-                if match_id:
-                    batch.append((match_id, full_url))
-                    total_discovered += 1
+            listings, stop = self._extract_matches_from_page(page_url)
+            batch = listings[: max_matches - total_discovered]
+            total_discovered += len(batch)
 
             if batch:
                 yield batch
 
-            if total_discovered >= max_matches or stop or not match_urls:
+            if total_discovered >= max_matches or stop or not listings:
                 break
 
             offset += 100
-            time.sleep(random.uniform(1.0, 2.0))
 
         logger.info("Discovered %s matches total.", total_discovered)
 
-    def _extract_matches_from_page(self, url: str) -> tuple[list[str], bool]:
+    def _extract_matches_from_page(self, url: str) -> tuple[list[ResultListing], bool]:
         """
-        Extracts match links from a results page.
+        Extracts match listings from a results page.
 
         Args:
             url (str): Page URL to scrape.
 
         Returns:
-            Tuple of (list of match URLs, whether to stop scraping)
+            Tuple of (match listings, whether to stop scraping)
         """
+        fetched = self.http_fetcher.fetch(url) if self.http_fetcher else None
+        if fetched is not None:
+            archive_page(self.archive, url, fetched.html, kind="results")
+            soup = fetched.soup
+        else:
+            page_source = self._load_in_browser(url)
+            archive_page(self.archive, url, page_source, kind="results")
+            soup = make_soup(page_source, regions=RESULTS_PAGE_REGIONS)
+        return self.parser.parse_results_page(
+            soup,
+            start_date=self.start_date,
+            end_date=self.end_date,
+        )
+
+    def _load_in_browser(self, url: str) -> str:
+        """Loads a results page in the browser session and returns its source."""
         try:
-            self.driver.get(url)
-            time.sleep(random.uniform(3, 5))
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            with self.rate_limiter.paced(url, acquire=self.http_fetcher is None):
+                self.driver.get(url)
+                self._wait_for_results_content(url)
+                page_source = str(self.driver.page_source)
+        except SessionScrapeError:
+            raise
         except Exception as e:
             raise SessionScrapeError(f"Failed to fetch results page: {url}") from e
 
-        matches: list[str] = []
-        stop_scraping = False
+        if self.http_fetcher is not None:
+            self.http_fetcher.harvest_browser_session(self.driver)
+        return page_source
 
-        for section in soup.find_all("div", class_="results-sublist"):
-            date_header = section.find("div", class_="standard-headline")
-            if not date_header:
-                continue
+    def _wait_for_results_content(self, url: str) -> None:
+        """Waits for the results listing, failing fast on challenge pages.
 
-            raw_date = re.sub(
-                r"(st|nd|rd|th)", "", date_header.text.replace("Results for ", "")
-            )
-            try:
-                match_date = dt.datetime.strptime(raw_date.strip(), "%B %d %Y").date()
-            except ValueError:
-                logger.warning("Could not parse date: %s", raw_date)
-                continue
-
-            if match_date > self.end_date:
-                continue
-            if match_date < self.start_date:
-                logger.info(
-                    "Stopping at match date %s because it is out of range.", match_date
-                )
-                return matches, True
-
-            for match in section.find_all("div", class_="result-con"):
-                a_tag = match.find("a", href=True)
-                if not a_tag:
-                    continue
-                full_url = f"https://www.hltv.org{a_tag['href']}"
-                matches.append(full_url)
-
-        return matches, stop_scraping
-
-    def _extract_match_id(self, url: str) -> int | None:
-        """
-        Extracts numeric match ID from the match URL.
-
-        Args:
-            url (str): HLTV match URL.
-
-        Returns:
-            Match ID or None if not found.
+        A results page past the last available result legitimately has no
+        sublists, so a timeout without challenge markers is logged and the
+        page is returned as-is; parsing then finds no matches and stops.
         """
-        match = re.search(r"/matches/(\d+)", url)
-        return int(match.group(1)) if match else None
+        selectors = self.blocking_profile.required_selectors
+        if wait_for_selectors(self.driver, selectors, self.content_wait_seconds):
+            return
+        marker_flags = log_missing_content(
+            self.driver,
+            logger=logger,
+            page_label="Results page",
+            selectors=selectors,
+            requested_url=url,
+        )
+        raise_for_challenge(
+            marker_flags,
+            page_label="Results page",
+            timeout=self.content_wait_seconds,
+            url=url,
+        )
 
     def close(self) -> None:
         """Closes the SeleniumBase driver."""
+        if self.http_fetcher is not None:
+            self.http_fetcher.close()
         try:
             self.driver.quit()
             logger.info("Selenium driver closed.")
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from cs2_analytics.models.player_batch import PlayerBatch
+from cs2_analytics.stage_services.group_commit import GroupCommitBuffer
 from cs2_analytics.stage_services.stage_result import StageItemResult
+from cs2_analytics.utils.log_manager import get_logger
 
 if TYPE_CHECKING:
     from typing import Protocol
 
     from cs2_analytics.ingestion_state import MapIngestionState
     from cs2_analytics.models.map import Map
-    from cs2_analytics.models.player import Player
-    from cs2_analytics.parsers.map_parser import MapParser
+    from cs2_analytics.parsers.map_parser import MapParser, ParsedMap
+    from cs2_analytics.parsers.schema_drift import SchemaDriftBreaker
     from cs2_analytics.scrapers.map_scraper import MapScraper
     from cs2_analytics.storage.database import Database
 
@@ -24,11 +27,22 @@ if TYPE_CHECKING:
     class PlayerWriter(Protocol):
         """Persists player rows, optionally joining the caller's transaction."""
 
-        def __call__(self, players: list[Player], /, cur: object = None) -> None: ...
+        def __call__(self, players: PlayerBatch, /, cur: object = None) -> None: ...
+
+
+logger = get_logger(__name__)
+
+# Failure reasons are truncated to fit ingestion-state rows, as in the controllers.
+FAILURE_REASON_LIMIT = 500
 
 
 class MapStageService:
-    """Coordinates one map ingestion item."""
+    """Coordinates one map ingestion item.
+
+    With group_commit_size > 1, parsed maps are queued and committed in
+    groups of that size instead of one transaction each; call
+    finish_writes() once the batch is done to commit the rest.
+    """
 
     def __init__(
         self,
@@ -37,12 +51,22 @@ class MapStageService:
         store_players: PlayerWriter,
         map_state: MapIngestionState,
         db: Database,
+        drift_breaker: SchemaDriftBreaker | None = None,
+        group_commit_size: int = 0,
     ) -> None:
         self.parser = parser
         self.store_maps = store_maps
         self.store_players = store_players
         self.map_state = map_state
         self.db = db
+        self.drift_breaker = drift_breaker
+        self.group_commit: GroupCommitBuffer[tuple[int, ParsedMap]] | None = None
+        if group_commit_size > 1:
+            self.group_commit = GroupCommitBuffer(
+                group_commit_size,
+                write_group=self.record_parsed_batch,
+                fail_item=self._mark_write_failed,
+            )
 
     def process_item(
         self,
@@ -61,6 +85,8 @@ class MapStageService:
         ingestion state.
         """
         soup = scraper.fetch_soup(map_url)
+        if self.drift_breaker is not None:
+            self.drift_breaker.observe_page(map_id, map_url, soup)
         parsed_map = self.parser.parse_map_details(
             soup,
             map_url,
@@ -69,13 +95,55 @@ class MapStageService:
             map_order=map_order,
         )
 
+        return self.record_parsed(map_id, parsed_map)
+
+    def record_parsed(self, map_id: int, parsed_map: ParsedMap) -> StageItemResult:
+        """Persist one map parsed elsewhere and return its per-item outcome.
+
+        Used by process_item and by the map controller's parse pipeline,
+        whose parser processes hand parsed maps back for persistence. Under
+        group commit the map is only queued here; a later failed write marks
+        it failed and is counted by finish_writes().
+        """
         if not parsed_map.players:
             message = "Parsing returned no player records"
             self.map_state.mark_as_failed(map_id, message)
             return StageItemResult.failed(message)
 
-        with self.db.transaction() as cur:
-            self.store_maps([parsed_map.map], cur=cur)
-            self.store_players(parsed_map.players, cur=cur)
-            self.map_state.mark_as_processed(map_id, cur=cur)
+        if self.group_commit is not None:
+            self.group_commit.add((map_id, parsed_map))
+        else:
+            self.record_parsed_batch([(map_id, parsed_map)])
         return StageItemResult.processed()
+
+    def finish_writes(self) -> int:
+        """Commits queued maps; returns how many failed to write since the last call.
+
+        Always 0 without group commit, where writes fail in process_item.
+        """
+        if self.group_commit is None:
+            return 0
+        return self.group_commit.drain()
+
+    def record_parsed_batch(self, parsed: list[tuple[int, ParsedMap]]) -> None:
+        """Persist already-parsed maps and their state updates in one transaction.
+
+        Used by process_item for a single live fetch and by offline replay
+        for a batch of archived pages. Every map row, player row, and
+        processed transition commits or rolls back together (ADR-0013).
+        """
+        if not parsed:
+            return
+        with self.db.transaction() as cur:
+            self.store_maps([parsed_map.map for _, parsed_map in parsed], cur=cur)
+            self.store_players(
+                PlayerBatch.concat(parsed_map.players for _, parsed_map in parsed),
+                cur=cur,
+            )
+            for map_id, _ in parsed:
+                self.map_state.mark_as_processed(map_id, cur=cur)
+
+    def _mark_write_failed(self, item: tuple[int, ParsedMap], error: Exception) -> None:
+        map_id, _ = item
+        logger.error("Failed to store map %s: %s", map_id, error)
+        self.map_state.mark_as_failed(map_id, str(error)[:FAILURE_REASON_LIMIT])
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from cs2_analytics.exceptions import MatchParseError
 from cs2_analytics.stage_services.stage_result import StageItemResult
+from cs2_analytics.utils.log_manager import get_logger
 
 if TYPE_CHECKING:
     from typing import Protocol
@@ -15,16 +17,24 @@ if TYPE_CHECKING:
         MatchIngestionState,
     )
     from cs2_analytics.models.match import Match
+    from cs2_analytics.models.result_listing import ResultListing
     from cs2_analytics.parsers.match_parser import MatchParser
     from cs2_analytics.scrapers.match_scraper import MatchScraper
     from cs2_analytics.storage.database import Database
 
+    type ParsedMatchPage = tuple[
+        int, Match, list[tuple[int, str]], list[tuple[str, str]]
+    ]
+
     class MatchWriter(Protocol):
         """Persists matches, optionally joining the caller's transaction."""
 
         def __call__(self, matches: list[Match], /, cur: object = None) -> None: ...
 
 
+logger = get_logger(__name__)
+
+
 class MatchStageService:
     """Coordinates one match ingestion item."""
 
@@ -60,12 +70,46 @@ class MatchStageService:
             self.match_state.mark_as_failed(match_id, message)
             return StageItemResult.failed(message)
 
-        with self.db.transaction() as cur:
-            self.store_matches([match], cur=cur)
-            self._record_followups(match_id, map_links, demo_links, cur=cur)
-            self.match_state.mark_as_processed(match_id, cur=cur)
+        self.record_parsed_batch([(match_id, match, map_links, demo_links)])
         return StageItemResult.processed()
 
+    def record_parsed_batch(self, parsed: list[ParsedMatchPage]) -> None:
+        """Persist already-parsed matches and their state updates in one transaction.
+
+        Used by process_item for a single live fetch and by offline replay
+        for a batch of archived pages. Every match row, follow-up link, and
+        processed transition commits or rolls back together (ADR-0013).
+        """
+        if not parsed:
+            return
+        with self.db.transaction() as cur:
+            self.store_matches([match for _, match, _, _ in parsed], cur=cur)
+            for match_id, _, map_links, demo_links in parsed:
+                self._record_followups(match_id, map_links, demo_links, cur=cur)
+                self.match_state.mark_as_processed(match_id, cur=cur)
+
+    def record_listed_forfeits(self, listings: list[ResultListing]) -> int:
+        """Store forfeits from their results listing header, with no page load.
+
+        Listings the parser cannot build a match from are left discovered
+        for the regular match-page path. Returns the count stored.
+        """
+        matches = []
+        for listing in listings:
+            try:
+                matches.append(self.parser.match_from_listing(listing))
+            except MatchParseError as e:
+                logger.warning(
+                    "Leaving match %s for a page fetch: %s", listing.match_id, e
+                )
+        if not matches:
+            return 0
+        with self.db.transaction() as cur:
+            self.store_matches(matches, cur=cur)
+            for match in matches:
+                self.match_state.mark_as_processed(match.match_id, cur=cur)
+        return len(matches)
+
     def _record_followups(
         self,
         match_id: int,
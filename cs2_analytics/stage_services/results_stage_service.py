@@ -4,18 +4,24 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from cs2_analytics.utils.ingestion_state_helpers import chunk_and_record
+from more_itertools import chunked
 
 if TYPE_CHECKING:
     from cs2_analytics.ingestion_state import MatchIngestionState
+    from cs2_analytics.models.result_listing import ResultListing
+
+# Forfeits have no maps or demos to scrape, so they are queued behind played
+# matches; the match stage resolves them from their listing header instead.
+FORFEIT_LISTING_PRIORITY = -1
 
 
 class ResultsStageService:
-    """Records discovered match links in match ingestion state.
+    """Records discovered match listings in match ingestion state.
 
     Owns the persistence side of results discovery so the results scraper
-    stays fetch-only: the scraper yields discovered (match_id, match_url)
-    batches, and this service writes them as pending ingestion-state rows.
+    stays fetch-only: the scraper yields batches of parsed result listings,
+    and this service writes them, with their header data, as pending
+    ingestion-state rows.
     """
 
     def __init__(
@@ -29,14 +35,24 @@ class ResultsStageService:
         self.source = source
         self.chunk_size = chunk_size
 
-    def record_batch(self, batch: list[tuple[int, str]]) -> int:
-        """Record one batch of discovered matches; returns the count recorded."""
+    def record_batch(
+        self, batch: list[ResultListing], *, skip_known: bool = False
+    ) -> int:
+        """Record one batch of discovered matches; returns the count recorded.
+
+        With skip_known, matches already in match ingestion state are
+        left untouched and only new ones are recorded, so a return of 0
+        for a non-empty batch means every match in it was already known.
+        """
+        if skip_known and batch:
+            known_ids = self.match_state.fetch_known_ids(
+                [listing.match_id for listing in batch]
+            )
+            batch = [listing for listing in batch if listing.match_id not in known_ids]
         if not batch:
             return 0
-        chunk_and_record(
-            items=list(batch),
-            state_obj=self.match_state,
-            chunk_size=self.chunk_size,
-            source=self.source,
-        )
+        for chunk in chunked(batch, self.chunk_size):
+            self.match_state.record_listings(
+                chunk, source=self.source, forfeit_priority=FORFEIT_LISTING_PRIORITY
+            )
         return len(batch)
@@ -0,0 +1,110 @@
+"""Async database access for the API, on psycopg 3's async connection pool.
+
+The sync Database serves ingestion, whose workers are threads. API handlers
+instead await their queries on the event loop, so a slow aggregate holds a
+pooled connection but no threadpool slot. The pool follows the DB_POOL_*
+settings: checkouts wait up to DB_POOL_TIMEOUT_SECONDS, connections are
+checked before reuse, and replaced after their maximum lifetime or idle time.
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import psycopg
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import DictRow, dict_row
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+
+from cs2_analytics.config.config import (
+    DB_HOST,
+    DB_NAME,
+    DB_PASS,
+    DB_POOL_MAX_CONNECTIONS,
+    DB_POOL_MAX_IDLE_SECONDS,
+    DB_POOL_MAX_LIFETIME_SECONDS,
+    DB_POOL_MIN_CONNECTIONS,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_PORT,
+    DB_USER,
+)
+from cs2_analytics.exceptions import DatabaseConnectionError, DatabaseOperationError
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+type AsyncDictPool = AsyncConnectionPool[psycopg.AsyncConnection[DictRow]]
+
+
+def _create_pool() -> AsyncDictPool:
+    """Builds the pool closed; AsyncDatabase.open() starts it on the running loop."""
+    return AsyncConnectionPool(
+        make_conninfo(
+            dbname=DB_NAME, user=DB_USER, password=DB_PASS, host=DB_HOST, port=DB_PORT
+        ),
+        connection_class=psycopg.AsyncConnection[DictRow],
+        kwargs={"row_factory": dict_row},
+        min_size=DB_POOL_MIN_CONNECTIONS,
+        max_size=DB_POOL_MAX_CONNECTIONS,
+        timeout=DB_POOL_TIMEOUT_SECONDS,
+        max_lifetime=DB_POOL_MAX_LIFETIME_SECONDS,
+        max_idle=DB_POOL_MAX_IDLE_SECONDS,
+        check=AsyncConnectionPool.check_connection,
+        open=False,
+        name="cs2-analytics-api",
+    )
+
+
+class AsyncDatabase:
+    """Async counterpart of Database: pooled connections and dict-row cursors."""
+
+    def __init__(self, pool: AsyncDictPool | None = None) -> None:
+        self.pool = pool if pool is not None else _create_pool()
+
+    async def open(self) -> None:
+        """Starts the pool; connections are opened in the background."""
+        await self.pool.open()
+        logger.info("Async PostgreSQL connection pool opened.")
+
+    async def close(self) -> None:
+        await self.pool.close()
+        logger.info("Async PostgreSQL connection pool closed.")
+
+    def pool_stats(self) -> dict[str, int]:
+        """Returns psycopg_pool's counters (pool_size, requests_waiting, ...)."""
+        stats: dict[str, int] = self.pool.get_stats()
+        return stats
+
+    @asynccontextmanager
+    async def get_cursor(self) -> AsyncIterator[psycopg.AsyncCursor[DictRow]]:
+        """Yield a dict-row cursor; commits on exit, rolls back on error."""
+        try:
+            async with self.pool.connection() as conn, conn.cursor() as cur:
+                yield cur
+        except PoolTimeout as e:
+            raise DatabaseConnectionError(
+                "Failed to acquire a database connection from the pool."
+            ) from e
+        except Exception as e:
+            raise DatabaseOperationError("Failed during database operation.") from e
+
+
+_async_db: AsyncDatabase | None = None
+
+
+def get_async_db() -> AsyncDatabase:
+    """Return the shared async database, creating its (unopened) pool on first use."""
+    global _async_db
+
+    if _async_db is None:
+        _async_db = AsyncDatabase()
+
+    return _async_db
+
+
+async def close_async_db() -> None:
+    """Closes and forgets the shared async database, if one was created."""
+    global _async_db
+
+    db, _async_db = _async_db, None
+    if db is not None:
+        await db.close()
@@ -0,0 +1,78 @@
+"""Bulk upserts through COPY into a temp staging table.
+
+psycopg2's executemany sends one INSERT per row, so a large upsert costs a
+network round-trip per row. copy_upsert instead streams the rows into a
+session temp table with one COPY and merges them into the target table with
+one INSERT ... SELECT ... ON CONFLICT, reusing the conflict clause of the
+table's executemany statement so both paths write identical rows.
+
+Staging tables are created once per connection, emptied before every load
+and on commit, and are never visible to other sessions.
+"""
+
+import csv
+import io
+from collections.abc import Iterable, Sequence
+
+from cs2_analytics.config.config import BULK_COPY_MIN_ROWS
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+# Row position within a load, so duplicate keys merge last-row-wins as they
+# do under executemany.
+STAGE_ORDER_COLUMN = "stage_order"
+
+
+def should_copy(row_count: int) -> bool:
+    """True when a write of row_count rows should take the COPY path."""
+    return BULK_COPY_MIN_ROWS > 0 and row_count >= BULK_COPY_MIN_ROWS
+
+
+def copy_upsert(
+    cur,
+    *,
+    table: str,
+    columns: Sequence[str],
+    key_columns: Sequence[str],
+    conflict_clause: str,
+    rows: Iterable[Sequence],
+) -> int:
+    """COPYs rows (in `columns` order) into staging and merges them into table.
+
+    Runs on the caller's cursor, so the merge joins its transaction.
+    Returns the number of rows loaded.
+    """
+    stage = f"{table}_copy_stage"
+    column_list = ", ".join(columns)
+    key_list = ", ".join(key_columns)
+
+    buffer = io.StringIO()
+    # Postgres CSV reads an unquoted empty field as NULL and a quoted one as
+    # an empty string, which is what QUOTE_NOTNULL writes for None and "".
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL, lineterminator="\n")
+    row_count = 0
+    for row_count, row in enumerate(rows, start=1):
+        writer.writerow((*row, row_count))
+    if row_count == 0:
+        return 0
+    buffer.seek(0)
+
+    cur.execute(
+        f"CREATE TEMP TABLE IF NOT EXISTS {stage} ON COMMIT DELETE ROWS AS "
+        f"SELECT {column_list}, NULL::bigint AS {STAGE_ORDER_COLUMN} "
+        f"FROM {table} WITH NO DATA"
+    )
+    cur.execute(f"TRUNCATE {stage}")
+    cur.copy_expert(
+        f"COPY {stage} ({column_list}, {STAGE_ORDER_COLUMN}) "
+        "FROM STDIN WITH (FORMAT csv)",
+        buffer,
+    )
+    cur.execute(
+        f"INSERT INTO {table} ({column_list}) "
+        f"SELECT DISTINCT ON ({key_list}) {column_list} FROM {stage} "
+        f"ORDER BY {key_list}, {STAGE_ORDER_COLUMN} DESC {conflict_clause}"
+    )
+    logger.debug("Bulk loaded %d %s rows through COPY.", row_count, table)
+    return row_count
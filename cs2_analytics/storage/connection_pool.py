@@ -0,0 +1,283 @@
+"""Blocking, self-healing PostgreSQL connection pool.
+
+psycopg2's ThreadedConnectionPool raises as soon as every connection is
+checked out, and hands back whatever it holds: a connection the server or a
+load balancer dropped while it sat idle fails on its first statement.
+
+ConnectionPool is shared by scraper workers, writer threads and the API:
+- Checkout blocks, up to a timeout, until a connection is free.
+- A connection idle past `validate_idle_seconds` is pinged before reuse.
+- Connections are closed once older than `max_lifetime_seconds` or idle
+  longer than `max_idle_seconds`, and replaced on demand.
+- A connection returned mid-transaction is rolled back; a broken one is
+  discarded.
+
+stats() reports size, in-use and waiting counts, and checkout wait times.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time pool occupancy and cumulative checkout counters."""
+
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    max_size: int
+    checkouts: int
+    timeouts: int
+    recycled: int
+    discarded: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+@dataclass
+class _IdleConnection:
+    conn: psycopg2.extensions.connection
+    created_at: float
+    idle_since: float
+
+
+class ConnectionPool:
+    """Thread-safe pool that blocks for a free connection instead of raising."""
+
+    def __init__(
+        self,
+        connect: Callable[[], psycopg2.extensions.connection],
+        *,
+        minconn: int,
+        maxconn: int,
+        timeout_seconds: float,
+        max_lifetime_seconds: float,
+        max_idle_seconds: float,
+        validate_idle_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.connect = connect
+        self.maxconn = maxconn
+        self.timeout_seconds = timeout_seconds
+        self.max_lifetime_seconds = max_lifetime_seconds
+        self.max_idle_seconds = max_idle_seconds
+        self.validate_idle_seconds = validate_idle_seconds
+        self.clock = clock
+        self._idle: deque[_IdleConnection] = deque()
+        self._created_at: dict[psycopg2.extensions.connection, float] = {}
+        # Slots reserved by threads opening a connection outside the lock.
+        self._opening = 0
+        self._waiting = 0
+        self._closed = False
+        self._checkouts = 0
+        self._timeouts = 0
+        self._recycled = 0
+        self._discarded = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._available = threading.Condition()
+
+        for _ in range(min(minconn, maxconn)):
+            conn = self.connect()
+            now = self.clock()
+            self._created_at[conn] = now
+            self._idle.append(_IdleConnection(conn, now, now))
+
+    def getconn(self) -> psycopg2.extensions.connection:
+        """Checks out a live connection, waiting up to timeout_seconds for one.
+
+        Raises psycopg2.pool.PoolError when the pool is closed or the wait
+        times out, and psycopg2.Error when a new connection cannot be opened.
+        """
+        started = self.clock()
+        deadline = started + self.timeout_seconds
+        with self._available:
+            while True:
+                if self._closed:
+                    raise psycopg2.pool.PoolError("connection pool is closed")
+                idle = self._take_idle()
+                if idle is not None:
+                    break
+                if len(self._created_at) + self._opening < self.maxconn:
+                    self._opening += 1
+                    break
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise psycopg2.pool.PoolError(
+                        f"timed out after {self.timeout_seconds:g}s waiting for a "
+                        f"database connection ({self._describe()})"
+                    )
+                self._waiting += 1
+                try:
+                    self._available.wait(remaining)
+                finally:
+                    self._waiting -= 1
+
+        if idle is not None and not self._is_alive(idle):
+            # Hand the dead connection's slot straight to its replacement.
+            with self._available:
+                self._created_at.pop(idle.conn, None)
+                self._discarded += 1
+                self._opening += 1
+            logger.warning("Replacing a database connection that failed its ping.")
+            _close_quietly(idle.conn)
+            idle = None
+        conn = idle.conn if idle is not None else self._open()
+
+        with self._available:
+            waited = self.clock() - started
+            self._checkouts += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        return conn
+
+    def putconn(self, conn: psycopg2.extensions.connection) -> None:
+        """Returns a connection, discarding it if broken, dirty or expired."""
+        with self._available:
+            created_at = self._created_at.get(conn)
+        if created_at is None:
+            raise psycopg2.pool.PoolError("connection does not belong to this pool")
+
+        if not self._reset(conn):
+            self._discard(conn, "was returned broken")
+            return
+        now = self.clock()
+        if self._closed or now - created_at >= self.max_lifetime_seconds:
+            self._discard(conn, None)
+            return
+        with self._available:
+            self._idle.append(_IdleConnection(conn, created_at, now))
+            self._available.notify()
+
+    def closeall(self) -> None:
+        """Closes idle connections; checked-out ones close when returned."""
+        with self._available:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._available.notify_all()
+        for entry in idle:
+            self._discard(entry.conn, None)
+
+    def stats(self) -> PoolStats:
+        with self._available:
+            size = len(self._created_at)
+            return PoolStats(
+                size=size,
+                idle=len(self._idle),
+                in_use=size - len(self._idle),
+                waiting=self._waiting,
+                max_size=self.maxconn,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                recycled=self._recycled,
+                discarded=self._discarded,
+                total_wait_seconds=round(self._total_wait, 3),
+                max_wait_seconds=round(self._max_wait, 3),
+            )
+
+    def _take_idle(self) -> _IdleConnection | None:
+        """Closes expired idle connections, then pops the most recently used.
+
+        Called with the lock held. Reusing the newest connection first lets
+        surplus ones sit idle long enough to expire.
+        """
+        now = self.clock()
+        live: deque[_IdleConnection] = deque()
+        for entry in self._idle:
+            if (
+                now - entry.created_at < self.max_lifetime_seconds
+                and now - entry.idle_since < self.max_idle_seconds
+            ):
+                live.append(entry)
+                continue
+            self._created_at.pop(entry.conn, None)
+            self._recycled += 1
+            _close_quietly(entry.conn)
+        self._idle = live
+        return self._idle.pop() if self._idle else None
+
+    def _is_alive(self, entry: _IdleConnection) -> bool:
+        if entry.conn.closed:
+            return False
+        if self.clock() - entry.idle_since < self.validate_idle_seconds:
+            return True
+        try:
+            with entry.conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            entry.conn.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+    def _reset(self, conn: psycopg2.extensions.connection) -> bool:
+        """Rolls back a returned connection left in a transaction; False if broken."""
+        if conn.closed:
+            return False
+        status = conn.info.transaction_status
+        if status == psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            return True
+        if status not in (
+            psycopg2.extensions.TRANSACTION_STATUS_INTRANS,
+            psycopg2.extensions.TRANSACTION_STATUS_INERROR,
+        ):
+            return False
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+    def _open(self) -> psycopg2.extensions.connection:
+        """Opens a connection into a slot reserved under the lock."""
+        try:
+            conn = self.connect()
+        except BaseException:
+            with self._available:
+                self._opening -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self._opening -= 1
+            self._created_at[conn] = self.clock()
+        return conn
+
+    def _discard(
+        self, conn: psycopg2.extensions.connection, reason: str | None
+    ) -> None:
+        with self._available:
+            self._created_at.pop(conn, None)
+            if reason is None:
+                self._recycled += 1
+            else:
+                self._discarded += 1
+            self._available.notify()
+        if reason is not None:
+            logger.warning("Discarding database connection that %s.", reason)
+        _close_quietly(conn)
+
+    def _describe(self) -> str:
+        return (
+            f"{len(self._created_at)}/{self.maxconn} open, "
+            f"{len(self._idle)} idle, {self._waiting} waiting"
+        )
+
+
+def _close_quietly(conn: psycopg2.extensions.connection) -> None:
+    try:
+        conn.close()
+    except psycopg2.Error as e:
+        logger.debug("Ignoring error while closing a database connection: %s", e)
@@ -1,20 +1,37 @@
 """Handles database connections and cursor lifecycle."""
 
 from contextlib import contextmanager
+from functools import partial
 
 import psycopg2
 import psycopg2.pool
 
-from cs2_analytics.config.config import DB_HOST, DB_NAME, DB_PASS, DB_PORT, DB_USER
+from cs2_analytics.config.config import (
+    DB_HOST,
+    DB_NAME,
+    DB_PASS,
+    DB_POOL_MAX_CONNECTIONS,
+    DB_POOL_MAX_IDLE_SECONDS,
+    DB_POOL_MAX_LIFETIME_SECONDS,
+    DB_POOL_MIN_CONNECTIONS,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_POOL_VALIDATE_IDLE_SECONDS,
+    DB_PORT,
+    DB_USER,
+)
 from cs2_analytics.exceptions import DatabaseConnectionError, DatabaseOperationError
+from cs2_analytics.storage.connection_pool import ConnectionPool, PoolStats
+from cs2_analytics.storage.prepared_statements import PreparedStatements
 from cs2_analytics.utils.log_manager import get_logger
 
 logger = get_logger(__name__)
 
-DB_POOL: psycopg2.pool.SimpleConnectionPool | None = None
+DB_POOL: ConnectionPool | None = None
+# Shared like DB_POOL, since every Database instance draws from that pool.
+PREPARED_STATEMENTS = PreparedStatements()
 
 
-def _initialize_db_pool() -> psycopg2.pool.SimpleConnectionPool | None:
+def _initialize_db_pool() -> ConnectionPool | None:
     """Lazily initializes and returns the shared DB connection pool."""
     global DB_POOL
 
@@ -22,14 +39,21 @@ def _initialize_db_pool() -> psycopg2.pool.SimpleConnectionPool | None:
         return DB_POOL
 
     try:
-        DB_POOL = psycopg2.pool.SimpleConnectionPool(
-            minconn=1,
-            maxconn=10,
-            dbname=DB_NAME,
-            user=DB_USER,
-            password=DB_PASS,
-            host=DB_HOST,
-            port=DB_PORT,
+        DB_POOL = ConnectionPool(
+            partial(
+                psycopg2.connect,
+                dbname=DB_NAME,
+                user=DB_USER,
+                password=DB_PASS,
+                host=DB_HOST,
+                port=DB_PORT,
+            ),
+            minconn=DB_POOL_MIN_CONNECTIONS,
+            maxconn=DB_POOL_MAX_CONNECTIONS,
+            timeout_seconds=DB_POOL_TIMEOUT_SECONDS,
+            max_lifetime_seconds=DB_POOL_MAX_LIFETIME_SECONDS,
+            max_idle_seconds=DB_POOL_MAX_IDLE_SECONDS,
+            validate_idle_seconds=DB_POOL_VALIDATE_IDLE_SECONDS,
         )
         logger.info("PostgreSQL connection pool initialized successfully.")
     except (psycopg2.pool.PoolError, psycopg2.Error) as e:
@@ -68,14 +92,35 @@ class Database:
             self.pool.putconn(conn)
             logger.debug("Database connection released back to the pool.")
 
+    def pool_stats(self) -> PoolStats:
+        """Returns the shared pool's size, in-use count and checkout waits."""
+        return self.pool.stats()
+
+    def execute_prepared(self, cur, name: str, query: str, params: tuple) -> None:
+        """Executes query on cur as a server-side prepared statement.
+
+        The statement is prepared once per pooled connection under name and
+        executed by name after that; cur may come from get_cursor or
+        transaction.
+        """
+        PREPARED_STATEMENTS.execute(cur, name, query, params)
+
     def close_db_pool(self):
         """Closes all connections in the database pool."""
         global DB_POOL
 
         if self.pool:
+            stats = self.pool.stats()
             self.pool.closeall()
+            PREPARED_STATEMENTS.clear()
             DB_POOL = None
-            logger.info("Database connection pool closed.")
+            logger.info(
+                "Database connection pool closed after %d checkouts "
+                "(max wait %.3fs, %d timeouts).",
+                stats.checkouts,
+                stats.max_wait_seconds,
+                stats.timeouts,
+            )
 
     @contextmanager
     def transaction(self):
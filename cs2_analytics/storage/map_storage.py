@@ -1,21 +1,28 @@
 from cs2_analytics.exceptions import MapStorageError
 from cs2_analytics.models.map import Map
+from cs2_analytics.storage.bulk_copy import copy_upsert, should_copy
 from cs2_analytics.storage.db_instance import get_db
 from cs2_analytics.utils.log_manager import get_logger
 
 logger = get_logger(__name__)
 
-INSERT_MAPS_QUERY = """
-    INSERT INTO maps (
-        map_id, match_id, map_url, map_order, map_name,
-        team1_score, team2_score, map_winner, date,
-        inserted_at, last_scraped_at, last_updated_at, data_complete
-    )
-    VALUES (
-        %(map_id)s, %(match_id)s, %(map_url)s, %(map_order)s, %(map_name)s,
-        %(team1_score)s, %(team2_score)s, %(map_winner)s, %(date)s,
-        %(inserted_at)s, %(last_scraped_at)s, %(last_updated_at)s, %(data_complete)s
-    )
+MAP_COLUMNS = (
+    "map_id",
+    "match_id",
+    "map_url",
+    "map_order",
+    "map_name",
+    "team1_score",
+    "team2_score",
+    "map_winner",
+    "date",
+    "inserted_at",
+    "last_scraped_at",
+    "last_updated_at",
+    "data_complete",
+)
+
+MAPS_CONFLICT_CLAUSE = """
     ON CONFLICT (map_id) DO UPDATE SET
         match_id = EXCLUDED.match_id,
         map_url = EXCLUDED.map_url,
@@ -30,10 +37,27 @@ INSERT_MAPS_QUERY = """
         data_complete = EXCLUDED.data_complete;
     """
 
+INSERT_MAPS_QUERY = (
+    """
+    INSERT INTO maps (
+        map_id, match_id, map_url, map_order, map_name,
+        team1_score, team2_score, map_winner, date,
+        inserted_at, last_scraped_at, last_updated_at, data_complete
+    )
+    VALUES (
+        %(map_id)s, %(match_id)s, %(map_url)s, %(map_order)s, %(map_name)s,
+        %(team1_score)s, %(team2_score)s, %(map_winner)s, %(date)s,
+        %(inserted_at)s, %(last_scraped_at)s, %(last_updated_at)s, %(data_complete)s
+    )
+    """
+    + MAPS_CONFLICT_CLAUSE
+)
+
 
 def store_maps(maps: list[Map], cur=None) -> None:
     """Upsert map rows.
 
+    Writes of BULK_COPY_MIN_ROWS or more are bulk loaded through COPY.
     When cur is provided the statements join the caller's transaction and
     the caller owns commit/rollback (ADR-0013); otherwise the write runs in
     its own transaction as before.
@@ -70,5 +94,15 @@ def _execute_store_maps(cur, maps: list[Map]) -> None:
         }
         for map_obj in maps
     ]
-    cur.executemany(INSERT_MAPS_QUERY, values)
+    if should_copy(len(values)):
+        copy_upsert(
+            cur,
+            table="maps",
+            columns=MAP_COLUMNS,
+            key_columns=("map_id",),
+            conflict_clause=MAPS_CONFLICT_CLAUSE,
+            rows=(tuple(row[column] for column in MAP_COLUMNS) for row in values),
+        )
+    else:
+        cur.executemany(INSERT_MAPS_QUERY, values)
     logger.info("Stored %d map records.", len(maps))
@@ -1,23 +1,32 @@
 from cs2_analytics.exceptions import MatchStorageError
 from cs2_analytics.models.match import Match
+from cs2_analytics.storage.bulk_copy import copy_upsert, should_copy
 from cs2_analytics.storage.db_instance import get_db
 from cs2_analytics.utils.log_manager import get_logger
 
 logger = get_logger(__name__)
 
-INSERT_MATCHES_QUERY = """
-    INSERT INTO matches (
-        match_id, match_url, team1, team2, score1, score2, winner,
-        event, match_type, forfeit, date,
-        map_links, demo_links,
-        last_inserted_at, last_scraped_at, last_updated_at, data_complete
-    )
-    VALUES (
-        %(match_id)s, %(match_url)s, %(team1)s, %(team2)s, %(score1)s, %(score2)s, %(winner)s,
-        %(event)s, %(match_type)s, %(forfeit)s, %(date)s,
-        %(map_links)s, %(demo_links)s,
-        %(last_inserted_at)s, %(last_scraped_at)s, %(last_updated_at)s, %(data_complete)s
-    )
+MATCH_COLUMNS = (
+    "match_id",
+    "match_url",
+    "team1",
+    "team2",
+    "score1",
+    "score2",
+    "winner",
+    "event",
+    "match_type",
+    "forfeit",
+    "date",
+    "map_links",
+    "demo_links",
+    "last_inserted_at",
+    "last_scraped_at",
+    "last_updated_at",
+    "data_complete",
+)
+
+MATCHES_CONFLICT_CLAUSE = """
     ON CONFLICT (match_id) DO UPDATE SET
         match_url = EXCLUDED.match_url,
         team1 = EXCLUDED.team1,
@@ -36,10 +45,29 @@ INSERT_MATCHES_QUERY = """
         data_complete = EXCLUDED.data_complete;
     """
 
+INSERT_MATCHES_QUERY = (
+    """
+    INSERT INTO matches (
+        match_id, match_url, team1, team2, score1, score2, winner,
+        event, match_type, forfeit, date,
+        map_links, demo_links,
+        last_inserted_at, last_scraped_at, last_updated_at, data_complete
+    )
+    VALUES (
+        %(match_id)s, %(match_url)s, %(team1)s, %(team2)s, %(score1)s, %(score2)s, %(winner)s,
+        %(event)s, %(match_type)s, %(forfeit)s, %(date)s,
+        %(map_links)s, %(demo_links)s,
+        %(last_inserted_at)s, %(last_scraped_at)s, %(last_updated_at)s, %(data_complete)s
+    )
+    """
+    + MATCHES_CONFLICT_CLAUSE
+)
+
 
 def store_matches(matches: list[Match], cur=None) -> None:
     """Upsert match rows.
 
+    Writes of BULK_COPY_MIN_ROWS or more are bulk loaded through COPY.
     When cur is provided the statements join the caller's transaction and
     the caller owns commit/rollback (ADR-0013); otherwise the write runs in
     its own transaction, now through the shared get_cursor path instead of
@@ -81,5 +109,15 @@ def _execute_store_matches(cur, matches: list[Match]) -> None:
         }
         for match in matches
     ]
-    cur.executemany(INSERT_MATCHES_QUERY, values)
+    if should_copy(len(values)):
+        copy_upsert(
+            cur,
+            table="matches",
+            columns=MATCH_COLUMNS,
+            key_columns=("match_id",),
+            conflict_clause=MATCHES_CONFLICT_CLAUSE,
+            rows=(tuple(row[column] for column in MATCH_COLUMNS) for row in values),
+        )
+    else:
+        cur.executemany(INSERT_MATCHES_QUERY, values)
     logger.info("Stored %d match records.", len(matches))
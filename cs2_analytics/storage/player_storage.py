@@ -1,25 +1,12 @@
 from cs2_analytics.exceptions import PlayerStorageError
-from cs2_analytics.models.player import Player
+from cs2_analytics.models.player_batch import PLAYER_COLUMNS, PlayerBatch
+from cs2_analytics.storage.bulk_copy import copy_upsert, should_copy
 from cs2_analytics.storage.db_instance import get_db
 from cs2_analytics.utils.log_manager import get_logger
 
 logger = get_logger(__name__)
 
-INSERT_PLAYERS_QUERY = """
-    INSERT INTO players (
-        map_id, player_id, player_name, player_url, map_name,
-        team_name, kills, headshots, assists, flash_assists, deaths, traded_deaths,
-        opening_kills, opening_deaths, multi_kills, clutches_won,
-        kast, kd_diff, adr, fk_diff, round_swing, rating,
-        last_inserted_at, last_scraped_at, last_updated_at, data_complete
-    )
-    VALUES (
-        %(map_id)s, %(player_id)s, %(player_name)s, %(player_url)s, %(map_name)s,
-        %(team_name)s, %(kills)s, %(headshots)s, %(assists)s, %(flash_assists)s, %(deaths)s, %(traded_deaths)s,
-        %(opening_kills)s, %(opening_deaths)s, %(multi_kills)s, %(clutches_won)s,
-        %(kast)s, %(kd_diff)s, %(adr)s, %(fk_diff)s, %(round_swing)s, %(rating)s,
-        %(last_inserted_at)s, %(last_scraped_at)s, %(last_updated_at)s, %(data_complete)s
-    )
+PLAYERS_CONFLICT_CLAUSE = """
     ON CONFLICT (map_id, player_id) DO UPDATE SET
         player_name = EXCLUDED.player_name,
         player_url = EXCLUDED.player_url,
@@ -46,10 +33,34 @@ INSERT_PLAYERS_QUERY = """
         data_complete = EXCLUDED.data_complete;
     """
 
+INSERT_PLAYERS_QUERY = (
+    """
+    INSERT INTO players (
+        map_id, player_id, player_name, player_url, map_name,
+        team_name, kills, headshots, assists, flash_assists, deaths, traded_deaths,
+        opening_kills, opening_deaths, multi_kills, clutches_won,
+        kast, kd_diff, adr, fk_diff, round_swing, rating,
+        last_inserted_at, last_scraped_at, last_updated_at, data_complete
+    )
+    VALUES (
+        %s, %s, %s, %s, %s,
+        %s, %s, %s, %s, %s, %s, %s,
+        %s, %s, %s, %s,
+        %s, %s, %s, %s, %s, %s,
+        %s, %s, %s, %s
+    )
+    """
+    + PLAYERS_CONFLICT_CLAUSE
+)
+
 
-def store_players(players: list[Player], cur=None) -> None:
+def store_players(players: PlayerBatch, cur=None) -> None:
     """Upsert player rows.
 
+    Rows are read straight out of the batch's columns as positional tuples,
+    without building a Player or dict per row. Writes of BULK_COPY_MIN_ROWS
+    or more are bulk loaded through COPY.
+
     When cur is provided the statements join the caller's transaction and
     the caller owns commit/rollback (ADR-0013); otherwise the write runs in
     its own transaction as before.
@@ -67,37 +78,17 @@ def store_players(players: list[Player], cur=None) -> None:
         raise PlayerStorageError("Failed to store player records.") from e
 
 
-def _execute_store_players(cur, players: list[Player]) -> None:
-    values = [
-        {
-            "map_id": p.map_id,
-            "player_id": p.player_id,
-            "player_name": p.player_name,
-            "player_url": p.player_url,
-            "map_name": p.map_name,
-            "team_name": p.team_name,
-            "kills": p.kills,
-            "headshots": p.headshots,
-            "assists": p.assists,
-            "flash_assists": p.flash_assists,
-            "deaths": p.deaths,
-            "traded_deaths": p.traded_deaths,
-            "opening_kills": p.opening_kills,
-            "opening_deaths": p.opening_deaths,
-            "multi_kills": p.multi_kills,
-            "clutches_won": p.clutches_won,
-            "kast": p.kast,
-            "kd_diff": p.kd_diff,
-            "adr": p.adr,
-            "fk_diff": p.fk_diff,
-            "round_swing": p.round_swing,
-            "rating": p.rating,
-            "last_inserted_at": p.last_inserted_at,
-            "last_scraped_at": p.last_scraped_at,
-            "last_updated_at": p.last_updated_at,
-            "data_complete": p.data_complete,
-        }
-        for p in players
-    ]
-    cur.executemany(INSERT_PLAYERS_QUERY, values)
+def _execute_store_players(cur, players: PlayerBatch) -> None:
+    rows = players.rows()
+    if should_copy(len(players)):
+        copy_upsert(
+            cur,
+            table="players",
+            columns=PLAYER_COLUMNS,
+            key_columns=("map_id", "player_id"),
+            conflict_clause=PLAYERS_CONFLICT_CLAUSE,
+            rows=rows,
+        )
+    else:
+        cur.executemany(INSERT_PLAYERS_QUERY, rows)
     logger.info("Stored %d player stat records.", len(players))
@@ -0,0 +1,84 @@
+"""Server-side prepared statements, tracked per pooled connection.
+
+The ingestion-state transitions run several times per item, and each call
+used to send its full SQL text for Postgres to parse and plan again.
+PreparedStatements sends `PREPARE` the first time a connection runs a named
+statement, then only `EXECUTE name (...)` with the parameters.
+
+Prepared statements live as long as the server session, and a rollback
+does not drop them, so the registry only needs to know which names each
+connection has prepared. Entries are weak references: a connection the pool
+closes drops out of the registry with it.
+"""
+
+import threading
+from weakref import WeakKeyDictionary
+
+import psycopg2
+import psycopg2.errors
+import psycopg2.extensions
+
+from cs2_analytics.utils.log_manager import get_logger
+
+logger = get_logger(__name__)
+
+
+def to_positional(query: str) -> str:
+    """Rewrites psycopg2's %s placeholders as PREPARE's $1, $2, ..."""
+    parts = query.split("%s")
+    return "".join(
+        f"{part}${index}" if index < len(parts) else part
+        for index, part in enumerate(parts, start=1)
+    )
+
+
+class PreparedStatements:
+    """Thread-safe registry of the statements each connection has prepared."""
+
+    def __init__(self) -> None:
+        self._prepared: WeakKeyDictionary[psycopg2.extensions.connection, set[str]] = (
+            WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def execute(
+        self,
+        cur: psycopg2.extensions.cursor,
+        name: str,
+        query: str,
+        params: tuple[object, ...],
+    ) -> None:
+        """Runs query as the named prepared statement on cur's connection.
+
+        name must identify one query text; it is prepared on first use per
+        connection. Statement errors propagate to the caller unchanged.
+        """
+        conn = cur.connection
+        with self._lock:
+            prepared = name in self._prepared.get(conn, ())
+        if not prepared:
+            cur.execute(f"PREPARE {name} AS {to_positional(query)}")
+            with self._lock:
+                self._prepared.setdefault(conn, set()).add(name)
+            logger.debug("Prepared statement %s on a pooled connection.", name)
+
+        placeholders = ", ".join(["%s"] * len(params))
+        try:
+            cur.execute(f"EXECUTE {name} ({placeholders})", params)
+        except psycopg2.errors.InvalidSqlStatementName:
+            # The session lost it (e.g. DISCARD ALL); prepare again next call.
+            self.forget(conn)
+            raise
+
+    def is_prepared(self, conn: psycopg2.extensions.connection, name: str) -> bool:
+        with self._lock:
+            return name in self._prepared.get(conn, ())
+
+    def forget(self, conn: psycopg2.extensions.connection) -> None:
+        """Drops every name recorded for conn."""
+        with self._lock:
+            self._prepared.pop(conn, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._prepared.clear()
@@ -152,7 +152,16 @@ CREATE TABLE IF NOT EXISTS match_ingestion_state (
     last_error_message TEXT,
     source TEXT,
     priority INT DEFAULT 0,
-    last_updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    last_updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Header data shown on the results listing, captured at discovery.
+    listing_team1 TEXT,
+    listing_team2 TEXT,
+    listing_score1 INT,
+    listing_score2 INT,
+    listing_event TEXT,
+    listing_format TEXT,
+    listing_forfeit BOOLEAN,
+    listing_date DATE
 );
 
 -- Map Ingestion State Table
@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 from cs2_analytics.models.map import Map
 from cs2_analytics.models.match import Match
 from cs2_analytics.models.player import Player
+from cs2_analytics.models.player_batch import PlayerBatch
 from cs2_analytics.storage.database import Database
 from cs2_analytics.storage.map_storage import store_maps
 from cs2_analytics.storage.match_storage import store_matches
@@ -148,36 +149,38 @@ def seed_smoke_source_rows() -> None:
     )
 
     store_players(
-        [
-            Player(
-                map_id=SMOKE_MAP_ID,
-                player_id=SMOKE_PLAYER_ID,
-                player_name=SMOKE_PLAYER_NAME,
-                player_url=f"https://smoke.local/player/{SMOKE_PLAYER_ID}",
-                map_name="Smoke",
-                team_name="Smoke Alpha",
-                kills=30,
-                headshots=20,
-                assists=5,
-                flash_assists=2,
-                deaths=4,
-                traded_deaths=1,
-                opening_kills=6,
-                opening_deaths=1,
-                multi_kills=8,
-                clutches_won=2,
-                kast=95.0,
-                kd_diff=26,
-                adr=150.0,
-                fk_diff=5,
-                round_swing=0.5,
-                rating=9.99,
-                last_inserted_at=now,
-                last_scraped_at=now,
-                last_updated_at=now,
-                data_complete=True,
-            )
-        ]
+        PlayerBatch.from_players(
+            [
+                Player(
+                    map_id=SMOKE_MAP_ID,
+                    player_id=SMOKE_PLAYER_ID,
+                    player_name=SMOKE_PLAYER_NAME,
+                    player_url=f"https://smoke.local/player/{SMOKE_PLAYER_ID}",
+                    map_name="Smoke",
+                    team_name="Smoke Alpha",
+                    kills=30,
+                    headshots=20,
+                    assists=5,
+                    flash_assists=2,
+                    deaths=4,
+                    traded_deaths=1,
+                    opening_kills=6,
+                    opening_deaths=1,
+                    multi_kills=8,
+                    clutches_won=2,
+                    kast=95.0,
+                    kd_diff=26,
+                    adr=150.0,
+                    fk_diff=5,
+                    round_swing=0.5,
+                    rating=9.99,
+                    last_inserted_at=now,
+                    last_scraped_at=now,
+                    last_updated_at=now,
+                    data_complete=True,
+                )
+            ]
+        )
     )
 
 
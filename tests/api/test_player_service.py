@@ -0,0 +1,78 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import main as api_main
+from api.routes import players as players_routes
+from api.schemas.player import PlayerStats
+from api.services.player_service import PlayerService
+
+
+class _FakeCursor:
+    def __init__(self, rows: list[dict[str, object]]) -> None:
+        self.rows = rows
+        self.executed: list[tuple[str, tuple[int, int]]] = []
+
+    async def execute(self, sql: str, params: tuple[int, int]) -> None:
+        self.executed.append((sql, params))
+
+    async def fetchall(self) -> list[dict[str, object]]:
+        return self.rows
+
+
+class _FakeAsyncDatabase:
+    def __init__(self, cursor: _FakeCursor) -> None:
+        self.cursor = cursor
+
+    @asynccontextmanager
+    async def get_cursor(self):
+        yield self.cursor
+
+
+def test_fetch_top_players_awaits_the_query_and_builds_models() -> None:
+    cursor = _FakeCursor(
+        [{"player_name": "ZywOo", "maps_played": 42, "avg_rating": 1.38}]
+    )
+    service = PlayerService(db=_FakeAsyncDatabase(cursor))
+
+    players = asyncio.run(service.fetch_top_players(min_maps=5, limit=10))
+
+    assert players == [
+        PlayerStats(player_name="ZywOo", maps_played=42, avg_rating=1.38)
+    ]
+    assert cursor.executed[0][1] == (5, 10)
+
+
+def test_fetch_top_players_wraps_database_failures() -> None:
+    class _FailingCursor(_FakeCursor):
+        async def execute(self, _sql: str, _params: tuple[int, int]) -> None:
+            raise RuntimeError("connection reset")
+
+    service = PlayerService(db=_FakeAsyncDatabase(_FailingCursor([])))
+
+    with pytest.raises(RuntimeError, match="Failed to fetch top players"):
+        asyncio.run(service.fetch_top_players(min_maps=5, limit=10))
+
+
+def test_top_players_route_is_async(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[int, int]] = []
+
+    class _FakeService:
+        async def fetch_top_players(self, min_maps: int, limit: int):
+            calls.append((min_maps, limit))
+            return [PlayerStats(player_name="m0NESY", maps_played=9, avg_rating=1.2)]
+
+    monkeypatch.setattr(players_routes, "PlayerService", _FakeService)
+    # Not entered as a context manager, so the lifespan never opens a pool.
+    client = TestClient(api_main.create_app())
+
+    response = client.get("/api/top_players", params={"min_maps": 3, "limit": 5})
+
+    assert asyncio.iscoroutinefunction(players_routes.get_top_players)
+    assert response.status_code == 200
+    assert response.json() == [
+        {"player_name": "m0NESY", "maps_played": 9, "avg_rating": 1.2}
+    ]
+    assert calls == [(3, 5)]
@@ -0,0 +1,88 @@
+import datetime as dt
+import gzip
+
+import pytest
+
+from cs2_analytics.archive import page_archive
+from cs2_analytics.archive.page_archive import PageArchive, archive_page
+from cs2_analytics.exceptions import PageArchiveError
+
+MAP_URL = "https://www.hltv.org/stats/matches/mapstatsid/1/test"
+
+
+def test_store_and_load_round_trip_with_sharded_body(tmp_path) -> None:
+    archive = PageArchive(tmp_path)
+
+    content_hash = archive.store(MAP_URL, "<html>Ancient</html>", kind="map")
+
+    shard = tmp_path / content_hash[:2] / content_hash[2:4]
+    assert [path.name.startswith(content_hash) for path in shard.iterdir()] == [True]
+    assert archive.load(content_hash) == "<html>Ancient</html>"
+
+
+def test_identical_pages_share_one_body_but_keep_every_fetch(tmp_path) -> None:
+    archive = PageArchive(tmp_path)
+    first = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+    second = dt.datetime(2026, 1, 2, tzinfo=dt.UTC)
+
+    hash_a = archive.store(MAP_URL, "<html>same</html>", kind="map", fetched_at=first)
+    hash_b = archive.store(MAP_URL, "<html>same</html>", kind="map", fetched_at=second)
+
+    assert hash_a == hash_b
+    assert len(list(tmp_path.glob("*/*/*.html.*"))) == 1
+    latest = archive.latest(MAP_URL)
+    assert latest is not None
+    assert latest.fetched_at == second.isoformat()
+
+
+def test_iter_latest_returns_newest_fetch_per_url_for_one_kind(tmp_path) -> None:
+    archive = PageArchive(tmp_path)
+    old = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+    new = dt.datetime(2026, 1, 2, tzinfo=dt.UTC)
+    archive.store(MAP_URL, "<html>old</html>", kind="map", fetched_at=old)
+    new_hash = archive.store(MAP_URL, "<html>new</html>", kind="map", fetched_at=new)
+    archive.store("https://www.hltv.org/matches/1/a", "<html/>", kind="match")
+
+    latest = list(archive.iter_latest("map"))
+
+    assert [(page.url, page.content_hash) for page in latest] == [(MAP_URL, new_hash)]
+
+
+def test_gzip_fallback_is_readable(tmp_path) -> None:
+    archive = PageArchive(tmp_path, use_zstd=False)
+
+    content_hash = archive.store(MAP_URL, "<html>gz</html>", kind="map")
+
+    (body_path,) = tmp_path.glob("*/*/*.html.gz")
+    assert gzip.decompress(body_path.read_bytes()) == b"<html>gz</html>"
+    assert archive.load(content_hash) == "<html>gz</html>"
+
+
+def test_load_missing_body_raises_typed_error(tmp_path) -> None:
+    archive = PageArchive(tmp_path)
+
+    with pytest.raises(PageArchiveError, match="Archived page body not found"):
+        archive.load("0" * 64)
+
+
+def test_archive_page_downgrades_failures_to_warning(monkeypatch) -> None:
+    warnings: list[tuple[object, ...]] = []
+    monkeypatch.setattr(
+        page_archive.logger, "warning", lambda *args: warnings.append(args)
+    )
+
+    class _BrokenArchive:
+        def store(self, *_args, **_kwargs) -> str:
+            raise PageArchiveError("disk full")
+
+    archive_page(_BrokenArchive(), MAP_URL, "<html/>", kind="map")
+    archive_page(None, MAP_URL, "<html/>", kind="map")
+
+    assert len(warnings) == 1
+    assert warnings[0][0] == "Failed to archive %s page %s: %s"
+
+
+def test_get_page_archive_is_disabled_without_directory(monkeypatch) -> None:
+    monkeypatch.setattr(page_archive, "PAGE_ARCHIVE_DIR", "")
+
+    assert page_archive.get_page_archive() is None
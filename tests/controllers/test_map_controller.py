@@ -1,9 +1,22 @@
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
+from bs4 import BeautifulSoup
 
 from cs2_analytics.controllers import map_controller as map_module
-from cs2_analytics.exceptions import MapParseError, SessionScrapeError
+from cs2_analytics.exceptions import (
+    MapParseError,
+    SchemaDriftError,
+    SessionScrapeError,
+)
+from cs2_analytics.parsers.schema_drift import SchemaDriftBreaker
 from cs2_analytics.stage_services import StageItemResult
-from tests.support import FakeTransactionDb
+from tests.support import (
+    FakeTransactionDb,
+    RecordingRateLimiter,
+    make_player_batch,
+)
 
 
 class _FakeMapState:
@@ -76,6 +89,9 @@ class _TrackingStageService:
             raise SessionScrapeError(f"Failed to fetch map stats page: {map_url}")
         return StageItemResult.processed()
 
+    def finish_writes(self) -> int:
+        return 0
+
 
 class _FailOnceThenSucceedParser:
     def __init__(self) -> None:
@@ -94,7 +110,9 @@ class _FailOnceThenSucceedParser:
         self.calls += 1
         if self.calls == 1:
             raise MapParseError("No player kills logged.")
-        return type("ParsedMap", (), {"map": object(), "players": [object()]})()
+        return type(
+            "ParsedMap", (), {"map": object(), "players": make_player_batch(200)}
+        )()
 
 
 class _SuccessfulParser:
@@ -108,7 +126,9 @@ class _SuccessfulParser:
         map_order: int | None,
     ) -> object:
         _ = (match_id, map_order)
-        return type("ParsedMap", (), {"map": object(), "players": [object()]})()
+        return type(
+            "ParsedMap", (), {"map": object(), "players": make_player_batch(200)}
+        )()
 
 
 def _build_map_controller(
@@ -130,7 +150,9 @@ def _build_map_controller(
         "store_players",
         lambda _players, cur=None: None,
     )
-    monkeypatch.setattr(map_module.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(map_module, "get_rate_limiter", RecordingRateLimiter)
+    monkeypatch.setattr(map_module, "SCRAPER_STANDBY_SESSIONS", 0)
+    monkeypatch.setattr(map_module, "SCHEMA_DRIFT_WINDOW", 0)
     return map_module.MapController()
 
 
@@ -154,7 +176,9 @@ def test_map_controller_continues_after_item_failure(
         "store_players",
         lambda players, cur=None: stored_players.append(players),
     )
-    monkeypatch.setattr(map_module.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(map_module, "get_rate_limiter", RecordingRateLimiter)
+    monkeypatch.setattr(map_module, "SCRAPER_STANDBY_SESSIONS", 0)
+    monkeypatch.setattr(map_module, "SCHEMA_DRIFT_WINDOW", 0)
     monkeypatch.setattr(
         map_module.logger,
         "info",
@@ -224,6 +248,9 @@ def test_map_controller_retries_retryable_error_before_succeeding(
     assert len(stored_maps) == 1
     assert len(stored_players) == 1
     assert len(reset_calls) == 1
+    assert controller.rate_limiter.deferred == [
+        ("https://www.hltv.org/stats/matches/mapstatsid/1/test", 3.0)
+    ]
     assert any(
         call_args[0]
         == "MapController summary: selected=%d succeeded=%d failed=%d retries=%d"
@@ -333,3 +360,174 @@ def test_map_controller_marks_failed_once_after_exhausting_retryable_errors(
         and call_args[1:] == (1, 0, 1, 2)
         for call_args, _ in info_calls
     )
+
+
+def test_map_controller_rolls_worker_counters_into_summary(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    info_calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
+    controller = _build_map_controller(
+        monkeypatch,
+        _SuccessfulScraper,
+        _SuccessfulParser,
+    )
+    monkeypatch.setattr(
+        map_module.logger,
+        "info",
+        lambda *args, **kwargs: info_calls.append((args, kwargs)),
+    )
+
+    controller.run(batch_size=2, workers=2)
+
+    assert sorted(controller.state.processing) == [1, 2]
+    assert sorted(controller.state.processed) == [1, 2]
+    worker_lines = [
+        call_args
+        for call_args, _ in info_calls
+        if call_args[0].startswith("MapController worker %d")
+    ]
+    assert len(worker_lines) == 2
+    assert any(
+        call_args[0]
+        == "MapController summary: selected=%d succeeded=%d failed=%d retries=%d"
+        and call_args[1:] == (2, 2, 0, 0)
+        for call_args, _ in info_calls
+    )
+
+
+def test_map_controller_rotation_swaps_in_standby_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created: list[_SuccessfulScraper] = []
+
+    class _CountingScraper(_SuccessfulScraper):
+        def __init__(self) -> None:
+            self.driver = SimpleNamespace(current_url="about:blank")
+            created.append(self)
+
+    controller = _build_map_controller(monkeypatch, _CountingScraper, _SuccessfulParser)
+    monkeypatch.setattr(map_module, "SCRAPER_STANDBY_SESSIONS", 1)
+    monkeypatch.setattr(map_module, "ROTATE_EVERY", 1)
+    monkeypatch.setattr(
+        map_module.StandbyScraperPool, "_warm", lambda self: self.scraper_factory()
+    )
+    used_scrapers: list[object] = []
+    monkeypatch.setattr(
+        controller.stage_service,
+        "process_item",
+        lambda *_args, scraper, **_kwargs: (
+            used_scrapers.append(scraper) or StageItemResult.processed()
+        ),
+    )
+
+    controller.run(batch_size=2)
+
+    # second map runs on the standby session swapped in at rotation
+    assert used_scrapers == [created[0], created[1]]
+    assert controller.standby is None
+
+
+def test_map_controller_worker_resets_stay_in_worker_run_state(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created: list[_SuccessfulScraper] = []
+
+    class _ClosingScraper(_SuccessfulScraper):
+        def __init__(self) -> None:
+            self.close_calls = 0
+            created.append(self)
+
+        def close(self) -> None:
+            self.close_calls += 1
+
+    controller = _build_map_controller(monkeypatch, _ClosingScraper, _SuccessfulParser)
+    initial_scraper = controller.scraper
+    monkeypatch.setattr(map_module, "ROTATE_EVERY", 1)
+
+    def fake_reset_scraper(scraper, factory, **_kwargs):
+        scraper.close()
+        return factory()
+
+    monkeypatch.setattr(map_module, "reset_scraper", fake_reset_scraper)
+    monkeypatch.setattr(
+        controller.state,
+        "fetch_with_match_context",
+        lambda _limit=25: [
+            (map_id, f"https://www.hltv.org/stats/matches/mapstatsid/{map_id}/t", 1, 1)
+            for map_id in range(1, 7)
+        ],
+    )
+    monkeypatch.setattr(
+        controller.stage_service,
+        "process_item",
+        lambda *_args, **_kwargs: StageItemResult.processed(),
+    )
+
+    controller.run(batch_size=6, workers=2)
+
+    assert controller.scraper is initial_scraper
+    # every session, rotated-out or final, is closed exactly once
+    assert [scraper.close_calls for scraper in created] == [1] * len(created)
+
+
+def test_map_controller_halts_fetches_once_schema_drift_trips(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    class _MaintenanceScraper(_SuccessfulScraper):
+        def fetch_soup(self, _url: str) -> object:
+            return BeautifulSoup("<html><body>maintenance</body></html>", "html.parser")
+
+    controller = _build_map_controller(
+        monkeypatch, _MaintenanceScraper, _SuccessfulParser
+    )
+    breaker = SchemaDriftBreaker(
+        stage="map", window=2, threshold_pct=50, diagnostics_dir=tmp_path
+    )
+    controller.drift_breaker = breaker
+    controller.stage_service.drift_breaker = breaker
+    monkeypatch.setattr(
+        controller.state,
+        "fetch_with_match_context",
+        lambda _limit=25: [
+            (map_id, f"https://www.hltv.org/stats/matches/mapstatsid/{map_id}/t", 1, 1)
+            for map_id in range(1, 5)
+        ],
+    )
+
+    with pytest.raises(SchemaDriftError, match="2 selected maps were not fetched"):
+        controller.run(batch_size=4)
+
+    # maps 3 and 4 were never claimed, so they stay discovered for the next run
+    assert controller.state.processing == [1, 2]
+    assert breaker.diagnostic_path is not None
+    assert (breaker.diagnostic_path / "diagnostic.json").exists()
+
+
+def test_map_controller_counts_failed_group_commit_writes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    info_calls: list[tuple[object, ...]] = []
+    monkeypatch.setattr(map_module, "MAP_GROUP_COMMIT_SIZE", 2)
+    controller = _build_map_controller(
+        monkeypatch, _SuccessfulScraper, _SuccessfulParser
+    )
+
+    def store_maps(_maps, cur=None) -> None:
+        raise RuntimeError("deadlock detected")
+
+    monkeypatch.setattr(controller.stage_service, "store_maps", store_maps)
+    monkeypatch.setattr(
+        map_module.logger, "info", lambda *args, **_kwargs: info_calls.append(args)
+    )
+
+    controller.run(batch_size=2)
+
+    assert controller.state.processed == []
+    assert [map_id for map_id, _ in controller.state.failed] == [1, 2]
+    assert (
+        "MapController summary: selected=%d succeeded=%d failed=%d retries=%d",
+        2,
+        0,
+        2,
+        0,
+    ) in info_calls
@@ -2,7 +2,7 @@ import pytest
 
 from cs2_analytics.controllers import match_controller as match_module
 from cs2_analytics.exceptions import MatchParseError, SessionScrapeError
-from tests.support import FakeTransactionDb
+from tests.support import FakeTransactionDb, RecordingRateLimiter
 
 
 class _FakeMatchState:
@@ -10,11 +10,15 @@ class _FakeMatchState:
         self.failed: list[tuple[int, str]] = []
         self.processed: list[int] = []
         self.processing: list[int] = []
+        self.listed_forfeits: list[object] = []
 
     def fetch(self, limit: int = 25) -> list[tuple[int, str]]:
         assert limit > 0
         return [(1, "https://www.hltv.org/matches/1/test")]
 
+    def fetch_listed_forfeits(self, limit: int = 25) -> list[object]:
+        return self.listed_forfeits[:limit]
+
     def mark_as_failed(self, item_id: int, reason: str) -> None:
         self.failed.append((item_id, reason))
 
@@ -101,7 +105,8 @@ def _build_match_controller(
     monkeypatch.setattr(match_module, "DemoIngestionState", _FakeFollowupState)
     monkeypatch.setattr(match_module, "store_matches", lambda _matches, cur=None: None)
     monkeypatch.setattr(match_module, "get_db", lambda: FakeTransactionDb())
-    monkeypatch.setattr(match_module.time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(match_module, "get_rate_limiter", RecordingRateLimiter)
+    monkeypatch.setattr(match_module, "SCRAPER_STANDBY_SESSIONS", 0)
     return match_module.MatchController()
 
 
@@ -245,7 +250,6 @@ def test_match_controller_continues_after_item_failure(
 def test_match_controller_applies_cooldown_after_consecutive_retryable_errors(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    sleep_calls: list[float] = []
     info_calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
     stored_matches: list[list[object]] = []
     reset_calls: list[object] = []
@@ -254,11 +258,6 @@ def test_match_controller_applies_cooldown_after_consecutive_retryable_errors(
         _RetryTwiceThenSucceedScraper,
         _SuccessfulParser,
     )
-    monkeypatch.setattr(
-        match_module.time,
-        "sleep",
-        lambda seconds, *_args, **_kwargs: sleep_calls.append(seconds),
-    )
     monkeypatch.setattr(
         match_module.logger,
         "info",
@@ -281,7 +280,8 @@ def test_match_controller_applies_cooldown_after_consecutive_retryable_errors(
     assert controller.match_state.processed == [1]
     assert len(stored_matches) == 1
     assert len(reset_calls) == 2
-    assert 8.0 in sleep_calls
+    # attempt 1 backs off 3s; attempt 2 backs off 6s plus the 8s cooldown.
+    assert [seconds for _, seconds in controller.rate_limiter.deferred] == [3.0, 14.0]
     assert any(
         call_args[0] == "Applying cooldown after %d consecutive recoverable errors"
         and call_args[1:] == (2,)
@@ -293,3 +293,31 @@ def test_match_controller_applies_cooldown_after_consecutive_retryable_errors(
         and call_args[1:] == (1, 1, 0, 2)
         for call_args, _ in info_calls
     )
+
+
+def test_match_controller_stores_listed_forfeits_before_fetching_pages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    controller = _build_match_controller(
+        monkeypatch,
+        _SuccessfulScraper,
+        _SuccessfulParser,
+    )
+    forfeited: list[list[object]] = []
+    controller.match_state.listed_forfeits = ["forfeit-listing"]
+    monkeypatch.setattr(
+        controller.stage_service,
+        "record_listed_forfeits",
+        lambda listings: forfeited.append(listings) or len(listings),
+    )
+
+    controller.run(batch_size=1)
+
+    assert forfeited == [["forfeit-listing"]]
+    assert controller.match_state.processed == [1]
+
+    forfeited.clear()
+    monkeypatch.setattr(match_module, "SCRAPE_FORFEITS_FROM_LISTING", False)
+    controller.run(batch_size=1)
+
+    assert forfeited == []
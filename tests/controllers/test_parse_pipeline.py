@@ -0,0 +1,141 @@
+"""Tests for the fetch -> parse -> persist pipeline and its map controller wiring."""
+
+import operator
+import threading
+from pathlib import Path
+
+import pytest
+
+from cs2_analytics.controllers import map_controller as map_module
+from cs2_analytics.controllers.parse_pipeline import (
+    MapParseTask,
+    ParsePipeline,
+    parse_fingerprinted_map_task,
+)
+from cs2_analytics.exceptions import MapParseError
+from cs2_analytics.stage_services import StageItemResult
+from tests.controllers.test_map_controller import _build_map_controller
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "parsers" / "fixtures"
+MAP_PAGE = (FIXTURES_DIR / "map_stats_page.html").read_text(encoding="utf-8")
+MAP_URL = "https://www.hltv.org/stats/matches/mapstatsid/{}/vitality-vs-navi"
+
+
+def _map_task(map_id: int) -> MapParseTask:
+    return MapParseTask(
+        map_id=map_id, map_url=MAP_URL.format(map_id), match_id=101, map_order=1
+    )
+
+
+def test_pipeline_parses_in_processes_and_writes_in_submission_order() -> None:
+    recorded: list[tuple[int, int | None]] = []
+    errors: list[tuple[int, MapParseError]] = []
+
+    def record(task: MapParseTask, page) -> StageItemResult:
+        if page.error is not None:
+            errors.append((task.map_id, page.error))
+            return StageItemResult.failed(str(page.error))
+        recorded.append((task.map_id, len(page.parsed_map.players)))
+        return StageItemResult.processed()
+
+    with ParsePipeline(
+        parse_fingerprinted_map_task,
+        record=record,
+        fail=lambda _task, error: pytest.fail(str(error)),
+        workers=2,
+    ) as pipeline:
+        pipeline.submit(_map_task(1), MAP_PAGE)
+        pipeline.submit(_map_task(2), "<html><body>maintenance</body></html>")
+        pipeline.submit(_map_task(3), MAP_PAGE)
+
+    # parse errors come back with the page's fingerprint instead of raising
+    assert recorded == [(1, 10), (3, 10)]
+    assert [map_id for map_id, _ in errors] == [2]
+    assert isinstance(errors[0][1], MapParseError)
+    assert (pipeline.totals.succeeded, pipeline.totals.failed) == (2, 1)
+
+
+def test_pipeline_blocks_fetchers_while_the_writer_is_behind() -> None:
+    release_writer = threading.Event()
+    written: list[str] = []
+
+    def slow_record(_task: str, parsed: str) -> StageItemResult:
+        release_writer.wait(timeout=10)
+        written.append(parsed)
+        return StageItemResult.processed()
+
+    with ParsePipeline(
+        operator.add,
+        record=slow_record,
+        fail=lambda _task, error: pytest.fail(str(error)),
+        workers=1,
+        parse_depth=1,
+        write_depth=1,
+    ) as pipeline:
+        # One page is held by the writer and one fills the write queue.
+        pipeline.submit("a", "1")
+        pipeline.submit("b", "2")
+        blocked = threading.Thread(target=pipeline.submit, args=("c", "3"))
+        blocked.start()
+        blocked.join(timeout=0.5)
+        assert blocked.is_alive()
+
+        release_writer.set()
+        blocked.join(timeout=10)
+        assert not blocked.is_alive()
+
+    assert written == ["a1", "b2", "c3"]
+
+
+class _PageScraper:
+    """Fetch-only scraper stand-in serving map HTML by map id."""
+
+    pages = {1: MAP_PAGE, 2: "<html><body>maintenance</body></html>"}
+
+    def fetch_page(self, url: str) -> str:
+        return self.pages[int(url.split("/")[-2])]
+
+    def fetch_soup(self, _url: str) -> object:
+        raise AssertionError("pipelined maps must not be parsed on the fetch thread")
+
+    def close(self) -> None:
+        return None
+
+
+def test_map_controller_pipelines_fetched_pages_through_parser_processes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    info_calls: list[tuple[object, ...]] = []
+    controller = _build_map_controller(monkeypatch, _PageScraper, object)
+    stored_players: list[list[object]] = []
+    monkeypatch.setattr(
+        controller.stage_service,
+        "store_players",
+        lambda players, cur=None: stored_players.append(players),
+    )
+    monkeypatch.setattr(
+        controller.state,
+        "fetch_with_match_context",
+        lambda _limit=25: [
+            (1, MAP_URL.format(1), 101, 1),
+            (2, MAP_URL.format(2), 101, 2),
+        ],
+    )
+    monkeypatch.setattr(
+        map_module.logger, "info", lambda *args, **_kwargs: info_calls.append(args)
+    )
+
+    controller.run(batch_size=2, parse_workers=2)
+
+    assert controller.state.processing == [1, 2]
+    assert controller.state.processed == [1]
+    assert [map_id for map_id, _ in controller.state.failed] == [2]
+    assert [len(players) for players in stored_players] == [10]
+    assert controller.pipeline is None
+    assert (
+        "MapController summary: selected=%d succeeded=%d failed=%d retries=%d",
+        2,
+        1,
+        1,
+        0,
+    ) in info_calls
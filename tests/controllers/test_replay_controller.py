@@ -0,0 +1,219 @@
+import pytest
+
+from cs2_analytics.archive import PageArchive
+from cs2_analytics.controllers import replay_controller as replay_module
+from cs2_analytics.exceptions import DatabaseOperationError
+from tests.support import FakeTransactionDb
+
+MATCH_PAGE = """
+<html>
+  <body>
+    <div class="team1-gradient"><a href="/team/1/a"></a><div>2</div></div>
+    <div class="team2-gradient"><a href="/team/2/b"></a><div>1</div></div>
+    <div class="teamName">Alpha</div>
+    <div class="teamName">Bravo</div>
+    <div class="event text-ellipsis">Test Masters</div>
+    <div class="padding preformatted-text">Best of 3 (LAN)</div>
+    <div class="mapname">Mirage</div>
+    <div class="date" data-unix="1767225600000"></div>
+    <a class="results-stats" href="/stats/matches/mapstatsid/501/alpha-vs-bravo"></a>
+    <a class="results-stats" href="/stats/matches/mapstatsid/502/alpha-vs-bravo"></a>
+  </body>
+</html>
+"""
+
+
+class _FakeMapState:
+    def __init__(self) -> None:
+        self.context: dict[int, tuple[int | None, int | None]] = {}
+
+    def fetch_match_context(
+        self, map_ids: list[int]
+    ) -> dict[int, tuple[int | None, int | None]]:
+        return {
+            map_id: self.context[map_id] for map_id in map_ids if map_id in self.context
+        }
+
+
+class _FakeState:
+    pass
+
+
+def _build_controller(
+    monkeypatch: pytest.MonkeyPatch, archive: PageArchive, **kwargs
+) -> replay_module.ReplayController:
+    monkeypatch.setattr(replay_module, "get_db", lambda: FakeTransactionDb())
+    monkeypatch.setattr(replay_module, "MatchIngestionState", _FakeState)
+    monkeypatch.setattr(replay_module, "DemoIngestionState", _FakeState)
+    monkeypatch.setattr(replay_module, "MapIngestionState", _FakeMapState)
+    return replay_module.ReplayController(archive, workers=1, **kwargs)
+
+
+def test_replay_parses_archived_match_pages_and_writes_in_batches(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    archive = PageArchive(tmp_path)
+    for match_id in (101, 102, 103):
+        archive.store(
+            f"https://www.hltv.org/matches/{match_id}/alpha-vs-bravo",
+            MATCH_PAGE,
+            kind="match",
+        )
+    controller = _build_controller(monkeypatch, archive, write_batch_size=2)
+    batches: list[list[tuple]] = []
+    monkeypatch.setattr(
+        controller.match_stage_service, "record_parsed_batch", batches.append
+    )
+
+    results = controller.run(stages=["match"])
+
+    assert [[item[0] for item in batch] for batch in batches] == [[101, 102], [103]]
+    match_id, match, map_links, demo_links = batches[0][0]
+    assert match.team1 == "Alpha"
+    assert match.match_type == "bo3"
+    assert map_links == [
+        (501, "https://www.hltv.org/stats/matches/mapstatsid/501/alpha-vs-bravo"),
+        (502, "https://www.hltv.org/stats/matches/mapstatsid/502/alpha-vs-bravo"),
+    ]
+    assert demo_links == []
+    assert results["match"] == replay_module.ReplayRunState(
+        selected=3, stored=3, failed=0, skipped=0
+    )
+
+
+def test_replay_counts_parse_failures_without_writing_them(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    archive = PageArchive(tmp_path)
+    archive.store("https://www.hltv.org/matches/101/a", MATCH_PAGE, kind="match")
+    archive.store("https://www.hltv.org/matches/102/b", "<html></html>", kind="match")
+    controller = _build_controller(monkeypatch, archive)
+    batches: list[list[tuple]] = []
+    monkeypatch.setattr(
+        controller.match_stage_service, "record_parsed_batch", batches.append
+    )
+
+    results = controller.run(stages=["match"])
+
+    assert [[item[0] for item in batch] for batch in batches] == [[101]]
+    assert results["match"].failed == 1
+    assert results["match"].stored == 1
+
+
+def test_replay_maps_skip_pages_without_parent_match_context(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    archive = PageArchive(tmp_path)
+    for map_id in (501, 502):
+        archive.store(
+            f"https://www.hltv.org/stats/matches/mapstatsid/{map_id}/x",
+            f"<html>{map_id}</html>",
+            kind="map",
+        )
+    controller = _build_controller(monkeypatch, archive)
+    controller.map_state.context = {501: (101, 1)}
+    parsed_tasks: list[replay_module.ReplayTask] = []
+
+    def fake_parse_map_page(_root: str, task: replay_module.ReplayTask, backend: str):
+        assert backend == controller.parse_backend
+        parsed_tasks.append(task)
+        return replay_module.ReplayOutcome(task=task, parsed=(task.item_id, object()))
+
+    monkeypatch.setattr(replay_module, "parse_map_page", fake_parse_map_page)
+    batches: list[list[tuple]] = []
+    monkeypatch.setattr(
+        controller.map_stage_service, "record_parsed_batch", batches.append
+    )
+
+    results = controller.run(stages=["map"])
+
+    assert [(task.item_id, task.match_id, task.map_order) for task in parsed_tasks] == [
+        (501, 101, 1)
+    ]
+    assert [[item[0] for item in batch] for batch in batches] == [[501]]
+    assert results["map"] == replay_module.ReplayRunState(
+        selected=2, stored=1, failed=0, skipped=1
+    )
+
+
+def test_replay_counts_failed_write_batch_and_continues(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    archive = PageArchive(tmp_path)
+    for match_id in (101, 102):
+        archive.store(
+            f"https://www.hltv.org/matches/{match_id}/a", MATCH_PAGE, kind="match"
+        )
+    controller = _build_controller(monkeypatch, archive, write_batch_size=1)
+    calls: list[int] = []
+
+    def flaky_record(batch: list[tuple]) -> None:
+        calls.append(batch[0][0])
+        if batch[0][0] == 101:
+            raise DatabaseOperationError("Failed during database transaction.")
+
+    monkeypatch.setattr(
+        controller.match_stage_service, "record_parsed_batch", flaky_record
+    )
+    monkeypatch.setattr(replay_module.logger, "exception", lambda *_args: None)
+
+    results = controller.run(stages=["match"])
+
+    assert calls == [101, 102]
+    assert results["match"].failed == 1
+    assert results["match"].stored == 1
+
+
+def test_replay_retries_a_failed_write_batch_item_by_item(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    archive = PageArchive(tmp_path)
+    for match_id in (101, 102, 103):
+        archive.store(
+            f"https://www.hltv.org/matches/{match_id}/a", MATCH_PAGE, kind="match"
+        )
+    controller = _build_controller(monkeypatch, archive, write_batch_size=3)
+    calls: list[list[int]] = []
+
+    def record_rejecting_102(batch: list[tuple]) -> None:
+        calls.append([item[0] for item in batch])
+        if any(item[0] == 102 for item in batch):
+            raise DatabaseOperationError("Failed during database transaction.")
+
+    monkeypatch.setattr(
+        controller.match_stage_service, "record_parsed_batch", record_rejecting_102
+    )
+    failed_items: list[object] = []
+    monkeypatch.setattr(
+        replay_module.logger,
+        "exception",
+        lambda _message, _stage, item_id, _error: failed_items.append(item_id),
+    )
+
+    results = controller.run(stages=["match"])
+
+    assert calls == [[101, 102, 103], [101], [102], [103]]
+    assert failed_items == [102]
+    assert results["match"] == replay_module.ReplayRunState(
+        selected=3, stored=2, failed=1, skipped=0
+    )
+
+
+def test_parse_match_page_runs_in_a_process_pool(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    archive = PageArchive(tmp_path)
+    for match_id in (101, 102, 103):
+        archive.store(
+            f"https://www.hltv.org/matches/{match_id}/a", MATCH_PAGE, kind="match"
+        )
+    controller = _build_controller(monkeypatch, archive)
+    controller.workers = 2
+    batches: list[list[tuple]] = []
+    monkeypatch.setattr(
+        controller.match_stage_service, "record_parsed_batch", batches.append
+    )
+
+    controller.run(stages=["match"])
+
+    assert [item[0] for batch in batches for item in batch] == [101, 102, 103]
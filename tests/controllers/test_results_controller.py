@@ -1,15 +1,26 @@
+import threading
+
 import pytest
 
 from cs2_analytics.controllers import results_controller as results_module
-from cs2_analytics.exceptions import PipelineError, SessionScrapeError
+from cs2_analytics.exceptions import (
+    DatabaseOperationError,
+    PipelineError,
+    SessionScrapeError,
+)
 
 
 class _FakeStageService:
-    def __init__(self) -> None:
+    def __init__(self, known_ids: frozenset[int] = frozenset()) -> None:
+        self.known_ids = known_ids
         self.batches: list[list[tuple[int, str]]] = []
 
-    def record_batch(self, batch: list[tuple[int, str]]) -> int:
+    def record_batch(
+        self, batch: list[tuple[int, str]], *, skip_known: bool = False
+    ) -> int:
         self.batches.append(list(batch))
+        if skip_known:
+            return len([item for item in batch if item[0] not in self.known_ids])
         return len(batch)
 
 
@@ -29,6 +40,25 @@ class _RetryThenSucceedScraper:
         self.close_calls += 1
 
 
+class _PagedScraper:
+    """Yields three results pages and counts how many were fetched."""
+
+    def __init__(self) -> None:
+        self.pages_fetched = 0
+        self.close_calls = 0
+
+    def iter_match_batches(self, max_matches: int = 50):
+        for page in range(3):
+            self.pages_fetched += 1
+            yield [
+                (page * 10 + n, f"https://www.hltv.org/matches/{page * 10 + n}/x")
+                for n in range(2)
+            ]
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+
 class _AlwaysFailingRetryableScraper:
     def __init__(self) -> None:
         self.run_calls = 0
@@ -232,3 +262,98 @@ def test_results_controller_raises_pipeline_error_for_non_retryable_failure(
         and call_args[1:] == ("failed", 0, 1, 25)
         for call_args, _ in info_calls
     )
+
+
+def test_results_controller_stops_at_first_fully_known_page(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(results_module, "ResultsScraper", _PagedScraper)
+    controller = results_module.ResultsController()
+    controller.stage_service = _FakeStageService(known_ids=frozenset({1, 10, 11}))
+
+    controller.run(max_matches=50, stop_at_known=True)
+
+    assert controller.scraper.pages_fetched == 2
+    assert [
+        [match_id for match_id, _ in b] for b in controller.stage_service.batches
+    ] == [
+        [0, 1],
+        [10, 11],
+    ]
+
+
+def test_results_controller_walks_every_page_without_stop_at_known(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(results_module, "ResultsScraper", _PagedScraper)
+    controller = results_module.ResultsController()
+    controller.stage_service = _FakeStageService(known_ids=frozenset({10, 11}))
+
+    controller.run(max_matches=50)
+
+    assert controller.scraper.pages_fetched == 3
+    assert len(controller.stage_service.batches) == 3
+
+
+class _OverlapProbe:
+    """Scraper and stage service that record whether page 2 was fetched
+    while page 1 was still being written."""
+
+    def __init__(self) -> None:
+        self.second_page_fetched = threading.Event()
+        self.overlapped: list[bool] = []
+        self.batches: list[list[tuple[int, str]]] = []
+        self.close_calls = 0
+
+    def iter_match_batches(self, max_matches: int = 50):
+        yield [(1, "https://www.hltv.org/matches/1/x")]
+        self.second_page_fetched.set()
+        yield [(2, "https://www.hltv.org/matches/2/x")]
+
+    def record_batch(
+        self, batch: list[tuple[int, str]], *, skip_known: bool = False
+    ) -> int:
+        if not self.batches:
+            self.overlapped.append(self.second_page_fetched.wait(timeout=5))
+        self.batches.append(list(batch))
+        return len(batch)
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+
+def test_results_controller_fetches_next_page_while_recording(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    probe = _OverlapProbe()
+    monkeypatch.setattr(results_module, "ResultsScraper", lambda: probe)
+    controller = results_module.ResultsController()
+    controller.stage_service = probe
+
+    controller.run(max_matches=50)
+
+    assert probe.overlapped == [True]
+    assert [[match_id for match_id, _ in b] for b in probe.batches] == [[1], [2]]
+
+
+class _FailingStageService:
+    def record_batch(
+        self, batch: list[tuple[int, str]], *, skip_known: bool = False
+    ) -> int:
+        raise DatabaseOperationError("Failed to record listed matches.")
+
+
+def test_results_controller_fails_the_run_when_a_background_write_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(results_module, "ResultsScraper", _PagedScraper)
+    controller = results_module.ResultsController()
+    controller.stage_service = _FailingStageService()
+
+    with pytest.raises(
+        PipelineError, match=r"non-retryable error at attempt 1/3"
+    ) as exc_info:
+        controller.run(max_matches=50)
+
+    assert isinstance(exc_info.value.__cause__, DatabaseOperationError)
+    assert controller.scraper.close_calls == 1
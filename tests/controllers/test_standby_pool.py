@@ -0,0 +1,130 @@
+"""Tests for pre-warmed standby scraper sessions."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from cs2_analytics.controllers import retry_utils
+from cs2_analytics.controllers import standby_pool as standby_module
+from cs2_analytics.controllers.standby_pool import StandbyScraperPool
+
+
+class _Logger:
+    def __init__(self) -> None:
+        self.infos: list[tuple[object, ...]] = []
+        self.warnings: list[tuple[object, ...]] = []
+
+    def info(self, *args: object) -> None:
+        self.infos.append(args)
+
+    def warning(self, *args: object) -> None:
+        self.warnings.append(args)
+
+
+class _DeadDriver:
+    @property
+    def current_url(self) -> str:
+        raise RuntimeError("invalid session id")
+
+
+class _Scraper:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.close_calls = 0
+        self.driver: object = SimpleNamespace(current_url="about:blank")
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+
+class _Factory:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.created: list[_Scraper] = []
+
+    def __call__(self) -> _Scraper:
+        if self.fail:
+            raise RuntimeError("chrome failed to launch")
+        scraper = _Scraper(f"standby-{len(self.created) + 1}")
+        self.created.append(scraper)
+        return scraper
+
+
+@pytest.fixture(autouse=True)
+def _no_startup_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(standby_module.time, "sleep", lambda *_args: None)
+
+
+def test_take_returns_warm_session_and_starts_replacement() -> None:
+    factory = _Factory()
+    logger = _Logger()
+    pool = StandbyScraperPool(factory, logger=logger)
+
+    first = pool.take()
+    second = pool.take()
+    pool.close()
+
+    assert first is factory.created[0]
+    assert second is factory.created[1]
+    assert first.close_calls == second.close_calls == 0
+    # the replacement for the second take is closed unused (or never started)
+    assert all(scraper.close_calls == 1 for scraper in factory.created[2:])
+    assert len(logger.infos) == 2
+    assert pool.take() is None
+
+
+def test_unhealthy_standby_session_is_closed_and_not_returned() -> None:
+    factory = _Factory()
+    logger = _Logger()
+    pool = StandbyScraperPool(factory, logger=logger, health_check=lambda _s: False)
+
+    assert pool.take() is None
+    pool.close()
+
+    assert factory.created[0].close_calls == 1
+    assert logger.warnings[0] == ("Standby scraper session failed its health check",)
+
+
+def test_standby_session_that_died_while_waiting_is_closed_and_not_returned() -> None:
+    factory = _Factory()
+    logger = _Logger()
+    pool = StandbyScraperPool(factory, logger=logger)
+    pool._pending[0].result().driver = _DeadDriver()
+
+    assert pool.take() is None
+    pool.close()
+
+    assert factory.created[0].close_calls == 1
+    assert logger.warnings == [("Standby scraper session died before it was taken",)]
+    assert logger.infos == []
+
+
+def test_standby_launch_failure_falls_back_to_none() -> None:
+    logger = _Logger()
+    pool = StandbyScraperPool(_Factory(fail=True), logger=logger)
+
+    assert pool.take() is None
+    pool.close()
+
+    assert logger.warnings[0][0] == "Standby scraper session failed to start: %s"
+
+
+def test_reset_scraper_swaps_in_standby_without_inline_build() -> None:
+    standby_factory = _Factory()
+    pool = StandbyScraperPool(standby_factory, logger=_Logger())
+    original = _Scraper("original")
+
+    def inline_factory() -> _Scraper:
+        raise AssertionError("reset should not build a session inline")
+
+    recovered = retry_utils.reset_scraper(
+        original,
+        inline_factory,
+        logger=_Logger(),
+        close_warning_message="Failed to close scraper during recovery: %s",
+        standby=pool,
+    )
+    pool.close()
+
+    assert recovered is standby_factory.created[0]
+    assert original.close_calls == 1
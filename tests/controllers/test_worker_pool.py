@@ -0,0 +1,133 @@
+import threading
+import time
+
+import pytest
+
+from cs2_analytics.controllers import worker_pool
+from cs2_analytics.controllers.retry_utils import BatchRunState
+
+
+class _Scraper:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.close_calls = 0
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+
+def test_single_worker_runs_inline_on_initial_scraper() -> None:
+    initial = _Scraper("initial")
+    seen: list[tuple[int, str, str]] = []
+
+    def process_item(item: int, run_state: BatchRunState[_Scraper]) -> None:
+        seen.append((item, run_state.scraper.name, threading.current_thread().name))
+        run_state.succeeded += 1
+
+    run_states = worker_pool.run_with_workers(
+        [1, 2, 3],
+        workers=1,
+        initial_scraper=initial,
+        scraper_factory=lambda: pytest.fail("single worker must not build scrapers"),
+        process_item=process_item,
+    )
+
+    current = threading.current_thread().name
+    assert seen == [
+        (1, "initial", current),
+        (2, "initial", current),
+        (3, "initial", current),
+    ]
+    assert [state.succeeded for state in run_states] == [3]
+    assert initial.close_calls == 1
+
+
+def test_each_worker_gets_its_own_scraper_and_run_state() -> None:
+    initial = _Scraper("initial")
+    built: list[_Scraper] = []
+    barrier = threading.Barrier(3, timeout=5)
+    seen_scrapers: set[str] = set()
+    lock = threading.Lock()
+
+    def scraper_factory() -> _Scraper:
+        scraper = _Scraper(f"worker-{len(built) + 2}")
+        built.append(scraper)
+        return scraper
+
+    def process_item(item: int, run_state: BatchRunState[_Scraper]) -> None:
+        if item < 3:
+            barrier.wait()
+        with lock:
+            seen_scrapers.add(run_state.scraper.name)
+        if item % 2:
+            run_state.succeeded += 1
+        else:
+            run_state.failed += 1
+            run_state.retries += 2
+
+    run_states = worker_pool.run_with_workers(
+        list(range(6)),
+        workers=3,
+        initial_scraper=initial,
+        scraper_factory=scraper_factory,
+        process_item=process_item,
+    )
+
+    assert len(run_states) == 3
+    assert len({id(state) for state in run_states}) == 3
+    assert seen_scrapers == {"initial", "worker-2", "worker-3"}
+    assert worker_pool.total_run_states(run_states) == worker_pool.BatchTotals(
+        succeeded=3, failed=3, retries=6
+    )
+    assert initial.close_calls == 1
+    assert [scraper.close_calls for scraper in built] == [1, 1]
+
+
+def test_worker_count_is_capped_by_batch_size() -> None:
+    built: list[_Scraper] = []
+
+    run_states = worker_pool.run_with_workers(
+        [1, 2],
+        workers=8,
+        initial_scraper=_Scraper("initial"),
+        scraper_factory=lambda: built.append(_Scraper("extra")) or built[-1],
+        process_item=lambda _item, _state: None,
+    )
+
+    assert len(run_states) == 2
+    assert len(built) == 1
+
+
+def test_worker_error_stops_other_workers_and_is_reraised() -> None:
+    initial = _Scraper("initial")
+    built: list[_Scraper] = []
+    processed: list[int] = []
+    lock = threading.Lock()
+    failed = threading.Event()
+
+    def scraper_factory() -> _Scraper:
+        scraper = _Scraper("extra")
+        built.append(scraper)
+        return scraper
+
+    def process_item(item: int, _run_state: BatchRunState[_Scraper]) -> None:
+        if item == 0:
+            failed.set()
+            raise RuntimeError("state table unavailable")
+        failed.wait(timeout=5)
+        time.sleep(0.01)
+        with lock:
+            processed.append(item)
+
+    with pytest.raises(RuntimeError, match="state table unavailable"):
+        worker_pool.run_with_workers(
+            list(range(50)),
+            workers=2,
+            initial_scraper=initial,
+            scraper_factory=scraper_factory,
+            process_item=process_item,
+        )
+
+    assert len(processed) < 49
+    assert initial.close_calls == 1
+    assert [scraper.close_calls for scraper in built] == [1]
@@ -35,15 +35,25 @@ class _RecordingCursor:
         self.executemany_query = query
         self.executemany_values = values
 
+    def fetchall(self) -> list[tuple]:
+        return []
+
 
 class _RecordingStateDb:
     def __init__(self, cursor: _RecordingCursor) -> None:
         self.cursor = cursor
+        self.prepared_names: list[str] = []
 
     @contextmanager
     def get_cursor(self):
         yield self.cursor
 
+    def execute_prepared(
+        self, cur: _RecordingCursor, name: str, query: str, params: tuple
+    ) -> None:
+        self.prepared_names.append(name)
+        cur.execute(query, params)
+
 
 def test_match_ingestion_state_wraps_db_failures_in_typed_exception(
     monkeypatch: pytest.MonkeyPatch,
@@ -199,3 +209,43 @@ def test_map_ingestion_state_records_parent_match_context(
         "match_parser",
         0,
     )
+
+
+def test_map_fetch_match_context_returns_context_by_map_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _ContextCursor(_RecordingCursor):
+        def fetchall(self) -> list[tuple[int, int | None, int | None]]:
+            return [(501, 101, 1), (502, None, None)]
+
+    cursor = _ContextCursor()
+    monkeypatch.setattr(base_state_module, "get_db", lambda: _RecordingStateDb(cursor))
+
+    context = MapIngestionState().fetch_match_context([501, 502])
+
+    assert context == {501: (101, 1), 502: (None, None)}
+    assert cursor.execute_values == ([501, 502],)
+    assert MapIngestionState().fetch_match_context([]) == {}
+
+
+def test_per_item_transitions_run_as_named_prepared_statements(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    db = _RecordingStateDb(_RecordingCursor())
+    monkeypatch.setattr(base_state_module, "get_db", lambda: db)
+    state = MatchIngestionState()
+
+    state.queue(1, "https://www.hltv.org/matches/1/test")
+    state.mark_as_processing(1)
+    state.mark_as_processed(1, cur=db.cursor)
+    state.mark_as_failed(1, "boom")
+    state.fetch(limit=5)
+
+    assert db.prepared_names == [
+        "match_ingestion_state_queue",
+        "match_ingestion_state_mark_processing",
+        "match_ingestion_state_mark_processed",
+        "match_ingestion_state_mark_failed",
+        "match_ingestion_state_fetch",
+    ]
+    assert db.cursor.execute_values == (5,)
@@ -138,3 +138,31 @@ def test_requeue_wraps_db_failures(monkeypatch: pytest.MonkeyPatch) -> None:
         match="Failed to requeue items in match_ingestion_state.",
     ):
         state.requeue([1], "failed")
+
+
+def test_fetch_known_ids_runs_one_membership_query(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cursor = _RecordingCursor(rows=[(2,), (3,)])
+    db = _RecordingStateDb(cursor)
+    monkeypatch.setattr(base_state_module, "get_db", lambda: db)
+    state = MatchIngestionState()
+
+    known = state.fetch_known_ids([1, 2, 3])
+
+    assert known == {2, 3}
+    assert db.cursor_uses == 1
+    assert cursor.execute_query is not None
+    assert "WHERE match_id = ANY(%s)" in cursor.execute_query
+    assert cursor.execute_values == ([1, 2, 3],)
+
+
+def test_fetch_known_ids_with_no_ids_skips_the_query(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cursor = _RecordingCursor()
+    db = _RecordingStateDb(cursor)
+    monkeypatch.setattr(base_state_module, "get_db", lambda: db)
+
+    assert MatchIngestionState().fetch_known_ids([]) == set()
+    assert db.cursor_uses == 0
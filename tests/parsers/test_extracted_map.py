@@ -0,0 +1,137 @@
+"""Cross-checks in-browser map extraction against the HTML parse path.
+
+No browser runs in the test suite, so `_browser_payload` builds the payload
+MAP_EXTRACTION_SCRIPT returns from a full html.parser soup, following the
+script's lookups step for step. MapParser's output from that payload must
+match its output from the page HTML.
+"""
+
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup, NavigableString
+
+from cs2_analytics.exceptions import MapParseError
+from cs2_analytics.parsers.extracted_map import ExtractedMapPage
+from cs2_analytics.parsers.map_parser import MapParser
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+TIMESTAMP_FIELDS = {
+    "inserted_at",
+    "last_inserted_at",
+    "last_scraped_at",
+    "last_updated_at",
+}
+MAP_PAGES = [
+    pytest.param(
+        "map_stats_page.html",
+        "https://www.hltv.org/stats/matches/mapstatsid/204269/vitality-vs-navi",
+        204269,
+        id="eco-adjusted-columns",
+    ),
+    pytest.param(
+        "map_stats_page_overtime.html",
+        "https://www.hltv.org/stats/matches/mapstatsid/205101/spirit-vs-faze",
+        205101,
+        id="overtime",
+    ),
+]
+
+
+def _stable_fields(model) -> dict:
+    return {
+        key: value
+        for key, value in asdict(model).items()
+        if key not in TIMESTAMP_FIELDS
+    }
+
+
+def _texts_of(tag) -> list[str]:
+    return list(tag.stripped_strings)
+
+
+def _cell_of(td) -> dict:
+    link = td.find("a")
+    return {
+        "classes": td.get("class", []),
+        "strings": _texts_of(td),
+        "link": None
+        if link is None
+        else {"href": link.get("href"), "strings": _texts_of(link)},
+    }
+
+
+def _table_of(table) -> dict:
+    team_header = table.select_one("th.st-teamname")
+    body = table.find("tbody")
+    return {
+        "classes": table.get("class", []),
+        "teamName": team_header.get_text().strip() if team_header else None,
+        "headers": [" ".join(_texts_of(th)) for th in table.select("thead th")],
+        "rows": None
+        if body is None
+        else [[_cell_of(td) for td in tr.find_all("td")] for tr in body.find_all("tr")],
+    }
+
+
+def _browser_payload(soup: BeautifulSoup) -> dict:
+    info_box = soup.select_one("div.match-info-box")
+    label = info_box.select_one("div.small-text") if info_box else None
+    map_name = None
+    for node in label.next_siblings if label else ():
+        if isinstance(node, NavigableString) and node.strip():
+            map_name = node.strip()
+            break
+    date_tag = soup.select_one("div.date")
+    return {
+        "mapName": map_name,
+        "infoBoxTokens": _texts_of(info_box) if info_box else [],
+        "dateUnix": date_tag.get("data-unix") if date_tag else None,
+        "tables": [_table_of(table) for table in soup.select("table.stats-table")],
+        "mapStatsHrefs": [
+            link.get("href")
+            for link in soup.select('a[href*="/stats/matches/mapstatsid/"]')
+        ],
+    }
+
+
+@pytest.mark.parametrize("map_order", [None, 2])
+@pytest.mark.parametrize(("name", "url", "map_id"), MAP_PAGES)
+def test_extracted_page_parses_identically_to_page_html(
+    name: str, url: str, map_id: int, map_order: int | None
+) -> None:
+    soup = BeautifulSoup(
+        (FIXTURES_DIR / name).read_text(encoding="utf-8"), "html.parser"
+    )
+    page = ExtractedMapPage.from_payload(_browser_payload(soup))
+
+    def parse(source):
+        parsed = MapParser().parse_map_details(
+            source, url, map_id, match_id=2380000, map_order=map_order
+        )
+        return _stable_fields(parsed.map), [_stable_fields(p) for p in parsed.players]
+
+    extracted = parse(page)
+    assert extracted == parse(soup)
+    assert len(extracted[1]) == 10
+
+
+@pytest.mark.parametrize("missing", ["mapName", "dateUnix", "tables"])
+def test_incomplete_payload_is_rejected_for_html_fallback(missing: str) -> None:
+    soup = BeautifulSoup(
+        (FIXTURES_DIR / "map_stats_page.html").read_text(encoding="utf-8"),
+        "html.parser",
+    )
+    payload = _browser_payload(soup)
+    payload[missing] = [] if missing == "tables" else None
+
+    with pytest.raises(MapParseError, match="found no map name, date or stats"):
+        ExtractedMapPage.from_payload(payload)
+
+
+def test_malformed_payload_is_rejected() -> None:
+    with pytest.raises(MapParseError, match="malformed payload"):
+        ExtractedMapPage.from_payload({"mapName": "Mirage", "tables": [{}]})
+    with pytest.raises(MapParseError, match="returned no payload"):
+        ExtractedMapPage.from_payload(None)
@@ -2,7 +2,7 @@ from typing import Any, cast
 
 from bs4 import BeautifulSoup
 
-from cs2_analytics.parsers.map_parser import MapParser
+from cs2_analytics.parsers.map_parser import MapParser, resolve_column_indexes
 
 
 def test_parse_map_prefers_visible_over_hidden_metric_cells() -> None:
@@ -204,3 +204,19 @@ def test_parse_map_details_extracts_map_metadata() -> None:
     assert parsed.map.date == "2025-08-05 14:30:00"
     assert parsed.map.data_complete is True
     assert len(parsed.players) == 2
+
+
+def test_column_indexes_follow_headers_and_are_memoized_by_signature() -> None:
+    resolve_column_indexes.cache_clear()
+    reordered = ("Vitality", "Rating 3.0", "K (hs)", "", "ADR")
+
+    first = resolve_column_indexes(reordered)
+    second = resolve_column_indexes(reordered)
+
+    assert second is first
+    assert resolve_column_indexes.cache_info().hits == 1
+    assert first["rating"] == 1
+    assert first["kills"] == 2
+    assert first["adr"] == 4
+    # Columns without a matching header keep their positional default.
+    assert first["kast"] == 4
@@ -0,0 +1,160 @@
+"""Regression harness: every parse backend yields identical parser output.
+
+Each fixture page is parsed with html.parser and with lxml, both as a full
+document and restricted to the parser's declared page regions, and the
+resulting Player/Map/Match objects must match the full html.parser parse
+field for field, apart from the wall-clock timestamps the parsers stamp on
+each object.
+"""
+
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from cs2_analytics.exceptions import ConfigurationError
+from cs2_analytics.parsers import parse_backend as backend_module
+from cs2_analytics.parsers.map_parser import MapParser
+from cs2_analytics.parsers.match_parser import MatchParser
+from cs2_analytics.parsers.parse_backend import (
+    PageRegion,
+    PageRegions,
+    make_soup,
+    resolve_parse_backend,
+)
+
+pytest.importorskip("lxml")
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+TIMESTAMP_FIELDS = {
+    "inserted_at",
+    "last_inserted_at",
+    "last_scraped_at",
+    "last_updated_at",
+}
+
+MAP_PAGES = [
+    pytest.param(
+        "map_stats_page.html",
+        "https://www.hltv.org/stats/matches/mapstatsid/204269/vitality-vs-navi",
+        204269,
+        id="eco-adjusted-columns",
+    ),
+    pytest.param(
+        "map_stats_page_overtime.html",
+        "https://www.hltv.org/stats/matches/mapstatsid/205101/spirit-vs-faze",
+        205101,
+        id="overtime",
+    ),
+]
+PARSE_VARIANTS = [
+    pytest.param("html.parser", True, id="html.parser-regions"),
+    pytest.param("lxml", False, id="lxml-full"),
+    pytest.param("lxml", True, id="lxml-regions"),
+]
+MATCH_PAGES = [
+    pytest.param("match_page.html", id="best-of-three"),
+    pytest.param("match_page_forfeit.html", id="forfeit"),
+]
+
+
+def _stable_fields(model) -> dict:
+    return {
+        key: value
+        for key, value in asdict(model).items()
+        if key not in TIMESTAMP_FIELDS
+    }
+
+
+def _parse_map_fixture(
+    name: str, url: str, map_id: int, backend: str, use_regions: bool = False
+):
+    page_source = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+    regions = MapParser.page_regions if use_regions else None
+    parsed = MapParser().parse_map_details(
+        make_soup(page_source, backend, regions),
+        url,
+        map_id,
+        match_id=2380000,
+        map_order=None,
+    )
+    return _stable_fields(parsed.map), [_stable_fields(p) for p in parsed.players]
+
+
+def _parse_match_fixture(name: str, backend: str, use_regions: bool = False):
+    page_source = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+    regions = MatchParser.page_regions if use_regions else None
+    match, map_links, demo_links = MatchParser().parse_match(
+        make_soup(page_source, backend, regions),
+        "https://www.hltv.org/matches/2380000/vitality-vs-navi-test-masters-2025",
+    )
+    return _stable_fields(match), map_links, demo_links
+
+
+@pytest.mark.parametrize(("backend", "use_regions"), PARSE_VARIANTS)
+@pytest.mark.parametrize(("name", "url", "map_id"), MAP_PAGES)
+def test_map_parser_output_is_identical_across_backends(
+    name: str, url: str, map_id: int, backend: str, use_regions: bool
+) -> None:
+    reference = _parse_map_fixture(name, url, map_id, "html.parser")
+    variant = _parse_map_fixture(name, url, map_id, backend, use_regions)
+
+    assert variant == reference
+    assert len(reference[1]) == 10
+
+
+@pytest.mark.parametrize(("backend", "use_regions"), PARSE_VARIANTS)
+@pytest.mark.parametrize("name", MATCH_PAGES)
+def test_match_parser_output_is_identical_across_backends(
+    name: str, backend: str, use_regions: bool
+) -> None:
+    assert _parse_match_fixture(name, backend, use_regions) == _parse_match_fixture(
+        name, "html.parser"
+    )
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+def test_page_regions_build_only_the_declared_subtrees(backend: str) -> None:
+    regions = PageRegions(
+        PageRegion("div", css_class="keep"),
+        PageRegion("a", href_contains="/mapstatsid/"),
+    )
+    soup = make_soup(
+        """
+        <html><body>
+          <aside><div class="news">drop</div><a href="/news/1">drop</a></aside>
+          <section><div class="box keep"><span>kept</span></div></section>
+          <a href="/stats/matches/mapstatsid/7/x">link</a>
+          loose text
+        </body></html>
+        """,
+        backend,
+        regions,
+    )
+
+    assert soup.find("aside") is None
+    assert soup.find("body") is None
+    assert soup.select_one("div.keep span").get_text() == "kept"
+    assert [a["href"] for a in soup.find_all("a")] == ["/stats/matches/mapstatsid/7/x"]
+    assert "loose text" not in soup.get_text()
+
+
+def test_resolve_parse_backend_fast_prefers_lxml(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert resolve_parse_backend("fast") == "lxml"
+
+    monkeypatch.setattr(backend_module, "LXML_AVAILABLE", False)
+    assert resolve_parse_backend("fast") == "html.parser"
+    with pytest.raises(ConfigurationError, match="requires the lxml package"):
+        resolve_parse_backend("lxml")
+
+
+def test_resolve_parse_backend_defaults_to_config_and_rejects_unknown(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(backend_module, "PARSE_BACKEND", "lxml")
+    assert resolve_parse_backend() == "lxml"
+
+    with pytest.raises(ConfigurationError, match="Unknown parse backend"):
+        resolve_parse_backend("html5lib")
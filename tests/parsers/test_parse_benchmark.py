@@ -0,0 +1,142 @@
+"""Tests for the parser benchmark corpus, baselines and regression gate."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cs2_analytics.exceptions import ParseError
+from cs2_analytics.parsers import parse_benchmark
+from cs2_analytics.parsers.parse_benchmark import (
+    BackendResult,
+    HeaderMemoTiming,
+    ParserTiming,
+    find_regressions,
+    format_results,
+    load_baseline,
+    load_corpus,
+    parse_corpus_page,
+    run_backend,
+    write_baseline,
+)
+
+CORPUS_MANIFEST = Path(__file__).parent / "fixtures" / "corpus.json"
+
+
+def _result(
+    backend: str,
+    pages_per_sec: float,
+    peak_rss_mib: float,
+    reference_pages_per_sec: float = 100.0,
+) -> BackendResult:
+    return BackendResult(
+        backend=backend,
+        peak_rss_mib=peak_rss_mib,
+        parsers={
+            "map": ParserTiming(
+                pages=4, pages_per_sec=pages_per_sec, p50_ms=10.0, p99_ms=20.0
+            )
+        },
+        reference_pages_per_sec=reference_pages_per_sec,
+    )
+
+
+@pytest.mark.parametrize("backend", parse_benchmark.default_backends())
+def test_every_corpus_page_parses_to_its_expected_item_count(backend: str) -> None:
+    pages = load_corpus(CORPUS_MANIFEST)
+
+    assert {page.parser for page in pages} == {"map", "match", "results"}
+    for page in pages:
+        parse_corpus_page(page, page.path.read_text(encoding="utf-8"), backend)
+
+
+def test_wrong_item_count_fails_the_page() -> None:
+    page = next(
+        page for page in load_corpus(CORPUS_MANIFEST) if page.name == "match-bo5"
+    )
+    forfeit_source = (page.path.parent / "match_page_forfeit.html").read_text(
+        encoding="utf-8"
+    )
+
+    with pytest.raises(ParseError, match="match-bo5 parsed 0 items"):
+        parse_corpus_page(page, forfeit_source, "html.parser")
+
+
+def test_regressions_beyond_the_threshold_are_reported() -> None:
+    baseline = {
+        "lxml": {
+            "peak_rss_mib": 100.0,
+            "parsers": {"map": {"pages_per_sec": 50.0, "relative_speed": 0.5}},
+        }
+    }
+
+    assert find_regressions([_result("lxml", 44.0, 110.0)], baseline, 15.0) == []
+    regressions = find_regressions([_result("lxml", 40.0, 120.0)], baseline, 15.0)
+    assert regressions == [
+        "lxml map: relative speed 0.400 (40.0 pages/sec) is below the baseline "
+        "0.500 by more than 15%",
+        "lxml: peak RSS 120.0 MiB is above the baseline 100.0 MiB by more than 15%",
+    ]
+    assert find_regressions([_result("html.parser", 1.0, 999.0)], baseline) == []
+
+
+def test_throughput_is_gated_relative_to_the_reference_pass() -> None:
+    baseline = {"lxml": {"parsers": {"map": {"relative_speed": 0.5}}}}
+
+    # Half the pages/sec on a machine half as fast is not a regression.
+    slow_machine = _result("lxml", 25.0, 50.0, reference_pages_per_sec=50.0)
+    assert find_regressions([slow_machine], baseline, 15.0) == []
+    # The same pages/sec on a machine twice as fast is.
+    fast_machine = _result("lxml", 50.0, 50.0, reference_pages_per_sec=200.0)
+    assert len(find_regressions([fast_machine], baseline, 15.0)) == 1
+
+
+def test_writing_a_baseline_keeps_other_backends(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    write_baseline([_result("html.parser", 10.0, 40.0)], path)
+    write_baseline([_result("lxml", 20.0, 41.0)], path)
+
+    stored = load_baseline(path)
+    assert sorted(stored) == ["html.parser", "lxml"]
+    assert stored["lxml"]["parsers"]["map"]["pages_per_sec"] == 20.0
+    assert stored["lxml"]["parsers"]["map"]["relative_speed"] == 0.2
+    assert "recorded_on" in json.loads(path.read_text(encoding="utf-8"))
+    assert load_baseline(tmp_path / "missing.json") == {}
+
+
+def test_map_pages_are_timed_with_a_cold_and_a_warm_header_memo() -> None:
+    map_pages = [page for page in load_corpus(CORPUS_MANIFEST) if page.parser == "map"]
+
+    result = run_backend(map_pages[:1], "html.parser", rounds=2)
+
+    memo = result.header_memo
+    assert memo is not None
+    assert memo.warm_pages_per_sec == result.parsers["map"].pages_per_sec
+    assert memo.cold_pages_per_sec > 0
+    assert 0 < memo.warm_resolve_us < memo.cold_resolve_us
+
+
+def test_header_memo_is_reported_but_not_stored_in_the_baseline(
+    tmp_path: Path,
+) -> None:
+    result = BackendResult(
+        backend="lxml",
+        peak_rss_mib=40.0,
+        parsers=_result("lxml", 20.0, 40.0).parsers,
+        reference_pages_per_sec=100.0,
+        header_memo=HeaderMemoTiming(
+            cold_pages_per_sec=18.0,
+            warm_pages_per_sec=20.0,
+            cold_resolve_us=30.0,
+            warm_resolve_us=0.5,
+        ),
+    )
+    path = tmp_path / "baseline.json"
+
+    write_baseline([result], path)
+
+    assert "header_memo" not in load_baseline(path)["lxml"]
+    assert format_results([result])[-1] == (
+        "lxml header memo: map pages 18.0 pages/s cold, 20.0 warm (1.11x); "
+        "header resolution 30.00 us cold, 0.50 us warm (60.0x)"
+    )
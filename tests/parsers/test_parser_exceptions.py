@@ -1,9 +1,11 @@
+import datetime as dt
 from unittest import mock
 
 import pytest
 from bs4 import BeautifulSoup
 
 from cs2_analytics.exceptions import MapParseError, MatchParseError
+from cs2_analytics.models import ResultListing
 from cs2_analytics.parsers import map_parser as map_parser_module
 from cs2_analytics.parsers.map_parser import MapParser
 from cs2_analytics.parsers.match_parser import MatchParser
@@ -630,3 +632,38 @@ def test_map_parser_logs_and_defaults_unparseable_round_swing() -> None:
     warning_mock.assert_called_once_with(
         "Could not parse %s from %r; defaulting to 0", "round swing", "n/a"
     )
+
+
+def test_match_parser_builds_forfeit_from_listing_header() -> None:
+    listing = ResultListing(
+        match_id=2379981,
+        match_url="https://www.hltv.org/matches/2379981/falcons-vs-astralis",
+        team1="Falcons",
+        team2="Astralis",
+        score1=0,
+        score2=1,
+        event="Test Masters 2025",
+        forfeit=True,
+        listed_date=dt.date(2025, 8, 4),
+    )
+
+    match = MatchParser().match_from_listing(listing)
+
+    assert match.winner == "Astralis"
+    assert match.forfeit is True
+    assert match.match_type is None
+    assert match.date == "2025-08-04"
+    assert (match.map_links, match.demo_links) == ([], [])
+    assert match.data_complete is False
+
+
+def test_match_parser_rejects_listing_without_forfeit_header() -> None:
+    headerless = ResultListing(
+        match_id=1, match_url="https://www.hltv.org/matches/1/a-vs-b", forfeit=True
+    )
+    played = ResultListing(match_id=2, match_url="https://www.hltv.org/matches/2/x")
+
+    with pytest.raises(MatchParseError, match="lacks header data"):
+        MatchParser().match_from_listing(headerless)
+    with pytest.raises(MatchParseError, match="is not a forfeit"):
+        MatchParser().match_from_listing(played)
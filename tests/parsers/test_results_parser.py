@@ -0,0 +1,82 @@
+"""Tests for match listing discovery from results pages."""
+
+import datetime as dt
+from pathlib import Path
+
+from cs2_analytics.models import ResultListing
+from cs2_analytics.parsers.parse_backend import make_soup
+from cs2_analytics.parsers.results_parser import ResultsParser
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _parse_fixture(
+    start_date: dt.date, end_date: dt.date
+) -> tuple[list[ResultListing], bool]:
+    page_source = (FIXTURES_DIR / "results_page.html").read_text(encoding="utf-8")
+    return ResultsParser().parse_results_page(
+        make_soup(page_source, regions=ResultsParser.page_regions),
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+def test_results_page_yields_links_inside_the_date_window() -> None:
+    matches, stop = _parse_fixture(dt.date(2025, 8, 4), dt.date(2025, 8, 4))
+
+    assert len(matches) == 17
+    assert matches[0].match_id == 2379983
+    assert matches[0].match_url.startswith("https://www.hltv.org/matches/2379983/")
+    assert stop is True
+
+
+def test_results_page_dates_keep_month_names_intact() -> None:
+    # "August" contains "st"; only the day's ordinal suffix may be dropped.
+    matches, stop = _parse_fixture(dt.date(2025, 8, 1), dt.date(2025, 8, 31))
+
+    assert len(matches) == 51
+    assert stop is False
+
+
+def test_results_rows_carry_header_data_and_format() -> None:
+    matches, _stop = _parse_fixture(dt.date(2025, 8, 4), dt.date(2025, 8, 4))
+    by_id = {listing.match_id: listing for listing in matches}
+
+    assert all(listing.has_header for listing in matches)
+    assert by_id[2379983].match_format == "bo1"  # map code for a best-of-one
+    assert (by_id[2379980].score1, by_id[2379980].score2) == (2, 1)
+    assert by_id[2379980].match_format == "bo3"
+    assert by_id[2379982].match_format == "bo5"
+    forfeit = by_id[2379981]
+    assert (forfeit.team1, forfeit.team2) == ("Falcons", "Astralis")
+    assert forfeit.event == "Test Masters 2025"
+    assert forfeit.forfeit is True
+    assert forfeit.match_format is None
+    assert forfeit.listed_date == dt.date(2025, 8, 4)
+
+
+def test_rows_without_a_match_link_are_skipped() -> None:
+    soup = make_soup(
+        """
+        <div class="results-sublist">
+          <div class="standard-headline">Results for May 5th 2025</div>
+          <div class="result-con"><a href="/results/not-a-match"></a></div>
+          <div class="result-con"><span>no link</span></div>
+          <div class="result-con"><a href="/matches/12345/a-vs-b"></a></div>
+        </div>
+        """,
+        regions=ResultsParser.page_regions,
+    )
+
+    matches, _stop = ResultsParser().parse_results_page(
+        soup, start_date=dt.date(2025, 1, 1), end_date=dt.date(2025, 12, 31)
+    )
+
+    assert matches == [
+        ResultListing(
+            match_id=12345,
+            match_url="https://www.hltv.org/matches/12345/a-vs-b",
+            listed_date=dt.date(2025, 5, 5),
+        )
+    ]
+    assert matches[0].has_header is False
@@ -0,0 +1,106 @@
+"""Tests for map page fingerprints and the schema drift breaker."""
+
+import json
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from cs2_analytics.parsers.schema_drift import (
+    SchemaDriftBreaker,
+    fingerprint_map_page,
+)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+MAP_URL = "https://www.hltv.org/stats/matches/mapstatsid/{}/vitality-vs-navi"
+MAINTENANCE_PAGE = "<html><body><h1>We'll be right back</h1></body></html>"
+
+
+def _soup(source: str) -> BeautifulSoup:
+    return BeautifulSoup(source, "html.parser")
+
+
+def _fixture(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def _breaker(tmp_path: Path, **kwargs) -> SchemaDriftBreaker:
+    options = {"window": 4, "threshold_pct": 50, "min_samples": 4}
+    options.update(kwargs)
+    return SchemaDriftBreaker(stage="map", diagnostics_dir=tmp_path, **options)
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "map_stats_page.html",
+        "map_stats_page_overtime.html",
+        # Lacks only the optional clutch and swing columns.
+        "map_stats_page_missing_columns.html",
+    ],
+)
+def test_parseable_map_pages_are_not_drifted(name: str) -> None:
+    fingerprint = fingerprint_map_page(_soup(_fixture(name)))
+
+    assert not fingerprint.drifted
+    assert fingerprint.header_signatures
+
+
+def test_maintenance_page_misses_every_selector() -> None:
+    fingerprint = fingerprint_map_page(_soup(MAINTENANCE_PAGE))
+
+    assert fingerprint.drifted
+    assert "table.stats-table" in fingerprint.missing_selectors
+    assert fingerprint.header_signatures == ()
+
+
+def test_renamed_stat_header_is_unresolved() -> None:
+    page = _fixture("map_stats_page.html").replace(">ADR<", ">Avg dmg<")
+
+    fingerprint = fingerprint_map_page(_soup(page))
+
+    assert fingerprint.missing_selectors == ()
+    assert fingerprint.unresolved_columns == ("adr",)
+
+
+def test_breaker_trips_once_and_writes_one_diagnostic(tmp_path: Path) -> None:
+    breaker = _breaker(tmp_path)
+    good = _fixture("map_stats_page.html")
+    pages = [good, MAINTENANCE_PAGE, good, MAINTENANCE_PAGE, MAINTENANCE_PAGE]
+
+    # The fifth page was already in flight on another worker when it tripped.
+    for map_id, page in enumerate(pages, start=1):
+        breaker.observe_page(map_id, MAP_URL.format(map_id), _soup(page))
+        assert breaker.tripped == (map_id >= 4)
+
+    assert not breaker.allow_fetch()
+    assert not breaker.allow_fetch()
+    assert breaker.refused == 2
+    assert breaker.diagnostic_path is not None
+    assert list(tmp_path.iterdir()) == [breaker.diagnostic_path]
+    summary = json.loads((breaker.diagnostic_path / "diagnostic.json").read_text())
+    assert (summary["drifted_pages"], summary["window_pages"]) == (2, 4)
+    assert [sample["item_id"] for sample in summary["samples"]] == [2, 4]
+    sample_file = breaker.diagnostic_path / summary["samples"][0]["page_file"]
+    assert "right back" in sample_file.read_text(encoding="utf-8")
+
+
+def test_breaker_waits_for_enough_samples(tmp_path: Path) -> None:
+    breaker = _breaker(tmp_path)
+
+    for map_id in range(1, 4):
+        breaker.observe_page(map_id, MAP_URL.format(map_id), _soup(MAINTENANCE_PAGE))
+
+    assert not breaker.tripped
+    assert breaker.allow_fetch()
+
+
+def test_zero_window_disables_the_breaker(tmp_path: Path) -> None:
+    breaker = _breaker(tmp_path, window=0)
+
+    for map_id in range(1, 10):
+        breaker.observe_page(map_id, MAP_URL.format(map_id), _soup(MAINTENANCE_PAGE))
+
+    assert not breaker.enabled
+    assert breaker.allow_fetch()
+    assert list(tmp_path.iterdir()) == []
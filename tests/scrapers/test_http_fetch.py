@@ -0,0 +1,279 @@
+"""Tests for the HTTP fetch path and its browser escalation."""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cs2_analytics.parsers.map_parser import MapParser
+from cs2_analytics.scrapers import http_fetch as http_fetch_module
+from cs2_analytics.scrapers import map_scraper as map_scraper_module
+from cs2_analytics.scrapers import page_readiness
+from cs2_analytics.scrapers.http_fetch import HttpPageFetcher, build_http_fetcher
+from cs2_analytics.scrapers.map_scraper import MAP_BLOCKING_PROFILE, MapScraper
+from cs2_analytics.scrapers.rate_control import AimdRateControl
+from cs2_analytics.scrapers.rate_limiter import HostRateLimiter
+from tests.support import RecordingRateLimiter
+
+MAP_PAGE = "<html><body><div class='match-info-box'>Mirage</div></body></html>"
+CHALLENGE_PAGE = "<html><title>Just a moment...</title><body>Cloudflare</body></html>"
+EMPTY_PAGE = "<html><body><div class='navbar'></div></body></html>"
+
+FIXTURE_ROUTES = {
+    "/map": (200, MAP_PAGE),
+    "/challenge": (503, CHALLENGE_PAGE),
+    "/challenge-ok-status": (200, CHALLENGE_PAGE),
+    "/empty": (200, EMPTY_PAGE),
+}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    requests: list[dict[str, str]] = []
+
+    def do_GET(self) -> None:
+        type(self).requests.append(
+            {
+                "path": self.path,
+                "cookie": self.headers.get("Cookie", ""),
+                "user_agent": self.headers.get("User-Agent", ""),
+            }
+        )
+        status, body = FIXTURE_ROUTES.get(self.path, (404, "not found"))
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args) -> None:
+        return None
+
+
+@pytest.fixture
+def page_server() -> Iterator[tuple[str, list[dict[str, str]]]]:
+    """Serves fixture pages on a local port for the duration of one test."""
+    handler = type("FixtureHandler", (_FixtureHandler,), {"requests": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", handler.requests
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def fetcher() -> Iterator[HttpPageFetcher]:
+    fetcher = HttpPageFetcher(
+        required_selectors=MAP_BLOCKING_PROFILE.required_selectors,
+        rate_limiter=RecordingRateLimiter(),
+        regions=MapParser.page_regions,
+        timeout_seconds=5.0,
+        max_consecutive_escalations=2,
+        stand_down_pages=3,
+    )
+    yield fetcher
+    fetcher.close()
+
+
+class _SessionDriver:
+    """Fake browser session that serves one page and exposes cookies."""
+
+    def __init__(self, page_source: str = MAP_PAGE) -> None:
+        self.page_source = page_source
+        self.current_url = "about:blank"
+        self.title = "fake page"
+        self.loaded_urls: list[str] = []
+        self.quit_called = False
+
+    def get(self, url: str) -> None:
+        self.loaded_urls.append(url)
+        self.current_url = url
+
+    def find_element(self, _by: str, _selector: str) -> object:
+        return object()
+
+    def get_cookies(self) -> list[dict[str, str]]:
+        return [
+            {
+                "name": "cf_clearance",
+                "value": "cleared",
+                "domain": "127.0.0.1",
+                "path": "/",
+            }
+        ]
+
+    def execute_script(self, _script: str) -> str:
+        return "Mozilla/5.0 (X11; Linux x86_64) Chrome/140.0"
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+class _FakeWait:
+    def __init__(self, driver: _SessionDriver, _timeout: float) -> None:
+        self.driver = driver
+
+    def until(self, condition) -> object:
+        return condition(self.driver)
+
+
+def test_fetch_returns_server_rendered_page_with_required_content(
+    page_server, fetcher: HttpPageFetcher
+) -> None:
+    base_url, requests = page_server
+
+    fetched = fetcher.fetch(f"{base_url}/map")
+
+    assert fetched is not None
+    assert fetched.html == MAP_PAGE
+    # Only the parser's regions are built; the page is not parsed again.
+    assert [tag.name for tag in fetched.soup.find_all()] == ["div"]
+    assert fetcher.rate_limiter.acquired == [f"{base_url}/map"]
+    assert fetcher.rate_limiter.failures == []
+    assert [request["path"] for request in requests] == ["/map"]
+
+
+@pytest.mark.parametrize("path", ["/challenge", "/challenge-ok-status"])
+def test_fetch_escalates_challenge_pages_without_cutting_the_shared_rate(
+    page_server, path: str
+) -> None:
+    base_url, _requests = page_server
+    rate_control = AimdRateControl(
+        30, min_requests_per_minute=6, max_requests_per_minute=90
+    )
+    fetcher = HttpPageFetcher(
+        required_selectors=MAP_BLOCKING_PROFILE.required_selectors,
+        rate_limiter=HostRateLimiter(0.0, rate_control=rate_control),
+        regions=MapParser.page_regions,
+        timeout_seconds=5.0,
+        max_consecutive_escalations=3,
+    )
+
+    try:
+        for _ in range(3):
+            assert fetcher.fetch(f"{base_url}{path}") is None
+    finally:
+        fetcher.close()
+
+    metrics = rate_control.metrics()
+    assert metrics.requests_per_minute == 30
+    assert metrics.decreases == 0
+    assert not metrics.backing_off
+    assert metrics.challenge_ratio == 0.0
+
+
+def test_fetch_escalates_pages_missing_required_content(
+    page_server, fetcher: HttpPageFetcher
+) -> None:
+    base_url, _requests = page_server
+
+    assert fetcher.fetch(f"{base_url}/empty") is None
+    assert fetcher.rate_limiter.acquired == [f"{base_url}/empty"]
+    assert fetcher.rate_limiter.failures == []
+
+
+def test_fetch_escalates_transport_errors(fetcher: HttpPageFetcher) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    closed_port = server.server_port
+    server.server_close()
+
+    assert fetcher.fetch(f"http://127.0.0.1:{closed_port}/map") is None
+
+
+def test_fetch_stands_down_after_consecutive_escalations(
+    page_server, fetcher: HttpPageFetcher
+) -> None:
+    base_url, requests = page_server
+
+    assert fetcher.fetch(f"{base_url}/challenge") is None
+    assert fetcher.fetch(f"{base_url}/challenge") is None
+    for _ in range(3):
+        assert fetcher.fetch(f"{base_url}/map") is None
+    fetched = fetcher.fetch(f"{base_url}/map")
+    assert fetched is not None and fetched.html == MAP_PAGE
+
+    # standing-down pages still take their token for the browser load
+    assert len(fetcher.rate_limiter.acquired) == 6
+
+    assert [request["path"] for request in requests] == [
+        "/challenge",
+        "/challenge",
+        "/map",
+    ]
+
+
+def test_harvested_browser_session_is_sent_with_http_requests(
+    page_server, fetcher: HttpPageFetcher
+) -> None:
+    base_url, requests = page_server
+
+    fetcher.harvest_browser_session(_SessionDriver())
+    fetcher.fetch(f"{base_url}/map")
+
+    assert requests[0]["cookie"] == "cf_clearance=cleared"
+    assert requests[0]["user_agent"] == "Mozilla/5.0 (X11; Linux x86_64) Chrome/140.0"
+
+
+def _build_scraper(
+    monkeypatch: pytest.MonkeyPatch,
+    driver: _SessionDriver,
+    fetcher: HttpPageFetcher,
+) -> MapScraper:
+    monkeypatch.setattr(map_scraper_module, "Driver", lambda **_kwargs: driver)
+    monkeypatch.setattr(page_readiness, "WebDriverWait", _FakeWait)
+    return MapScraper(
+        content_wait_seconds=0.1,
+        rate_limiter=fetcher.rate_limiter,
+        http_fetcher=fetcher,
+    )
+
+
+def test_scraper_uses_http_page_without_loading_the_browser(
+    monkeypatch: pytest.MonkeyPatch, page_server, fetcher: HttpPageFetcher
+) -> None:
+    base_url, _requests = page_server
+    driver = _SessionDriver()
+    scraper = _build_scraper(monkeypatch, driver, fetcher)
+
+    def _reparse(*_args, **_kwargs):
+        raise AssertionError("HTTP page was parsed a second time")
+
+    monkeypatch.setattr(map_scraper_module, "make_soup", _reparse)
+    soup = scraper.fetch_soup(f"{base_url}/map")
+
+    assert soup.select_one("div.match-info-box") is not None
+    assert driver.loaded_urls == []
+
+
+def test_scraper_escalates_challenge_to_browser_and_harvests_its_session(
+    monkeypatch: pytest.MonkeyPatch, page_server, fetcher: HttpPageFetcher
+) -> None:
+    base_url, requests = page_server
+    driver = _SessionDriver()
+    scraper = _build_scraper(monkeypatch, driver, fetcher)
+
+    soup = scraper.fetch_soup(f"{base_url}/challenge")
+    scraper.fetch_soup(f"{base_url}/map")
+
+    assert soup.select_one("div.match-info-box") is not None
+    assert driver.loaded_urls == [f"{base_url}/challenge"]
+    assert [request["cookie"] for request in requests] == ["", "cf_clearance=cleared"]
+    # the escalated browser load reuses the HTTP attempt's token
+    assert fetcher.rate_limiter.acquired == [
+        f"{base_url}/challenge",
+        f"{base_url}/map",
+    ]
+
+
+def test_build_http_fetcher_respects_toggle(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(http_fetch_module, "SCRAPE_HTTP_FETCH", False)
+    assert build_http_fetcher(MAP_BLOCKING_PROFILE, RecordingRateLimiter()) is None
+
+    monkeypatch.setattr(http_fetch_module, "SCRAPE_HTTP_FETCH", True)
+    fetcher = build_http_fetcher(MAP_BLOCKING_PROFILE, RecordingRateLimiter())
+    assert isinstance(fetcher, HttpPageFetcher)
+    fetcher.close()
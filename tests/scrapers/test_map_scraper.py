@@ -1,9 +1,12 @@
 import pytest
 from selenium.common.exceptions import TimeoutException
 
-from cs2_analytics.exceptions import SessionScrapeError
+from cs2_analytics.exceptions import ChallengePageError, SessionScrapeError
+from cs2_analytics.parsers.extracted_map import ExtractedMapPage
 from cs2_analytics.scrapers import map_scraper as map_scraper_module
+from cs2_analytics.scrapers import page_readiness
 from cs2_analytics.scrapers.map_scraper import MapScraper
+from tests.support import RecordingRateLimiter
 
 
 class _FakeDriver:
@@ -48,8 +51,8 @@ def _build_scraper(
     driver: _FakeDriver,
 ) -> MapScraper:
     monkeypatch.setattr(map_scraper_module, "Driver", lambda **_kwargs: driver)
-    monkeypatch.setattr(map_scraper_module, "WebDriverWait", _FakeWait)
-    return MapScraper(content_wait_seconds=0.1)
+    monkeypatch.setattr(page_readiness, "WebDriverWait", _FakeWait)
+    return MapScraper(content_wait_seconds=0.1, rate_limiter=RecordingRateLimiter())
 
 
 def test_map_scraper_waits_for_required_match_info_box(
@@ -67,6 +70,7 @@ def test_map_scraper_waits_for_required_match_info_box(
     assert driver.loaded_urls == [
         "https://www.hltv.org/stats/matches/mapstatsid/1/test"
     ]
+    assert scraper.rate_limiter.acquired == driver.loaded_urls
     assert driver.find_calls == [
         ("css selector", map_scraper_module.REQUIRED_MAP_SELECTOR)
     ]
@@ -89,18 +93,21 @@ def test_map_scraper_missing_match_info_box_is_retryable(
     scraper = _build_scraper(monkeypatch, driver)
 
     with pytest.raises(
-        SessionScrapeError,
+        ChallengePageError,
         match="Map stats page appears blocked or challenged after 0.1s",
     ):
         scraper.fetch_soup("https://www.hltv.org/stats/matches/mapstatsid/1/test")
 
+    assert [type(error) for error in scraper.rate_limiter.failures] == [
+        ChallengePageError
+    ]
+
     assert driver.find_calls == [
         ("css selector", map_scraper_module.REQUIRED_MAP_SELECTOR)
     ]
     assert len(warning_calls) == 1
-    assert warning_calls[0][0][0].startswith(
-        "Map stats page missing required selector=%s"
-    )
+    assert warning_calls[0][0][0].startswith("%s missing required selector=%s")
+    assert warning_calls[0][0][1] == "Map stats page"
 
 
 def test_map_scraper_missing_match_info_box_without_challenge_is_retryable(
@@ -117,3 +124,134 @@ def test_map_scraper_missing_match_info_box_without_challenge_is_retryable(
         match="Map stats page missing required content after 0.1s",
     ):
         scraper.fetch_soup("https://www.hltv.org/stats/matches/mapstatsid/1/test")
+
+
+def test_map_scraper_archives_raw_page_source(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    from cs2_analytics.archive import PageArchive
+
+    html = "<html><body><div class='match-info-box'>Ancient</div></body></html>"
+    driver = _FakeDriver(html, has_required_content=True)
+    monkeypatch.setattr(map_scraper_module, "Driver", lambda **_kwargs: driver)
+    monkeypatch.setattr(page_readiness, "WebDriverWait", _FakeWait)
+    archive = PageArchive(tmp_path)
+    scraper = MapScraper(
+        content_wait_seconds=0.1,
+        archive=archive,
+        rate_limiter=RecordingRateLimiter(),
+    )
+    url = "https://www.hltv.org/stats/matches/mapstatsid/1/test"
+
+    scraper.fetch_soup(url)
+
+    archived = archive.latest(url)
+    assert archived is not None
+    assert archived.kind == "map"
+    assert archive.load(archived.content_hash) == html
+
+
+EXTRACTED_PAYLOAD = {
+    "mapName": "Ancient",
+    "infoBoxTokens": ["Map", "Ancient", "Vitality", "13", "NAVI", "9"],
+    "dateUnix": "1754400000000",
+    "tables": [
+        {
+            "classes": ["stats-table", "totalstats"],
+            "teamName": "Vitality",
+            "headers": ["Vitality", "K (hs)"],
+            "rows": [],
+        }
+    ],
+    "mapStatsHrefs": [],
+}
+
+
+class _ExtractingDriver(_FakeDriver):
+    """Fake driver whose page runs the extraction script."""
+
+    def __init__(self, page_source: str, payload: object) -> None:
+        super().__init__(page_source, has_required_content=True)
+        self._page_source = page_source
+        self.payload = payload
+        self.scripts_run = 0
+        self.source_reads = 0
+
+    @property
+    def page_source(self) -> str:
+        self.source_reads += 1
+        return self._page_source
+
+    @page_source.setter
+    def page_source(self, value: str) -> None:
+        self._page_source = value
+
+    def execute_script(self, _script: str) -> object:
+        self.scripts_run += 1
+        if isinstance(self.payload, Exception):
+            raise self.payload
+        return self.payload
+
+
+def _build_extracting_scraper(
+    monkeypatch: pytest.MonkeyPatch, driver: _FakeDriver, archive=None
+) -> MapScraper:
+    monkeypatch.setattr(map_scraper_module, "Driver", lambda **_kwargs: driver)
+    monkeypatch.setattr(page_readiness, "WebDriverWait", _FakeWait)
+    return MapScraper(
+        content_wait_seconds=0.1,
+        archive=archive,
+        rate_limiter=RecordingRateLimiter(),
+        extract_in_browser=True,
+    )
+
+
+def test_map_scraper_extracts_in_browser_without_reading_page_source(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = _ExtractingDriver("<html></html>", EXTRACTED_PAYLOAD)
+    scraper = _build_extracting_scraper(monkeypatch, driver)
+    monkeypatch.setattr(scraper, "archive", None)
+
+    page = scraper.fetch_soup("https://www.hltv.org/stats/matches/mapstatsid/1/test")
+
+    assert isinstance(page, ExtractedMapPage)
+    assert page.map_name == "Ancient"
+    assert driver.source_reads == 0
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [RuntimeError("javascript error"), {**EXTRACTED_PAYLOAD, "dateUnix": None}],
+    ids=["script-error", "incomplete"],
+)
+def test_map_scraper_falls_back_to_page_html_when_extraction_fails(
+    monkeypatch: pytest.MonkeyPatch, payload: object
+) -> None:
+    html = "<html><body><div class='match-info-box'>Ancient</div></body></html>"
+    driver = _ExtractingDriver(html, payload)
+    scraper = _build_extracting_scraper(monkeypatch, driver)
+    monkeypatch.setattr(scraper, "archive", None)
+
+    page = scraper.fetch_soup("https://www.hltv.org/stats/matches/mapstatsid/1/test")
+
+    assert page.select_one("div.match-info-box") is not None
+    assert driver.scripts_run == 1
+
+
+def test_map_scraper_skips_extraction_while_archiving(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    from cs2_analytics.archive import PageArchive
+
+    html = "<html><body><div class='match-info-box'>Ancient</div></body></html>"
+    driver = _ExtractingDriver(html, EXTRACTED_PAYLOAD)
+    archive = PageArchive(tmp_path)
+    scraper = _build_extracting_scraper(monkeypatch, driver, archive=archive)
+    url = "https://www.hltv.org/stats/matches/mapstatsid/1/test"
+
+    page = scraper.fetch_soup(url)
+
+    assert page.select_one("div.match-info-box") is not None
+    assert driver.scripts_run == 0
+    assert archive.load(archive.latest(url).content_hash) == html
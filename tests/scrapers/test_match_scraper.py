@@ -1,10 +1,13 @@
 """Tests for the fetch-only match scraper."""
 
 import pytest
+from selenium.common.exceptions import TimeoutException
 
-from cs2_analytics.exceptions import MatchScrapeError
+from cs2_analytics.exceptions import MatchScrapeError, SessionScrapeError
 from cs2_analytics.scrapers import match_scraper as match_scraper_module
+from cs2_analytics.scrapers import page_readiness
 from cs2_analytics.scrapers.match_scraper import MatchScraper
+from tests.support import RecordingRateLimiter
 
 
 class _FailingQuitDriver:
@@ -16,6 +19,76 @@ class _FailingQuitDriver:
         raise RuntimeError("browser already gone")
 
 
+class _FakePageDriver:
+    def __init__(self, page_source: str, *, present: tuple[str, ...]) -> None:
+        self.page_source = page_source
+        self.present = present
+        self.current_url = "about:blank"
+        self.title = "fake match page"
+        self.find_calls: list[tuple[str, str]] = []
+
+    def get(self, url: str) -> None:
+        self.current_url = url
+
+    def find_element(self, by: str, selector: str) -> object:
+        self.find_calls.append((by, selector))
+        if selector in self.present:
+            return object()
+        raise TimeoutException(f"missing {selector}")
+
+
+class _FakeWait:
+    def __init__(self, driver: _FakePageDriver, _timeout: float) -> None:
+        self.driver = driver
+
+    def until(self, condition) -> object:
+        return condition(self.driver)
+
+
+def _build_scraper(
+    monkeypatch: pytest.MonkeyPatch, driver: _FakePageDriver
+) -> MatchScraper:
+    monkeypatch.setattr(match_scraper_module, "Driver", lambda **_kwargs: driver)
+    monkeypatch.setattr(page_readiness, "WebDriverWait", _FakeWait)
+    return MatchScraper(
+        archive=None, content_wait_seconds=0.1, rate_limiter=RecordingRateLimiter()
+    )
+
+
+def test_match_scraper_waits_for_teams_and_maps(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = _FakePageDriver(
+        "<html><body><div class='teamName'>A</div>"
+        "<div class='mapname'>Mirage</div></body></html>",
+        present=match_scraper_module.REQUIRED_MATCH_SELECTORS,
+    )
+    scraper = _build_scraper(monkeypatch, driver)
+
+    soup = scraper.fetch_soup("https://www.hltv.org/matches/1/a-vs-b")
+
+    assert soup.select_one("div.mapname") is not None
+    assert driver.find_calls == [
+        ("css selector", selector)
+        for selector in match_scraper_module.REQUIRED_MATCH_SELECTORS
+    ]
+
+
+def test_match_scraper_missing_content_is_retryable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = _FakePageDriver(
+        "<html><body><div class='teamName'>A</div></body></html>",
+        present=("div.teamName",),
+    )
+    scraper = _build_scraper(monkeypatch, driver)
+
+    with pytest.raises(
+        SessionScrapeError, match="Match page missing required content after 0.1s"
+    ):
+        scraper.fetch_soup("https://www.hltv.org/matches/1/a-vs-b")
+
+
 def test_close_failure_raises_typed_error(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(match_scraper_module, "Driver", _FailingQuitDriver)
     scraper = MatchScraper()
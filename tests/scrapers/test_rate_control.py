@@ -0,0 +1,98 @@
+"""Tests for AIMD adaptive scrape-rate control."""
+
+import pytest
+
+from cs2_analytics.exceptions import (
+    ChallengePageError,
+    ConfigurationError,
+    SessionScrapeError,
+)
+from cs2_analytics.scrapers.rate_control import AimdRateControl
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _control(clock: _FakeClock, **kwargs) -> AimdRateControl:
+    options = {
+        "min_requests_per_minute": 6,
+        "max_requests_per_minute": 40,
+        "increase_step": 2.0,
+        "backoff_seconds": 30.0,
+        "clock": clock,
+    }
+    options.update(kwargs)
+    return AimdRateControl(30, **options)
+
+
+def test_clean_fast_pages_raise_rate_up_to_max() -> None:
+    control = _control(_FakeClock())
+
+    for _ in range(3):
+        control.record_success(latency_seconds=1.0)
+    assert control.metrics().requests_per_minute == 36
+
+    for _ in range(10):
+        control.record_success(latency_seconds=1.0)
+    assert control.metrics().requests_per_minute == 40
+    assert control.requests_per_second == pytest.approx(40 / 60)
+
+
+def test_slow_pages_hold_rate() -> None:
+    control = _control(_FakeClock(), slow_page_seconds=5.0)
+
+    control.record_success(latency_seconds=9.0)
+
+    assert control.metrics().requests_per_minute == 30
+
+
+def test_challenge_cuts_rate_and_holds_during_backoff() -> None:
+    clock = _FakeClock()
+    control = _control(clock)
+
+    control.record_failure(ChallengePageError("Map stats page appears blocked"))
+    control.record_success(latency_seconds=1.0)
+
+    metrics = control.metrics()
+    assert metrics.requests_per_minute == 15
+    assert metrics.backing_off is True
+    assert metrics.backoff_remaining_seconds == 30.0
+    assert metrics.challenge_ratio == 0.5
+    assert metrics.decreases == 1
+
+    clock.now = 31.0
+    control.record_success(latency_seconds=1.0)
+    assert control.metrics().requests_per_minute == 17
+    assert control.metrics().backing_off is False
+
+
+def test_isolated_session_error_does_not_cut_but_spike_does() -> None:
+    control = _control(_FakeClock())
+    for _ in range(5):
+        control.record_success(latency_seconds=1.0)
+
+    control.record_failure(SessionScrapeError("missing required content"))
+    assert control.metrics().decreases == 0
+
+    control.record_failure(SessionScrapeError("missing required content"))
+    assert control.metrics().decreases == 1
+    assert control.metrics().requests_per_minute == 20
+
+
+def test_rate_never_drops_below_minimum() -> None:
+    control = _control(_FakeClock())
+
+    for _ in range(5):
+        control.record_failure(ChallengePageError("challenged"))
+
+    assert control.metrics().requests_per_minute == 6
+
+
+def test_invalid_bounds_are_rejected() -> None:
+    with pytest.raises(ConfigurationError, match="Adaptive rate bounds"):
+        AimdRateControl(30, min_requests_per_minute=50, max_requests_per_minute=40)
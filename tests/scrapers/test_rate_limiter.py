@@ -0,0 +1,125 @@
+"""Tests for the shared per-host scraper rate limiter."""
+
+import pytest
+
+from cs2_analytics.exceptions import ChallengePageError, ConfigurationError
+from cs2_analytics.scrapers import rate_limiter as rate_limiter_module
+from cs2_analytics.scrapers.rate_control import AimdRateControl
+from cs2_analytics.scrapers.rate_limiter import HostRateLimiter
+
+MATCH_URL = "https://www.hltv.org/matches/1/a-vs-b"
+MAP_URL = "https://www.hltv.org/stats/matches/mapstatsid/2/test"
+OTHER_HOST_URL = "https://example.com/page"
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: _FakeClock, **kwargs) -> HostRateLimiter:
+    return HostRateLimiter(2.0, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_acquire_sleeps_only_when_ahead_of_rate() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock)
+
+    assert limiter.acquire(MATCH_URL) == 0.0
+    clock.now += 0.2
+    assert limiter.acquire(MAP_URL) == pytest.approx(0.3)
+    clock.now += 2.0
+    assert limiter.acquire(MATCH_URL) == 0.0
+    assert clock.sleeps == [pytest.approx(0.3)]
+
+
+def test_burst_allows_back_to_back_requests_then_paces() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, burst=3)
+
+    waits = [limiter.acquire(MATCH_URL) for _ in range(5)]
+
+    assert waits == [0.0, 0.0, 0.0, pytest.approx(0.5), pytest.approx(0.5)]
+
+
+def test_hosts_have_independent_buckets() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock)
+
+    limiter.acquire(MATCH_URL)
+
+    assert limiter.acquire(OTHER_HOST_URL) == 0.0
+
+
+def test_jitter_is_added_only_to_enforced_waits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, jitter_seconds=0.4)
+    monkeypatch.setattr(rate_limiter_module.random, "uniform", lambda _low, high: high)
+
+    assert limiter.acquire(MATCH_URL) == 0.0
+    assert limiter.acquire(MATCH_URL) == pytest.approx(0.9)
+
+
+def test_defer_holds_back_next_request_even_when_unlimited() -> None:
+    clock = _FakeClock()
+    limiter = HostRateLimiter(0, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire(MATCH_URL) == 0.0
+    limiter.defer(MATCH_URL, 8.0)
+    clock.now += 3.0
+
+    assert limiter.acquire(MAP_URL) == pytest.approx(5.0)
+    assert limiter.acquire(MAP_URL) == 0.0
+
+
+def test_invalid_burst_is_rejected() -> None:
+    with pytest.raises(ConfigurationError, match="burst must be at least 1"):
+        HostRateLimiter(1.0, burst=0)
+
+
+def test_paced_reports_outcomes_and_follows_adaptive_rate() -> None:
+    clock = _FakeClock()
+    control = AimdRateControl(
+        60,
+        min_requests_per_minute=6,
+        max_requests_per_minute=120,
+        clock=clock,
+    )
+    limiter = HostRateLimiter(1.0, clock=clock, sleep=clock.sleep, rate_control=control)
+
+    with limiter.paced(MATCH_URL):
+        clock.now += 1.0
+    with pytest.raises(ChallengePageError), limiter.paced(MATCH_URL):
+        raise ChallengePageError("Match page appears blocked")
+
+    metrics = limiter.metrics()
+    assert metrics is not None
+    assert metrics.requests_per_minute == pytest.approx(30.5)
+    assert metrics.challenge_ratio == 0.5
+    assert limiter.interval == pytest.approx(60 / 30.5)
+
+
+def test_paced_without_acquire_does_not_spend_another_token() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock)
+
+    limiter.acquire(MATCH_URL)
+    with limiter.paced(MATCH_URL, acquire=False):
+        pass
+
+    assert limiter.acquire(MATCH_URL) == pytest.approx(0.5)
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_metrics_are_none_without_rate_control() -> None:
+    assert HostRateLimiter(1.0).metrics() is None
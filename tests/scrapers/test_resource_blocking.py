@@ -0,0 +1,190 @@
+"""Tests for scraper resource blocking profiles."""
+
+from dataclasses import asdict
+
+import pytest
+from bs4 import BeautifulSoup
+
+from cs2_analytics.parsers.match_parser import MatchParser
+from cs2_analytics.scrapers import map_scraper, match_scraper, results_scraper
+from cs2_analytics.scrapers import resource_blocking as blocking_module
+from cs2_analytics.scrapers.resource_blocking import (
+    BlockingProfile,
+    apply_blocking_profile,
+)
+
+SCRAPER_PROFILES = [
+    pytest.param(
+        map_scraper.MapScraper.blocking_profile,
+        (map_scraper.REQUIRED_MAP_SELECTOR,),
+        id="map",
+    ),
+    pytest.param(
+        match_scraper.MatchScraper.blocking_profile,
+        match_scraper.REQUIRED_MATCH_SELECTORS,
+        id="match",
+    ),
+    pytest.param(
+        results_scraper.ResultsScraper.blocking_profile,
+        (results_scraper.REQUIRED_RESULTS_SELECTOR,),
+        id="results",
+    ),
+]
+
+FIRST_PARTY_URLS = (
+    "https://www.hltv.org/results?offset=100&gameType=CS2",
+    "https://www.hltv.org/matches/2380000/navi-vs-g2-iem-cologne-2026",
+    "https://www.hltv.org/stats/matches/mapstatsid/190000/navi-vs-g2",
+    "https://www.hltv.org/scripts/hltv.min.js?v=1234",
+    "https://www.hltv.org/css/hltv.min.css",
+    "https://challenges.cloudflare.com/turnstile/v0/api.js",
+    "https://www.hltv.org/cdn-cgi/challenge-platform/h/g/orchestrate/jsch/v1",
+)
+BLOCKED_URLS = (
+    "https://img-cdn.hltv.org/teamlogo/abc.svg?ixlib=java-2.1.0&s=123",
+    "https://www.hltv.org/img/static/flags/30x20/DK.gif",
+    "https://www.hltv.org/fonts/Roboto.woff2",
+    "https://fonts.gstatic.com/s/roboto/v30/font.woff2",
+    "https://securepubads.g.doubleclick.net/tag/js/gpt.js",
+    "https://www.googletagmanager.com/gtm.js?id=GTM-XXXX",
+    "https://www.google-analytics.com/analytics.js",
+    "https://player.twitch.tv/?channel=esl_csgo",
+)
+
+BLOCKED_RESOURCES_MARKUP = """
+<img src="https://img-cdn.hltv.org/teamlogo/abc.svg" alt="Alpha">
+<script src="https://www.googletagmanager.com/gtm.js?id=GTM-XXXX"></script>
+<iframe src="https://securepubads.g.doubleclick.net/ad"></iframe>
+<link rel="preload" href="https://www.hltv.org/fonts/Roboto.woff2">
+<script src="https://www.hltv.org/scripts/hltv.min.js"></script>
+"""
+
+MATCH_PAGE = f"""
+<html>
+  <body>
+    {BLOCKED_RESOURCES_MARKUP}
+    <div class="team1-gradient"><a href="/team/1/a"></a><div>2</div></div>
+    <div class="team2-gradient"><a href="/team/2/b"></a><div>1</div></div>
+    <div class="teamName">Alpha</div>
+    <div class="teamName">Bravo</div>
+    <div class="event text-ellipsis">Test Masters</div>
+    <div class="padding preformatted-text">Best of 3 (LAN)</div>
+    <div class="mapname">Mirage</div>
+    <div class="date" data-unix="1767225600000"></div>
+    <a class="results-stats" href="/stats/matches/mapstatsid/501/alpha-vs-bravo"></a>
+  </body>
+</html>
+"""
+
+
+def _strip_blocked_resources(html: str, profile: BlockingProfile) -> BeautifulSoup:
+    """Simulates the browser DOM when blocked subresources never load."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup.find_all(["img", "script", "iframe", "link"]):
+        url = tag.get("src") or tag.get("href")
+        if url and profile.blocks(url):
+            tag.decompose()
+    return soup
+
+
+@pytest.mark.parametrize(("profile", "readiness_selectors"), SCRAPER_PROFILES)
+def test_profile_guards_the_scraper_readiness_selectors(
+    profile: BlockingProfile, readiness_selectors: tuple[str, ...]
+) -> None:
+    assert profile.required_selectors == readiness_selectors
+
+
+@pytest.mark.parametrize(("profile", "_readiness_selectors"), SCRAPER_PROFILES)
+def test_profile_never_blocks_first_party_pages_scripts_or_challenges(
+    profile: BlockingProfile, _readiness_selectors: tuple[str, ...]
+) -> None:
+    assert [url for url in FIRST_PARTY_URLS if profile.blocks(url)] == []
+    assert [url for url in BLOCKED_URLS if not profile.blocks(url)] == []
+
+
+@pytest.mark.parametrize(("profile", "readiness_selectors"), SCRAPER_PROFILES)
+def test_required_selectors_survive_blocked_resources(
+    profile: BlockingProfile, readiness_selectors: tuple[str, ...]
+) -> None:
+    markup = "".join(
+        f'<div class="{selector.split(".", 1)[1]}">x</div>'
+        for selector in readiness_selectors
+    )
+    soup = _strip_blocked_resources(
+        f"<html><body>{BLOCKED_RESOURCES_MARKUP}{markup}</body></html>", profile
+    )
+
+    assert soup.find("img") is None
+    assert [s["src"] for s in soup.find_all("script")] == [
+        "https://www.hltv.org/scripts/hltv.min.js"
+    ]
+    for selector in profile.required_selectors:
+        assert soup.select_one(selector) is not None
+
+
+def _parsed_fields(parsed: tuple) -> tuple:
+    match, map_links, demo_links = parsed
+    fields = {
+        key: value
+        for key, value in asdict(match).items()
+        if not key.startswith("last_")
+    }
+    return fields, map_links, demo_links
+
+
+def test_match_parser_output_is_unchanged_by_blocking() -> None:
+    profile = match_scraper.MatchScraper.blocking_profile
+    url = "https://www.hltv.org/matches/101/alpha-vs-bravo"
+    full = MatchParser().parse_match(BeautifulSoup(MATCH_PAGE, "html.parser"), url)
+    blocked = MatchParser().parse_match(
+        _strip_blocked_resources(MATCH_PAGE, profile), url
+    )
+
+    assert _parsed_fields(blocked) == _parsed_fields(full)
+
+
+class _CdpDriver:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.commands: list[tuple[str, dict]] = []
+
+    def execute_cdp_cmd(self, command: str, params: dict) -> dict:
+        if self.fail:
+            raise RuntimeError("cdp unavailable")
+        self.commands.append((command, params))
+        return {}
+
+
+def test_apply_blocking_profile_installs_blocklist_via_cdp() -> None:
+    driver = _CdpDriver()
+    profile = BlockingProfile(name="test", required_selectors=("div.x",))
+
+    assert apply_blocking_profile(driver, profile) is True
+    assert driver.commands == [
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": list(profile.blocked_url_patterns)}),
+    ]
+
+
+def test_apply_blocking_profile_downgrades_cdp_failure_to_warning(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    warnings: list[tuple[object, ...]] = []
+    monkeypatch.setattr(
+        blocking_module.logger, "warning", lambda *args: warnings.append(args)
+    )
+    profile = BlockingProfile(name="test", required_selectors=("div.x",))
+
+    assert apply_blocking_profile(_CdpDriver(fail=True), profile) is False
+    assert warnings[0][1] == "test"
+
+
+def test_apply_blocking_profile_respects_global_toggle(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(blocking_module, "SCRAPE_BLOCK_RESOURCES", False)
+    driver = _CdpDriver()
+
+    profile = BlockingProfile(name="test", required_selectors=("div.x",))
+    assert apply_blocking_profile(driver, profile) is False
+    assert driver.commands == []
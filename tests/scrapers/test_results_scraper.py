@@ -4,10 +4,15 @@ import datetime as dt
 from unittest import mock
 
 import pytest
+from selenium.common.exceptions import TimeoutException
 
-from cs2_analytics.exceptions import ResultsScrapeError
+from cs2_analytics.exceptions import ResultsScrapeError, SessionScrapeError
+from cs2_analytics.models import ResultListing
+from cs2_analytics.parsers import results_parser as results_parser_module
+from cs2_analytics.scrapers import page_readiness
 from cs2_analytics.scrapers import results_scraper as results_scraper_module
 from cs2_analytics.scrapers.results_scraper import ResultsScraper
+from tests.support import RecordingRateLimiter
 
 
 class _FakeDriver:
@@ -21,54 +26,55 @@ class _FakeDriver:
 class _FakePageDriver:
     """Serves a fixed results page for _extract_matches_from_page tests."""
 
-    def __init__(self, page_source: str) -> None:
+    def __init__(self, page_source: str, *, has_results: bool = True) -> None:
         self.page_source = page_source
+        self.has_results = has_results
+        self.current_url = "about:blank"
+        self.title = "fake results page"
         self.loaded_urls: list[str] = []
+        self.find_calls: list[tuple[str, str]] = []
 
     def get(self, url: str) -> None:
         self.loaded_urls.append(url)
+        self.current_url = url
+
+    def find_element(self, by: str, selector: str) -> object:
+        self.find_calls.append((by, selector))
+        if self.has_results:
+            return object()
+        raise TimeoutException("missing results listing")
+
+
+class _FakeWait:
+    def __init__(self, driver: _FakePageDriver, _timeout: float) -> None:
+        self.driver = driver
+
+    def until(self, condition) -> object:
+        return condition(self.driver)
 
 
 @pytest.fixture
 def scraper(monkeypatch: pytest.MonkeyPatch) -> ResultsScraper:
     monkeypatch.setattr(results_scraper_module, "Driver", _FakeDriver)
-    monkeypatch.setattr(
-        results_scraper_module.time, "sleep", lambda *_args, **_kwargs: None
-    )
-    return ResultsScraper()
+    monkeypatch.setattr(page_readiness, "WebDriverWait", _FakeWait)
+    return ResultsScraper(content_wait_seconds=0.1, rate_limiter=RecordingRateLimiter())
 
 
-def _page(urls: list[str], stop: bool) -> tuple[list[str], bool]:
-    return urls, stop
+def _listing(match_id: int) -> ResultListing:
+    return ResultListing(
+        match_id=match_id, match_url=f"https://www.hltv.org/matches/{match_id}/x-vs-y"
+    )
 
 
-def test_iter_match_batches_yields_page_batches_with_ids(
+def test_iter_match_batches_yields_page_batches(
     scraper: ResultsScraper, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    pages = iter(
-        [
-            _page(
-                [
-                    "https://www.hltv.org/matches/111/a-vs-b",
-                    "https://www.hltv.org/matches/222/c-vs-d",
-                    "https://www.hltv.org/results/not-a-match",
-                ],
-                stop=False,
-            ),
-            _page(["https://www.hltv.org/matches/333/e-vs-f"], stop=True),
-        ]
-    )
+    pages = iter([([_listing(111), _listing(222)], False), ([_listing(333)], True)])
     monkeypatch.setattr(scraper, "_extract_matches_from_page", lambda _url: next(pages))
 
     batches = list(scraper.iter_match_batches(max_matches=50))
 
-    assert batches == [
-        [
-            (111, "https://www.hltv.org/matches/111/a-vs-b"),
-            (222, "https://www.hltv.org/matches/222/c-vs-d"),
-        ],
-        [(333, "https://www.hltv.org/matches/333/e-vs-f")],
-    ]
+    assert batches == [[_listing(111), _listing(222)], [_listing(333)]]
 
 
 def test_iter_match_batches_stops_at_max_matches(
@@ -76,10 +82,10 @@ def test_iter_match_batches_stops_at_max_matches(
 ) -> None:
     calls = 0
 
-    def fake_extract(_url: str) -> tuple[list[str], bool]:
+    def fake_extract(_url: str) -> tuple[list[ResultListing], bool]:
         nonlocal calls
         calls += 1
-        return [f"https://www.hltv.org/matches/{calls}00/x-vs-y"], False
+        return [_listing(calls * 100)], False
 
     monkeypatch.setattr(scraper, "_extract_matches_from_page", fake_extract)
 
@@ -92,24 +98,18 @@ def test_iter_match_batches_stops_at_max_matches(
 def test_iter_match_batches_caps_within_a_page(
     scraper: ResultsScraper, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    urls = [f"https://www.hltv.org/matches/{n}/x-vs-y" for n in (101, 102, 103)]
     calls = 0
 
-    def fake_extract(_url: str) -> tuple[list[str], bool]:
+    def fake_extract(_url: str) -> tuple[list[ResultListing], bool]:
         nonlocal calls
         calls += 1
-        return urls, False
+        return [_listing(n) for n in (101, 102, 103)], False
 
     monkeypatch.setattr(scraper, "_extract_matches_from_page", fake_extract)
 
     batches = list(scraper.iter_match_batches(max_matches=2))
 
-    assert batches == [
-        [
-            (101, "https://www.hltv.org/matches/101/x-vs-y"),
-            (102, "https://www.hltv.org/matches/102/x-vs-y"),
-        ]
-    ]
+    assert batches == [[_listing(101), _listing(102)]]
     assert calls == 1
 
 
@@ -121,13 +121,6 @@ def test_iter_match_batches_stops_on_empty_page(
     assert list(scraper.iter_match_batches(max_matches=10)) == []
 
 
-def test_extract_match_id(scraper: ResultsScraper) -> None:
-    assert (
-        scraper._extract_match_id("https://www.hltv.org/matches/12345/a-vs-b") == 12345
-    )
-    assert scraper._extract_match_id("https://www.hltv.org/results") is None
-
-
 def test_extract_matches_from_page_warns_and_skips_unparseable_date(
     scraper: ResultsScraper,
 ) -> None:
@@ -154,14 +147,52 @@ def test_extract_matches_from_page_warns_and_skips_unparseable_date(
     scraper.start_date = dt.date(2025, 1, 1)
     scraper.end_date = dt.date(2025, 12, 31)
 
-    with mock.patch.object(results_scraper_module.logger, "warning") as warning_mock:
+    with mock.patch.object(results_parser_module.logger, "warning") as warning_mock:
         matches, stop = scraper._extract_matches_from_page(
             "https://www.hltv.org/results?offset=0"
         )
 
     warning_mock.assert_called_once_with("Could not parse date: %s", "not-a-date")
-    assert matches == ["https://www.hltv.org/matches/222/c-vs-d"]
+    assert [listing.match_url for listing in matches] == [
+        "https://www.hltv.org/matches/222/c-vs-d"
+    ]
     assert stop is False
+    assert scraper.driver.find_calls == [
+        ("css selector", results_scraper_module.REQUIRED_RESULTS_SELECTOR)
+    ]
+
+
+def test_extract_matches_from_page_tolerates_empty_listing(
+    scraper: ResultsScraper,
+) -> None:
+    scraper.driver = _FakePageDriver(
+        "<html><body>No results found</body></html>", has_results=False
+    )
+
+    with mock.patch.object(results_scraper_module.logger, "warning") as warning_mock:
+        matches, stop = scraper._extract_matches_from_page(
+            "https://www.hltv.org/results?offset=9000"
+        )
+
+    assert matches == []
+    assert stop is False
+    assert warning_mock.call_args.args[1] == "Results page"
+
+
+def test_extract_matches_from_page_challenge_is_retryable(
+    scraper: ResultsScraper,
+) -> None:
+    scraper.driver = _FakePageDriver(
+        "<html><head><title>Just a moment...</title></head>"
+        "<body>Checking your browser before accessing HLTV.</body></html>",
+        has_results=False,
+    )
+
+    with pytest.raises(
+        SessionScrapeError,
+        match="Results page appears blocked or challenged after 0.1s",
+    ):
+        scraper._extract_matches_from_page("https://www.hltv.org/results?offset=0")
 
 
 def test_close_failure_raises_typed_error(scraper: ResultsScraper) -> None:
@@ -12,7 +12,7 @@ import pytest
 
 from cs2_analytics.exceptions import DatabaseOperationError
 from cs2_analytics.stage_services import MapStageService, MatchStageService
-from tests.support import FakeTransactionDb
+from tests.support import FakeTransactionDb, make_player_batch
 
 
 class _FakeScraper:
@@ -49,7 +49,7 @@ class _MapParser:
     def parse_map_details(self, _soup, _url, _map_id, *, match_id, map_order):
         class _Parsed:
             map = object()
-            players = [object()]
+            players = make_player_batch(200)
 
         return _Parsed()
 
@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from cs2_analytics.models.map import Map
 from cs2_analytics.models.match import Match
 from cs2_analytics.models.player import Player
+from cs2_analytics.models.player_batch import PlayerBatch
 from cs2_analytics.stage_services import MapStageService, MatchStageService
 from tests.support import FakeTransactionDb
 
@@ -11,7 +12,7 @@ from tests.support import FakeTransactionDb
 @dataclass(frozen=True)
 class _ParsedMap:
     map: Map
-    players: list[Player]
+    players: PlayerBatch
 
 
 @dataclass(frozen=True)
@@ -72,10 +73,12 @@ class _FakeMapParser:
             last_updated_at=now,
             data_complete=True,
         )
-        players = [
-            _player(map_id, 1000 + map_id, "NAVI", map_name, now),
-            _player(map_id, 2000 + map_id, "Vitality", map_name, now),
-        ]
+        players = PlayerBatch.from_players(
+            [
+                _player(map_id, 1000 + map_id, "NAVI", map_name, now),
+                _player(map_id, 2000 + map_id, "Vitality", map_name, now),
+            ]
+        )
         return _ParsedMap(map=parsed_map, players=players)
 
 
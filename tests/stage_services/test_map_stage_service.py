@@ -1,13 +1,14 @@
 from dataclasses import dataclass
 
+from cs2_analytics.models.player_batch import PlayerBatch
 from cs2_analytics.stage_services import MapStageService
-from tests.support import FakeTransactionDb
+from tests.support import FakeTransactionDb, make_player_batch
 
 
 @dataclass(frozen=True)
 class _ParsedMap:
     map: object
-    players: list[object]
+    players: PlayerBatch
 
 
 class _FakeScraper:
@@ -20,7 +21,7 @@ class _FakeScraper:
 
 
 class _FakeParser:
-    def __init__(self, players: list[object], map_obj: object | None = None) -> None:
+    def __init__(self, players: PlayerBatch, map_obj: object | None = None) -> None:
         self.players = players
         self.map_obj = map_obj or object()
         self.calls: list[tuple[str, int, int | None, int | None]] = []
@@ -56,9 +57,9 @@ class _FakeMapState:
 
 def test_map_stage_service_processes_success() -> None:
     stored_maps: list[list[object]] = []
-    stored_players: list[list[object]] = []
+    stored_players: list[PlayerBatch] = []
     parsed_map = object()
-    players = [object()]
+    players = make_player_batch(200, 201)
     map_state = _FakeMapState()
     parser = _FakeParser(players=players, map_obj=parsed_map)
     service = MapStageService(
@@ -88,15 +89,15 @@ def test_map_stage_service_processes_success() -> None:
     assert map_state.processed == [1]
     assert map_state.failed == []
     assert stored_maps == [[parsed_map]]
-    assert stored_players == [players]
+    assert [list(batch.rows()) for batch in stored_players] == [list(players.rows())]
 
 
 def test_map_stage_service_marks_failed_when_parser_returns_no_players() -> None:
     stored_maps: list[list[object]] = []
-    stored_players: list[list[object]] = []
+    stored_players: list[PlayerBatch] = []
     map_state = _FakeMapState()
     service = MapStageService(
-        parser=_FakeParser(players=[]),
+        parser=_FakeParser(players=PlayerBatch()),
         store_maps=lambda maps, cur=None: stored_maps.append(maps),
         store_players=lambda parsed_players, cur=None: stored_players.append(
             parsed_players
@@ -126,7 +127,7 @@ def test_map_stage_service_marks_failed_when_parser_returns_no_players() -> None
 def test_map_stage_service_processes_with_attempt_scraper() -> None:
     attempt_scraper = _FakeScraper()
     service = MapStageService(
-        parser=_FakeParser(players=[object()]),
+        parser=_FakeParser(players=make_player_batch(200)),
         store_maps=lambda _maps, cur=None: None,
         store_players=lambda _players, cur=None: None,
         map_state=_FakeMapState(),
@@ -144,3 +145,75 @@ def test_map_stage_service_processes_with_attempt_scraper() -> None:
     assert attempt_scraper.urls == [
         "https://www.hltv.org/stats/matches/mapstatsid/1/test"
     ]
+
+
+def _process(service: MapStageService, map_id: int) -> None:
+    result = service.process_item(
+        map_id,
+        f"https://www.hltv.org/stats/matches/mapstatsid/{map_id}/test",
+        scraper=_FakeScraper(),
+        match_id=101,
+        map_order=1,
+    )
+    assert result.succeeded is True
+
+
+def test_map_stage_service_group_commits_queued_maps() -> None:
+    stored_maps: list[list[object]] = []
+    map_state = _FakeMapState()
+    db = FakeTransactionDb()
+    service = MapStageService(
+        parser=_FakeParser(players=make_player_batch(200)),
+        store_maps=lambda maps, cur=None: stored_maps.append(maps),
+        store_players=lambda _players, cur=None: None,
+        map_state=map_state,
+        db=db,
+        group_commit_size=2,
+    )
+
+    _process(service, 1)
+    assert db.cursors == []
+    _process(service, 2)
+    _process(service, 3)
+
+    assert service.finish_writes() == 0
+    assert [len(maps) for maps in stored_maps] == [2, 1]
+    assert len(db.cursors) == 2
+    assert map_state.processed == [1, 2, 3]
+
+
+def test_map_stage_service_retries_a_failed_group_map_by_map() -> None:
+    bad_player_id = 666
+
+    class _PerMapParser(_FakeParser):
+        def parse_map_details(self, soup, map_url, map_id, *, match_id, map_order):
+            player_id = bad_player_id if map_id == 2 else 200
+            self.players = make_player_batch(player_id, map_id=map_id)
+            return super().parse_map_details(
+                soup, map_url, map_id, match_id=match_id, map_order=map_order
+            )
+
+    def store_players(players, cur=None) -> None:
+        if bad_player_id in players.column("player_id"):
+            raise ValueError("numeric field overflow")
+
+    map_state = _FakeMapState()
+    db = FakeTransactionDb()
+    service = MapStageService(
+        parser=_PerMapParser(players=PlayerBatch()),
+        store_maps=lambda _maps, cur=None: None,
+        store_players=store_players,
+        map_state=map_state,
+        db=db,
+        group_commit_size=3,
+    )
+
+    for map_id in (1, 2, 3):
+        _process(service, map_id)
+
+    # one failed group transaction, then one transaction per map
+    assert len(db.cursors) == 4
+    assert map_state.processed == [1, 3]
+    assert map_state.failed == [(2, "Failed during database transaction.")]
+    assert service.finish_writes() == 1
+    assert service.finish_writes() == 0
@@ -1,3 +1,7 @@
+import datetime as dt
+
+from cs2_analytics.exceptions import MatchParseError
+from cs2_analytics.models import ResultListing
 from cs2_analytics.stage_services import MatchStageService
 from tests.support import FakeTransactionDb
 
@@ -152,3 +156,55 @@ def test_match_stage_service_processes_with_attempt_scraper() -> None:
     )
 
     assert attempt_scraper.urls == ["https://www.hltv.org/matches/1/test"]
+
+
+class _ListingParser:
+    def match_from_listing(self, listing: ResultListing) -> object:
+        if not listing.has_header:
+            raise MatchParseError(
+                f"Listing for match {listing.match_id} lacks header data."
+            )
+        return type("ListedMatch", (), {"match_id": listing.match_id})()
+
+
+def _listing(match_id: int, *, with_header: bool = True) -> ResultListing:
+    header = (
+        {
+            "team1": "Falcons",
+            "team2": "Astralis",
+            "score1": 0,
+            "score2": 1,
+            "event": "Test Masters 2025",
+            "listed_date": dt.date(2025, 8, 4),
+        }
+        if with_header
+        else {}
+    )
+    return ResultListing(
+        match_id=match_id,
+        match_url=f"https://www.hltv.org/matches/{match_id}/test",
+        forfeit=True,
+        **header,
+    )
+
+
+def test_record_listed_forfeits_stores_without_a_page_load() -> None:
+    stored_matches: list[list[object]] = []
+    match_state = _FakeMatchState()
+    service = MatchStageService(
+        parser=_ListingParser(),
+        store_matches=lambda matches, cur=None: stored_matches.append(matches),
+        match_state=match_state,
+        map_state=_FakeFollowupState(),
+        demo_state=_FakeFollowupState(),
+        db=FakeTransactionDb(),
+    )
+
+    stored = service.record_listed_forfeits(
+        [_listing(1), _listing(2, with_header=False), _listing(3)]
+    )
+
+    assert stored == 2
+    assert [[match.match_id for match in batch] for batch in stored_matches] == [[1, 3]]
+    assert match_state.processed == [1, 3]
+    assert match_state.processing == []
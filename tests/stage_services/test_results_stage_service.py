@@ -1,36 +1,60 @@
 """Tests for the results discovery persistence service."""
 
+import datetime as dt
+
+from cs2_analytics.models import ResultListing
 from cs2_analytics.stage_services import ResultsStageService
+from cs2_analytics.stage_services.results_stage_service import (
+    FORFEIT_LISTING_PRIORITY,
+)
 
 
 class _FakeMatchState:
-    def __init__(self) -> None:
-        self.record_many_calls: list[tuple[list[tuple[int, str]], str, int]] = []
+    def __init__(self, known_ids: frozenset[int] = frozenset()) -> None:
+        self.known_ids = known_ids
+        self.known_id_lookups: list[list[int]] = []
+        self.record_listings_calls: list[tuple[list[ResultListing], str, int]] = []
+
+    def fetch_known_ids(self, ids: list[int]) -> set[int]:
+        self.known_id_lookups.append(list(ids))
+        return {match_id for match_id in ids if match_id in self.known_ids}
 
-    def record_many(
+    def record_listings(
         self,
-        items: list[tuple[int, str]],
+        listings: list[ResultListing],
         source: str = "unknown",
-        priority: int = 0,
+        *,
+        forfeit_priority: int = 0,
     ) -> None:
-        self.record_many_calls.append((list(items), source, priority))
+        self.record_listings_calls.append((list(listings), source, forfeit_priority))
+
+
+def _listing(match_id: int, *, forfeit: bool = False) -> ResultListing:
+    return ResultListing(
+        match_id=match_id,
+        match_url=f"https://example.test/matches/{match_id}",
+        team1="Vitality",
+        team2="NAVI",
+        score1=1 if forfeit else 2,
+        score2=0,
+        event="BLAST Open",
+        match_format=None if forfeit else "bo3",
+        forfeit=forfeit,
+        listed_date=dt.date(2025, 8, 4),
+    )
 
 
 def test_record_batch_records_items_with_source() -> None:
     state = _FakeMatchState()
     service = ResultsStageService(match_state=state)
-    batch = [
-        (1001, "https://example.test/matches/1001"),
-        (1002, "https://example.test/matches/1002"),
-    ]
+    batch = [_listing(1001), _listing(1002, forfeit=True)]
 
     recorded = service.record_batch(batch)
 
     assert recorded == 2
-    assert len(state.record_many_calls) == 1
-    items, source, _priority = state.record_many_calls[0]
-    assert items == batch
-    assert source == "results_scraper"
+    assert state.record_listings_calls == [
+        (batch, "results_scraper", FORFEIT_LISTING_PRIORITY)
+    ]
 
 
 def test_record_batch_empty_is_a_no_op() -> None:
@@ -38,16 +62,36 @@ def test_record_batch_empty_is_a_no_op() -> None:
     service = ResultsStageService(match_state=state)
 
     assert service.record_batch([]) == 0
-    assert state.record_many_calls == []
+    assert state.record_listings_calls == []
 
 
 def test_record_batch_chunks_large_batches() -> None:
     state = _FakeMatchState()
     service = ResultsStageService(match_state=state, chunk_size=2)
-    batch = [(n, f"https://example.test/matches/{n}") for n in range(5)]
+    batch = [_listing(n) for n in range(5)]
 
     recorded = service.record_batch(batch)
 
     assert recorded == 5
-    assert len(state.record_many_calls) == 3
-    assert [len(items) for items, _, _ in state.record_many_calls] == [2, 2, 1]
+    assert [len(items) for items, _, _ in state.record_listings_calls] == [2, 2, 1]
+
+
+def test_record_batch_skip_known_records_only_new_matches() -> None:
+    state = _FakeMatchState(known_ids=frozenset({1002}))
+    service = ResultsStageService(match_state=state)
+    batch = [_listing(1001), _listing(1002)]
+
+    recorded = service.record_batch(batch, skip_known=True)
+
+    assert recorded == 1
+    assert state.known_id_lookups == [[1001, 1002]]
+    assert state.record_listings_calls[0][0] == [batch[0]]
+
+
+def test_record_batch_skip_known_fully_known_page_records_nothing() -> None:
+    state = _FakeMatchState(known_ids=frozenset({1001, 1002}))
+    service = ResultsStageService(match_state=state)
+    batch = [_listing(1001), _listing(1002)]
+
+    assert service.record_batch(batch, skip_known=True) == 0
+    assert state.record_listings_calls == []
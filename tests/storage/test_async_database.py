@@ -0,0 +1,64 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from psycopg_pool import PoolTimeout
+
+from cs2_analytics.exceptions import DatabaseConnectionError, DatabaseOperationError
+from cs2_analytics.storage.async_database import AsyncDatabase
+
+
+class _FakeCursor:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+class _FakeConnection:
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor()
+
+
+class _FakePool:
+    def __init__(self, checkout_error: Exception | None = None) -> None:
+        self.checkout_error = checkout_error
+        self.checkouts = 0
+
+    @asynccontextmanager
+    async def connection(self):
+        if self.checkout_error is not None:
+            raise self.checkout_error
+        self.checkouts += 1
+        yield _FakeConnection()
+
+
+async def _use_cursor(db: AsyncDatabase, error: Exception | None = None) -> None:
+    async with db.get_cursor():
+        if error is not None:
+            raise error
+
+
+def test_get_cursor_yields_a_pooled_cursor() -> None:
+    pool = _FakePool()
+
+    asyncio.run(_use_cursor(AsyncDatabase(pool)))
+
+    assert pool.checkouts == 1
+
+
+def test_pool_timeout_surfaces_as_connection_error() -> None:
+    db = AsyncDatabase(_FakePool(checkout_error=PoolTimeout("no connection")))
+
+    with pytest.raises(DatabaseConnectionError, match="acquire a database connection"):
+        asyncio.run(_use_cursor(db))
+
+
+def test_query_failures_surface_as_operation_errors() -> None:
+    db = AsyncDatabase(_FakePool())
+
+    with pytest.raises(DatabaseOperationError) as excinfo:
+        asyncio.run(_use_cursor(db, ValueError("bad query")))
+
+    assert isinstance(excinfo.value.__cause__, ValueError)
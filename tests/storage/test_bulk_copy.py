@@ -0,0 +1,64 @@
+import pytest
+
+from cs2_analytics.storage import bulk_copy
+
+
+class _CopyCursor:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+        self.copied: list[tuple[str, str]] = []
+
+    def execute(self, query: str) -> None:
+        self.statements.append(query)
+
+    def copy_expert(self, query: str, file) -> None:
+        self.statements.append(query)
+        self.copied.append((query, file.read()))
+
+
+def _copy_upsert(cur: _CopyCursor, rows) -> int:
+    return bulk_copy.copy_upsert(
+        cur,
+        table="maps",
+        columns=("map_id", "map_name", "map_winner"),
+        key_columns=("map_id",),
+        conflict_clause="ON CONFLICT (map_id) DO UPDATE SET map_name = EXCLUDED.map_name;",
+        rows=rows,
+    )
+
+
+def test_copy_upsert_stages_rows_and_merges_once() -> None:
+    cur = _CopyCursor()
+
+    loaded = _copy_upsert(cur, [(1, "Train", None), (2, "", "Liquid, Inc.")])
+
+    assert loaded == 2
+    create, truncate, copy, merge = cur.statements
+    assert create.startswith("CREATE TEMP TABLE IF NOT EXISTS maps_copy_stage")
+    assert "ON COMMIT DELETE ROWS" in create
+    assert truncate == "TRUNCATE maps_copy_stage"
+    assert copy.startswith("COPY maps_copy_stage (map_id, map_name, map_winner, ")
+    # None stays unquoted (NULL); an empty string is quoted so it stays ''
+    assert cur.copied[0][1] == '"1","Train",,"1"\n"2","","Liquid, Inc.","2"\n'
+    assert merge.startswith("INSERT INTO maps (map_id, map_name, map_winner) ")
+    assert "SELECT DISTINCT ON (map_id)" in merge
+    assert "ORDER BY map_id, stage_order DESC" in merge
+    assert merge.endswith(
+        "ON CONFLICT (map_id) DO UPDATE SET map_name = EXCLUDED.map_name;"
+    )
+
+
+def test_copy_upsert_skips_an_empty_load() -> None:
+    cur = _CopyCursor()
+
+    assert _copy_upsert(cur, iter(())) == 0
+    assert cur.statements == []
+
+
+def test_should_copy_honours_the_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(bulk_copy, "BULK_COPY_MIN_ROWS", 3)
+    assert not bulk_copy.should_copy(2)
+    assert bulk_copy.should_copy(3)
+
+    monkeypatch.setattr(bulk_copy, "BULK_COPY_MIN_ROWS", 0)
+    assert not bulk_copy.should_copy(10_000)
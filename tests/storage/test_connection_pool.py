@@ -0,0 +1,182 @@
+import threading
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+import pytest
+
+from cs2_analytics.storage.connection_pool import ConnectionPool
+
+
+class _FakeInfo:
+    def __init__(self) -> None:
+        self.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConnection") -> None:
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    def execute(self, _query: str) -> None:
+        if self.conn.dropped:
+            raise psycopg2.OperationalError("server closed the connection")
+        self.conn.pings += 1
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.closed = 0
+        self.dropped = False
+        self.pings = 0
+        self.rolled_back = 0
+        self.info = _FakeInfo()
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def rollback(self) -> None:
+        self.rolled_back += 1
+        self.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pool(opened: list[_FakeConnection], **overrides) -> ConnectionPool:
+    def connect() -> _FakeConnection:
+        opened.append(_FakeConnection())
+        return opened[-1]
+
+    options = {
+        "minconn": 0,
+        "maxconn": 2,
+        "timeout_seconds": 5,
+        "max_lifetime_seconds": 100,
+        "max_idle_seconds": 50,
+        "validate_idle_seconds": 10,
+    }
+    options.update(overrides)
+    return ConnectionPool(connect, **options)
+
+
+def test_checkout_blocks_until_a_connection_is_returned() -> None:
+    pool = _pool([], maxconn=1)
+    held = pool.getconn()
+    got: list[object] = []
+    waiter = threading.Thread(target=lambda: got.append(pool.getconn()))
+
+    waiter.start()
+    waiter.join(timeout=0.1)
+    assert waiter.is_alive()
+    assert pool.stats().waiting == 1
+
+    pool.putconn(held)
+    waiter.join(timeout=5)
+    assert got == [held]
+    assert pool.stats().checkouts == 2
+    assert pool.stats().max_wait_seconds > 0
+
+
+def test_checkout_times_out_when_the_pool_stays_exhausted() -> None:
+    pool = _pool([], maxconn=1, timeout_seconds=0.05)
+    pool.getconn()
+
+    with pytest.raises(psycopg2.pool.PoolError, match="1/1 open, 0 idle"):
+        pool.getconn()
+
+    stats = pool.stats()
+    assert (stats.size, stats.in_use, stats.timeouts) == (1, 1, 1)
+
+
+def test_expired_connections_are_recycled() -> None:
+    opened: list[_FakeConnection] = []
+    clock = _Clock()
+    pool = _pool(opened, clock=clock)
+    first = pool.getconn()
+    pool.putconn(first)
+
+    clock.now = 60  # idle past max_idle_seconds
+    second = pool.getconn()
+
+    assert second is not first
+    assert first.closed
+    assert pool.stats().recycled == 1
+
+    clock.now = 200  # older than max_lifetime_seconds when returned
+    pool.putconn(second)
+    assert second.closed
+    assert pool.stats().size == 0
+
+
+def test_idle_connection_is_pinged_and_replaced_when_dropped() -> None:
+    opened: list[_FakeConnection] = []
+    clock = _Clock()
+    pool = _pool(opened, clock=clock)
+    conn = pool.getconn()
+    pool.putconn(conn)
+
+    clock.now = 5  # recently used: reused without a ping
+    assert pool.getconn() is conn
+    assert conn.pings == 0
+    pool.putconn(conn)
+
+    clock.now = 20
+    assert pool.getconn() is conn
+    assert conn.pings == 1
+    pool.putconn(conn)
+
+    conn.dropped = True
+    clock.now = 40
+    replacement = pool.getconn()
+
+    assert replacement is opened[1]
+    assert conn.closed
+    stats = pool.stats()
+    assert (stats.size, stats.discarded) == (1, 1)
+
+
+def test_returned_connections_are_reset_or_discarded() -> None:
+    opened: list[_FakeConnection] = []
+    pool = _pool(opened)
+    dirty, broken = pool.getconn(), pool.getconn()
+    dirty.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+    broken.closed = 2
+
+    pool.putconn(dirty)
+    pool.putconn(broken)
+
+    assert dirty.rolled_back == 1
+    stats = pool.stats()
+    assert (stats.size, stats.idle, stats.discarded) == (1, 1, 1)
+    with pytest.raises(psycopg2.pool.PoolError, match="does not belong"):
+        pool.putconn(broken)
+
+
+def test_closed_pool_refuses_checkouts_and_closes_returns() -> None:
+    opened: list[_FakeConnection] = []
+    pool = _pool(opened, minconn=1)
+    held = pool.getconn()
+    spare = pool.getconn()
+    pool.putconn(spare)
+
+    pool.closeall()
+    pool.putconn(held)
+
+    assert opened == [held, spare]
+    assert held.closed and spare.closed
+    with pytest.raises(psycopg2.pool.PoolError, match="closed"):
+        pool.getconn()
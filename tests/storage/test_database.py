@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 from cs2_analytics.models.map import Map
 from cs2_analytics.models.match import Match
 from cs2_analytics.models.player import Player
+from cs2_analytics.models.player_batch import PlayerBatch
 from cs2_analytics.storage.database import Database
 from cs2_analytics.storage.map_storage import store_maps
 from cs2_analytics.storage.match_storage import store_matches
@@ -157,7 +158,7 @@ class TestDatabase(unittest.TestCase):
         sys.stdout.flush()
         store_matches([test_match])
         store_maps([test_map])
-        store_players([test_player])
+        store_players(PlayerBatch.from_players([test_player]))
 
         print("🔍 Fetching player from database...")
         sys.stdout.flush()
@@ -4,6 +4,7 @@ import pytest
 
 from cs2_analytics.exceptions import MapStorageError
 from cs2_analytics.models.map import Map
+from cs2_analytics.storage import bulk_copy
 from cs2_analytics.storage import map_storage as map_storage_module
 
 
@@ -11,6 +12,8 @@ class _RecordingCursor:
     def __init__(self, should_fail: bool = False) -> None:
         self.should_fail = should_fail
         self.executed: list[tuple[str, list[dict[str, object]]]] = []
+        self.statements: list[str] = []
+        self.copied: list[str] = []
 
     def __enter__(self):
         return self
@@ -23,6 +26,13 @@ class _RecordingCursor:
             raise RuntimeError("insert failed")
         self.executed.append((query, values))
 
+    def execute(self, query: str) -> None:
+        self.statements.append(query)
+
+    def copy_expert(self, query: str, file) -> None:
+        self.statements.append(query)
+        self.copied.append(file.read())
+
 
 class _FakeDb:
     def __init__(self, cursor: _RecordingCursor) -> None:
@@ -118,6 +128,24 @@ def test_store_maps_refreshes_trusted_fields_without_replacing_inserted_at(
     assert "inserted_at = EXCLUDED.inserted_at" not in conflict_update
 
 
+def test_store_maps_bulk_loads_through_copy_above_the_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cursor = _RecordingCursor()
+    monkeypatch.setattr(bulk_copy, "BULK_COPY_MIN_ROWS", 2)
+
+    map_storage_module.store_maps([_map(), _map()], cur=cursor)
+
+    assert cursor.executed == []
+    copy, merge = cursor.statements[-2:]
+    assert copy.startswith(
+        f"COPY maps_copy_stage ({', '.join(map_storage_module.MAP_COLUMNS)}, "
+    )
+    first_row = cursor.copied[0].splitlines()[0]
+    assert first_row.startswith('"204269","1001","https://www.hltv.org/stats/')
+    assert merge.endswith(map_storage_module.MAPS_CONFLICT_CLAUSE)
+
+
 def test_store_maps_wraps_database_failures(monkeypatch: pytest.MonkeyPatch) -> None:
     cursor = _RecordingCursor(should_fail=True)
     monkeypatch.setattr(map_storage_module, "get_db", lambda: _FakeDb(cursor))
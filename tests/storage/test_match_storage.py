@@ -5,16 +5,24 @@ import pytest
 
 from cs2_analytics.exceptions import MatchStorageError
 from cs2_analytics.models.match import Match
+from cs2_analytics.storage import bulk_copy
 from cs2_analytics.storage import match_storage as match_storage_module
 
 
 class _RecordingCursor:
     def __init__(self) -> None:
         self.executed: list[tuple[str, list[dict[str, object]]]] = []
+        self.statements: list[str] = []
 
     def executemany(self, query: str, values: list[dict[str, object]]) -> None:
         self.executed.append((query, values))
 
+    def execute(self, query: str) -> None:
+        self.statements.append(query)
+
+    def copy_expert(self, query: str, _file) -> None:
+        self.statements.append(query)
+
 
 class _RecordingConnection:
     def __init__(self, cursor: _RecordingCursor) -> None:
@@ -151,6 +159,23 @@ def test_store_matches_batches_rows_into_one_write(
     assert len(values) == 2
 
 
+def test_store_matches_bulk_loads_through_copy_above_the_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cursor = _RecordingCursor()
+    monkeypatch.setattr(bulk_copy, "BULK_COPY_MIN_ROWS", 2)
+
+    match_storage_module.store_matches([_match(), _match()], cur=cursor)
+
+    assert cursor.executed == []
+    copy, merge = cursor.statements[-2:]
+    assert copy.startswith(
+        f"COPY matches_copy_stage ({', '.join(match_storage_module.MATCH_COLUMNS)}, "
+    )
+    assert "SELECT DISTINCT ON (match_id)" in merge
+    assert merge.endswith(match_storage_module.MATCHES_CONFLICT_CLAUSE)
+
+
 def test_store_matches_wraps_database_factory_failures(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
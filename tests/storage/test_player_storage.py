@@ -1,15 +1,19 @@
-from datetime import UTC, datetime
+import pickle
+from array import array
 
 import pytest
 
 from cs2_analytics.exceptions import PlayerStorageError
-from cs2_analytics.models.player import Player
+from cs2_analytics.models.player_batch import PLAYER_COLUMNS, PlayerBatch
+from cs2_analytics.storage import bulk_copy
 from cs2_analytics.storage import player_storage as player_storage_module
+from tests.support import make_player, make_player_batch
 
 
 class _RecordingCursor:
     def __init__(self) -> None:
-        self.executed: list[tuple[str, list[dict[str, object]]]] = []
+        self.executed: list[tuple[str, list[tuple]]] = []
+        self.statements: list[str] = []
 
     def __enter__(self):
         return self
@@ -17,8 +21,14 @@ class _RecordingCursor:
     def __exit__(self, exc_type, exc, tb) -> None:
         return None
 
-    def executemany(self, query: str, values: list[dict[str, object]]) -> None:
-        self.executed.append((query, values))
+    def executemany(self, query: str, values) -> None:
+        self.executed.append((query, list(values)))
+
+    def execute(self, query: str) -> None:
+        self.statements.append(query)
+
+    def copy_expert(self, query: str, _file) -> None:
+        self.statements.append(query)
 
 
 class _FakeDb:
@@ -29,38 +39,6 @@ class _FakeDb:
         return self.cursor
 
 
-def _player() -> Player:
-    now = datetime.now(UTC)
-    return Player(
-        map_id=100,
-        player_id=200,
-        player_name="Player",
-        player_url="https://www.hltv.org/player/200/player",
-        map_name="Train",
-        team_name="Team",
-        kills=20,
-        headshots=12,
-        assists=5,
-        flash_assists=1,
-        deaths=13,
-        traded_deaths=2,
-        opening_kills=4,
-        opening_deaths=3,
-        multi_kills=6,
-        clutches_won=1,
-        kast=75.0,
-        kd_diff=7,
-        adr=90.5,
-        fk_diff=1,
-        round_swing=0.07,
-        rating=1.31,
-        last_inserted_at=now,
-        last_scraped_at=now,
-        last_updated_at=now,
-        data_complete=True,
-    )
-
-
 def _conflict_update_clause(query: str) -> str:
     assert "ON CONFLICT" in query, (
         "Expected storage query to define an upsert conflict clause."
@@ -74,10 +52,10 @@ def test_store_players_refreshes_context_and_metrics_on_conflict(
     cursor = _RecordingCursor()
     monkeypatch.setattr(player_storage_module, "get_db", lambda: _FakeDb(cursor))
 
-    player_storage_module.store_players([_player()])
+    player_storage_module.store_players(make_player_batch(200))
 
     query, values = cursor.executed[0]
-    params = values[0]
+    params = dict(zip(PLAYER_COLUMNS, values[0], strict=True))
     conflict_update = _conflict_update_clause(query)
 
     assert "ON CONFLICT (map_id, player_id)" in query
@@ -111,6 +89,32 @@ def test_store_players_refreshes_context_and_metrics_on_conflict(
     assert "last_inserted_at = EXCLUDED.last_inserted_at" not in conflict_update
     assert params["map_id"] == 100
     assert params["player_id"] == 200
+    assert params["kast"] == 75.0
+
+
+def test_insert_columns_follow_the_player_field_order() -> None:
+    insert_columns = (
+        player_storage_module.INSERT_PLAYERS_QUERY.split("(", 1)[1]
+        .split(")", 1)[0]
+        .replace("\n", " ")
+    )
+
+    assert tuple(name.strip() for name in insert_columns.split(",")) == PLAYER_COLUMNS
+
+
+def test_store_players_writes_player_rows_positionally(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cursor = _RecordingCursor()
+    monkeypatch.setattr(player_storage_module, "get_db", lambda: _FakeDb(cursor))
+    players = [make_player(201), make_player(202)]
+
+    player_storage_module.store_players(PlayerBatch.from_players(players))
+
+    _query, values = cursor.executed[0]
+    assert values == [
+        tuple(getattr(player, name) for name in PLAYER_COLUMNS) for player in players
+    ]
 
 
 def test_store_players_batches_rows_into_one_write(
@@ -119,13 +123,28 @@ def test_store_players_batches_rows_into_one_write(
     cursor = _RecordingCursor()
     monkeypatch.setattr(player_storage_module, "get_db", lambda: _FakeDb(cursor))
 
-    player_storage_module.store_players([_player(), _player()])
+    player_storage_module.store_players(make_player_batch(201, 202))
 
     assert len(cursor.executed) == 1
     _query, values = cursor.executed[0]
     assert len(values) == 2
 
 
+def test_store_players_bulk_loads_through_copy_above_the_threshold(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cursor = _RecordingCursor()
+    monkeypatch.setattr(bulk_copy, "BULK_COPY_MIN_ROWS", 2)
+
+    player_storage_module.store_players(make_player_batch(201, 202), cur=cursor)
+
+    assert cursor.executed == []
+    copy, merge = cursor.statements[-2:]
+    assert copy.startswith(f"COPY players_copy_stage ({', '.join(PLAYER_COLUMNS)}, ")
+    assert "SELECT DISTINCT ON (map_id, player_id)" in merge
+    assert merge.endswith(player_storage_module.PLAYERS_CONFLICT_CLAUSE)
+
+
 def test_store_players_wraps_database_factory_failures(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -135,4 +154,26 @@ def test_store_players_wraps_database_factory_failures(
     monkeypatch.setattr(player_storage_module, "get_db", raise_database_error)
 
     with pytest.raises(PlayerStorageError, match="Failed to store player records."):
-        player_storage_module.store_players([_player()])
+        player_storage_module.store_players(make_player_batch(200))
+
+
+def test_player_batch_packs_numeric_stats_into_typed_arrays() -> None:
+    players = [make_player(201), make_player(202)]
+    batch = PlayerBatch.from_players(players)
+
+    assert len(batch) == 2
+    assert batch.column("kills") == array("q", [20, 20])
+    assert batch.column("adr") == array("d", [90.5, 90.5])
+    assert batch.column("player_name") == ["Player", "Player"]
+    assert list(batch) == players
+    assert batch[1] == players[1]
+
+
+def test_player_batch_concat_keeps_row_order_and_survives_pickling() -> None:
+    joined = PlayerBatch.concat(
+        [make_player_batch(201), PlayerBatch(), make_player_batch(202, 203)]
+    )
+
+    assert list(joined.column("player_id")) == [201, 202, 203]
+    restored = pickle.loads(pickle.dumps(joined))
+    assert list(restored.rows()) == list(joined.rows())
@@ -0,0 +1,78 @@
+import psycopg2.errors
+import pytest
+
+from cs2_analytics.storage.prepared_statements import PreparedStatements, to_positional
+
+
+class _FakeConnection:
+    pass
+
+
+class _FakeCursor:
+    def __init__(self, conn: _FakeConnection, fail_execute: bool = False) -> None:
+        self.connection = conn
+        self.fail_execute = fail_execute
+        self.statements: list[tuple[str, tuple | None]] = []
+
+    def execute(self, query: str, params: tuple | None = None) -> None:
+        self.statements.append((query, params))
+        if self.fail_execute and query.startswith("EXECUTE"):
+            raise psycopg2.errors.InvalidSqlStatementName("does not exist")
+
+
+QUERY = "UPDATE t SET status = 'failed', reason = %s WHERE id = %s;"
+
+
+def test_to_positional_numbers_each_placeholder() -> None:
+    assert to_positional(QUERY) == (
+        "UPDATE t SET status = 'failed', reason = $1 WHERE id = $2;"
+    )
+    assert to_positional("SELECT 1;") == "SELECT 1;"
+
+
+def test_statement_is_prepared_once_per_connection() -> None:
+    registry = PreparedStatements()
+    first, second = _FakeConnection(), _FakeConnection()
+    cur = _FakeCursor(first)
+
+    registry.execute(cur, "t_mark_failed", QUERY, ("boom", 1))
+    registry.execute(cur, "t_mark_failed", QUERY, ("bang", 2))
+
+    assert cur.statements == [
+        (
+            "PREPARE t_mark_failed AS "
+            "UPDATE t SET status = 'failed', reason = $1 WHERE id = $2;",
+            None,
+        ),
+        ("EXECUTE t_mark_failed (%s, %s)", ("boom", 1)),
+        ("EXECUTE t_mark_failed (%s, %s)", ("bang", 2)),
+    ]
+    assert registry.is_prepared(first, "t_mark_failed")
+    assert not registry.is_prepared(second, "t_mark_failed")
+
+    other = _FakeCursor(second)
+    registry.execute(other, "t_mark_failed", QUERY, ("boom", 3))
+    assert other.statements[0][0].startswith("PREPARE t_mark_failed")
+
+
+def test_lost_statement_is_prepared_again_on_next_use() -> None:
+    registry = PreparedStatements()
+    conn = _FakeConnection()
+
+    registry.execute(_FakeCursor(conn), "t_mark_failed", QUERY, ("boom", 1))
+    with pytest.raises(psycopg2.errors.InvalidSqlStatementName):
+        registry.execute(
+            _FakeCursor(conn, fail_execute=True), "t_mark_failed", QUERY, ("x", 1)
+        )
+
+    assert not registry.is_prepared(conn, "t_mark_failed")
+
+
+def test_closed_connections_drop_out_of_the_registry() -> None:
+    registry = PreparedStatements()
+    conn = _FakeConnection()
+    registry.execute(_FakeCursor(conn), "t_mark_failed", QUERY, ("boom", 1))
+
+    del conn
+
+    assert len(registry._prepared) == 0
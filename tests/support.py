@@ -1,8 +1,51 @@
-"""Shared test fakes for transaction-aware stage-service wiring."""
+"""Shared test fakes for transaction-aware stage-service and controller wiring."""
 
 from contextlib import contextmanager
+from datetime import UTC, datetime
 
 from cs2_analytics.exceptions import DatabaseOperationError
+from cs2_analytics.models.player import Player
+from cs2_analytics.models.player_batch import PlayerBatch
+
+
+def make_player(player_id: int = 200, *, map_id: int = 100) -> Player:
+    """Builds a complete Player row with fixed stats."""
+    now = datetime.now(UTC)
+    return Player(
+        map_id=map_id,
+        player_id=player_id,
+        player_name="Player",
+        player_url=f"https://www.hltv.org/player/{player_id}/player",
+        map_name="Train",
+        team_name="Team",
+        kills=20,
+        headshots=12,
+        assists=5,
+        flash_assists=1,
+        deaths=13,
+        traded_deaths=2,
+        opening_kills=4,
+        opening_deaths=3,
+        multi_kills=6,
+        clutches_won=1,
+        kast=75.0,
+        kd_diff=7,
+        adr=90.5,
+        fk_diff=1,
+        round_swing=0.07,
+        rating=1.31,
+        last_inserted_at=now,
+        last_scraped_at=now,
+        last_updated_at=now,
+        data_complete=True,
+    )
+
+
+def make_player_batch(*player_ids: int, map_id: int = 100) -> PlayerBatch:
+    """Builds a PlayerBatch holding one make_player row per id."""
+    return PlayerBatch.from_players(
+        make_player(player_id, map_id=map_id) for player_id in player_ids
+    )
 
 
 class FakeCursor:
@@ -38,3 +81,32 @@ class FakeTransactionDb:
                 raise self.fail_on_exit
         except Exception as e:
             raise DatabaseOperationError("Failed during database transaction.") from e
+
+
+class RecordingRateLimiter:
+    """Fake HostRateLimiter that never sleeps and records pacing calls."""
+
+    def __init__(self) -> None:
+        self.acquired: list[str] = []
+        self.deferred: list[tuple[str, float]] = []
+        self.failures: list[Exception] = []
+
+    def acquire(self, url: str) -> float:
+        self.acquired.append(url)
+        return 0.0
+
+    @contextmanager
+    def paced(self, url: str, *, acquire: bool = True):
+        if acquire:
+            self.acquire(url)
+        try:
+            yield
+        except Exception as e:
+            self.failures.append(e)
+            raise
+
+    def metrics(self) -> None:
+        return None
+
+    def defer(self, url: str, seconds: float) -> None:
+        self.deferred.append((url, seconds))
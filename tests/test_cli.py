@@ -6,11 +6,14 @@ replaced in their source modules because the CLI imports them lazily
 inside command bodies.
 """
 
+from pathlib import Path
+
 from typer.testing import CliRunner
 
 from cs2_analytics.cli import app
 
 runner = CliRunner()
+CORPUS_MANIFEST = Path(__file__).parent / "parsers" / "fixtures" / "corpus.json"
 
 
 class _RecordingController:
@@ -49,7 +52,7 @@ def test_help_lists_all_commands() -> None:
     result = runner.invoke(app, ["--help"])
 
     assert result.exit_code == 0
-    for command in ("ingest", "process", "retry", "status", "db"):
+    for command in ("ingest", "process", "replay", "retry", "status", "db", "bench"):
         assert command in result.stdout
 
 
@@ -66,7 +69,7 @@ def test_discover_defaults_to_incremental_cap(monkeypatch) -> None:
     result = runner.invoke(app, ["ingest", "discover"])
 
     assert result.exit_code == 0
-    assert calls == [("results", {"max_matches": 50})]
+    assert calls == [("results", {"max_matches": 50, "stop_at_known": True})]
 
 
 def test_discover_backfill_raises_the_cap(monkeypatch) -> None:
@@ -82,7 +85,7 @@ def test_discover_backfill_raises_the_cap(monkeypatch) -> None:
     result = runner.invoke(app, ["ingest", "discover", "--mode", "backfill"])
 
     assert result.exit_code == 0
-    assert calls == [("results", {"max_matches": 1000})]
+    assert calls == [("results", {"max_matches": 1000, "stop_at_known": False})]
 
 
 def test_discover_max_matches_overrides_mode(monkeypatch) -> None:
@@ -100,7 +103,7 @@ def test_discover_max_matches_overrides_mode(monkeypatch) -> None:
     )
 
     assert result.exit_code == 0
-    assert calls == [("results", {"max_matches": 7})]
+    assert calls == [("results", {"max_matches": 7, "stop_at_known": False})]
 
 
 def test_discover_rejects_nonpositive_max_matches(monkeypatch) -> None:
@@ -156,11 +159,79 @@ def test_process_runs_matches_then_maps_with_batch(monkeypatch) -> None:
 
     assert result.exit_code == 0
     assert calls == [
-        ("match", {"batch_size": 10}),
-        ("map", {"batch_size": 10}),
+        ("match", {"batch_size": 10, "workers": 1}),
+        ("map", {"batch_size": 10, "workers": 1, "parse_workers": 0}),
+    ]
+
+
+def test_process_passes_worker_count_to_both_stages(monkeypatch) -> None:
+    calls: list[tuple[str, dict]] = []
+    _patch_controller(
+        monkeypatch,
+        "cs2_analytics.controllers.match_controller",
+        "MatchController",
+        "match",
+        calls,
+    )
+    _patch_controller(
+        monkeypatch,
+        "cs2_analytics.controllers.map_controller",
+        "MapController",
+        "map",
+        calls,
+    )
+
+    result = runner.invoke(app, ["process", "--batch", "10", "--workers", "3"])
+
+    assert result.exit_code == 0
+    assert calls == [
+        ("match", {"batch_size": 10, "workers": 3}),
+        ("map", {"batch_size": 10, "workers": 3, "parse_workers": 0}),
+    ]
+
+
+def test_process_passes_parse_workers_to_map_stage_only(monkeypatch) -> None:
+    calls: list[tuple[str, dict]] = []
+    _patch_controller(
+        monkeypatch,
+        "cs2_analytics.controllers.match_controller",
+        "MatchController",
+        "match",
+        calls,
+    )
+    _patch_controller(
+        monkeypatch,
+        "cs2_analytics.controllers.map_controller",
+        "MapController",
+        "map",
+        calls,
+    )
+
+    result = runner.invoke(app, ["process", "--batch", "10", "--parse-workers", "4"])
+
+    assert result.exit_code == 0
+    assert calls == [
+        ("match", {"batch_size": 10, "workers": 1}),
+        ("map", {"batch_size": 10, "workers": 1, "parse_workers": 4}),
     ]
 
 
+def test_process_rejects_nonpositive_workers(monkeypatch) -> None:
+    calls: list[tuple[str, dict]] = []
+    _patch_controller(
+        monkeypatch,
+        "cs2_analytics.controllers.match_controller",
+        "MatchController",
+        "match",
+        calls,
+    )
+
+    result = runner.invoke(app, ["process", "--workers", "0"])
+
+    assert result.exit_code != 0
+    assert calls == []
+
+
 class _FakeRetryState:
     """Ingestion-state stand-in recording fetch/requeue calls per stage."""
 
@@ -476,3 +547,124 @@ def test_db_current_reports_revision_and_prints_target(monkeypatch) -> None:
     assert result.exit_code == 0
     assert calls == [("current", ())]
     assert "Target database:" in result.stdout
+
+
+def test_replay_requires_an_archive_directory(monkeypatch) -> None:
+    from cs2_analytics.config import config
+
+    monkeypatch.setattr(config, "PAGE_ARCHIVE_DIR", "")
+
+    result = runner.invoke(app, ["replay"])
+
+    assert result.exit_code == 1
+    assert "No page archive configured" in result.output
+
+
+def test_replay_runs_requested_stages_against_archive(monkeypatch, tmp_path) -> None:
+    import cs2_analytics.controllers.replay_controller as replay_module
+
+    calls: list[tuple[str, object, dict]] = []
+
+    class _RecordingReplayController:
+        def __init__(self, archive, **kwargs) -> None:
+            calls.append(("init", str(archive.root), kwargs))
+
+        def run(self, **kwargs) -> None:
+            calls.append(("run", None, kwargs))
+
+    monkeypatch.setattr(replay_module, "ReplayController", _RecordingReplayController)
+    monkeypatch.setattr("cs2_analytics.cli._echo_target_database", lambda: None)
+
+    result = runner.invoke(
+        app,
+        [
+            "replay",
+            "--stage",
+            "map",
+            "--archive-dir",
+            str(tmp_path),
+            "--workers",
+            "4",
+            "--limit",
+            "10",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert calls == [
+        (
+            "init",
+            str(tmp_path),
+            {"workers": 4, "write_batch_size": 200, "parse_backend": "fast"},
+        ),
+        ("run", None, {"stages": ("map",), "limit": 10}),
+    ]
+
+
+def test_bench_parse_fails_when_a_backend_regresses(monkeypatch, tmp_path) -> None:
+    from cs2_analytics.parsers import parse_benchmark
+
+    ran: list[tuple[tuple[str, ...], int]] = []
+
+    def fake_benchmark(_pages, backends, rounds):
+        ran.append((tuple(backends), rounds))
+        return [
+            parse_benchmark.BackendResult(
+                backend="html.parser",
+                peak_rss_mib=40.0,
+                parsers={
+                    "match": parse_benchmark.ParserTiming(
+                        pages=8, pages_per_sec=50.0, p50_ms=20.0, p99_ms=25.0
+                    )
+                },
+                reference_pages_per_sec=100.0,
+            )
+        ]
+
+    monkeypatch.setattr(parse_benchmark, "benchmark_backends", fake_benchmark)
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        '{"backends": {"html.parser": {"peak_rss_mib": 40.0,'
+        ' "parsers": {"match": {"relative_speed": 1.0}}}}}'
+    )
+    args = [
+        "bench",
+        "parse",
+        "--corpus",
+        str(CORPUS_MANIFEST),
+        "--backend",
+        "html.parser",
+        "--rounds",
+        "3",
+    ]
+
+    result = runner.invoke(app, [*args, "--baseline", str(baseline)])
+
+    assert result.exit_code == 1
+    assert ran == [(("html.parser",), 3)]
+    assert "html.parser  match" in result.stdout
+    assert "Regression: html.parser match: relative speed 0.500" in result.output
+
+    tolerant = runner.invoke(
+        app, [*args, "--baseline", str(baseline), "--max-regression", "60"]
+    )
+    assert tolerant.exit_code == 0
+
+
+def test_bench_parse_reports_a_bad_corpus_without_a_traceback(tmp_path) -> None:
+    result = runner.invoke(
+        app, ["bench", "parse", "--corpus", str(tmp_path / "missing.json")]
+    )
+
+    assert result.exit_code == 1
+    assert "Parse benchmark failed: Could not load parse benchmark corpus" in (
+        result.output
+    )
+    assert isinstance(result.exception, SystemExit)
+
+
+def test_bench_parse_requires_a_corpus() -> None:
+    result = runner.invoke(app, ["bench", "parse"])
+
+    assert result.exit_code != 0
+    assert "--corpus" in result.output
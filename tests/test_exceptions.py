@@ -1,4 +1,5 @@
 from cs2_analytics.exceptions import (
+    ChallengePageError,
     CS2AnalyticsError,
     DatabaseConnectionError,
     DatabaseError,
@@ -8,6 +9,7 @@ from cs2_analytics.exceptions import (
     ParseError,
     PlayerStorageError,
     RetryableScrapeError,
+    SchemaDriftError,
     ScrapeError,
     SessionScrapeError,
     StorageError,
@@ -22,8 +24,10 @@ def test_exception_hierarchy_uses_shared_base_classes() -> None:
 
     assert issubclass(MatchParseError, ParseError)
     assert issubclass(MapParseError, ParseError)
+    assert issubclass(SchemaDriftError, ParseError)
     assert issubclass(RetryableScrapeError, ScrapeError)
     assert issubclass(SessionScrapeError, RetryableScrapeError)
+    assert issubclass(ChallengePageError, SessionScrapeError)
     assert issubclass(DatabaseError, StorageError)
     assert issubclass(DatabaseConnectionError, DatabaseError)
     assert issubclass(PlayerStorageError, StorageError)